@@ -0,0 +1,156 @@
+"""
+Benchmark: o agregado Order com pedidos de centenas de linhas.
+
+Compara o modelo antigo (dataclasses sem __slots__, busca linear do item
+em add_item/remove_product e total recalculado a cada leitura) com o atual
+(slots, índice product_id -> item e total em cache) em três cenários:
+
+- montar: add_item de N produtos e, depois, mais uma unidade de cada um;
+- totais: ler order.total_price / table.total_bill várias vezes;
+- detalhes: serializar GET /tables/<id> (TableDetailsResponseSchema).
+
+Confere também que os totais e o JSON dos dois modelos são iguais.
+Não usa o banco.
+
+Uso (a partir de 'backend/'):
+    python benchmarks/bench_order_model.py --lines 50 200 800 --repeat 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from adapters.web.schemas import TableDetailsResponseSchema
+from domain.models import Order, OrderStatus, Product, Table, TableStatus
+
+CREATED_AT = datetime(2025, 11, 3, 19, 0)
+
+
+# --- Modelo antigo (como era antes dos índices e do cache) ---
+
+@dataclass
+class LegacyItemOrder:
+    product: Product
+    quantity: int
+
+    @property
+    def total_price(self) -> float:
+        return self.product.price * self.quantity
+
+
+@dataclass
+class LegacyOrder:
+    id: int
+    table_number: int
+    waiter_id: int
+    items: List[LegacyItemOrder] = field(default_factory=list)
+    status: OrderStatus = OrderStatus.PENDING
+    created_at: datetime = CREATED_AT
+
+    @property
+    def total_price(self) -> float:
+        return sum(item.total_price for item in self.items)
+
+    def add_item(self, product: Product, quantity: int = 1):
+        existing_item = next((item for item in self.items if item.product.id == product.id), None)
+        if existing_item:
+            existing_item.quantity += quantity
+        else:
+            self.items.append(LegacyItemOrder(product=product, quantity=quantity))
+
+
+@dataclass
+class LegacyTable:
+    id: int
+    status: TableStatus = TableStatus.OCCUPIED
+    number_of_people: int = 4
+    orders: List[LegacyOrder] = field(default_factory=list)
+
+    @property
+    def total_bill(self) -> float:
+        return sum(o.total_price for o in self.orders if o.status != OrderStatus.CANCELLED)
+
+
+# --- Cenários ---
+
+def make_products(n: int) -> List[Product]:
+    return [
+        Product(id=i, name=f"Prato nº {i}", price=12.5 + i * 0.1, availability=True,
+                category="Pratos", imageUrl="", visibility=True)
+        for i in range(1, n + 1)
+    ]
+
+
+def build(order_cls, products):
+    order = order_cls(id=1, table_number=1, waiter_id=1, created_at=CREATED_AT)
+    for product in products:
+        order.add_item(product, 1)
+    for product in products:
+        order.add_item(product, 1)
+    return order
+
+
+def make_table(table_cls, order_cls, products, n_orders: int = 3):
+    table = table_cls(id=1, status=TableStatus.OCCUPIED, number_of_people=4)
+    for i in range(n_orders):
+        order = build(order_cls, products)
+        order.id = i + 1
+        table.orders.append(order)
+    return table
+
+
+def read_totals(table, reads: int = 20):
+    for _ in range(reads):
+        table.total_bill
+        for order in table.orders:
+            order.total_price
+
+
+def serialize(table) -> bytes:
+    return TableDetailsResponseSchema.model_validate(table).model_dump_json().encode()
+
+
+def measure(fn, repeat: int) -> float:
+    fn() # Aquecimento
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Agregado Order com muitas linhas.")
+    parser.add_argument("--lines", type=int, nargs="+", default=[50, 200, 800])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'linhas':>7} | {'cenário':<9} | {'antigo (ms)':>12} | {'atual (ms)':>11} | {'ganho':>6}")
+    for n in args.lines:
+        products = make_products(n)
+        old_table = make_table(LegacyTable, LegacyOrder, products)
+        new_table = make_table(Table, Order, products)
+
+        if old_table.total_bill != new_table.total_bill or serialize(old_table) != serialize(new_table):
+            sys.exit(f"ERRO: resultados diferentes com {n} linhas.")
+
+        scenarios = [
+            ("montar", lambda: build(LegacyOrder, products), lambda: build(Order, products)),
+            ("totais", lambda: read_totals(old_table), lambda: read_totals(new_table)),
+            ("detalhes", lambda: serialize(old_table), lambda: serialize(new_table)),
+        ]
+        for name, old_fn, new_fn in scenarios:
+            old_ms = measure(old_fn, args.repeat)
+            new_ms = measure(new_fn, args.repeat)
+            print(f"{n:>7} | {name:<9} | {old_ms:>12.3f} | {new_ms:>11.3f} | {old_ms / new_ms:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
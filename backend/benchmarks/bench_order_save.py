@@ -0,0 +1,137 @@
+"""
+Benchmark: gravação de pedidos grandes em 'order_items'.
+
+Compara a estratégia antiga do MySQLOrderRepository.save (DELETE de todos
+os itens + INSERT de todos novamente) com a gravação incremental atual,
+no cenário "adicionar mais uma unidade de um produto a um pedido de N linhas".
+
+Cria (e remove no final) uma mesa, um usuário e N produtos temporários.
+
+Uso (a partir de 'backend/', com o banco do .env no ar):
+    python benchmarks/bench_order_save.py --lines 20 100 500 --repeat 30
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from adapters.db import MySQLOrderRepository
+from adapters.db.connection_pool import connection_pool
+from domain.models import Order, Product
+
+
+def create_fixtures(n_products: int):
+    """Cria mesa, garçom e produtos temporários. Retorna (table_id, waiter_id, products)."""
+    with connection_pool.get_connection() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO tables (status, number_of_people) VALUES ('occupied', 2)"
+            )
+            table_id = cursor.lastrowid
+            cursor.execute(
+                "INSERT INTO users (username, name, hashed_password, roles) "
+                "VALUES (%s, 'Bench', '-', '[\"waiter\"]')",
+                (f"bench_{os.getpid()}_{int(time.time())}",)
+            )
+            waiter_id = cursor.lastrowid
+
+            products = []
+            for i in range(n_products):
+                cursor.execute(
+                    "INSERT INTO products (name, price, availability, category, imageUrl, visibility) "
+                    "VALUES (%s, 10.0, 1, 'bench', '', 0)",
+                    (f"bench-product-{i}",)
+                )
+                products.append(Product(
+                    id=cursor.lastrowid, name=f"bench-product-{i}", price=10.0,
+                    availability=True, category="bench", imageUrl="", visibility=False
+                ))
+            connection.commit()
+    return table_id, waiter_id, products
+
+
+def drop_fixtures(table_id: int, waiter_id: int, products):
+    with connection_pool.get_connection() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM orders WHERE table_number = %s", (table_id,))
+            cursor.execute("DELETE FROM tables WHERE id = %s", (table_id,))
+            cursor.execute("DELETE FROM users WHERE id = %s", (waiter_id,))
+            ids = [p.id for p in products]
+            placeholders = ','.join(['%s'] * len(ids))
+            cursor.execute(f"DELETE FROM products WHERE id IN ({placeholders})", ids)
+            connection.commit()
+
+
+def legacy_save_items(order: Order) -> int:
+    """Reproduz a gravação antiga dos itens. Retorna o nº de linhas escritas."""
+    with connection_pool.get_connection() as connection:
+        connection.start_transaction()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE orders SET table_number = %s, status = %s WHERE id = %s",
+                (order.table_number, order.status.value, order.id)
+            )
+            cursor.execute("DELETE FROM order_items WHERE order_id = %s", (order.id,))
+            rows = cursor.rowcount
+            cursor.executemany(
+                "INSERT INTO order_items (order_id, product_id, quantity, price_at_order) "
+                "VALUES (%s, %s, %s, %s)",
+                [(order.id, i.product.id, i.quantity, i.product.price) for i in order.items]
+            )
+            rows += cursor.rowcount
+        connection.commit()
+    return rows
+
+
+def run_case(repo: MySQLOrderRepository, table_id, waiter_id, products, n_lines, repeat):
+    """Mede as duas estratégias para um pedido de 'n_lines' linhas."""
+    results = {}
+    for strategy in ("legacy", "incremental"):
+        order = Order(id=0, table_number=table_id, waiter_id=waiter_id)
+        for product in products[:n_lines]:
+            order.add_item(product, 1)
+        repo.save(order)
+
+        timings = []
+        for _ in range(repeat):
+            order.add_item(products[0], 1) # "Mais uma coca"
+            start = time.perf_counter()
+            if strategy == "legacy":
+                rows = legacy_save_items(order)
+                order.mark_as_persisted()
+            else:
+                changes = order.pending_item_changes()
+                rows = len(changes.added) + len(changes.changed) + len(changes.removed)
+                repo.save(order)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        results[strategy] = (statistics.median(timings), max(timings), rows)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, nargs="+", default=[20, 100, 500],
+                        help="Tamanhos de pedido (nº de linhas) a medir.")
+    parser.add_argument("--repeat", type=int, default=30,
+                        help="Quantas gravações medir por tamanho.")
+    args = parser.parse_args()
+
+    repo = MySQLOrderRepository()
+    table_id, waiter_id, products = create_fixtures(max(args.lines))
+    try:
+        print(f"{'linhas':>7} | {'estratégia':<12} | {'mediana (ms)':>12} | {'máx (ms)':>9} | {'linhas escritas':>15}")
+        print("-" * 68)
+        for n_lines in args.lines:
+            results = run_case(repo, table_id, waiter_id, products, n_lines, args.repeat)
+            for strategy, (median_ms, max_ms, rows) in results.items():
+                print(f"{n_lines:>7} | {strategy:<12} | {median_ms:>12.2f} | {max_ms:>9.2f} | {rows:>15}")
+    finally:
+        drop_fixtures(table_id, waiter_id, products)
+
+
+if __name__ == "__main__":
+    main()
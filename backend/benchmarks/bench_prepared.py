@@ -0,0 +1,109 @@
+"""
+Benchmark: consultas por request com e sem prepared statements.
+
+Mede as buscas que a API faz a cada request (produto, usuário por ID e por
+username, mesa com pedidos, pedidos pendentes) pelos próprios repositórios,
+uma vez com o pool enviando o SQL como texto (prepared_statements=False) e
+outra com os comandos registrados preparados uma vez por conexão.
+
+Cada rodada usa um pool de UMA conexão, aquecida antes da medição (o
+primeiro uso de cada comando inclui o prepare). Também confere que os dois
+caminhos devolvem os mesmos objetos (o protocolo binário converte os tipos
+por conta própria).
+
+Recria um banco de teste a partir de 'database/init_db.sql' (o mesmo
+preparo do load_test.py).
+
+Uso (a partir de 'backend/', com um MySQL/MariaDB local e o .env apontando
+para ele; o usuário precisa poder criar bancos):
+    python benchmarks/bench_prepared.py --repeat 2000
+"""
+import argparse
+import statistics
+import sys
+import time
+
+# Reaproveita o preparo do banco do teste de carga (também ajusta o sys.path)
+from load_test import reset_database
+
+from adapters.db.connection_pool import ConnectionPool
+from adapters.db.db_config import db_config
+from adapters.db.order_repository import MySQLOrderRepository
+from adapters.db.product_repository import MySQLProductRepository
+from adapters.db.table_repository import MySQLTableRepository
+from adapters.db.user_repository import MySQLUserRepository
+from domain.models import OrderStatus
+
+
+def _repository(cls, pool):
+    repo = cls.__new__(cls) # Sem o pool global
+    repo.pool = repo.read_pool = pool
+    return repo
+
+
+def lookups(pool) -> dict:
+    """As buscas medidas: nome -> função sem argumentos."""
+    products = _repository(MySQLProductRepository, pool)
+    users = _repository(MySQLUserRepository, pool)
+    tables = _repository(MySQLTableRepository, pool)
+    orders = _repository(MySQLOrderRepository, pool)
+    waiter_id = users.find_by_username("bench_waiter").id
+
+    return {
+        "products.find_by_id": lambda: products.find_by_id(1),
+        "users.find_by_id": lambda: users.find_by_id(waiter_id),
+        "users.find_by_username": lambda: users.find_by_username("bench_waiter"),
+        "tables.find_by_id": lambda: tables.find_by_id(1),
+        "orders.find_by_status": lambda: orders.find_by_status(OrderStatus.PENDING),
+    }
+
+
+def measure(function, repeat: int) -> list:
+    """Latências (µs) de 'repeat' chamadas seguidas."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Buscas por request: SQL em texto x prepared statements.")
+    parser.add_argument("--db-name", default="mdk_prepared", help="Banco de teste (será RECRIADO)")
+    parser.add_argument("--repeat", type=int, default=2000, help="Chamadas por busca")
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args()
+
+    reset_database(args.db_name, n_tables=5)
+    config = {**db_config, "database": args.db_name}
+
+    pools = {
+        "texto": ConnectionPool(config, pool_size=1, max_overflow=0, prepared_statements=False),
+        "prepared": ConnectionPool(config, pool_size=1, max_overflow=0, prepared_statements=True),
+    }
+    runs = {mode: lookups(pool) for mode, pool in pools.items()}
+
+    print(f"{'busca':<24} | {'texto p50 (µs)':>14} | {'prepared p50 (µs)':>17} | "
+          f"{'texto p95':>9} | {'prepared p95':>12} | {'ganho p50':>9}")
+    for name in runs["texto"]:
+        text_fn, prepared_fn = runs["texto"][name], runs["prepared"][name]
+        if text_fn() != prepared_fn():
+            sys.exit(f"ERRO: '{name}' devolve resultados diferentes com prepared statements.")
+
+        medians, p95s = {}, {}
+        for mode, function in (("texto", text_fn), ("prepared", prepared_fn)):
+            measure(function, args.warmup)
+            timings = measure(function, args.repeat)
+            medians[mode] = statistics.median(timings)
+            p95s[mode] = statistics.quantiles(timings, n=20)[-1]
+
+        gain = (1 - medians["prepared"] / medians["texto"]) * 100
+        print(f"{name:<24} | {medians['texto']:>14.1f} | {medians['prepared']:>17.1f} | "
+              f"{p95s['texto']:>9.1f} | {p95s['prepared']:>12.1f} | {gain:>8.1f}%")
+
+    print(f"\nStatements preparados na conexão: {pools['prepared'].stats()['prepared_statements']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: serialização das listagens (caso da cozinha com N pedidos).
+
+Compara o caminho antigo das rotas de listagem (model_validate().model_dump()
+por objeto + jsonify) com o atual (dump_many_json: a lista inteira validada
+por um TypeAdapter e codificada direto em bytes pelo pydantic). Confere
+também que os dois produzem exatamente os mesmos bytes.
+
+Não usa o banco: os pedidos são montados em memória.
+
+Uso (a partir de 'backend/'):
+    python benchmarks/bench_serialization.py --orders 500 --items 4 --repeat 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from flask import Flask, jsonify
+
+from adapters.web.schemas import OrderResponseSchema, dump_many_json
+from domain.models import Order, Product
+
+
+def make_orders(n_orders: int, n_items: int):
+    products = [
+        Product(id=i, name=f"Prato nº {i}", price=12.5 + i, availability=True,
+                category="Pratos", imageUrl=f"https://example.com/{i}.jpg", visibility=True)
+        for i in range(1, n_items + 1)
+    ]
+    start = datetime(2025, 11, 3, 19, 0)
+    orders = []
+    for i in range(1, n_orders + 1):
+        order = Order(id=i, table_number=i % 30 + 1, waiter_id=1, created_at=start + timedelta(seconds=i))
+        for product in products:
+            order.add_item(product, i % 3 + 1)
+        orders.append(order)
+    return orders
+
+
+def legacy(orders) -> bytes:
+    return jsonify([OrderResponseSchema.model_validate(o).model_dump() for o in orders]).get_data()
+
+
+def current(orders) -> bytes:
+    return dump_many_json(OrderResponseSchema, orders)
+
+
+def measure(fn, orders, repeat: int):
+    fn(orders) # Aquecimento (e cria o TypeAdapter em cache)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(orders)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialização de listas de pedidos.")
+    parser.add_argument("--orders", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--items", type=int, default=4, help="Itens por pedido")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    with app.app_context():
+        print(f"{'pedidos':>8} | {'antigo (ms)':>12} | {'atual (ms)':>11} | {'ganho':>6}")
+        for n in args.orders:
+            orders = make_orders(n, args.items)
+            if legacy(orders) != current(orders):
+                sys.exit(f"ERRO: saídas diferentes com {n} pedidos.")
+            old_median, _ = measure(legacy, orders, args.repeat)
+            new_median, _ = measure(current, orders, args.repeat)
+            print(f"{n:>8} | {old_median:>12.2f} | {new_median:>11.2f} | {old_median / new_median:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
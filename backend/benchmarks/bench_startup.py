@@ -0,0 +1,117 @@
+"""
+Benchmark: tempo de partida do app Flask, do app ASGI e do cli.py.
+
+Cada medição roda num processo Python novo (sem módulos já importados
+nem caches aquecidos) e separa três etapas:
+
+- import: importar o módulo de entrada (deps.py para o cli; main.py/asgi.py);
+- montagem: pegar o que o processo usa do container (o create_user_uc no
+  cli; create_app()/create_asgi_app() nos apps);
+- 1º request: o primeiro request pelo test client ('/' por padrão, que
+  não usa o banco). No cli não há request.
+
+Não usa o banco: as dependências do container não abrem conexões ao serem
+criadas, então o resultado não depende do MySQL estar no ar.
+
+Uso (a partir de 'backend/'):
+    python benchmarks/bench_startup.py --targets cli web asgi --repeat 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Cada script imprime um JSON com os tempos (ms) das etapas
+_PRELUDE = """
+import json, os, sys, time
+sys.path.insert(0, {src!r})
+timings = {{}}
+started = time.perf_counter()
+"""
+
+_SCRIPTS = {
+    "cli": """
+from adapters.web.deps import container
+timings["import"] = (time.perf_counter() - started) * 1000
+
+started = time.perf_counter()
+container.create_user_uc
+timings["montagem"] = (time.perf_counter() - started) * 1000
+""",
+    "web": """
+from adapters.web.main import create_app
+timings["import"] = (time.perf_counter() - started) * 1000
+
+started = time.perf_counter()
+app = create_app()
+timings["montagem"] = (time.perf_counter() - started) * 1000
+
+started = time.perf_counter()
+response = app.test_client().get({path!r})
+timings["1º request"] = (time.perf_counter() - started) * 1000
+timings["status"] = response.status_code
+""",
+    "asgi": """
+import asyncio
+from adapters.web.asgi import create_asgi_app
+timings["import"] = (time.perf_counter() - started) * 1000
+
+started = time.perf_counter()
+app = create_asgi_app()
+timings["montagem"] = (time.perf_counter() - started) * 1000
+
+async def first_request():
+    async with app.test_app():
+        return await app.test_client().get({path!r})
+
+started = time.perf_counter()
+response = asyncio.run(first_request())
+timings["1º request"] = (time.perf_counter() - started) * 1000
+timings["status"] = response.status_code
+""",
+}
+
+STAGES = ("import", "montagem", "1º request")
+
+
+def run_once(target: str, path: str) -> dict:
+    script = _PRELUDE.format(src=SRC) + _SCRIPTS[target].format(path=path) + "\nprint(json.dumps(timings))\n"
+    env = dict(os.environ, REQUEST_LOG="0")
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, cwd=SRC
+    )
+    if result.returncode != 0:
+        sys.exit(f"ERRO ao medir '{target}':\n{result.stderr}")
+    # A última linha é o JSON (create_app() também imprime)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de partida (import, montagem e 1º request).")
+    parser.add_argument("--targets", nargs="+", choices=sorted(_SCRIPTS), default=["cli", "web", "asgi"])
+    parser.add_argument("--path", default="/", help="Rota do primeiro request (web/asgi)")
+    parser.add_argument("--repeat", type=int, default=10, help="Processos por alvo")
+    args = parser.parse_args()
+
+    print(f"{'alvo':>6} | {'import (ms)':>11} | {'montagem (ms)':>13} | {'1º request (ms)':>15} | {'total (ms)':>10}")
+    for target in args.targets:
+        runs = [run_once(target, args.path) for _ in range(args.repeat)]
+        statuses = {run.get("status") for run in runs} - {None}
+        if any(status >= 500 for status in statuses):
+            sys.exit(f"ERRO: '{target}' respondeu {sorted(statuses)} em {args.path}.")
+
+        medians = {
+            stage: statistics.median(run[stage] for run in runs) if stage in runs[0] else None
+            for stage in STAGES
+        }
+        total = statistics.median(sum(run.get(stage, 0) for stage in STAGES) for run in runs)
+        cells = [f"{medians[stage]:.1f}" if medians[stage] is not None else "-" for stage in STAGES]
+        print(f"{target:>6} | {cells[0]:>11} | {cells[1]:>13} | {cells[2]:>15} | {total:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
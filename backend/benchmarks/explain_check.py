@@ -0,0 +1,296 @@
+"""
+Confere os planos de execução (EXPLAIN) das consultas "quentes" dos
+repositórios contra um banco semeado com histórico.
+
+Recria um banco de teste a partir de 'database/init_db.sql' (o mesmo
+preparo do load_test.py), insere várias noites de histórico (sessões
+fechadas, com pedidos concluídos e seus itens já no arquivo) e uma mesa
+aberta com pedidos pendentes, roda ANALYZE e então EXPLAIN em cada consulta.
+
+Falha (código de saída 1) se alguma consulta fizer varredura completa de
+uma tabela (type 'ALL' ou 'index'), exceto onde isso é esperado (ex: a
+listagem de todas as mesas ou do cardápio).
+
+As consultas são importadas dos próprios repositórios, então o script
+confere exatamente o SQL que a aplicação executa.
+
+Uso (a partir de 'backend/', com um MySQL/MariaDB local e o .env apontando
+para ele; o usuário precisa poder criar bancos):
+    python benchmarks/explain_check.py
+    python benchmarks/explain_check.py --sessions-per-table 200 --verbose
+"""
+import argparse
+import random
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+# Reaproveita o preparo do banco do teste de carga (também ajusta o sys.path)
+from load_test import reset_database
+
+# Varreduras completas: 'ALL' (tabela inteira) e 'index' (índice inteiro)
+FULL_SCAN_TYPES = ("ALL", "index")
+
+BATCH_SIZE = 5000
+
+
+# --- Histórico ---
+
+def _insert_batches(cursor, query: str, rows: list):
+    for start in range(0, len(rows), BATCH_SIZE):
+        cursor.executemany(query, rows[start:start + BATCH_SIZE])
+
+
+def seed_history(connection, n_tables: int, sessions_per_table: int,
+                 orders_per_session: int, items_per_order: int, seed: int) -> dict:
+    """
+    Insere o histórico e abre a mesa 1 com pedidos pendentes.
+    Retorna IDs de exemplo para os parâmetros das consultas.
+    """
+    rng = random.Random(seed)
+    cursor = connection.cursor()
+
+    cursor.execute("SELECT id, price FROM products")
+    products = cursor.fetchall()
+    cursor.execute("SELECT id FROM users WHERE username = 'bench_waiter'")
+    waiter_id = cursor.fetchone()[0]
+
+    sessions, orders, items = [], [], []
+    archived_orders, archived_items = [], []
+    session_id = order_id = item_id = 0
+    opened_at = datetime.now() - timedelta(days=sessions_per_table)
+
+    def add_orders(table_id: int, session: int, created_at: datetime, status_choices,
+                   order_rows: list, item_rows: list):
+        nonlocal order_id, item_id
+        for _ in range(orders_per_session):
+            order_id += 1
+            order_rows.append((order_id, table_id, waiter_id, rng.choice(status_choices), created_at, session))
+            for product_id, price in rng.sample(products, min(items_per_order, len(products))):
+                item_id += 1
+                item_rows.append((item_id, order_id, product_id, rng.randint(1, 4), price))
+            created_at += timedelta(minutes=5)
+
+    # 1. Noites anteriores: uma sessão fechada por mesa por "dia"
+    # (arquivadas no fechamento da mesa, como faz o MySQLTableRepository)
+    for day in range(sessions_per_table):
+        for table_id in range(1, n_tables + 1):
+            session_id += 1
+            start = opened_at + timedelta(days=day, minutes=table_id)
+            sessions.append((session_id, table_id, rng.randint(1, 6), start, start + timedelta(hours=2)))
+            add_orders(table_id, session_id, start, ("completed", "completed", "cancelled"),
+                       archived_orders, archived_items)
+
+    # 2. Serviço atual: mesa 1 aberta com pedidos pendentes
+    session_id += 1
+    sessions.append((session_id, 1, 4, datetime.now(), None))
+    first_open_order = order_id + 1
+    add_orders(1, session_id, datetime.now(), ("pending",), orders, items)
+
+    _insert_batches(cursor,
+        "INSERT INTO table_sessions (id, table_id, number_of_people, opened_at, closed_at) "
+        "VALUES (%s, %s, %s, %s, %s)", sessions)
+    for table in ("orders", "orders_archive"):
+        _insert_batches(cursor,
+            f"INSERT INTO {table} (id, table_number, waiter_id, status, created_at, session_id) "
+            "VALUES (%s, %s, %s, %s, %s, %s)", orders if table == "orders" else archived_orders)
+    for table in ("order_items", "order_items_archive"):
+        _insert_batches(cursor,
+            f"INSERT INTO {table} (id, order_id, product_id, quantity, price_at_order) "
+            "VALUES (%s, %s, %s, %s, %s)", items if table == "order_items" else archived_items)
+    cursor.execute(
+        "UPDATE tables SET status = 'occupied', number_of_people = 4, current_session_id = %s WHERE id = 1",
+        (session_id,)
+    )
+
+    # Resumos de vendas dos pedidos concluídos (o que o order_repository
+    # teria somado a cada conclusão)
+    seed_sales_rollups(cursor, archived_orders, archived_items)
+    connection.commit()
+
+    # Estatísticas atualizadas para o otimizador (depois de TODAS as
+    # inserções, inclusive as dos resumos)
+    cursor.execute("ANALYZE TABLE tables, table_sessions, orders, order_items, "
+                   "orders_archive, order_items_archive, products, users, "
+                   "sales_hourly, sales_by_product, sales_by_category, sales_by_waiter")
+    cursor.fetchall()
+    cursor.close()
+
+    open_item = next(item for item in items if item[1] == first_open_order)
+    print(f"Histórico: {len(sessions)} sessões, {len(orders) + len(archived_orders)} pedidos "
+          f"({len(archived_orders)} arquivados), {len(items) + len(archived_items)} itens.")
+    return {
+        "order_id": first_open_order,
+        "open_order_ids": tuple(range(first_open_order, order_id + 1)),
+        "product_id": open_item[2],
+        "waiter_id": waiter_id,
+    }
+
+
+def seed_sales_rollups(cursor, orders: list, items: list):
+    """Preenche as tabelas de resumo a partir dos pedidos concluídos semeados."""
+    cursor.execute("SELECT id, category FROM products")
+    categories = dict(cursor.fetchall())
+    completed = {order[0]: order for order in orders if order[3] == "completed"}
+
+    # { chave -> [pedidos, itens, faturamento] } por resumo
+    rollups = {name: defaultdict(lambda: [set(), 0, 0]) for name in ("hour", "product", "category", "waiter")}
+    for _, order_id, product_id, quantity, price in items:
+        order = completed.get(order_id)
+        if order is None:
+            continue
+        created_at, day = order[4], order[4].date()
+        for name, key in (("hour", created_at.replace(minute=0, second=0, microsecond=0)),
+                          ("product", (day, product_id)),
+                          ("category", (day, categories[product_id] or "")),
+                          ("waiter", (day, order[2]))):
+            totals = rollups[name][key]
+            totals[0].add(order_id)
+            totals[1] += quantity
+            totals[2] += quantity * price
+
+    def rows(name):
+        for key, (order_ids, quantity, revenue) in rollups[name].items():
+            yield (*(key if isinstance(key, tuple) else (key,)), len(order_ids), quantity, revenue)
+
+    _insert_batches(cursor, "INSERT INTO sales_hourly (hour, orders_count, items_count, revenue) "
+                            "VALUES (%s, %s, %s, %s)", list(rows("hour")))
+    for table, column in (("sales_by_product", "product_id"), ("sales_by_category", "category"),
+                          ("sales_by_waiter", "waiter_id")):
+        _insert_batches(cursor, f"INSERT INTO {table} (day, {column}, orders_count, items_count, revenue) "
+                                "VALUES (%s, %s, %s, %s, %s)", list(rows(table.rsplit("_", 1)[1])))
+
+
+# --- Consultas Verificadas ---
+
+def hot_queries(ids: dict):
+    """
+    Lista (nome, sql, parâmetros, tabelas onde a varredura é aceita).
+    As tabelas são identificadas como aparecem no EXPLAIN (alias ou nome).
+    """
+    from adapters.db import order_repository as orders
+    from adapters.db import order_archive as archive
+    from adapters.db import sales_report_repository as sales
+    from adapters.db import product_repository as products
+    from adapters.db import table_repository as tables
+    from adapters.db import user_repository as users
+    from domain.models import OrderHistoryFilter, OrderHistoryCursor, OrderStatus
+
+    order_id, product_id = ids["order_id"], ids["product_id"]
+    open_ids = ids["open_order_ids"]
+    in_open = ','.join(['%s'] * len(open_ids))
+
+    now = datetime.now()
+    one_year = OrderHistoryFilter(date_from=now - timedelta(days=365), date_to=now)
+    history = {
+        "período de 1 ano": orders.history_query(one_year, None, 50),
+        "mesa": orders.history_query(OrderHistoryFilter(table_id=1), None, 50),
+        "garçom": orders.history_query(OrderHistoryFilter(waiter_id=ids["waiter_id"]), None, 50),
+        "status": orders.history_query(OrderHistoryFilter(status=OrderStatus.COMPLETED), None, 50),
+        "próxima página": orders.history_query(
+            OrderHistoryFilter(), OrderHistoryCursor(created_at=now - timedelta(days=3), id=order_id), 50
+        ),
+    }
+
+    return [
+        ("orders.find_by_id", orders.QUERY_ORDER_BY_ID, (order_id,), ()),
+        ("orders.find_by_id (itens)", orders.QUERY_ITEMS_BY_ORDER, (order_id,), ()),
+        ("orders.find_by_status", orders.QUERY_ORDERS_BY_STATUS, ("pending",), ()),
+        ("orders.find_by_status (itens)",
+         orders.QUERY_ITEMS_BY_ORDERS.format(placeholders=in_open), open_ids, ()),
+        ("orders.save (status)", orders.UPDATE_ORDER, (1, "in_progress", order_id, 0), ()),
+        ("orders.save (sessão da mesa)", orders.CLAIM_TABLE_SESSION, (1, None), ()),
+        ("orders.save (quantidade)", orders.UPDATE_ORDER_ITEM_QUANTITY, (2, order_id, product_id), ()),
+        ("orders.save (remove itens)",
+         orders.DELETE_ORDER_ITEMS.format(placeholders='%s'), (order_id, product_id), ()),
+        ("tables.find_by_id", tables.QUERY_TABLE_DETAILS, (1,), ()),
+        ("tables.get_all_tables", tables.QUERY_ALL_TABLES, (), ("tables",)),
+        ("tables.save (fecha sessão)", tables.CLOSE_TABLE_SESSION, (1,), ()),
+        ("tables.save (arquiva pedidos)", archive.ARCHIVE_SESSION_ORDERS, (1,), ()),
+        ("tables.save (arquiva itens)", archive.ARCHIVE_SESSION_ITEMS, (1,), ()),
+        ("tables.save (apaga pedidos)", archive.DELETE_SESSION_ORDERS, (1,), ()),
+        ("archive-orders (lote)", archive.QUERY_ARCHIVABLE_ORDER_IDS, (0, 500), ()),
+        ("archive-orders (pedidos)",
+         archive.ARCHIVE_ORDERS_BY_IDS.format(placeholders=in_open), open_ids, ()),
+        ("archive-orders (itens)",
+         archive.ARCHIVE_ITEMS_BY_ORDERS.format(placeholders=in_open), open_ids, ()),
+        ("tables.save", tables.UPDATE_TABLE, ("occupied", 4, None, 1, 0), ()),
+        ("products.get_visible_products", products.QUERY_VISIBLE_PRODUCTS, (), ("products",)),
+        ("products.get_all", products.QUERY_ALL_PRODUCTS, (), ("products",)),
+        ("products.iter_all (página)", products.QUERY_PRODUCTS_PAGE, (0, 500), ()),
+        ("products.find_by_id", products.QUERY_PRODUCT_BY_ID, (product_id,), ()),
+        ("products.find_by_ids",
+         products.QUERY_PRODUCTS_BY_IDS.format(placeholders='%s,%s'), (product_id, product_id + 1), ()),
+        ("users.find_by_id", users.QUERY_USER_BY_ID, (ids["waiter_id"],), ()),
+        ("users.find_by_username", users.QUERY_USER_BY_USERNAME, ("bench_waiter",), ()),
+    ] + [
+        (f"orders.find_history ({name})", query, params, ())
+        for name, (query, params) in history.items()
+    ] + [
+        ("orders.find_history (itens)", *orders.history_items_query(open_ids), ()),
+    ] + [
+        (f"orders.save (resumo de vendas {n})", statement, (order_id,), ())
+        for n, statement in enumerate(sales.RECORD_SALE_STATEMENTS, start=1)
+    ] + [
+        (f"sales.find_sales ({dimension.value}, mês)", query,
+         ((now - timedelta(days=30)).date(), (now + timedelta(days=1)).date()), ())
+        for dimension, query in sales.SALES_QUERIES.items()
+    ]
+
+
+def explain(connection, query: str, params) -> list:
+    with connection.cursor(dictionary=True) as cursor:
+        cursor.execute("EXPLAIN " + query, params)
+        return cursor.fetchall()
+
+
+def check_queries(connection, ids: dict, verbose: bool = False) -> list:
+    """Roda EXPLAIN em cada consulta e retorna a lista de falhas."""
+    failures = []
+    for name, query, params, allowed in hot_queries(ids):
+        plan = explain(connection, query, params)
+        scans = [
+            row for row in plan
+            if row.get("type") in FULL_SCAN_TYPES and row.get("table") not in allowed
+        ]
+        print(f"{'FALHA' if scans else 'ok':5}  {name}")
+        if verbose or scans:
+            for row in plan:
+                print(f"         {row.get('table')!s:16} type={row.get('type')!s:7} "
+                      f"key={row.get('key')!s:32} rows={row.get('rows')!s:7} {row.get('Extra') or ''}")
+        if scans:
+            failures.append(name)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN das consultas quentes dos repositórios.")
+    parser.add_argument("--db-name", default="mdk_explain", help="Banco de teste (será RECRIADO)")
+    parser.add_argument("--tables", type=int, default=30)
+    parser.add_argument("--sessions-per-table", type=int, default=50, help="Noites de histórico")
+    parser.add_argument("--orders-per-session", type=int, default=3)
+    parser.add_argument("--items-per-order", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--verbose", action="store_true", help="Mostra o plano de todas as consultas")
+    args = parser.parse_args()
+
+    import mysql.connector
+    from adapters.db.db_config import db_config
+
+    reset_database(args.db_name, args.tables)
+    connection = mysql.connector.connect(**{**db_config, "database": args.db_name})
+    try:
+        ids = seed_history(connection, args.tables, args.sessions_per_table,
+                           args.orders_per_session, args.items_per_order, args.seed)
+        failures = check_queries(connection, ids, args.verbose)
+    finally:
+        connection.close()
+
+    if failures:
+        print(f"\n{len(failures)} consulta(s) com varredura completa: {', '.join(failures)}")
+        sys.exit(1)
+    print("\nNenhuma consulta quente faz varredura completa.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+"""
+Teste de carga: replay de um serviço de jantar completo contra a API.
+
+Recria um banco de benchmark a partir de 'database/init_db.sql', sobe o
+create_app() em um servidor HTTP local (com threads) -- ou, com
+'--server asgi', o create_asgi_app() no Hypercorn -- e simula o serviço:
+
+- Garçons (threads): fazem login, listam mesas e cardápio, abrem uma mesa,
+  criam pedidos, adicionam itens, consultam a mesa até a cozinha terminar
+  e fecham a mesa. Repetem com a próxima mesa da fila.
+- Cozinha (threads): consulta os pedidos pendentes, inicia e conclui cada um.
+
+Ao final, mostra latência p50/p95/p99 e vazão por endpoint. Com '--output'
+o resultado é salvo em JSON; com '--compare' as medianas/p95 são comparadas
+com um resultado anterior (ex: do branch principal).
+
+O banco é recriado a cada execução e as escolhas "aleatórias" usam uma
+semente fixa ('--seed'), para que execuções com os mesmos argumentos sejam
+comparáveis.
+
+Uso (a partir de 'backend/', com um MySQL/MariaDB local e o .env apontando
+para ele; o usuário precisa poder criar bancos):
+    python benchmarks/load_test.py --tables 30 --waiters 10 --output main.json
+    git checkout minha-branch
+    python benchmarks/load_test.py --tables 30 --waiters 10 --compare main.json
+
+Para comparar os dois apps com muitos clientes simultâneos:
+    python benchmarks/load_test.py --waiters 100 --tables 200 --output wsgi.json
+    python benchmarks/load_test.py --waiters 100 --tables 200 --server asgi --compare wsgi.json
+"""
+import argparse
+import http.client
+import json
+import os
+import queue
+import random
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+INIT_DB_SQL = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'database', 'init_db.sql'))
+sys.path.insert(0, SRC_DIR)
+
+BENCH_PASSWORD = "bench-password"
+
+
+# --- Preparação do Banco ---
+
+def split_sql_script(script: str):
+    """
+    Divide um script .sql em comandos (um por ';').
+    Suficiente para o init_db.sql: remove comentários '--' até o fim da
+    linha (o script não tem '--' dentro de strings) e não usa DELIMITER.
+    """
+    lines = [re.sub(r'--.*$', '', line) for line in script.splitlines()]
+    statements = '\n'.join(lines).split(';')
+    return [s.strip() for s in statements if s.strip()]
+
+
+def reset_database(db_name: str, n_tables: int):
+    """
+    Recria o banco de benchmark (esquema + cardápio do init_db.sql),
+    cria N mesas livres, um garçom e um admin (que faz o papel da cozinha).
+    """
+    import bcrypt
+    import mysql.connector
+    from adapters.db.db_config import db_config
+
+    with open(INIT_DB_SQL, encoding='utf-8') as f:
+        script = f.read().replace('mdk_db', db_name)
+
+    server_config = {k: v for k, v in db_config.items() if k != 'database'}
+    connection = mysql.connector.connect(**server_config)
+    try:
+        cursor = connection.cursor()
+        for statement in split_sql_script(script):
+            cursor.execute(statement)
+
+        cursor.executemany(
+            "INSERT INTO tables (id, status, number_of_people) VALUES (%s, 'available', 0)",
+            [(i,) for i in range(1, n_tables + 1)]
+        )
+
+        # Custo mínimo do bcrypt: o benchmark mede a API, não o login
+        # (o custo configurado volta a valer no primeiro login, via rehash)
+        hashed = bcrypt.hashpw(BENCH_PASSWORD.encode('utf-8'), bcrypt.gensalt(rounds=4)).decode('utf-8')
+        cursor.executemany(
+            "INSERT INTO users (username, name, hashed_password, roles) VALUES (%s, %s, %s, %s)",
+            [
+                ("bench_waiter", "Garçom Benchmark", hashed, '["waiter"]'),
+                ("bench_kitchen", "Cozinha Benchmark", hashed, '["admin"]'),
+            ]
+        )
+        connection.commit()
+        cursor.close()
+    finally:
+        connection.close()
+
+
+# --- Servidor ---
+
+def start_server(host: str, port: int):
+    """Sobe o create_app() em uma thread (werkzeug, uma thread por request)."""
+    from werkzeug.serving import make_server
+    from adapters.web.main import create_app
+
+    server = make_server(host, port, create_app(), threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+class _AsgiServer:
+    """Hypercorn rodando o create_asgi_app() em uma thread com seu próprio event loop."""
+
+    def __init__(self, host: str, port: int):
+        import asyncio
+        from hypercorn.config import Config
+        from adapters.web.asgi import create_asgi_app
+
+        self._config = Config()
+        self._config.bind = [f"{host}:{port}"]
+        self._config.accesslog = None
+        self._app = create_asgi_app()
+        self._loop = asyncio.new_event_loop()
+        self._stop = asyncio.Event()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        from hypercorn.asyncio import serve
+        self._loop.call_soon(self._started.set)
+        self._loop.run_until_complete(serve(self._app, self._config, shutdown_trigger=self._stop.wait))
+
+    def start(self):
+        self._thread.start()
+        self._started.wait()
+        time.sleep(0.5) # Dá tempo para o bind do socket
+
+    def shutdown(self):
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join(timeout=10)
+
+
+def start_asgi_server(host: str, port: int):
+    """Sobe o create_asgi_app() no Hypercorn (um event loop, sem thread por request)."""
+    server = _AsgiServer(host, port)
+    server.start()
+    return server
+
+
+# --- Cliente HTTP com medição ---
+
+class Recorder:
+    """Acumula as latências (ms) e erros por endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, endpoint: str, elapsed_ms: float, ok: bool):
+        with self._lock:
+            self.latencies[endpoint].append(elapsed_ms)
+            if not ok:
+                self.errors[endpoint] += 1
+
+
+class ApiClient:
+    """Cliente de UMA thread (mantém a conexão HTTP aberta entre requests)."""
+
+    def __init__(self, host: str, port: int, recorder: Recorder):
+        self.connection = http.client.HTTPConnection(host, port, timeout=60)
+        self.recorder = recorder
+        self.token = None
+
+    def request(self, method: str, path: str, endpoint: str, body=None):
+        """
+        Faz o request e registra a latência sob 'endpoint' (o caminho
+        com os IDs trocados por '<id>', para agrupar).
+        """
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        payload = json.dumps(body) if body is not None else None
+
+        start = time.perf_counter()
+        self.connection.request(method, path, body=payload, headers=headers)
+        response = self.connection.getresponse()
+        data = response.read()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        self.recorder.record(f"{method} {endpoint}", elapsed_ms, response.status < 400)
+        if response.status >= 400:
+            raise RuntimeError(f"{method} {path} -> {response.status}: {data[:200]!r}")
+        return json.loads(data) if data else None
+
+    def login(self, username: str):
+        data = self.request("POST", "/auth/login", "/auth/login",
+                            {"username": username, "password": BENCH_PASSWORD})
+        self.token = data["access_token"]
+
+
+# --- Simulação ---
+
+def waiter_loop(client: ApiClient, tables: "queue.Queue[int]", args, rng: random.Random, failures: list):
+    """Atende mesas da fila até ela acabar."""
+    try:
+        client.login("bench_waiter")
+        products = [p["id"] for p in client.request("GET", "/products", "/products")]
+    except Exception as e:
+        failures.append(f"Garçom: {e}")
+        return
+
+    while True:
+        try:
+            table_id = tables.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            serve_table(client, table_id, products, args, rng)
+        except Exception as e:
+            failures.append(f"Mesa {table_id}: {e}")
+
+
+def serve_table(client: ApiClient, table_id: int, products, args, rng: random.Random):
+    """Uma sessão completa de mesa: abrir -> pedidos -> esperar cozinha -> fechar."""
+    think = lambda: time.sleep(rng.uniform(0, args.think_ms) / 1000) if args.think_ms else None
+
+    client.request("GET", "/tables", "/tables")
+    client.request("POST", f"/tables/{table_id}/open", "/tables/<id>/open",
+                   {"number_of_people": rng.randint(1, 6)})
+    think()
+
+    for _ in range(args.orders_per_table):
+        items = [
+            {"product_id": product_id, "quantity": rng.randint(1, 3)}
+            for product_id in rng.sample(products, args.items_per_order)
+        ]
+        order = client.request("POST", f"/tables/{table_id}/orders", "/tables/<id>/orders",
+                               {"items": items})
+        think()
+
+        client.request("POST", f"/orders/{order['id']}/items", "/orders/<id>/items",
+                       {"product_id": rng.choice(products), "quantity": 1})
+        client.request("GET", f"/tables/{table_id}", "/tables/<id>")
+        think()
+
+    # Espera a cozinha concluir todos os pedidos (a tela do garçom faz polling)
+    deadline = time.monotonic() + args.kitchen_timeout
+    while True:
+        details = client.request("GET", f"/tables/{table_id}", "/tables/<id>")
+        if all(o["status"] in ("completed", "cancelled") for o in details["orders"]):
+            break
+        if time.monotonic() > deadline:
+            raise RuntimeError("a cozinha não concluiu os pedidos a tempo")
+        time.sleep(args.poll_ms / 1000)
+
+    client.request("POST", f"/tables/{table_id}/close", "/tables/<id>/close")
+
+
+def kitchen_loop(client: ApiClient, worker: int, stop: threading.Event, args, failures: list):
+    """
+    Prepara os pedidos pendentes até o fim do serviço.
+    Cada thread cuida dos pedidos com 'id % args.kitchen == worker'
+    (duas threads nunca disputam o mesmo pedido).
+    """
+    try:
+        client.login("bench_kitchen")
+    except Exception as e:
+        failures.append(f"Cozinha: {e}")
+        return
+    while not stop.is_set():
+        pending = []
+        try:
+            pending = client.request("GET", "/kitchen/orders/pending", "/kitchen/orders/pending")
+            for order in pending:
+                if order["id"] % args.kitchen != worker:
+                    continue
+                client.request("POST", f"/kitchen/orders/{order['id']}/start", "/kitchen/orders/<id>/start")
+                client.request("POST", f"/kitchen/orders/{order['id']}/complete", "/kitchen/orders/<id>/complete")
+        except Exception as e:
+            failures.append(f"Cozinha: {e}")
+        if not pending:
+            time.sleep(args.poll_ms / 1000)
+
+
+def run_service(args) -> dict:
+    """Executa o serviço completo e retorna as medições."""
+    recorder = Recorder()
+    tables: "queue.Queue[int]" = queue.Queue()
+    for table_id in range(1, args.tables + 1):
+        tables.put(table_id)
+
+    failures: list = []
+    stop_kitchen = threading.Event()
+    new_client = lambda: ApiClient(args.host, args.port, recorder)
+
+    kitchen = [
+        threading.Thread(target=kitchen_loop, args=(new_client(), i, stop_kitchen, args, failures))
+        for i in range(args.kitchen)
+    ]
+    waiters = [
+        threading.Thread(target=waiter_loop,
+                         args=(new_client(), tables, args, random.Random(args.seed + i), failures))
+        for i in range(args.waiters)
+    ]
+
+    start = time.perf_counter()
+    for thread in kitchen + waiters:
+        thread.start()
+    for thread in waiters:
+        thread.join()
+    wall_seconds = time.perf_counter() - start
+
+    stop_kitchen.set()
+    for thread in kitchen:
+        thread.join()
+
+    return {
+        "wall_seconds": wall_seconds,
+        "endpoints": summarize(recorder, wall_seconds),
+        "failures": failures,
+    }
+
+
+# --- Relatório ---
+
+def percentile(sorted_values, p: float) -> float:
+    """Percentil pelo método "nearest-rank"."""
+    index = max(0, min(len(sorted_values) - 1, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize(recorder: Recorder, wall_seconds: float) -> dict:
+    result = {}
+    for endpoint, values in sorted(recorder.latencies.items()):
+        values = sorted(values)
+        result[endpoint] = {
+            "count": len(values),
+            "errors": recorder.errors.get(endpoint, 0),
+            "p50_ms": round(statistics.median(values), 2),
+            "p95_ms": round(percentile(values, 95), 2),
+            "p99_ms": round(percentile(values, 99), 2),
+            "max_ms": round(values[-1], 2),
+            "rps": round(len(values) / wall_seconds, 2),
+        }
+    return result
+
+
+def print_report(result: dict, baseline: dict = None):
+    header = f"{'endpoint':<36} | {'n':>6} | {'err':>4} | {'p50':>8} | {'p95':>8} | {'p99':>8} | {'req/s':>7}"
+    if baseline:
+        header += f" | {'Δp50':>7} | {'Δp95':>7}"
+    print(header)
+    print("-" * len(header))
+
+    for endpoint, m in result["endpoints"].items():
+        line = (f"{endpoint:<36} | {m['count']:>6} | {m['errors']:>4} | {m['p50_ms']:>8.2f} | "
+                f"{m['p95_ms']:>8.2f} | {m['p99_ms']:>8.2f} | {m['rps']:>7.1f}")
+        if baseline:
+            base = baseline["endpoints"].get(endpoint)
+            if base:
+                line += f" | {delta(base['p50_ms'], m['p50_ms'])} | {delta(base['p95_ms'], m['p95_ms'])}"
+        print(line)
+
+    total = sum(m["count"] for m in result["endpoints"].values())
+    print(f"\nTotal: {total} requests em {result['wall_seconds']:.1f}s "
+          f"({total / result['wall_seconds']:.1f} req/s)")
+    if baseline:
+        print(f"Base:  {baseline['meta']['git_rev']} ({baseline['meta']['started_at']}, "
+              f"{baseline['meta']['args'].get('server', 'wsgi')}), {baseline['wall_seconds']:.1f}s")
+    if result["failures"]:
+        print(f"\n{len(result['failures'])} falha(s). Primeiras:")
+        for failure in result["failures"][:5]:
+            print(f"  - {failure}")
+
+
+def delta(before: float, after: float) -> str:
+    if not before:
+        return f"{'-':>7}"
+    return f"{(after - before) / before * 100:>+6.1f}%"
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "desconhecida"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-name", default="mdk_bench",
+                        help="Banco de benchmark (APAGADO e recriado a cada execução).")
+    parser.add_argument("--tables", type=int, default=30, help="Mesas atendidas no serviço.")
+    parser.add_argument("--waiters", type=int, default=10, help="Garçons simultâneos (threads).")
+    parser.add_argument("--kitchen", type=int, default=2, help="Threads da cozinha.")
+    parser.add_argument("--orders-per-table", type=int, default=3)
+    parser.add_argument("--items-per-order", type=int, default=4)
+    parser.add_argument("--think-ms", type=float, default=0,
+                        help="Pausa máxima (aleatória) entre ações do garçom. 0 = vazão máxima.")
+    parser.add_argument("--poll-ms", type=float, default=50,
+                        help="Intervalo de polling (garçom esperando a cozinha / cozinha ociosa).")
+    parser.add_argument("--kitchen-timeout", type=float, default=60,
+                        help="Espera máxima (s) pela cozinha antes de fechar a mesa.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--server", choices=("wsgi", "asgi"), default="wsgi",
+                        help="App testado: create_app() (Flask) ou create_asgi_app() (Quart/Hypercorn).")
+    parser.add_argument("--output", help="Salva o resultado em JSON.")
+    parser.add_argument("--compare", help="JSON de uma execução anterior para comparar.")
+    args = parser.parse_args()
+
+    if args.kitchen < 1 or args.waiters < 1:
+        parser.error("--kitchen e --waiters devem ser pelo menos 1.")
+    if args.items_per_order > 29:
+        parser.error("--items-per-order deve ser no máximo 29 (tamanho do cardápio).")
+
+    # A aplicação lê o banco de db_config no import: aponta para o de benchmark
+    os.environ["DB_NAME"] = args.db_name
+
+    print(f">>> Recriando o banco '{args.db_name}' a partir de {INIT_DB_SQL}...")
+    reset_database(args.db_name, args.tables)
+    if args.server == "asgi":
+        server = start_asgi_server(args.host, args.port)
+    else:
+        server = start_server(args.host, args.port)
+
+    print(f">>> Servidor: {args.server}")
+    print(f">>> Serviço: {args.tables} mesas, {args.waiters} garçons, {args.kitchen} cozinha...")
+    started_at = datetime.now().isoformat(timespec="seconds")
+    try:
+        result = run_service(args)
+    finally:
+        server.shutdown()
+
+    result["meta"] = {
+        "git_rev": git_revision(),
+        "started_at": started_at,
+        "python": sys.version.split()[0],
+        "args": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        # O tipo de servidor pode mudar: comparar WSGI x ASGI é um uso esperado
+        same_args = lambda meta: {k: v for k, v in meta["args"].items() if k != "server"}
+        if same_args(baseline["meta"]) != same_args(result["meta"]):
+            print("AVISO: a execução base usou argumentos diferentes; a comparação pode não ser justa.")
+
+    print()
+    print_report(result, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"\nResultado salvo em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 import sys
 import os
+import argparse
+import csv
+import json
+import time
 import getpass # Para digitar a senha de forma segura (escondida)
 
 # --- Configuração de Caminho ---
@@ -9,7 +13,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src'
 # -----------------------------
 
 try:
-    # 1. Importa o container (isso inicializa tudo: pool, etc.)
+    # 1. Importa o container (as dependências são criadas no primeiro uso)
     from adapters.web.deps import container
     from domain.models import UserRole
     from domain.exceptions import BusinessRuleException, DomainException
@@ -69,5 +73,210 @@ def create_admin_user():
     except Exception as e:
         print(f"\n❌ Erro Inesperado: {e}")
 
+def archive_orders(batch_size: int, pause_seconds: float):
+    """
+    Função de CLI para mover o histórico já gravado (pedidos de sessões
+    encerradas) para as tabelas de arquivo, em lotes pequenos.
+    (Ver database/migrations/005_order_archive.sql.)
+    """
+    from adapters.db.order_archive import OrderArchiver
+
+    print(f"--- Arquivar Pedidos (lotes de {batch_size}) ---")
+
+    def report(moved, total):
+        print(f"  {moved} pedidos movidos (total: {total})")
+
+    try:
+        total = OrderArchiver().backfill(batch_size, pause_seconds, on_batch=report)
+        print(f"\n✅ Concluído: {total} pedidos arquivados.")
+    except KeyboardInterrupt:
+        # Os lotes já confirmados ficam arquivados; rodar de novo continua daí
+        print("\nInterrompido. Rode o comando de novo para continuar.")
+    except Exception as e:
+        print(f"\n❌ Erro Inesperado: {e}")
+        sys.exit(1)
+
+
+def read_roster(path: str):
+    """
+    Lê a lista da equipe: CSV com cabeçalho (username,name,password,roles;
+    vários papéis separados por ';') ou JSON (lista de objetos com os
+    mesmos campos). Sem papéis, o usuário é garçom.
+    Retorna pares (linha do arquivo, dados); no JSON, a posição na lista.
+    """
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as roster:
+            entries = json.load(roster)
+        return [(line, {"roles": [UserRole.WAITER.value], **entry}) for line, entry in enumerate(entries, start=1)]
+
+    rows = []
+    with open(path, newline="", encoding="utf-8-sig") as roster:
+        reader = csv.DictReader(roster)
+        for row in reader:
+            user_data = {key: (value or "").strip() for key, value in row.items() if key and key != "roles"}
+            roles = [role.strip() for role in (row.get("roles") or "").split(";") if role.strip()]
+            user_data["roles"] = roles or [UserRole.WAITER.value]
+            rows.append((reader.line_num, user_data))
+    return rows
+
+
+def import_staff(path: str, batch_size: int, workers: int):
+    """
+    Função de CLI para cadastrar a equipe de uma vez a partir de um
+    arquivo. As senhas são "hasheadas" em paralelo ('workers' processos)
+    e os usuários gravados em lotes; o relatório mostra cada linha.
+    """
+    from pydantic import ValidationError
+    from adapters.services import BcryptPasswordHasher
+    from adapters.web.schemas import UserCreateSchema
+    from domain.models import UserImportResult
+
+    print(f"--- Importar Equipe ({path}) ---")
+
+    try:
+        rows = read_roster(path)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"\n❌ Não foi possível ler o arquivo: {e}")
+        sys.exit(1)
+
+    # 1. Valida cada linha com o mesmo schema do POST /admin/users
+    results, valid_rows = [], []
+    for line, user_data in rows:
+        try:
+            user = UserCreateSchema.model_validate(user_data)
+            valid_rows.append((line, user.model_dump(mode="json")))
+        except ValidationError as e:
+            errors = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+            )
+            results.append(UserImportResult(line=line, username=str(user_data.get("username", "")), error=errors))
+
+    # 2. Hasher com um processo por núcleo, só para esta carga
+    container.password_hasher = BcryptPasswordHasher(workers=workers)
+
+    started = time.perf_counter()
+    try:
+        results += container.import_users_uc.execute(valid_rows, batch_size=batch_size)
+    except Exception as e:
+        print(f"\n❌ Erro Inesperado: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    # 3. Relatório, na ordem do arquivo
+    for result in sorted(results, key=lambda result: result.line):
+        status = f"✅ criado (ID: {result.user_id})" if result.created else f"❌ {result.error}"
+        print(f"  linha {result.line:>4}  {result.username:<20} {status}")
+
+    created = sum(1 for result in results if result.created)
+    print(f"\n{created} usuários criados, {len(results) - created} linhas recusadas ({elapsed:.1f}s).")
+    if created < len(results):
+        sys.exit(1)
+
+
+def export_menu(fmt: str, output: str):
+    """
+    Função de CLI para exportar o cardápio inteiro (CSV ou NDJSON). As
+    linhas são gravadas à medida que as páginas chegam do banco.
+    Sem '--output', o arquivo vai para a saída padrão.
+    """
+    from adapters.web.catalog_io import CatalogWriter
+
+    started = time.perf_counter()
+    exported = 0
+    try:
+        destination = open(output, "w", newline="", encoding="utf-8") if output else sys.stdout
+        try:
+            writer = CatalogWriter(fmt)
+            destination.write(writer.header())
+            for product in container.export_products_uc.execute():
+                destination.write(writer.row(product))
+                exported += 1
+        finally:
+            if output:
+                destination.close()
+    except Exception as e:
+        print(f"\n❌ Erro Inesperado: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # As mensagens vão para stderr, para não se misturarem ao arquivo na saída padrão
+    print(f"✅ {exported} produtos exportados ({time.perf_counter() - started:.1f}s).", file=sys.stderr)
+
+
+def import_menu(path: str, fmt: str, batch_size: int):
+    """
+    Função de CLI para importar um cardápio (CSV ou NDJSON) lendo o
+    arquivo linha a linha: produtos iguais aos do banco são ignorados,
+    novos e alterados são gravados em lotes.
+    """
+    from adapters.web.catalog_io import catalog_format, read_catalog, text_lines
+    from domain.models.product_import import MAX_REPORTED_ERRORS
+
+    print(f"--- Importar Cardápio ({path}) ---")
+
+    started = time.perf_counter()
+    try:
+        fmt = catalog_format(fmt, path)
+        with open(path, "rb") as catalog:
+            summary = container.import_products_uc.execute(
+                read_catalog(text_lines(catalog), fmt), batch_size=batch_size
+            )
+    except (OSError, ValueError) as e:
+        print(f"\n❌ Não foi possível ler o arquivo: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Erro Inesperado: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    for row in summary.errors:
+        print(f"  linha {row.line:>6}  ❌ {row.error}")
+    if summary.rejected > len(summary.errors):
+        print(f"  ... (só as primeiras {MAX_REPORTED_ERRORS} recusas são listadas)")
+
+    print(
+        f"\n{summary.inserted} inseridos, {summary.updated} atualizados, "
+        f"{summary.unchanged} sem mudança, {summary.rejected} recusados ({elapsed:.1f}s)."
+    )
+    if summary.rejected:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tarefas de administração do Mandaladaka.")
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser("create-admin", help="Cria um usuário administrador (padrão)")
+
+    archive = commands.add_parser("archive-orders", help="Move o histórico antigo para o arquivo")
+    archive.add_argument("--batch-size", type=int, default=500, help="Pedidos por transação")
+    archive.add_argument("--pause", type=float, default=0.05, help="Pausa entre lotes (segundos)")
+
+    staff = commands.add_parser("import-staff", help="Cadastra a equipe a partir de um CSV/JSON")
+    staff.add_argument("path", help="Arquivo .csv (username,name,password,roles) ou .json")
+    staff.add_argument("--batch-size", type=int, default=50, help="Usuários por transação")
+    staff.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processos de hash (0 = sem pool)")
+
+    export = commands.add_parser("export-menu", help="Exporta o cardápio (CSV/NDJSON)")
+    export.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    export.add_argument("--output", help="Arquivo de saída (padrão: saída padrão)")
+
+    menu = commands.add_parser("import-menu", help="Importa o cardápio de um CSV/NDJSON")
+    menu.add_argument("path", help="Arquivo .csv ou .ndjson (mesmas colunas do export-menu)")
+    menu.add_argument("--format", choices=["csv", "ndjson"], help="Padrão: pela extensão do arquivo")
+    menu.add_argument("--batch-size", type=int, default=500, help="Produtos por transação")
+
+    args = parser.parse_args()
+    if args.command == "archive-orders":
+        archive_orders(args.batch_size, args.pause)
+    elif args.command == "import-staff":
+        import_staff(args.path, args.batch_size, args.workers)
+    elif args.command == "export-menu":
+        export_menu(args.format, args.output)
+    elif args.command == "import-menu":
+        import_menu(args.path, args.format, args.batch_size)
+    else:
+        create_admin_user()
+
+
 if __name__ == "__main__":
-    create_admin_user()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,4 +1,25 @@
 from adapters.db.product_repository import MySQLProductRepository
 from adapters.db.user_repository import MySQLUserRepository
 from adapters.db.order_repository import MySQLOrderRepository
-from adapters.db.table_repository import MySQLTableRepository
\ No newline at end of file
+from adapters.db.table_repository import MySQLTableRepository
+from adapters.db.cached_product_repository import CachedProductRepository
+from adapters.db.cached_user_repository import CachedUserRepository
+from adapters.db.connection_pool import ConnectionPool, PoolExhaustedError
+from adapters.db.versioned_table_repository import VersionedTableRepository
+from adapters.db.version_counter import VersionCounter, SharedVersionCounter
+from adapters.db.read_routing import ReadRouter, read_router
+from adapters.db.order_archive import OrderArchiver
+from adapters.db.sales_report_repository import MySQLSalesReportRepository
+
+# Versões assíncronas (app ASGI)
+from adapters.db.async_product_repository import AsyncMySQLProductRepository
+from adapters.db.async_user_repository import AsyncMySQLUserRepository
+from adapters.db.async_order_repository import AsyncMySQLOrderRepository
+from adapters.db.async_table_repository import AsyncMySQLTableRepository
+from adapters.db.cached_product_repository import AsyncCachedProductRepository
+from adapters.db.cached_user_repository import AsyncCachedUserRepository
+from adapters.db.versioned_table_repository import AsyncVersionedTableRepository
+from adapters.db.version_counter import AsyncSharedVersionCounter
+from adapters.db.async_connection_pool import AsyncConnectionPool
+from adapters.db.read_routing import AsyncReadRouter
+from adapters.db.async_sales_report_repository import AsyncMySQLSalesReportRepository
@@ -0,0 +1,331 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import mysql.connector.aio
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+
+# Mesma configuração (e os mesmos limites) do pool síncrono
+from .db_config import db_config, pool_config
+from .connection_pool import PoolExhaustedError, is_prepared
+
+# Medições do request atual (tempo de SQL e de espera por conexão)
+from .. import request_stats
+
+
+class AsyncTimedCursor:
+    """Versão assíncrona do TimedCursor (soma SQL e leitura ao request atual)."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._cursor.close()
+
+    async def _timed(self, method, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            request_stats.record_sql(time.perf_counter() - start)
+
+    async def execute(self, *args, **kwargs):
+        return await self._timed(self._cursor.execute, *args, **kwargs)
+
+    async def executemany(self, *args, **kwargs):
+        return await self._timed(self._cursor.executemany, *args, **kwargs)
+
+    async def fetchone(self):
+        with request_stats.timed("db"):
+            return await self._cursor.fetchone()
+
+    async def fetchall(self):
+        with request_stats.timed("db"):
+            return await self._cursor.fetchall()
+
+
+class AsyncPooledCursor(AsyncTimedCursor):
+    """Versão assíncrona do PooledCursor (prepared statements por conexão)."""
+
+    def __init__(self, cursor, connection, statements: Dict[Tuple[str, bool], Tuple[str, Any]], dictionary: bool):
+        super().__init__(cursor)
+        self._text_cursor = cursor
+        self._connection = connection
+        self._statements = statements
+        self._dictionary = dictionary
+        self._rows: Optional[deque] = None
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._text_cursor.close()
+
+    async def execute(self, operation, params=()):
+        if not is_prepared(operation):
+            self._cursor, self._rows = self._text_cursor, None
+            return await super().execute(operation, params)
+
+        key = (operation, self._dictionary)
+        if key not in self._statements:
+            self._statements[key] = (
+                operation, await self._connection.cursor(prepared=True, dictionary=self._dictionary)
+            )
+        operation, self._cursor = self._statements[key]
+
+        await super().execute(operation, params)
+        self._rows = deque(await super().fetchall() if self._cursor.with_rows else ())
+
+    async def executemany(self, *args, **kwargs):
+        self._cursor, self._rows = self._text_cursor, None
+        return await super().executemany(*args, **kwargs)
+
+    async def fetchone(self):
+        if self._rows is None:
+            return await super().fetchone()
+        return self._rows.popleft() if self._rows else None
+
+    async def fetchall(self):
+        if self._rows is None:
+            return await super().fetchall()
+        rows, self._rows = list(self._rows), deque()
+        return rows
+
+
+class AsyncPooledConnection:
+    """
+    Conexão emprestada do AsyncConnectionPool (ver PooledConnection).
+
+    Uso:
+        async with await pool.get_connection() as connection:
+            async with await connection.cursor(dictionary=True) as cursor:
+                ...
+    """
+
+    def __init__(self, pool: 'AsyncConnectionPool', connection):
+        self._pool = pool
+        self._connection = connection
+
+    def _real(self):
+        if self._connection is None:
+            raise PoolError("A conexão já foi devolvida ao pool.")
+        return self._connection
+
+    def __getattr__(self, name):
+        return getattr(self._real(), name)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def cursor(self, *args, **kwargs) -> AsyncTimedCursor:
+        connection = self._real()
+        cursor = await connection.cursor(*args, **kwargs)
+        if not self._pool.prepared_statements or args or set(kwargs) - {"dictionary"}:
+            return AsyncTimedCursor(cursor)
+        return AsyncPooledCursor(
+            cursor, connection, self._pool._statements_for(connection), bool(kwargs.get("dictionary"))
+        )
+
+    async def commit(self):
+        """Confirma a transação e avisa os 'commit_listeners' do pool."""
+        await self._real().commit()
+        for listener in self._pool.commit_listeners:
+            listener()
+
+    async def close(self):
+        """Devolve a conexão ao pool (só na primeira chamada)."""
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await self._pool._release(connection)
+
+
+class AsyncConnectionPool:
+    """
+    Versão asyncio do ConnectionPool, usada pelos repositórios do app ASGI.
+
+    Mesmo comportamento (criação preguiçosa, overflow, espera limitada por
+    'checkout_timeout', ping em conexões ociosas, stats() para o /metrics),
+    mas quem espera por uma conexão libera o event loop em vez de bloquear
+    uma thread. Usa as conexões de 'mysql.connector.aio'. Os prepared
+    statements também são mantidos por conexão (ver AsyncPooledCursor).
+
+    NOTA: O pool pertence ao event loop em que foi usado pela primeira vez
+    (um por processo ASGI).
+    """
+
+    def __init__(
+        self,
+        config: dict,
+        pool_size: int = 5,
+        max_overflow: int = 5,
+        checkout_timeout: float = 10.0,
+        health_check_seconds: float = 30.0,
+        prepared_statements: bool = True,
+        connection_factory: Optional[Callable[..., Awaitable]] = None
+    ):
+        """
+        Args:
+            (os mesmos do ConnectionPool)
+            connection_factory: Corrotina que abre uma conexão real
+                                (padrão: mysql.connector.aio.connect).
+        """
+        self.config = config
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.checkout_timeout = checkout_timeout
+        self.health_check_seconds = health_check_seconds
+        self.prepared_statements = prepared_statements
+        self._connect = connection_factory or mysql.connector.aio.connect
+
+        self._condition = asyncio.Condition()
+        self._idle: deque = deque() # (conexão, devolvida_em), usada como pilha (LIFO)
+        self._open = 0
+        self._in_use = 0
+        self._statements: Dict[Any, dict] = {} # Prepared statements de cada conexão aberta
+
+        # Contadores (expostos em /metrics)
+        self.checkouts = 0
+        self.exhausted = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.health_check_failures = 0
+
+        # Funções chamadas após cada commit (ex: ReadRouter.note_write)
+        self.commit_listeners: List[Callable[[], None]] = []
+
+    # --- Empréstimo e Devolução ---
+
+    async def get_connection(self) -> AsyncPooledConnection:
+        """
+        Empresta uma conexão. Use com 'async with' para devolvê-la ao final.
+
+        Raises:
+            PoolExhaustedError: Se nenhuma conexão ficar livre a tempo.
+            mysql.connector.Error: Se não for possível abrir uma conexão.
+        """
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+        idle_connection = None
+
+        # 1. Reserva uma conexão livre ou uma "vaga" para abrir outra
+        async with self._condition:
+            while True:
+                if self._idle:
+                    idle_connection = self._idle.pop()
+                    break
+                if self._open < self.pool_size + self.max_overflow:
+                    self._open += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.exhausted += 1
+                    raise PoolExhaustedError(
+                        f"Nenhuma conexão livre após {self.checkout_timeout}s "
+                        f"({self._open} em uso)."
+                    )
+                try:
+                    await asyncio.wait_for(self._condition.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass # Volta ao laço e falha acima (ou pega uma vaga de última hora)
+
+            self._in_use += 1
+            self.checkouts += 1
+            waited = time.monotonic() - start
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+
+        # 2. Abre ou valida a conexão (fora do lock)
+        try:
+            if idle_connection is None:
+                connection = await self._connect(**self.config)
+            else:
+                connection = await self._checked(*idle_connection)
+        except BaseException:
+            await self._discard()
+            raise
+
+        request_stats.record("pool", time.monotonic() - start)
+        return AsyncPooledConnection(self, connection)
+
+    async def _checked(self, connection, released_at: float):
+        """Garante que uma conexão ociosa ainda está viva (ou abre outra)."""
+        if time.monotonic() - released_at < self.health_check_seconds:
+            return connection
+        try:
+            await connection.ping(reconnect=False)
+            return connection
+        except Error:
+            self.health_check_failures += 1
+            await self._close_quietly(connection)
+            return await self._connect(**self.config)
+
+    async def _release(self, connection):
+        """Recebe uma conexão de volta (chamado por AsyncPooledConnection.close)."""
+        try:
+            if connection.in_transaction:
+                await connection.rollback()
+        except Error:
+            await self._close_quietly(connection)
+            await self._discard()
+            return
+
+        async with self._condition:
+            self._in_use -= 1
+            if self._open > self.pool_size:
+                self._open -= 1
+                self._condition.notify()
+            else:
+                self._idle.append((connection, time.monotonic()))
+                self._condition.notify()
+                return
+        await self._close_quietly(connection)
+
+    async def _discard(self):
+        """Libera a vaga de uma conexão que não pôde ser usada."""
+        async with self._condition:
+            self._in_use -= 1
+            self._open -= 1
+            self._condition.notify()
+
+    def _statements_for(self, connection) -> dict:
+        """O registro de prepared statements de uma conexão (criado no 1º uso)."""
+        return self._statements.setdefault(connection, {})
+
+    async def _close_quietly(self, connection):
+        self._statements.pop(connection, None)
+        try:
+            await connection.close()
+        except Error:
+            pass
+
+    # --- Observabilidade ---
+
+    def stats(self) -> dict:
+        """Retorna os contadores do pool (mesmas chaves do ConnectionPool)."""
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "open": self._open,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "checkouts": self.checkouts,
+            "exhausted": self.exhausted,
+            "health_check_failures": self.health_check_failures,
+            "prepared_statements": sum(len(statements) for statements in self._statements.values()),
+            "wait_time_total_ms": round(self.wait_time_total * 1000, 2),
+            "wait_time_max_ms": round(self.wait_time_max * 1000, 2),
+        }
+
+
+def create_async_connection_pool() -> AsyncConnectionPool:
+    """Cria o pool do app ASGI com a configuração do .env (DB_*, DB_POOL_*)."""
+    return AsyncConnectionPool(db_config, **pool_config)
@@ -0,0 +1,195 @@
+from mysql.connector import Error
+from typing import Dict, List, Optional
+
+# Importa a PORTA (Interface) assíncrona
+from domain.ports.async_order_repository import AsyncOrderRepositoryPort
+
+# Importa os MODELOS de domínio
+from domain.models import Order, OrderStatus, OrderHistoryFilter, OrderHistoryCursor, OrderHistoryPage
+from domain.exceptions import ConcurrencyConflictException
+
+# Reaproveita as consultas e o mapeamento da versão síncrona
+from .order_repository import (
+    MySQLOrderRepository,
+    QUERY_ORDER_BY_ID,
+    QUERY_ORDERS_BY_STATUS,
+    QUERY_ITEMS_BY_ORDER,
+    QUERY_ITEMS_BY_ORDERS,
+    order_write_steps,
+    history_query,
+    history_items_query,
+    history_page
+)
+from .sql_steps import run_steps_async
+from .async_connection_pool import AsyncConnectionPool
+from .read_routing import AsyncReadRouter
+
+
+class AsyncMySQLOrderRepository(AsyncOrderRepositoryPort):
+    """
+    Implementação CONCRETA da AsyncOrderRepositoryPort (mysql.connector.aio).
+    Mesmo SQL e mesma gravação incremental de itens do MySQLOrderRepository.
+    """
+
+    def __init__(self, pool: AsyncConnectionPool, read_pool: Optional[AsyncReadRouter] = None):
+        self.pool = pool                   # Escritas (primário)
+        self.read_pool = read_pool or pool # Leituras (primário ou réplica)
+
+    # --- Funções de Mapeamento (as mesmas da versão síncrona) ---
+    _row_to_order_base = MySQLOrderRepository._row_to_order_base
+    _row_to_item_with_product = MySQLOrderRepository._row_to_item_with_product
+    _attach_items = MySQLOrderRepository._attach_items
+
+    # --- Implementação dos Métodos da Porta (Leitura) ---
+
+    async def find_by_id(self, order_id: int) -> Optional[Order]:
+        try:
+            async with await self.read_pool.get_connection() as connection:
+                async with await connection.cursor(dictionary=True) as cursor:
+
+                    # 1. Busca o Pedido (Order) principal
+                    await cursor.execute(QUERY_ORDER_BY_ID, (order_id,))
+                    order_row = await cursor.fetchone()
+                    if not order_row:
+                        return None
+
+                    # 2. Busca os Itens + Produtos e os aninha no Pedido
+                    order = self._row_to_order_base(order_row)
+                    await cursor.execute(QUERY_ITEMS_BY_ORDER, (order_id,))
+                    item_rows = await cursor.fetchall()
+                    return self._attach_items({order.id: order}, item_rows)[0]
+
+        except Error as e:
+            print(f"Erro ao buscar pedido por ID {order_id}: {e}")
+            return None
+
+    async def find_by_status(self, status: OrderStatus) -> List[Order]:
+        orders_map: Dict[int, Order] = {}
+
+        try:
+            # Lê do PRIMÁRIO (ver MySQLOrderRepository.find_by_status)
+            async with await self.pool.get_connection() as connection:
+                async with await connection.cursor(dictionary=True) as cursor:
+
+                    # 1. Busca todos os Pedidos (base) com o status
+                    await cursor.execute(QUERY_ORDERS_BY_STATUS, (status.value,))
+                    for row in await cursor.fetchall():
+                        order = self._row_to_order_base(row)
+                        orders_map[order.id] = order
+
+                    if not orders_map:
+                        return []
+
+                    # 2. Busca TODOS os itens de uma só vez e os "costura"
+                    order_ids = tuple(orders_map.keys())
+                    placeholders = ','.join(['%s'] * len(order_ids))
+                    await cursor.execute(QUERY_ITEMS_BY_ORDERS.format(placeholders=placeholders), order_ids)
+                    return self._attach_items(orders_map, await cursor.fetchall())
+
+        except Error as e:
+            print(f"Erro ao buscar pedidos por status {status.value}: {e}")
+            return []
+
+    async def find_history(
+        self,
+        filters: OrderHistoryFilter,
+        after: Optional[OrderHistoryCursor] = None,
+        limit: int = 50
+    ) -> OrderHistoryPage:
+        """Uma página do histórico em duas consultas (ver MySQLOrderRepository.find_history)."""
+        query, params = history_query(filters, after, limit)
+        try:
+            async with await self.read_pool.get_connection() as connection:
+                async with await connection.cursor(dictionary=True) as cursor:
+                    await cursor.execute(query, params)
+                    order_rows = await cursor.fetchall()
+                    orders_map = {
+                        row['id']: self._row_to_order_base(row) for row in order_rows[:limit]
+                    }
+                    if not orders_map:
+                        return OrderHistoryPage(orders=[])
+
+                    await cursor.execute(*history_items_query(orders_map))
+                    orders = self._attach_items(orders_map, await cursor.fetchall())
+
+        except Error as e:
+            print(f"Erro ao buscar o histórico de pedidos: {e}")
+            raise e
+
+        return history_page(orders, has_more=len(order_rows) > limit)
+
+    # --- Implementação dos Métodos da Porta (Escrita) ---
+
+    async def save(self, order: Order) -> Order:
+        """
+        Salva o agregado (Order + ItemOrders alterados) em uma TRANSAÇÃO.
+        ConcurrencyConflictException se o pedido mudou desde a carga.
+        """
+        is_new = order.id == 0
+        try:
+            async with await self.pool.get_connection() as connection:
+                await connection.start_transaction()
+
+                try:
+                    async with await connection.cursor() as cursor:
+                        # --- Passos 1 e 2: Pedido e ItemOrders alterados ---
+                        bumped = await self._write_order(cursor, order)
+
+                    # --- Passo 3: Finalizar a Transação ---
+                    await connection.commit()
+                    if bumped:
+                        order.version += 1
+                    order.mark_as_persisted()
+                    return order
+
+                except ConcurrencyConflictException:
+                    await connection.rollback()
+                    if is_new:
+                        order.id = 0
+                    raise
+
+                except Error as e:
+                    print(f"Erro durante a transação do pedido {order.id}. (ROLLBACK)")
+                    await connection.rollback()
+                    raise e
+
+        except Error as e:
+            print(f"Erro ao obter conexão para salvar pedido: {e}")
+            raise e
+
+    async def save_all(self, orders: List[Order]) -> List[Order]:
+        """Salva vários pedidos em UMA transação (ver MySQLOrderRepository.save_all)."""
+        if not orders:
+            return []
+
+        new_orders = [order for order in orders if order.id == 0]
+        try:
+            async with await self.pool.get_connection() as connection:
+                await connection.start_transaction()
+
+                try:
+                    async with await connection.cursor() as cursor:
+                        bumped = [order for order in orders if await self._write_order(cursor, order)]
+                    await connection.commit()
+
+                except (Error, ConcurrencyConflictException) as e:
+                    if isinstance(e, Error):
+                        print(f"Erro durante a transação de {len(orders)} pedidos. (ROLLBACK)")
+                    await connection.rollback()
+                    for order in new_orders:
+                        order.id = 0
+                    raise e
+
+        except Error as e:
+            print(f"Erro ao obter conexão para salvar pedidos: {e}")
+            raise e
+
+        for order in bumped:
+            order.version += 1
+        for order in orders:
+            order.mark_as_persisted()
+        return orders
+
+    async def _write_order(self, cursor, order: Order) -> bool:
+        """Grava UM pedido (sem commit), com os passos do order_write_steps."""
+        return await run_steps_async(cursor, order_write_steps(order))
@@ -0,0 +1,154 @@
+from mysql.connector import Error
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+# Importa a PORTA (Interface) assíncrona
+from domain.ports.async_product_repository import AsyncProductRepositoryPort
+
+# Importa o MODELO de domínio
+from domain.models import Product
+
+# Reaproveita as consultas e o mapeamento da versão síncrona
+from .product_repository import (
+    MySQLProductRepository,
+    QUERY_VISIBLE_PRODUCTS,
+    QUERY_PRODUCT_BY_ID,
+    QUERY_PRODUCTS_BY_IDS,
+    QUERY_ALL_PRODUCTS,
+    INSERT_PRODUCT,
+    UPDATE_PRODUCT,
+    QUERY_PRODUCTS_PAGE,
+    QUERY_PRODUCTS_BY_IDS_FOR_UPDATE,
+    UPSERT_PRODUCT,
+    DEFAULT_EXPORT_BATCH_SIZE,
+    diff_products,
+    upsert_params
+)
+from .version_counter import BUMP_DATASET_VERSION, MENU_DATASET
+from .async_connection_pool import AsyncConnectionPool
+from .read_routing import AsyncReadRouter
+
+
+class AsyncMySQLProductRepository(AsyncProductRepositoryPort):
+    """Implementação CONCRETA da AsyncProductRepositoryPort (mysql.connector.aio)."""
+
+    def __init__(self, pool: AsyncConnectionPool, read_pool: Optional[AsyncReadRouter] = None):
+        self.pool = pool                   # Escritas (primário)
+        self.read_pool = read_pool or pool # Leituras (primário ou réplica)
+
+    # Mesmo mapeamento (linha -> Product) da versão síncrona
+    _row_to_product = MySQLProductRepository._row_to_product
+
+    async def _fetch_all(self, query: str, params=()) -> List[Product]:
+        async with await self.read_pool.get_connection() as connection:
+            async with await connection.cursor(dictionary=True) as cursor:
+                await cursor.execute(query, params)
+                return [self._row_to_product(row) for row in await cursor.fetchall()]
+
+    # --- Implementação dos Métodos da Porta ---
+
+    async def get_visible_products(self) -> List[Product]:
+        try:
+            return await self._fetch_all(QUERY_VISIBLE_PRODUCTS)
+        except Error as e:
+            print(f"Erro ao buscar produtos visíveis: {e}")
+            return []
+
+    async def find_by_id(self, product_id: int) -> Optional[Product]:
+        try:
+            products = await self._fetch_all(QUERY_PRODUCT_BY_ID, (product_id,))
+            return products[0] if products else None
+        except Error as e:
+            print(f"Erro ao buscar produto por ID {product_id}: {e}")
+            return None
+
+    async def find_by_ids(self, product_ids: List[int]) -> Dict[int, Product]:
+        unique_ids = tuple(dict.fromkeys(product_ids))
+        if not unique_ids:
+            return {}
+
+        placeholders = ','.join(['%s'] * len(unique_ids))
+        try:
+            products = await self._fetch_all(QUERY_PRODUCTS_BY_IDS.format(placeholders=placeholders), unique_ids)
+            return {product.id: product for product in products}
+        except Error as e:
+            print(f"Erro ao buscar produtos por IDs {unique_ids}: {e}")
+            return {}
+
+    async def get_all(self) -> List[Product]:
+        try:
+            return await self._fetch_all(QUERY_ALL_PRODUCTS)
+        except Error as e:
+            print(f"Erro ao buscar todos os produtos: {e}")
+            return []
+
+    async def save(self, product: Product) -> Product:
+        params = (
+            product.name, product.price, product.availability,
+            product.category, product.imageUrl, product.visibility
+        )
+        query = INSERT_PRODUCT if product.id == 0 else UPDATE_PRODUCT
+        if product.id != 0:
+            params += (product.id,)
+
+        try:
+            async with await self.pool.get_connection() as connection:
+                async with await connection.cursor() as cursor:
+                    await cursor.execute(query, params)
+                    if product.id == 0:
+                        product.id = cursor.lastrowid
+                    await cursor.execute(BUMP_DATASET_VERSION, (MENU_DATASET,))
+                    await connection.commit()
+                    return product
+        except Error as e:
+            print(f"Erro ao salvar produto: {e}")
+            raise e
+
+    async def iter_all(self, batch_size: int = DEFAULT_EXPORT_BATCH_SIZE) -> AsyncIterator[Product]:
+        last_id = 0
+        while True:
+            try:
+                products = await self._fetch_all(QUERY_PRODUCTS_PAGE, (last_id, batch_size))
+            except Error as e:
+                print(f"Erro ao exportar produtos após o ID {last_id}: {e}")
+                raise e
+
+            for product in products:
+                yield product
+
+            if len(products) < batch_size:
+                return
+            last_id = products[-1].id
+
+    async def upsert_batch(self, products: List[Product]) -> Tuple[int, int, int]:
+        ids = tuple(dict.fromkeys(product.id for product in products if product.id))
+
+        try:
+            async with await self.pool.get_connection() as connection:
+                await connection.start_transaction()
+
+                try:
+                    async with await connection.cursor(dictionary=True) as cursor:
+                        # 1. Linhas atuais (só as do lote)
+                        current: Dict[int, Product] = {}
+                        if ids:
+                            placeholders = ','.join(['%s'] * len(ids))
+                            await cursor.execute(QUERY_PRODUCTS_BY_IDS_FOR_UPDATE.format(placeholders=placeholders), ids)
+                            current = {row['id']: self._row_to_product(row) for row in await cursor.fetchall()}
+
+                        # 2. Só o que é novo ou mudou
+                        changed, inserted, updated, unchanged = diff_products(products, current)
+                        if changed:
+                            await cursor.executemany(UPSERT_PRODUCT, [upsert_params(product) for product in changed])
+                            await cursor.execute(BUMP_DATASET_VERSION, (MENU_DATASET,))
+
+                    await connection.commit()
+                    return inserted, updated, unchanged
+
+                except Error as e:
+                    print(f"Erro ao gravar lote de {len(products)} produtos. (ROLLBACK)")
+                    await connection.rollback()
+                    raise e
+
+        except Error as e:
+            print(f"Erro ao obter conexão para gravar produtos: {e}")
+            raise e
@@ -0,0 +1,35 @@
+from mysql.connector import Error
+from typing import List, Optional
+from datetime import date
+
+# Importa a PORTA (Interface) assíncrona
+from domain.ports.async_sales_report_repository import AsyncSalesReportRepositoryPort
+
+# Importa os MODELOS de domínio
+from domain.models import SalesDimension, SalesReportLine
+
+# Reaproveita as consultas e o mapeamento da versão síncrona
+from .sales_report_repository import SALES_QUERIES, row_to_sales_line
+from .async_connection_pool import AsyncConnectionPool
+from .read_routing import AsyncReadRouter
+
+
+class AsyncMySQLSalesReportRepository(AsyncSalesReportRepositoryPort):
+    """
+    Implementação CONCRETA da AsyncSalesReportRepositoryPort (mysql.connector.aio).
+    Mesmo SQL do MySQLSalesReportRepository.
+    """
+
+    def __init__(self, pool: AsyncConnectionPool, read_pool: Optional[AsyncReadRouter] = None):
+        self.read_pool = read_pool or pool # Leituras (primário ou réplica)
+
+    async def find_sales(self, dimension: SalesDimension, date_from: date, date_to: date) -> List[SalesReportLine]:
+        try:
+            async with await self.read_pool.get_connection() as connection:
+                async with await connection.cursor(dictionary=True) as cursor:
+                    await cursor.execute(SALES_QUERIES[dimension], (date_from, date_to))
+                    return [row_to_sales_line(row) for row in await cursor.fetchall()]
+
+        except Error as e:
+            print(f"Erro ao buscar o relatório de vendas por {dimension.value}: {e}")
+            raise e
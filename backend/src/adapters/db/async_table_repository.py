@@ -0,0 +1,100 @@
+from mysql.connector import Error
+from typing import List, Optional
+
+# Importa a PORTA (Interface) assíncrona
+from domain.ports.async_table_repository import AsyncTableRepositoryPort
+
+# Importa os MODELOS de domínio
+from domain.models import Table
+from domain.exceptions import ConcurrencyConflictException
+
+# Reaproveita as consultas e o mapeamento da versão síncrona
+from .table_repository import (
+    MySQLTableRepository,
+    QUERY_TABLE_DETAILS,
+    QUERY_ALL_TABLES,
+    table_save_steps
+)
+from .sql_steps import run_steps_async
+from .async_connection_pool import AsyncConnectionPool
+from .read_routing import AsyncReadRouter
+
+
+class AsyncMySQLTableRepository(AsyncTableRepositoryPort):
+    """
+    Implementação CONCRETA da AsyncTableRepositoryPort (mysql.connector.aio).
+    Mesmo SQL e mesmas regras de sessão do MySQLTableRepository.
+    """
+
+    def __init__(self, pool: AsyncConnectionPool, read_pool: Optional[AsyncReadRouter] = None):
+        self.pool = pool                   # Escritas (primário)
+        self.read_pool = read_pool or pool # Leituras (primário ou réplica)
+
+    # --- Funções de Mapeamento (as mesmas da versão síncrona) ---
+    _row_to_table = MySQLTableRepository._row_to_table
+    _row_to_order_base = MySQLTableRepository._row_to_order_base
+    _row_to_item_with_product = MySQLTableRepository._row_to_item_with_product
+    _rows_to_table_details = MySQLTableRepository._rows_to_table_details
+
+    # --- Implementação dos Métodos da Porta (Leitura) ---
+
+    async def find_by_id(self, table_id: int) -> Optional[Table]:
+        """Busca uma mesa com os pedidos e itens da SESSÃO ATUAL (uma consulta)."""
+        try:
+            async with await self.read_pool.get_connection() as connection:
+                async with await connection.cursor(dictionary=True) as cursor:
+                    await cursor.execute(QUERY_TABLE_DETAILS, (table_id,))
+                    rows = await cursor.fetchall()
+                    if not rows:
+                        return None # Mesa não encontrada
+                    return self._rows_to_table_details(rows)
+
+        except Error as e:
+            print(f"Erro ao buscar mesa por ID {table_id}: {e}")
+            return None
+
+    async def get_all_tables(self) -> List[Table]:
+        try:
+            async with await self.read_pool.get_connection() as connection:
+                async with await connection.cursor(dictionary=True) as cursor:
+                    await cursor.execute(QUERY_ALL_TABLES)
+                    return [self._row_to_table(row) for row in await cursor.fetchall()]
+
+        except Error as e:
+            print(f"Erro ao buscar todas as mesas: {e}")
+            return []
+
+    # --- Implementação dos Métodos da Porta (Escrita) ---
+
+    async def save(self, table: Table) -> Table:
+        """
+        Salva a mesa, abrindo/encerrando (e arquivando) sua sessão, em uma TRANSAÇÃO.
+        ConcurrencyConflictException se a mesa mudou desde a carga.
+        """
+        loaded_session_id = table.session_id
+        try:
+            async with await self.pool.get_connection() as connection:
+                await connection.start_transaction()
+
+                try:
+                    async with await connection.cursor() as cursor:
+                        # Sessão, mesa e versão da lista (ver table_save_steps)
+                        await run_steps_async(cursor, table_save_steps(table))
+
+                    await connection.commit()
+                    table.version += 1
+                    return table
+
+                except ConcurrencyConflictException:
+                    await connection.rollback()
+                    table.session_id = loaded_session_id
+                    raise
+
+                except Error as e:
+                    print(f"Erro durante a transação da mesa {table.id}. (ROLLBACK)")
+                    await connection.rollback()
+                    raise e
+
+        except Error as e:
+            print(f"Erro ao salvar mesa: {e}")
+            raise e
@@ -0,0 +1,73 @@
+import json
+from mysql.connector import Error
+from typing import Optional
+
+# Importa a PORTA (Interface) assíncrona
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
+
+# Importa o MODELO de domínio
+from domain.models import User
+
+# Reaproveita as consultas e o mapeamento da versão síncrona
+from .user_repository import (
+    MySQLUserRepository,
+    QUERY_USER_BY_ID,
+    QUERY_USER_BY_USERNAME,
+    INSERT_USER,
+    UPDATE_USER
+)
+from .async_connection_pool import AsyncConnectionPool
+from .read_routing import AsyncReadRouter
+
+
+class AsyncMySQLUserRepository(AsyncUserRepositoryPort):
+    """Implementação CONCRETA da AsyncUserRepositoryPort (mysql.connector.aio)."""
+
+    def __init__(self, pool: AsyncConnectionPool, read_pool: Optional[AsyncReadRouter] = None):
+        self.pool = pool                   # Escritas (primário)
+        self.read_pool = read_pool or pool # Leituras (primário ou réplica)
+
+    # Mesmo mapeamento (linha -> User) da versão síncrona
+    _row_to_user = MySQLUserRepository._row_to_user
+
+    async def _fetch_one(self, query: str, params) -> Optional[User]:
+        async with await self.read_pool.get_connection() as connection:
+            async with await connection.cursor(dictionary=True) as cursor:
+                await cursor.execute(query, params)
+                row = await cursor.fetchone()
+                return self._row_to_user(row) if row else None
+
+    # --- Implementação dos Métodos da Porta ---
+
+    async def find_by_id(self, user_id: int) -> Optional[User]:
+        try:
+            return await self._fetch_one(QUERY_USER_BY_ID, (user_id,))
+        except Error as e:
+            print(f"Erro ao buscar usuário por ID {user_id}: {e}")
+            return None
+
+    async def find_by_username(self, username: str) -> Optional[User]:
+        try:
+            return await self._fetch_one(QUERY_USER_BY_USERNAME, (username,))
+        except Error as e:
+            print(f"Erro ao buscar usuário por username {username}: {e}")
+            return None
+
+    async def save(self, user: User) -> User:
+        roles_json = json.dumps([role.value for role in user.roles])
+        params = (user.username, user.name, user.hashed_password, roles_json)
+        query = INSERT_USER if user.id == 0 else UPDATE_USER
+        if user.id != 0:
+            params += (user.id,)
+
+        try:
+            async with await self.pool.get_connection() as connection:
+                async with await connection.cursor() as cursor:
+                    await cursor.execute(query, params)
+                    await connection.commit()
+                    if user.id == 0:
+                        user.id = cursor.lastrowid
+                    return user
+        except Error as e:
+            print(f"Erro ao salvar usuário (pode ser username duplicado): {e}")
+            raise e
@@ -0,0 +1,292 @@
+import asyncio
+import copy
+import threading
+import time
+from typing import AsyncIterator, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Importa a PORTA (Interface) que esta classe implementa
+from domain.ports.product_repository import ProductRepositoryPort
+from domain.ports.async_product_repository import AsyncProductRepositoryPort
+
+# Importa o MODELO de domínio
+from domain.models import Product
+
+from .version_counter import VersionCounter, AsyncVersionCounter
+from .read_routing import primary_reads
+
+
+class _MenuSnapshot(NamedTuple):
+    """Foto imutável do cardápio, montada a partir de um único get_all()."""
+    all: List[Product]
+    visible: List[Product]
+    by_id: Dict[int, Product]
+    loaded_at: float
+    version: str # Versão do cardápio (etag) lida ANTES da carga
+
+
+class CachedProductRepository(ProductRepositoryPort):
+    """
+    Cache de leitura ("read-through") na frente de outro ProductRepositoryPort
+    (normalmente o MySQLProductRepository).
+
+    O cardápio muda poucas vezes por dia, mas é lido a cada tela do garçom.
+    Por isso mantemos em memória uma "foto" (snapshot) de TODOS os produtos,
+    carregada com um único 'get_all()', e servimos a partir dela:
+    - get_visible_products()
+    - get_all()
+    - find_by_id()
+
+    O snapshot é descartado quando:
+    - a versão do cardápio muda ('version': com o SharedVersionCounter,
+      também as escritas feitas por outro worker ou pelo cli.py);
+    - o TTL expira (rede de segurança);
+    - save() é chamado (Create/UpdateProductUseCase), que é o único
+      caminho de escrita de produtos na aplicação.
+
+    save() também incrementa 'version' (a ETag do cardápio em GET /products).
+    """
+
+    def __init__(self, inner: ProductRepositoryPort, ttl_seconds: float = 300.0,
+                 version: Optional[VersionCounter] = None):
+        """
+        Args:
+            inner: O repositório "real" que acessa o banco.
+            ttl_seconds: Tempo máximo de vida do snapshot, em segundos.
+            version: Versão do cardápio, incrementada a cada save().
+        """
+        self.inner = inner
+        self.ttl_seconds = ttl_seconds
+        self.version = version or VersionCounter()
+
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_MenuSnapshot] = None
+
+        # Contadores (expostos em /metrics)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # --- Gerenciamento do Snapshot ---
+
+    def _current_snapshot(self) -> _MenuSnapshot:
+        """
+        Retorna o snapshot atual, recarregando do repositório interno
+        se ele estiver vazio ou vencido.
+
+        A recarga acontece dentro do lock: se vários requests chegarem
+        juntos com o cache vazio, apenas UM vai ao banco.
+        """
+        # Versão ANTES da carga: uma escrita no meio muda a versão e a
+        # próxima leitura recarrega
+        version = self.version.etag()
+        with self._lock:
+            snapshot = self._snapshot
+            if self._is_fresh(snapshot, version):
+                self.hits += 1
+                return snapshot
+
+            self.misses += 1
+            # Do primário: um snapshot lido de uma réplica atrasada
+            # ficaria velho até a próxima escrita
+            with primary_reads():
+                return self._store(self.inner.get_all(), version)
+
+    def _is_fresh(self, snapshot: Optional[_MenuSnapshot], version: str) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.version == version
+            and (time.monotonic() - snapshot.loaded_at) < self.ttl_seconds
+        )
+
+    @staticmethod
+    def _snapshot_of(products: List[Product], version: str) -> _MenuSnapshot:
+        return _MenuSnapshot(
+            all=products,
+            visible=[p for p in products if p.visibility],
+            by_id={p.id: p for p in products},
+            loaded_at=time.monotonic(),
+            version=version
+        )
+
+    def _store(self, products: List[Product], version: str) -> _MenuSnapshot:
+        snapshot = self._snapshot_of(products, version)
+
+        # O repositório MySQL devolve [] em caso de erro de conexão.
+        # Não guardamos uma lista vazia para não "congelar" a falha
+        # durante todo o TTL.
+        if products:
+            self._snapshot = snapshot
+        return snapshot
+
+    def invalidate(self):
+        """Descarta o snapshot. A próxima leitura irá ao banco."""
+        with self._lock:
+            self._snapshot = None
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Retorna os contadores do cache (para observabilidade)."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "cached_products": len(self._snapshot.all) if self._snapshot else 0,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    # --- Implementação dos Métodos da Porta ---
+    # (Sempre devolvemos CÓPIAS: os casos de uso alteram os objetos
+    # recebidos, ex: UpdateProductUseCase faz setattr antes do save.)
+
+    def get_visible_products(self) -> List[Product]:
+        return [copy.copy(p) for p in self._current_snapshot().visible]
+
+    def get_all(self) -> List[Product]:
+        return [copy.copy(p) for p in self._current_snapshot().all]
+
+    def find_by_id(self, product_id: int) -> Optional[Product]:
+        product = self._current_snapshot().by_id.get(product_id)
+        if product:
+            return copy.copy(product)
+
+        # Produto fora do snapshot (ex: criado por outro processo
+        # depois da última carga): consulta o banco diretamente.
+        return self.inner.find_by_id(product_id)
+
+    def find_by_ids(self, product_ids: List[int]) -> Dict[int, Product]:
+        snapshot = self._current_snapshot()
+        products_map: Dict[int, Product] = {}
+        missing_ids: List[int] = []
+
+        for product_id in product_ids:
+            product = snapshot.by_id.get(product_id)
+            if product:
+                products_map[product_id] = copy.copy(product)
+            else:
+                missing_ids.append(product_id)
+
+        # Apenas os IDs fora do snapshot vão ao banco (numa única consulta)
+        if missing_ids:
+            products_map.update(self.inner.find_by_ids(missing_ids))
+        return products_map
+
+    def save(self, product: Product) -> Product:
+        saved_product = self.inner.save(product)
+        # Nesta ordem: quem ler a nova versão já encontra o cache vazio
+        self.invalidate()
+        self.version.bump()
+        return saved_product
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Product]:
+        # Exportação: direto do banco, em páginas (sem montar o snapshot)
+        return self.inner.iter_all(batch_size)
+
+    def upsert_batch(self, products: List[Product]) -> Tuple[int, int, int]:
+        # O diff é feito no banco (não recarrega o snapshot a cada lote)
+        inserted, updated, unchanged = self.inner.upsert_batch(products)
+        if inserted or updated:
+            self.invalidate()
+            self.version.bump()
+        return inserted, updated, unchanged
+
+
+class AsyncCachedProductRepository(AsyncProductRepositoryPort):
+    """
+    Versão assíncrona do CachedProductRepository (para o app ASGI).
+
+    Mesmo snapshot, TTL, cópias e contadores. A recarga é serializada por
+    um asyncio.Lock: enquanto UMA tarefa vai ao banco, as outras esperam
+    sem bloquear o event loop.
+    """
+
+    def __init__(self, inner: AsyncProductRepositoryPort, ttl_seconds: float = 300.0,
+                 version: Optional[AsyncVersionCounter] = None):
+        self.inner = inner
+        self.ttl_seconds = ttl_seconds
+        self.version = version or VersionCounter()
+
+        self._lock = threading.Lock() # Protege snapshot e contadores (trechos curtos, sem await)
+        self._reload_lock = asyncio.Lock()
+        self._snapshot: Optional[_MenuSnapshot] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # Mesmo gerenciamento do snapshot da versão síncrona
+    _is_fresh = CachedProductRepository._is_fresh
+    _snapshot_of = staticmethod(CachedProductRepository._snapshot_of)
+    _store = CachedProductRepository._store
+    invalidate = CachedProductRepository.invalidate
+    stats = CachedProductRepository.stats
+
+    async def _current_snapshot(self) -> _MenuSnapshot:
+        version = await self.version.etag_async()
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot, version):
+            self.hits += 1
+            return snapshot
+
+        async with self._reload_lock:
+            # Outra tarefa pode ter recarregado enquanto esperávamos
+            snapshot = self._snapshot
+            if self._is_fresh(snapshot, version):
+                self.hits += 1
+                return snapshot
+
+            self.misses += 1
+            generation = self.invalidations
+            with primary_reads():
+                products = await self.inner.get_all()
+            with self._lock:
+                # Um save() durante a consulta invalida o que acabamos de ler
+                if self.invalidations != generation:
+                    return self._snapshot_of(products, version)
+                return self._store(products, version)
+
+    # --- Implementação dos Métodos da Porta ---
+
+    async def get_visible_products(self) -> List[Product]:
+        return [copy.copy(p) for p in (await self._current_snapshot()).visible]
+
+    async def get_all(self) -> List[Product]:
+        return [copy.copy(p) for p in (await self._current_snapshot()).all]
+
+    async def find_by_id(self, product_id: int) -> Optional[Product]:
+        product = (await self._current_snapshot()).by_id.get(product_id)
+        if product:
+            return copy.copy(product)
+        return await self.inner.find_by_id(product_id)
+
+    async def find_by_ids(self, product_ids: List[int]) -> Dict[int, Product]:
+        snapshot = await self._current_snapshot()
+        products_map: Dict[int, Product] = {}
+        missing_ids: List[int] = []
+
+        for product_id in product_ids:
+            product = snapshot.by_id.get(product_id)
+            if product:
+                products_map[product_id] = copy.copy(product)
+            else:
+                missing_ids.append(product_id)
+
+        if missing_ids:
+            products_map.update(await self.inner.find_by_ids(missing_ids))
+        return products_map
+
+    async def save(self, product: Product) -> Product:
+        saved_product = await self.inner.save(product)
+        self.invalidate()
+        self.version.bump()
+        return saved_product
+
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Product]:
+        return self.inner.iter_all(batch_size)
+
+    async def upsert_batch(self, products: List[Product]) -> Tuple[int, int, int]:
+        inserted, updated, unchanged = await self.inner.upsert_batch(products)
+        if inserted or updated:
+            self.invalidate()
+            self.version.bump()
+        return inserted, updated, unchanged
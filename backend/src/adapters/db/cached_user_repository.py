@@ -0,0 +1,164 @@
+import dataclasses
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+# Importa a PORTA (Interface) que esta classe implementa
+from domain.ports.user_repository import UserRepositoryPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
+
+# Importa o MODELO de domínio
+from domain.models import User
+
+from .read_routing import primary_reads
+
+
+class CachedUserRepository(UserRepositoryPort):
+    """
+    Cache de leitura ("read-through") de usuários por ID, na frente de outro
+    UserRepositoryPort (normalmente o MySQLUserRepository).
+
+    Todo caso de uso de admin começa com 'find_by_id(admin_id)' só para
+    checar 'is_admin()', e /auth/me lê o usuário do token. Com o cache,
+    um request autenticado não vai ao banco para isso.
+
+    Uma entrada é descartada quando:
+    - o TTL expira (protege contra escritas feitas por outro processo);
+    - save() é chamado para aquele usuário (Create/UpdateUserUseCase).
+
+    find_by_username() NÃO usa o cache: o login precisa do hash atual.
+    """
+
+    def __init__(self, inner: UserRepositoryPort, ttl_seconds: float = 60.0):
+        """
+        Args:
+            inner: O repositório "real" que acessa o banco.
+            ttl_seconds: Tempo máximo de vida de cada entrada, em segundos.
+        """
+        self.inner = inner
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._users: Dict[int, Tuple[User, float]] = {} # { user_id -> (User, carregado_em) }
+
+        # Contadores (expostos em /metrics)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _copy(user: User) -> User:
+        # Os casos de uso alteram o objeto recebido (ex: limpam o
+        # 'hashed_password' antes de responder), então nunca entregamos
+        # a instância guardada.
+        return dataclasses.replace(user, roles=list(user.roles))
+
+    def invalidate(self, user_id: Optional[int] = None):
+        """Descarta um usuário (ou todos, se 'user_id' for None)."""
+        with self._lock:
+            if user_id is None:
+                self._users.clear()
+            else:
+                self._users.pop(user_id, None)
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Retorna os contadores do cache (para observabilidade)."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "cached_users": len(self._users),
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    # --- Implementação dos Métodos da Porta ---
+
+    def find_by_id(self, user_id: int) -> Optional[User]:
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry and (time.monotonic() - entry[1]) < self.ttl_seconds:
+                self.hits += 1
+                return self._copy(entry[0])
+            self.misses += 1
+            generation = self.invalidations
+
+        # Busca fora do lock (não bloqueia as leituras de outros usuários),
+        # no primário: o que for lido fica no cache durante o TTL
+        with primary_reads():
+            user = self.inner.find_by_id(user_id)
+
+        # Usuário inexistente (ou erro de banco) não é guardado, nem um
+        # resultado lido antes de uma invalidação concorrente
+        if user:
+            with self._lock:
+                if self.invalidations == generation:
+                    self._users[user_id] = (self._copy(user), time.monotonic())
+        return user
+
+    def find_by_username(self, username: str) -> Optional[User]:
+        return self.inner.find_by_username(username)
+
+    def save(self, user: User) -> User:
+        saved_user = self.inner.save(user)
+        self.invalidate(saved_user.id)
+        return saved_user
+
+    def find_existing_usernames(self, usernames: List[str]) -> Set[str]:
+        return self.inner.find_existing_usernames(usernames)
+
+    def insert_batch(self, users: List[User]) -> List[User]:
+        # Usuários novos: nenhum deles está no cache
+        return self.inner.insert_batch(users)
+
+
+class AsyncCachedUserRepository(AsyncUserRepositoryPort):
+    """
+    Versão assíncrona do CachedUserRepository (para o app ASGI).
+    Mesmo TTL, cópias, invalidação e contadores.
+    """
+
+    def __init__(self, inner: AsyncUserRepositoryPort, ttl_seconds: float = 60.0):
+        self.inner = inner
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._users: Dict[int, Tuple[User, float]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # Mesmas cópias, invalidação e contadores da versão síncrona
+    _copy = staticmethod(CachedUserRepository._copy)
+    invalidate = CachedUserRepository.invalidate
+    stats = CachedUserRepository.stats
+
+    # --- Implementação dos Métodos da Porta ---
+
+    async def find_by_id(self, user_id: int) -> Optional[User]:
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry and (time.monotonic() - entry[1]) < self.ttl_seconds:
+                self.hits += 1
+                return self._copy(entry[0])
+            self.misses += 1
+            generation = self.invalidations
+
+        with primary_reads():
+            user = await self.inner.find_by_id(user_id)
+
+        if user:
+            with self._lock:
+                if self.invalidations == generation:
+                    self._users[user_id] = (self._copy(user), time.monotonic())
+        return user
+
+    async def find_by_username(self, username: str) -> Optional[User]:
+        return await self.inner.find_by_username(username)
+
+    async def save(self, user: User) -> User:
+        saved_user = await self.inner.save(user)
+        self.invalidate(saved_user.id)
+        return saved_user
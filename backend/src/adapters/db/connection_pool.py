@@ -1,22 +1,395 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
 import mysql.connector
-from mysql.connector import pooling, Error
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
 
 # 1. Importa a configuração do arquivo vizinho 'db_config.py'
-from .db_config import db_config
-
-try:
-    # 2. Cria o Pool de Conexões UMA ÚNICA VEZ,
-    #    usando a configuração importada.
-    connection_pool = mysql.connector.pooling.MySQLConnectionPool(
-        pool_name="mdk_app_pool",
-        pool_size=5,  # Um bom número para começar
-        **db_config   # <-- Passa o dicionário importado aqui
-    )
-    
-    print(">>> Pool de conexões MySQL criado com sucesso.")
-
-except Error as e:
-    # 3. Se a criação do pool falhar, a aplicação não pode continuar.
-    print(f"Erro fatal ao criar o pool de conexões MySQL: {e}")
-    print(">>> Verifique suas variáveis de ambiente (.env) e se o banco de dados está no ar.")
-    exit(1) # Encerra a aplicação se não puder conectar
\ No newline at end of file
+from .db_config import db_config, pool_config
+
+# Medições do request atual (tempo de SQL e de espera por conexão)
+from .. import request_stats
+
+
+class PoolExhaustedError(PoolError):
+    """Nenhuma conexão ficou livre dentro do 'checkout_timeout'."""
+    pass
+
+
+class TimedCursor:
+    """
+    Cursor que soma o tempo (e a contagem) dos comandos SQL ao request
+    atual. Repassa todo o resto (lastrowid, rowcount...) ao cursor real.
+    """
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._cursor.close()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def _timed(self, method, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            request_stats.record_sql(time.perf_counter() - start)
+
+    def execute(self, *args, **kwargs):
+        return self._timed(self._cursor.execute, *args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        return self._timed(self._cursor.executemany, *args, **kwargs)
+
+    # A leitura dos resultados também é tempo de banco (mas não é
+    # um comando novo)
+    def fetchone(self):
+        with request_stats.timed("db"):
+            return self._cursor.fetchone()
+
+    def fetchall(self):
+        with request_stats.timed("db"):
+            return self._cursor.fetchall()
+
+
+# --- Prepared statements ---
+
+# Comandos "quentes" registrados pelos repositórios: texto fixo, executados
+# a cada request. Só estes viram prepared statements (um por conexão); os
+# de texto variável (ex: IN com N placeholders) continuam como texto, ou
+# cada tamanho de lista ocuparia um statement no servidor.
+_prepared_queries: Set[str] = set()
+
+
+def register_prepared(*queries: str):
+    """Marca comandos SQL (de texto fixo) para serem executados como prepared statements."""
+    _prepared_queries.update(queries)
+
+
+def is_prepared(operation) -> bool:
+    return operation in _prepared_queries
+
+
+class PooledCursor(TimedCursor):
+    """
+    Cursor entregue pelo PooledConnection quando o pool usa prepared
+    statements.
+
+    Comandos registrados (register_prepared) vão para o cursor preparado
+    daquele comando NESTA conexão: o MySQL faz o parse e o plano uma vez,
+    e as execuções seguintes (deste e dos próximos requests que pegarem a
+    mesma conexão) só enviam os parâmetros. O resto vai para o cursor de
+    texto normal; executemany() também (o INSERT de várias linhas do
+    conector é um comando só, contra um por linha no cursor preparado).
+
+    As linhas de um comando preparado são lidas logo após o execute(): o
+    cursor preparado fica com a conexão e não pode sobrar resultado
+    pendente nele.
+    """
+
+    def __init__(self, cursor, connection, statements: Dict[Tuple[str, bool], Tuple[str, Any]], dictionary: bool):
+        super().__init__(cursor)
+        self._text_cursor = cursor
+        self._connection = connection
+        self._statements = statements # O registro da conexão: (SQL, dictionary) -> (SQL, cursor)
+        self._dictionary = dictionary
+        self._rows: Optional[deque] = None # Linhas do último comando preparado
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Os cursores preparados ficam abertos, com a conexão
+        self._text_cursor.close()
+
+    def __iter__(self):
+        return iter(self.fetchall()) if self._rows is not None else iter(self._cursor)
+
+    def execute(self, operation, params=()):
+        if not is_prepared(operation):
+            self._cursor, self._rows = self._text_cursor, None
+            return super().execute(operation, params)
+
+        key = (operation, self._dictionary)
+        if key not in self._statements:
+            self._statements[key] = (operation, self._connection.cursor(prepared=True, dictionary=self._dictionary))
+        # O conector reaproveita o statement só se o texto for o MESMO objeto
+        operation, self._cursor = self._statements[key]
+
+        super().execute(operation, params)
+        self._rows = deque(super().fetchall() if self._cursor.with_rows else ())
+
+    def executemany(self, *args, **kwargs):
+        self._cursor, self._rows = self._text_cursor, None
+        return super().executemany(*args, **kwargs)
+
+    def fetchone(self):
+        if self._rows is None:
+            return super().fetchone()
+        return self._rows.popleft() if self._rows else None
+
+    def fetchall(self):
+        if self._rows is None:
+            return super().fetchall()
+        rows, self._rows = list(self._rows), deque()
+        return rows
+
+
+class PooledConnection:
+    """
+    Conexão emprestada do pool.
+
+    Repassa tudo (commit, rollback, start_transaction...) para a conexão
+    real; os cursores são embrulhados em TimedCursor. Ao sair do bloco
+    'with' (ou ao chamar close()), a conexão volta ao pool em vez de ser
+    fechada.
+    """
+
+    def __init__(self, pool: 'ConnectionPool', connection):
+        self._pool = pool
+        self._connection = connection
+
+    def _real(self):
+        if self._connection is None:
+            raise PoolError("A conexão já foi devolvida ao pool.")
+        return self._connection
+
+    def __getattr__(self, name):
+        return getattr(self._real(), name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def cursor(self, *args, **kwargs) -> TimedCursor:
+        connection = self._real()
+        cursor = connection.cursor(*args, **kwargs)
+        if not self._pool.prepared_statements or args or set(kwargs) - {"dictionary"}:
+            return TimedCursor(cursor)
+        return PooledCursor(
+            cursor, connection, self._pool._statements_for(connection), bool(kwargs.get("dictionary"))
+        )
+
+    def commit(self):
+        """Confirma a transação e avisa os 'commit_listeners' do pool."""
+        self._real().commit()
+        for listener in self._pool.commit_listeners:
+            listener()
+
+    def close(self):
+        """Devolve a conexão ao pool (só na primeira chamada)."""
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._pool._release(connection)
+
+
+class ConnectionPool:
+    """
+    Pool de conexões MySQL usado por todos os repositórios.
+
+    Diferenças em relação ao 'MySQLConnectionPool' do conector:
+    - Criação preguiçosa: nenhuma conexão é aberta no import, então a
+      aplicação sobe mesmo com o banco fora do ar.
+    - 'pool_size' conexões ficam abertas; até 'max_overflow' conexões extras
+      são criadas em picos e fechadas ao serem devolvidas.
+    - Com tudo ocupado, get_connection() ESPERA até 'checkout_timeout'
+      segundos por uma conexão livre (em vez de falhar na hora).
+    - Conexões paradas há mais de 'health_check_seconds' recebem um ping
+      antes de serem entregues; conexões mortas são substituídas.
+    - Comandos registrados com register_prepared() viram prepared
+      statements, preparados uma vez por conexão e mantidos enquanto ela
+      ficar no pool (ver PooledCursor).
+    - Contadores de uso expostos em stats() (ver /metrics).
+    """
+
+    def __init__(
+        self,
+        config: dict,
+        pool_size: int = 5,
+        max_overflow: int = 5,
+        checkout_timeout: float = 10.0,
+        health_check_seconds: float = 30.0,
+        prepared_statements: bool = True,
+        connection_factory: Optional[Callable] = None
+    ):
+        """
+        Args:
+            config: Parâmetros de conexão (host, user, password, database).
+            pool_size: Conexões mantidas abertas.
+            max_overflow: Conexões extras permitidas em picos.
+            checkout_timeout: Espera máxima (segundos) por uma conexão livre.
+            health_check_seconds: Conexões ociosas há mais tempo que isso
+                                  são testadas (ping) antes do uso. 0 = sempre.
+            prepared_statements: Se False, todos os comandos vão como texto.
+            connection_factory: Função que abre uma conexão real
+                                (padrão: mysql.connector.connect).
+        """
+        self.config = config
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.checkout_timeout = checkout_timeout
+        self.health_check_seconds = health_check_seconds
+        self.prepared_statements = prepared_statements
+        self._connect = connection_factory or mysql.connector.connect
+
+        self._condition = threading.Condition()
+        # Conexões livres: (conexão, momento em que foi devolvida).
+        # Usada como pilha (LIFO): as mais "quentes" são reutilizadas primeiro.
+        self._idle: deque = deque()
+        self._open = 0      # Conexões abertas (livres + em uso)
+        self._in_use = 0
+        # Registro de prepared statements de cada conexão aberta (ver PooledCursor)
+        self._statements: Dict[Any, dict] = {}
+
+        # Contadores (expostos em /metrics)
+        self.checkouts = 0
+        self.exhausted = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.health_check_failures = 0
+
+        # Funções chamadas após cada commit (ex: ReadRouter.note_write)
+        self.commit_listeners: List[Callable[[], None]] = []
+
+    # --- Empréstimo e Devolução ---
+
+    def get_connection(self) -> PooledConnection:
+        """
+        Empresta uma conexão. Use com 'with' para devolvê-la ao final.
+
+        Raises:
+            PoolExhaustedError: Se nenhuma conexão ficar livre a tempo.
+            mysql.connector.Error: Se não for possível abrir uma conexão.
+        """
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+        idle_connection = None
+
+        # 1. Reserva uma conexão livre ou uma "vaga" para abrir outra
+        with self._condition:
+            while True:
+                if self._idle:
+                    idle_connection = self._idle.pop()
+                    break
+                if self._open < self.pool_size + self.max_overflow:
+                    self._open += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.exhausted += 1
+                    raise PoolExhaustedError(
+                        f"Nenhuma conexão livre após {self.checkout_timeout}s "
+                        f"({self._open} em uso)."
+                    )
+                self._condition.wait(remaining)
+
+            self._in_use += 1
+            self.checkouts += 1
+            waited = time.monotonic() - start
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+
+        # 2. Abre ou valida a conexão (fora do lock: envolve rede)
+        try:
+            if idle_connection is None:
+                connection = self._connect(**self.config)
+            else:
+                connection = self._checked(*idle_connection)
+        except Exception:
+            self._discard()
+            raise
+
+        # Espera + abertura/validação da conexão contam como tempo de "pool"
+        request_stats.record("pool", time.monotonic() - start)
+        return PooledConnection(self, connection)
+
+    def _checked(self, connection, released_at: float):
+        """Garante que uma conexão ociosa ainda está viva (ou abre outra)."""
+        if time.monotonic() - released_at < self.health_check_seconds:
+            return connection
+        try:
+            connection.ping(reconnect=False)
+            return connection
+        except Error:
+            with self._condition:
+                self.health_check_failures += 1
+            self._close_quietly(connection)
+            return self._connect(**self.config)
+
+    def _release(self, connection):
+        """Recebe uma conexão de volta (chamado por PooledConnection.close)."""
+        # Uma transação esquecida não pode vazar para o próximo request
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except Error:
+            self._close_quietly(connection)
+            self._discard()
+            return
+
+        with self._condition:
+            self._in_use -= 1
+            if self._open > self.pool_size:
+                # Conexão de "overflow": fecha ao devolver
+                self._open -= 1
+                self._condition.notify()
+            else:
+                self._idle.append((connection, time.monotonic()))
+                self._condition.notify()
+                return
+        self._close_quietly(connection)
+
+    def _discard(self):
+        """Libera a vaga de uma conexão que não pôde ser usada."""
+        with self._condition:
+            self._in_use -= 1
+            self._open -= 1
+            self._condition.notify()
+
+    def _statements_for(self, connection) -> dict:
+        """O registro de prepared statements de uma conexão (criado no 1º uso)."""
+        return self._statements.setdefault(connection, {})
+
+    def _close_quietly(self, connection):
+        # Fechar a conexão desaloca os statements dela no servidor
+        self._statements.pop(connection, None)
+        try:
+            connection.close()
+        except Error:
+            pass
+
+    # --- Observabilidade ---
+
+    def stats(self) -> dict:
+        """Retorna os contadores do pool (para observabilidade)."""
+        with self._condition:
+            return {
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "open": self._open,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "checkouts": self.checkouts,
+                "exhausted": self.exhausted,
+                "health_check_failures": self.health_check_failures,
+                "prepared_statements": sum(len(statements) for statements in list(self._statements.values())),
+                "wait_time_total_ms": round(self.wait_time_total * 1000, 2),
+                "wait_time_max_ms": round(self.wait_time_max * 1000, 2),
+            }
+
+
+# 2. Cria o Pool UMA ÚNICA VEZ, usando a configuração importada.
+#    (Nenhuma conexão é aberta aqui: a primeira é criada no primeiro uso.)
+connection_pool = ConnectionPool(db_config, **pool_config)
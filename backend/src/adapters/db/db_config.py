@@ -15,4 +15,49 @@ db_config = {
     'user': os.environ.get('DB_USER', 'root'),
     'password': os.environ.get('DB_PASSWORD', 'default_password'), # Mude o padrão se quiser
     'database': os.environ.get('DB_NAME', 'mdk_db')
+}
+
+# Réplica de leitura (opcional, ver read_routing.py).
+# Sem DB_REPLICA_HOST, todas as leituras vão ao primário.
+# O usuário precisa do privilégio REPLICATION CLIENT (para medir o atraso).
+replica_config = {
+    'host': os.environ.get('DB_REPLICA_HOST', ''),
+    'user': os.environ.get('DB_REPLICA_USER', db_config['user']),
+    'password': os.environ.get('DB_REPLICA_PASSWORD', db_config['password']),
+    'database': db_config['database']
+}
+
+# Roteamento das leituras entre primário e réplica
+read_routing_config = {
+    # Depois de gravar, o mesmo usuário lê do primário por este tempo (segundos)
+    'read_your_writes_seconds': float(os.environ.get('DB_READ_YOUR_WRITES_SECONDS', 5)),
+    # Réplica mais atrasada que isso (segundos) deixa de ser usada
+    'max_lag_seconds': float(os.environ.get('DB_REPLICA_MAX_LAG_SECONDS', 2)),
+    # Intervalo entre medições do atraso da réplica (segundos)
+    'lag_check_seconds': float(os.environ.get('DB_REPLICA_LAG_CHECK_SECONDS', 5))
+}
+
+# Configuração do pool de conexões (ver connection_pool.py)
+pool_config = {
+    # Conexões mantidas abertas
+    'pool_size': int(os.environ.get('DB_POOL_SIZE', 5)),
+    # Conexões extras permitidas em picos (fechadas ao serem devolvidas)
+    'max_overflow': int(os.environ.get('DB_POOL_MAX_OVERFLOW', 5)),
+    # Espera máxima (segundos) por uma conexão livre
+    'checkout_timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+    # Conexões ociosas há mais tempo que isso recebem um ping antes do uso
+    'health_check_seconds': float(os.environ.get('DB_POOL_HEALTH_CHECK_SECONDS', 30)),
+    # Comandos registrados viram prepared statements, um por conexão (0 desliga)
+    'prepared_statements': os.environ.get('DB_PREPARED_STATEMENTS', '1') != '0'
+}
+
+# Configuração dos caches em memória da aplicação
+cache_config = {
+    # Tempo de vida (segundos) do snapshot do cardápio
+    'product_ttl_seconds': float(os.environ.get('PRODUCT_CACHE_TTL_SECONDS', 300)),
+    # Tempo de vida (segundos) de cada usuário no cache de usuários
+    'user_ttl_seconds': float(os.environ.get('USER_CACHE_TTL_SECONDS', 60)),
+    # Intervalo máximo (segundos) entre leituras das versões do cardápio e
+    # das mesas no banco (uma escrita de outro worker aparece nesse prazo)
+    'version_refresh_seconds': float(os.environ.get('VERSION_REFRESH_SECONDS', 1))
 }
\ No newline at end of file
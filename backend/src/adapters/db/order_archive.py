@@ -0,0 +1,151 @@
+import time
+from mysql.connector import Error
+from typing import Callable, List, Optional, Tuple
+
+# Mesmas colunas de 'orders' (o arquivo guarda o pedido como estava)
+from .order_repository import ORDER_COLUMNS
+from .connection_pool import connection_pool
+
+
+# --- Arquivamento ---
+# Pedidos de sessões encerradas saem de 'orders'/'order_items' e vão para
+# 'orders_archive'/'order_items_archive' (mesmas colunas e mesmos IDs).
+# Assim as tabelas "quentes" guardam só as sessões abertas; o histórico
+# (GET /admin/orders/history) lê as duas (ver database/migrations/005).
+
+ITEM_COLUMNS = "id, order_id, product_id, quantity, price_at_order"
+
+# --- Ao fechar a mesa (na mesma transação do MySQLTableRepository.save) ---
+# A sessão é a aberta da mesa: índice table_sessions(table_id, closed_at),
+# depois orders(session_id) e order_items(order_id, product_id).
+
+ARCHIVE_SESSION_ORDERS = f"""
+    INSERT INTO orders_archive ({ORDER_COLUMNS})
+    SELECT {', '.join('o.' + column for column in ORDER_COLUMNS.split(', '))}
+    FROM table_sessions s
+    JOIN orders o ON o.session_id = s.id
+    WHERE s.table_id = %s AND s.closed_at IS NULL
+"""
+
+ARCHIVE_SESSION_ITEMS = f"""
+    INSERT INTO order_items_archive ({ITEM_COLUMNS})
+    SELECT {', '.join('oi.' + column for column in ITEM_COLUMNS.split(', '))}
+    FROM table_sessions s
+    JOIN orders o ON o.session_id = s.id
+    JOIN order_items oi ON oi.order_id = o.id
+    WHERE s.table_id = %s AND s.closed_at IS NULL
+"""
+
+# Os itens saem junto (order_items.order_id é ON DELETE CASCADE)
+DELETE_SESSION_ORDERS = """
+    DELETE o FROM orders o
+    JOIN table_sessions s ON s.id = o.session_id
+    WHERE s.table_id = %s AND s.closed_at IS NULL
+"""
+
+# Executadas em ordem, todas com (table_id,)
+ARCHIVE_SESSION_STATEMENTS = (ARCHIVE_SESSION_ORDERS, ARCHIVE_SESSION_ITEMS, DELETE_SESSION_ORDERS)
+
+# --- Back-fill (histórico gravado antes do arquivamento) ---
+
+# Pedidos de sessões já encerradas, ou sem sessão (anteriores à
+# migração 001), em ordem de ID a partir do último lote (keyset pela PK)
+QUERY_ARCHIVABLE_ORDER_IDS = """
+    SELECT o.id FROM orders o
+    LEFT JOIN table_sessions s ON s.id = o.session_id
+    WHERE o.id > %s AND (o.session_id IS NULL OR s.closed_at IS NOT NULL)
+    ORDER BY o.id
+    LIMIT %s
+"""
+
+# '{placeholders}' é trocado por '%s,%s,...' (um por pedido do lote)
+ARCHIVE_ORDERS_BY_IDS = f"""
+    INSERT INTO orders_archive ({ORDER_COLUMNS})
+    SELECT {ORDER_COLUMNS} FROM orders WHERE id IN ({{placeholders}})
+"""
+
+ARCHIVE_ITEMS_BY_ORDERS = f"""
+    INSERT INTO order_items_archive ({ITEM_COLUMNS})
+    SELECT {ITEM_COLUMNS} FROM order_items WHERE order_id IN ({{placeholders}})
+"""
+
+DELETE_ORDERS_BY_IDS = "DELETE FROM orders WHERE id IN ({placeholders})"
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_PAUSE_SECONDS = 0.05
+
+
+class OrderArchiver:
+    """
+    Move o histórico antigo de 'orders'/'order_items' para as tabelas de
+    arquivo em lotes pequenos, cada um na sua própria transação curta:
+    os bloqueios duram um lote, e o serviço segue normalmente enquanto o
+    back-fill roda (com uma pausa entre os lotes para não disputar o banco).
+
+    Pode ser interrompido e executado de novo: cada lote é movido por
+    inteiro ou não é movido.
+    """
+
+    def __init__(self, pool=None, sleep: Callable[[float], None] = time.sleep):
+        self.pool = pool or connection_pool
+        self._sleep = sleep
+
+    def archive_batch(self, after_id: int = 0, batch_size: int = DEFAULT_BATCH_SIZE) -> Tuple[int, Optional[int]]:
+        """
+        Arquiva até 'batch_size' pedidos com ID maior que 'after_id'.
+        Retorna (pedidos movidos, último ID do lote), ou (0, None) se não
+        há mais nada para arquivar.
+        """
+        try:
+            with self.pool.get_connection() as connection:
+                connection.start_transaction()
+
+                try:
+                    with connection.cursor() as cursor:
+                        # 1. Escolhe o lote (pela PK, a partir do anterior)
+                        cursor.execute(QUERY_ARCHIVABLE_ORDER_IDS, (after_id, batch_size))
+                        order_ids: List[int] = [row[0] for row in cursor.fetchall()]
+                        if not order_ids:
+                            connection.rollback()
+                            return 0, None
+
+                        # 2. Copia pedidos e itens e apaga os originais
+                        placeholders = ','.join(['%s'] * len(order_ids))
+                        cursor.execute(ARCHIVE_ORDERS_BY_IDS.format(placeholders=placeholders), order_ids)
+                        moved = cursor.rowcount
+                        cursor.execute(ARCHIVE_ITEMS_BY_ORDERS.format(placeholders=placeholders), order_ids)
+                        cursor.execute(DELETE_ORDERS_BY_IDS.format(placeholders=placeholders), order_ids)
+
+                    connection.commit()
+                    return moved, order_ids[-1]
+
+                except Error as e:
+                    print(f"Erro ao arquivar pedidos após o ID {after_id}. (ROLLBACK)")
+                    connection.rollback()
+                    raise e
+
+        except Error as e:
+            print(f"Erro ao obter conexão para arquivar pedidos: {e}")
+            raise e
+
+    def backfill(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        pause_seconds: float = DEFAULT_PAUSE_SECONDS,
+        on_batch: Optional[Callable[[int, int], None]] = None
+    ) -> int:
+        """
+        Arquiva todo o histórico pendente, lote a lote.
+        'on_batch(movidos_no_lote, total)' é chamado após cada lote (progresso).
+        Retorna o total de pedidos movidos.
+        """
+        total, last_id = 0, 0
+        while True:
+            moved, last_id = self.archive_batch(last_id, batch_size)
+            if last_id is None:
+                return total
+
+            total += moved
+            if on_batch is not None:
+                on_batch(moved, total)
+            self._sleep(pause_seconds)
@@ -1,16 +1,137 @@
 import mysql.connector
 from mysql.connector import Error
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 
 # Importa as PORTAS (Interface)
 from domain.ports.order_repository import OrderRepositoryPort
 
 # Importa os MODELOS de domínio
-from domain.models import Order, OrderStatus, ItemOrder, Product
+from domain.models import (
+    Order, OrderStatus, ItemOrder, Product,
+    OrderHistoryFilter, OrderHistoryCursor, OrderHistoryPage
+)
+from domain.models.order import OrderItemChanges
+from domain.exceptions import ConcurrencyConflictException
 
 # Importa o POOL de conexões
-from .connection_pool import connection_pool
+from .connection_pool import connection_pool, register_prepared
+from .read_routing import read_router
+from .sales_report_repository import RECORD_SALE_STATEMENTS
+from .sql_steps import Step, StepGenerator, run_steps
+
+
+# --- Consultas ---
+# (Listas de colunas explícitas, em vez de 'SELECT *'. Os índices usados
+# por cada consulta estão em database/migrations/002; o script
+# benchmarks/explain_check.py confere que nenhuma faz varredura completa.)
+
+ORDER_COLUMNS = "id, table_number, waiter_id, status, created_at, session_id, version"
+
+ITEM_WITH_PRODUCT_COLUMNS = """
+    oi.order_id, oi.quantity,
+    p.id as product_id, p.name as product_name, p.price as product_price,
+    p.availability as product_availability, p.category as product_category,
+    p.imageUrl as product_imageUrl, p.visibility as product_visibility
+"""
+
+QUERY_ORDER_BY_ID = f"SELECT {ORDER_COLUMNS} FROM orders WHERE id = %s"
+
+# Índice: orders(status, created_at) -> já sai na ordem de chegada
+QUERY_ORDERS_BY_STATUS = f"""
+    SELECT {ORDER_COLUMNS} FROM orders
+    WHERE status = %s
+    ORDER BY created_at, id
+"""
+
+# Índice: order_items(order_id, product_id)
+QUERY_ITEMS_BY_ORDER = f"""
+    SELECT {ITEM_WITH_PRODUCT_COLUMNS}
+    FROM order_items oi
+    JOIN products p ON oi.product_id = p.id
+    WHERE oi.order_id = %s
+"""
+
+# '{placeholders}' é trocado por '%s,%s,...' (um por pedido)
+QUERY_ITEMS_BY_ORDERS = f"""
+    SELECT {ITEM_WITH_PRODUCT_COLUMNS}
+    FROM order_items oi
+    JOIN products p ON oi.product_id = p.id
+    WHERE oi.order_id IN ({{placeholders}})
+"""
+
+# Histórico (do mais recente para o mais antigo), paginado por cursor:
+# '{conditions}' recebe os filtros e a posição "depois de (created_at, id)".
+# Cada filtro tem um índice que termina em created_at (e o InnoDB guarda o
+# id em todo índice secundário), então o MySQL percorre o índice de trás
+# para frente e para em LIMIT linhas, sem OFFSET e sem filesort
+# (ver database/migrations/004).
+# Os pedidos de sessões encerradas estão em 'orders_archive' (mesmos
+# índices, migração 005): cada lado traz no máximo LIMIT linhas e o
+# resultado junta os dois (um pedido está em um lado só).
+QUERY_ORDER_HISTORY = f"""
+    (SELECT {ORDER_COLUMNS} FROM orders
+     WHERE {{conditions}}
+     ORDER BY created_at DESC, id DESC
+     LIMIT %s)
+    UNION ALL
+    (SELECT {ORDER_COLUMNS} FROM orders_archive
+     WHERE {{conditions}}
+     ORDER BY created_at DESC, id DESC
+     LIMIT %s)
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+"""
+
+# Itens da página do histórico: ativos ou arquivados
+QUERY_HISTORY_ITEMS_BY_ORDERS = f"""
+    SELECT {ITEM_WITH_PRODUCT_COLUMNS}
+    FROM order_items oi
+    JOIN products p ON oi.product_id = p.id
+    WHERE oi.order_id IN ({{placeholders}})
+    UNION ALL
+    SELECT {ITEM_WITH_PRODUCT_COLUMNS}
+    FROM order_items_archive oi
+    JOIN products p ON oi.product_id = p.id
+    WHERE oi.order_id IN ({{placeholders}})
+"""
+
+INSERT_ORDER = """
+    INSERT INTO orders (table_number, status, created_at, waiter_id, session_id)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+# Controle otimista: só grava se a versão ainda for a lida na carga
+# (0 linhas alteradas = outra pessoa salvou antes)
+UPDATE_ORDER = """
+    UPDATE orders SET table_number = %s, status = %s, version = version + 1
+    WHERE id = %s AND version = %s
+"""
+
+# Um pedido novo só entra na sessão da mesa se ela ainda estiver aberta.
+# Incrementa a versão da mesa: um fechamento lido antes deste pedido
+# (que não viu o pedido pendente) falha no UPDATE versionado da mesa.
+CLAIM_TABLE_SESSION = """
+    UPDATE tables SET version = version + 1
+    WHERE id = %s AND status = 'occupied' AND current_session_id <=> %s
+"""
+
+DELETE_ORDER_ITEMS = "DELETE FROM order_items WHERE order_id = %s AND product_id IN ({placeholders})"
+
+UPDATE_ORDER_ITEM_QUANTITY = "UPDATE order_items SET quantity = %s WHERE order_id = %s AND product_id = %s"
+
+INSERT_ORDER_ITEM = """
+    INSERT INTO order_items (order_id, product_id, quantity, price_at_order)
+    VALUES (%s, %s, %s, %s)
+"""
+
+
+# Comandos de texto fixo: prepared statements (ver connection_pool.py).
+# Os de IN (...) e o histórico (filtros variáveis) continuam como texto.
+register_prepared(
+    QUERY_ORDER_BY_ID, QUERY_ORDERS_BY_STATUS, QUERY_ITEMS_BY_ORDER,
+    INSERT_ORDER, UPDATE_ORDER, CLAIM_TABLE_SESSION
+)
 
 class MySQLOrderRepository(OrderRepositoryPort):
     """
@@ -19,7 +140,8 @@ class MySQLOrderRepository(OrderRepositoryPort):
     """
     
     def __init__(self):
-        self.pool = connection_pool
+        self.pool = connection_pool      # Escritas (primário)
+        self.read_pool = read_router     # Leituras (primário ou réplica)
 
     # --- Funções de Mapeamento (Tradução DB -> Domínio) ---
 
@@ -31,6 +153,8 @@ class MySQLOrderRepository(OrderRepositoryPort):
             waiter_id=row['waiter_id'], # PRENDA SUA ATENÇAO AQUI: EU ADICIONEI ESSA LINHA DE WAITER E ESTOU RECEBENDO O ERRO DE PYTHON TUPLE CANNOT BE CONVERTED
             status=OrderStatus(row['status']), # Converte string "pending" para Enum
             created_at=row['created_at'],
+            session_id=row['session_id'],
+            version=row['version'],
             items=[] # A lista de itens será preenchida depois
         )
 
@@ -56,31 +180,26 @@ class MySQLOrderRepository(OrderRepositoryPort):
             quantity=row['quantity']
         )
     
+    def _attach_items(self, orders_map: Dict[int, Order], item_rows: List[dict]) -> List[Order]:
+        """Distribui as linhas de itens (com 'order_id') entre os pedidos carregados."""
+        for item_row in item_rows:
+            order = orders_map.get(item_row['order_id'])
+            if order is not None:
+                order.attach_item(self._row_to_item_with_product(item_row))
+
+        for order in orders_map.values():
+            order.mark_as_persisted()
+        return list(orders_map.values())
+    
     # --- Implementação dos Métodos da Porta (Leitura) ---
 
     def find_by_id(self, order_id: int) -> Optional[Order]:
-        query_order = "SELECT * FROM orders WHERE id = %s"
-        query_items = """
-            SELECT 
-                oi.quantity,
-                p.id as product_id,
-                p.name as product_name,
-                p.price as product_price,
-                p.availability as product_availability,
-                p.category as product_category,
-                p.imageUrl as product_imageUrl,
-                p.visibility as product_visibility
-            FROM order_items oi
-            JOIN products p ON oi.product_id = p.id
-            WHERE oi.order_id = %s
-        """
-        
         try:
-            with self.pool.get_connection() as connection:
+            with self.read_pool.get_connection() as connection:
                 with connection.cursor(dictionary=True) as cursor:
                     
                     # 1. Busca o Pedido (Order) principal
-                    cursor.execute(query_order, (order_id,))
+                    cursor.execute(QUERY_ORDER_BY_ID, (order_id,))
                     order_row = cursor.fetchone()
                     
                     if not order_row:
@@ -90,14 +209,16 @@ class MySQLOrderRepository(OrderRepositoryPort):
                     order = self._row_to_order_base(order_row)
                     
                     # 3. Busca os Itens + Produtos associados
-                    cursor.execute(query_items, (order_id,))
+                    cursor.execute(QUERY_ITEMS_BY_ORDER, (order_id,))
                     item_rows = cursor.fetchall()
                     
                     # 4. Converte e aninha os Itens no Pedido
                     for item_row in item_rows:
                         item = self._row_to_item_with_product(item_row)
-                        order.items.append(item)
-                        
+                        order.attach_item(item)
+
+                    # 5. Marca o estado carregado como "igual ao banco"
+                    order.mark_as_persisted()
                     return order
 
         except Error as e:
@@ -110,25 +231,15 @@ class MySQLOrderRepository(OrderRepositoryPort):
 
     def find_by_status(self, status: OrderStatus) -> List[Order]:
         orders_map: Dict[int, Order] = {} # { order_id -> Order_Object }
-        
-        query_orders = "SELECT * FROM orders WHERE status = %s"
-        query_items = """
-            SELECT 
-                oi.order_id, oi.quantity,
-                p.id as product_id, p.name as product_name, p.price as product_price,
-                p.availability as product_availability, p.category as product_category,
-                p.imageUrl as product_imageUrl, p.visibility as product_visibility
-            FROM order_items oi
-            JOIN products p ON oi.product_id = p.id
-            WHERE oi.order_id IN (%s)
-        """
 
         try:
+            # Lê do PRIMÁRIO: a cozinha combina esta lista com o cursor do
+            # KitchenEventFeed; uma réplica atrasada perderia pedidos novos.
             with self.pool.get_connection() as connection:
                 with connection.cursor(dictionary=True) as cursor:
                     
                     # 1. Busca todos os Pedidos (base) com o status
-                    cursor.execute(query_orders, (status.value,))
+                    cursor.execute(QUERY_ORDERS_BY_STATUS, (status.value,))
                     order_rows = cursor.fetchall()
                     
                     if not order_rows:
@@ -145,20 +256,13 @@ class MySQLOrderRepository(OrderRepositoryPort):
                         
                         # Formata a query para o IN clause
                         placeholders = ','.join(['%s'] * len(order_ids))
-                        formatted_query = query_items % placeholders
+                        formatted_query = QUERY_ITEMS_BY_ORDERS.format(placeholders=placeholders)
                         
                         cursor.execute(formatted_query, order_ids)
                         item_rows = cursor.fetchall()
                         
                         # 4. "Costura" os itens nos seus respectivos pedidos
-                        for item_row in item_rows:
-                            item = self._row_to_item_with_product(item_row)
-                            order_id = item_row['order_id']
-                            
-                            if order_id in orders_map:
-                                orders_map[order_id].items.append(item)
-                            
-                        return list(orders_map.values())
+                        return self._attach_items(orders_map, item_rows)
                     else:
                         return []
 
@@ -173,12 +277,57 @@ class MySQLOrderRepository(OrderRepositoryPort):
 
 
 
+    def find_history(
+        self,
+        filters: OrderHistoryFilter,
+        after: Optional[OrderHistoryCursor] = None,
+        limit: int = 50
+    ) -> OrderHistoryPage:
+        """
+        Busca uma página do histórico: no máximo 'limit' pedidos (com itens),
+        ativos ou arquivados, em DUAS consultas, quaisquer que sejam o
+        período e a página.
+        Lê uma linha a mais que o limite só para saber se há próxima página.
+        """
+        query, params = history_query(filters, after, limit)
+        try:
+            with self.read_pool.get_connection() as connection:
+                with connection.cursor(dictionary=True) as cursor:
+
+                    # 1. Busca os pedidos da página (pelo índice, sem OFFSET)
+                    cursor.execute(query, params)
+                    order_rows = cursor.fetchall()
+                    orders_map = {
+                        row['id']: self._row_to_order_base(row) for row in order_rows[:limit]
+                    }
+                    if not orders_map:
+                        return OrderHistoryPage(orders=[])
+
+                    # 2. Busca os itens de todos eles numa única consulta
+                    cursor.execute(*history_items_query(orders_map))
+                    orders = self._attach_items(orders_map, cursor.fetchall())
+
+        except Error as e:
+            print(f"Erro ao buscar o histórico de pedidos: {e}")
+            raise e
+
+        return history_page(orders, has_more=len(order_rows) > limit)
+
     # --- Implementação dos Métodos da Porta (Escrita) ---
 
     def save(self, order: Order) -> Order:
         """
         Salva o agregado (Order + ItemOrders) dentro de uma TRANSAÇÃO.
+
+        Grava apenas o que mudou desde a carga (ver Order.pending_item_changes):
+        adicionar um item a um pedido existente custa UM INSERT (ou UPDATE),
+        e não a regravação de todas as linhas de 'order_items'.
+
+        Raises:
+            ConcurrencyConflictException: Se o pedido (ou a sessão da mesa,
+                                          para um pedido novo) mudou desde a carga.
         """
+        is_new = order.id == 0
         try:
             # Pega uma conexão para a transação
             with self.pool.get_connection() as connection:
@@ -188,61 +337,22 @@ class MySQLOrderRepository(OrderRepositoryPort):
                 
                 try:
                     with connection.cursor() as cursor:
-                        
-                        # --- Passo 1: Salvar o Order principal ---
-                        if order.id == 0: # INSERT
-                            order_query = """
-                                INSERT INTO orders (table_number, status, created_at,waiter_id) 
-                                VALUES (%s, %s, %s, %s)
-                            """
-                            order_params = (
-                                order.table_number, 
-                                order.status.value, # Converte Enum para string
-                                order.created_at,
-                                order.waiter_id
-                            )
-                            cursor.execute(order_query, order_params)
-                            order.id = cursor.lastrowid # Atualiza o ID no objeto
-                        
-                        else: # UPDATE
-                            order_query = """
-                                UPDATE orders SET table_number = %s, status = %s 
-                                WHERE id = %s
-                            """
-                            order_params = (
-                                order.table_number, 
-                                order.status.value, 
-                                order.id
-                            )
-                            cursor.execute(order_query, order_params)
-
-                        # --- Passo 2: Salvar os ItemOrders ---
-                        
-                        # 2a. Primeiro, limpa os itens antigos (maneira mais simples de sincronizar)
-                        cursor.execute("DELETE FROM order_items WHERE order_id = %s", (order.id,))
-                        
-                        # 2b. Insere os itens atuais (se houver)
-                        if order.items:
-                            item_query = """
-                                INSERT INTO order_items (order_id, product_id, quantity, price_at_order) 
-                                VALUES (%s, %s, %s, %s)
-                            """
-                            # Cria uma lista de tuplas para o 'executemany'
-                            items_data = [
-                                (
-                                    order.id, 
-                                    item.product.id, 
-                                    item.quantity,
-                                    item.product.price # Salva o preço do produto no momento
-                                ) 
-                                for item in order.items
-                            ]
-                            cursor.executemany(item_query, items_data)
+                        # --- Passos 1 e 2: Pedido e ItemOrders alterados ---
+                        bumped = self._write_order(cursor, order)
 
                     # --- Passo 3: Finalizar a Transação ---
                     connection.commit()
+                    if bumped:
+                        order.version += 1
+                    order.mark_as_persisted()
                     return order
 
+                except ConcurrencyConflictException:
+                    connection.rollback()
+                    if is_new:
+                        order.id = 0
+                    raise
+
                 except Error as e:
                     # Se qualquer passo falhar, desfaz tudo
                     print(f"Erro durante a transação do pedido {order.id}. (ROLLBACK)")
@@ -251,4 +361,203 @@ class MySQLOrderRepository(OrderRepositoryPort):
 
         except Error as e:
             print(f"Erro ao obter conexão para salvar pedido: {e}")
-            raise e
\ No newline at end of file
+            raise e
+
+    def save_all(self, orders: List[Order]) -> List[Order]:
+        """
+        Salva vários pedidos (novos ou existentes) em UMA transação,
+        com a mesma gravação incremental do save(). Usado pelo envio
+        em lote do garçom: ou todos os pedidos são gravados, ou nenhum.
+        """
+        if not orders:
+            return []
+
+        new_orders = [order for order in orders if order.id == 0]
+        try:
+            with self.pool.get_connection() as connection:
+                connection.start_transaction()
+
+                try:
+                    with connection.cursor() as cursor:
+                        bumped = [order for order in orders if self._write_order(cursor, order)]
+                    connection.commit()
+
+                except (Error, ConcurrencyConflictException) as e:
+                    if isinstance(e, Error):
+                        print(f"Erro durante a transação de {len(orders)} pedidos. (ROLLBACK)")
+                    connection.rollback()
+                    # Os IDs gerados pelos INSERTs foram desfeitos
+                    for order in new_orders:
+                        order.id = 0
+                    raise e
+
+        except Error as e:
+            print(f"Erro ao obter conexão para salvar pedidos: {e}")
+            raise e
+
+        for order in bumped:
+            order.version += 1
+        for order in orders:
+            order.mark_as_persisted()
+        return orders
+
+    def _write_order(self, cursor, order: Order) -> bool:
+        """
+        Grava UM pedido (sem commit): ver order_write_steps.
+        Retorna True se a versão do pedido foi incrementada no banco (o
+        chamador incrementa 'order.version' depois do commit).
+        """
+        return run_steps(cursor, order_write_steps(order))
+
+
+# --- Gravação (comum às versões síncrona e assíncrona) ---
+
+def order_write_steps(order: Order) -> StepGenerator:
+    """
+    Passos da gravação de UM pedido: a linha em 'orders', os itens
+    alterados e, se o pedido acabou de ser concluído, as vendas nos resumos.
+    Retorna True se a versão do pedido foi incrementada no banco.
+
+    Raises:
+        ConcurrencyConflictException: Se a sessão da mesa (pedido novo) ou
+                                      o pedido mudou desde a carga.
+    """
+    changes = order.pending_item_changes()
+
+    # --- Passo 1: Salvar o Order principal ---
+    if order.id == 0: # INSERT (só na sessão ainda aberta da mesa)
+        cursor = yield Step(CLAIM_TABLE_SESSION, (order.table_number, order.session_id))
+        if cursor.rowcount == 0:
+            raise ConcurrencyConflictException(
+                f"A Mesa {order.table_number} foi fechada ou reaberta. Tente novamente."
+            )
+        order_params = (
+            order.table_number, 
+            order.status.value, # Converte Enum para string
+            order.created_at,
+            order.waiter_id,
+            order.session_id # Sessão atual da mesa
+        )
+        cursor = yield Step(INSERT_ORDER, order_params)
+        order.id = cursor.lastrowid # Atualiza o ID no objeto
+        bumped = False
+    
+    elif order.has_status_change() or not changes.is_empty():
+        # UPDATE versionado: também quando só os itens mudaram, para que
+        # dois garçons alterando o mesmo pedido não se sobrescrevam
+        order_params = (
+            order.table_number, 
+            order.status.value, 
+            order.id,
+            order.version
+        )
+        cursor = yield Step(UPDATE_ORDER, order_params)
+        if cursor.rowcount == 0:
+            raise ConcurrencyConflictException(
+                f"O Pedido {order.id} foi alterado por outra pessoa. Tente novamente."
+            )
+        bumped = True
+
+    else:
+        return False # Nada mudou desde a carga
+
+    # --- Passo 2: Salvar apenas os ItemOrders alterados ---
+    yield from item_change_steps(order, changes)
+
+    # --- Passo 3: Pedido concluído agora -> soma nos resumos de vendas ---
+    # (na mesma transação: se o UPDATE versionado falhar, nada é somado)
+    if order.status == OrderStatus.COMPLETED and order.has_status_change():
+        for statement in RECORD_SALE_STATEMENTS:
+            yield Step(statement, (order.id,))
+    return bumped
+
+
+def item_change_steps(order: Order, changes: OrderItemChanges) -> StepGenerator:
+    """
+    Apenas os INSERT/UPDATE/DELETE necessários em 'order_items'.
+    (Um produto aparece no máximo uma vez por pedido, então o par
+    (order_id, product_id) identifica a linha.)
+    """
+
+    # 2a. Itens removidos do pedido
+    if changes.removed:
+        placeholders = ','.join(['%s'] * len(changes.removed))
+        yield Step(
+            DELETE_ORDER_ITEMS.format(placeholders=placeholders),
+            (order.id, *changes.removed)
+        )
+
+    # 2b. Itens que tiveram a quantidade alterada
+    if changes.changed:
+        yield Step(
+            UPDATE_ORDER_ITEM_QUANTITY,
+            [(item.quantity, order.id, item.product.id) for item in changes.changed],
+            many=True
+        )
+
+    # 2c. Itens novos
+    if changes.added:
+        # Uma tupla por item para o 'executemany'
+        items_data = [
+            (
+                order.id, 
+                item.product.id, 
+                item.quantity,
+                item.product.price # Salva o preço do produto no momento
+            ) 
+            for item in changes.added
+        ]
+        yield Step(INSERT_ORDER_ITEM, items_data, many=True)
+
+
+# --- Histórico (comum às versões síncrona e assíncrona) ---
+
+def history_query(
+    filters: OrderHistoryFilter,
+    after: Optional[OrderHistoryCursor],
+    limit: int
+) -> Tuple[str, tuple]:
+    """Monta o QUERY_ORDER_HISTORY (SQL e parâmetros) para os filtros dados."""
+    conditions: List[str] = []
+    params: list = []
+
+    if filters.date_from is not None:
+        conditions.append("created_at >= %s")
+        params.append(filters.date_from)
+    if filters.date_to is not None:
+        conditions.append("created_at < %s")
+        params.append(filters.date_to)
+    if filters.table_id is not None:
+        conditions.append("table_number = %s")
+        params.append(filters.table_id)
+    if filters.waiter_id is not None:
+        conditions.append("waiter_id = %s")
+        params.append(filters.waiter_id)
+    if filters.status is not None:
+        conditions.append("status = %s")
+        params.append(filters.status.value)
+
+    # Keyset: tudo que vem DEPOIS do último pedido entregue.
+    # (Escrito por extenso: o MySQL usa a faixa do índice nesta forma.)
+    if after is not None:
+        conditions.append("(created_at < %s OR (created_at = %s AND id < %s))")
+        params.extend((after.created_at, after.created_at, after.id))
+
+    # Os mesmos filtros nos dois lados do UNION (ativos e arquivados);
+    # uma linha a mais que o limite indica que há próxima página
+    query = QUERY_ORDER_HISTORY.format(conditions=" AND ".join(conditions) or "TRUE")
+    page_size = limit + 1
+    return query, (*params, page_size, *params, page_size, page_size)
+
+
+def history_items_query(order_ids) -> Tuple[str, tuple]:
+    """Monta o QUERY_HISTORY_ITEMS_BY_ORDERS para os pedidos de uma página."""
+    order_ids = tuple(order_ids)
+    placeholders = ','.join(['%s'] * len(order_ids))
+    return QUERY_HISTORY_ITEMS_BY_ORDERS.format(placeholders=placeholders), order_ids * 2
+
+
+def history_page(orders: List[Order], has_more: bool) -> OrderHistoryPage:
+    """Página com os pedidos (já na ordem da consulta) e o cursor da próxima."""
+    next_cursor = OrderHistoryCursor.after(orders[-1]) if has_more else None
+    return OrderHistoryPage(orders=orders, next_cursor=next_cursor)
@@ -1,6 +1,7 @@
 # import mysql.connector
+import dataclasses
 from mysql.connector import Error
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Importa a PORTA (Interface) que esta classe implementa
 from domain.ports.product_repository import ProductRepositoryPort
@@ -9,7 +10,97 @@ from domain.ports.product_repository import ProductRepositoryPort
 from domain.models import Product
 
 # Importa o POOL de conexões
-from .connection_pool import connection_pool
+from .connection_pool import connection_pool, register_prepared
+from .read_routing import read_router
+from .version_counter import BUMP_DATASET_VERSION, MENU_DATASET
+
+
+# --- Consultas (colunas explícitas, na ordem do _row_to_product) ---
+PRODUCT_COLUMNS = "id, name, price, availability, category, imageUrl, visibility"
+
+QUERY_VISIBLE_PRODUCTS = f"SELECT {PRODUCT_COLUMNS} FROM products WHERE visibility = TRUE"
+QUERY_PRODUCT_BY_ID = f"SELECT {PRODUCT_COLUMNS} FROM products WHERE id = %s"
+QUERY_PRODUCTS_BY_IDS = f"SELECT {PRODUCT_COLUMNS} FROM products WHERE id IN ({{placeholders}})"
+QUERY_ALL_PRODUCTS = f"SELECT {PRODUCT_COLUMNS} FROM products"
+
+INSERT_PRODUCT = """
+    INSERT INTO products (name, price, availability, category, imageUrl, visibility)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+UPDATE_PRODUCT = """
+    UPDATE products SET name = %s, price = %s, availability = %s,
+                        category = %s, imageUrl = %s, visibility = %s
+    WHERE id = %s
+"""
+
+# --- Exportação / importação do cardápio em lote ---
+
+# Uma página em ordem de ID, a partir da anterior (keyset pela PK)
+QUERY_PRODUCTS_PAGE = f"SELECT {PRODUCT_COLUMNS} FROM products WHERE id > %s ORDER BY id LIMIT %s"
+
+# As linhas atuais do lote, travadas até o fim da transação (o diff e a
+# gravação veem o mesmo estado)
+QUERY_PRODUCTS_BY_IDS_FOR_UPDATE = QUERY_PRODUCTS_BY_IDS + " FOR UPDATE"
+
+# ID NULL: produto novo (AUTO_INCREMENT); ID informado: insere com esse ID
+# ou atualiza o existente
+UPSERT_PRODUCT = f"""
+    INSERT INTO products ({PRODUCT_COLUMNS})
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        name = VALUES(name), price = VALUES(price), availability = VALUES(availability),
+        category = VALUES(category), imageUrl = VALUES(imageUrl), visibility = VALUES(visibility)
+"""
+
+# Comandos de texto fixo usados a cada request: prepared statements
+# (preparados uma vez por conexão do pool; ver connection_pool.py)
+register_prepared(
+    QUERY_VISIBLE_PRODUCTS, QUERY_PRODUCT_BY_ID, QUERY_ALL_PRODUCTS,
+    INSERT_PRODUCT, UPDATE_PRODUCT, QUERY_PRODUCTS_PAGE
+)
+
+DEFAULT_EXPORT_BATCH_SIZE = 500
+
+
+def diff_products(
+    products: List[Product], current: Dict[int, Product]
+) -> Tuple[List[Product], int, int, int]:
+    """
+    Compara um lote com as linhas atuais ('current', por ID).
+    Retorna (a gravar, inseridos, atualizados, iguais). Um ID repetido no
+    lote vale pela última ocorrência; o preço é comparado como o DECIMAL(10,2).
+    """
+    latest: Dict[int, Product] = {}
+    changed: List[Product] = []
+    for product in products:
+        if product.id:
+            latest[product.id] = product
+        else:
+            changed.append(product) # Sem ID: sempre um produto novo
+
+    inserted, updated, unchanged = len(changed), 0, 0
+    for product_id, product in latest.items():
+        existing = current.get(product_id)
+        if existing is None:
+            inserted += 1
+        elif existing == dataclasses.replace(product, price=round(product.price, 2)):
+            unchanged += 1
+            continue
+        else:
+            updated += 1
+        changed.append(product)
+
+    return changed, inserted, updated, unchanged
+
+
+def upsert_params(product: Product) -> tuple:
+    """Parâmetros do UPSERT_PRODUCT (ID 0 vira NULL: AUTO_INCREMENT)."""
+    return (
+        product.id or None, product.name, product.price, product.availability,
+        product.category, product.imageUrl, product.visibility
+    )
+
 
 class MySQLProductRepository(ProductRepositoryPort):
     """
@@ -19,9 +110,11 @@ class MySQLProductRepository(ProductRepositoryPort):
     
     def __init__(self):
         """
-        O construtor armazena uma referência ao pool de conexões.
+        O construtor armazena uma referência ao pool de conexões
+        (escritas) e ao roteador de leituras (primário ou réplica).
         """
         self.pool = connection_pool
+        self.read_pool = read_router
 
     def _row_to_product(self, row: dict) -> Product:
         """
@@ -43,15 +136,12 @@ class MySQLProductRepository(ProductRepositoryPort):
 
     def get_visible_products(self) -> List[Product]:
         products_list = []
-        # Selecionamos * para que o _row_to_product funcione
-        query = "SELECT * FROM products WHERE visibility = TRUE"
-        
         try:
             # Pega uma conexão "emprestada" do pool
-            with self.pool.get_connection() as connection:
+            with self.read_pool.get_connection() as connection:
                 # O 'with' garante que o cursor será fechado
                 with connection.cursor(dictionary=True) as cursor:
-                    cursor.execute(query)
+                    cursor.execute(QUERY_VISIBLE_PRODUCTS)
                     results = cursor.fetchall()
                     
                     for row in results:
@@ -65,12 +155,10 @@ class MySQLProductRepository(ProductRepositoryPort):
             return [] # Retorna vazio em caso de erro
 
     def find_by_id(self, product_id: int) -> Optional[Product]:
-        query = "SELECT * FROM products WHERE id = %s"
-        
         try:
-            with self.pool.get_connection() as connection:
+            with self.read_pool.get_connection() as connection:
                 with connection.cursor(dictionary=True) as cursor:
-                    cursor.execute(query, (product_id,))
+                    cursor.execute(QUERY_PRODUCT_BY_ID, (product_id,))
                     row = cursor.fetchone()
                     
                     if row:
@@ -81,14 +169,38 @@ class MySQLProductRepository(ProductRepositoryPort):
             print(f"Erro ao buscar produto por ID {product_id}: {e}")
             return None
 
+    def find_by_ids(self, product_ids: List[int]) -> Dict[int, Product]:
+        products_map: Dict[int, Product] = {}
+        unique_ids = tuple(dict.fromkeys(product_ids)) # Remove duplicados, mantendo a ordem
+        if not unique_ids:
+            return products_map
+
+        # Uma única consulta com IN (...) em vez de uma por produto
+        placeholders = ','.join(['%s'] * len(unique_ids))
+        query = QUERY_PRODUCTS_BY_IDS.format(placeholders=placeholders)
+
+        try:
+            with self.read_pool.get_connection() as connection:
+                with connection.cursor(dictionary=True) as cursor:
+                    cursor.execute(query, unique_ids)
+                    results = cursor.fetchall()
+
+                    for row in results:
+                        product = self._row_to_product(row)
+                        products_map[product.id] = product
+
+            return products_map
+
+        except Error as e:
+            print(f"Erro ao buscar produtos por IDs {unique_ids}: {e}")
+            return {}
+
     def get_all(self) -> List[Product]:
         products_list = []
-        query = "SELECT * FROM products" # O Admin vê todos
-        
         try:
-            with self.pool.get_connection() as connection:
+            with self.read_pool.get_connection() as connection:
                 with connection.cursor(dictionary=True) as cursor:
-                    cursor.execute(query)
+                    cursor.execute(QUERY_ALL_PRODUCTS) # O Admin vê todos
                     results = cursor.fetchall()
                     
                     for row in results:
@@ -107,21 +219,14 @@ class MySQLProductRepository(ProductRepositoryPort):
         """
         if product.id == 0:
             # Lógica de INSERT
-            query = """
-                INSERT INTO products (name, price, availability, category, imageUrl, visibility) 
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
+            query = INSERT_PRODUCT
             params = (
                 product.name, product.price, product.availability,
                 product.category, product.imageUrl, product.visibility
             )
         else:
             # Lógica de UPDATE
-            query = """
-                UPDATE products SET name = %s, price = %s, availability = %s, 
-                                   category = %s, imageUrl = %s, visibility = %s
-                WHERE id = %s
-            """
+            query = UPDATE_PRODUCT
             params = (
                 product.name, product.price, product.availability,
                 product.category, product.imageUrl, product.visibility,
@@ -133,14 +238,78 @@ class MySQLProductRepository(ProductRepositoryPort):
                 # Cursor normal, não 'dictionary=True', pois estamos escrevendo
                 with connection.cursor() as cursor:
                     cursor.execute(query, params)
-                    connection.commit() # ESSENCIAL: Salva as mudanças no DB
-                    
                     if product.id == 0:
                         # Se foi um INSERT, atualiza o objeto com o novo ID
-                        product.id = cursor.lastrowid 
+                        product.id = cursor.lastrowid
+
+                    # Nova versão do cardápio (ETag), na mesma transação
+                    cursor.execute(BUMP_DATASET_VERSION, (MENU_DATASET,))
+                    connection.commit() # ESSENCIAL: Salva as mudanças no DB
                     
                     return product # Retorna o objeto atualizado
         except Error as e:
             print(f"Erro ao salvar produto: {e}")
             # Em um app real, você relançaria uma exceção
-            raise e
\ No newline at end of file
+            raise e
+
+    def iter_all(self, batch_size: int = DEFAULT_EXPORT_BATCH_SIZE) -> Iterator[Product]:
+        """
+        Uma conexão emprestada por página e devolvida antes de entregar os
+        produtos: quem consome devagar (ex: download do CSV) não segura o pool.
+        """
+        last_id = 0
+        while True:
+            try:
+                with self.read_pool.get_connection() as connection:
+                    with connection.cursor(dictionary=True) as cursor:
+                        cursor.execute(QUERY_PRODUCTS_PAGE, (last_id, batch_size))
+                        rows = cursor.fetchall()
+            except Error as e:
+                print(f"Erro ao exportar produtos após o ID {last_id}: {e}")
+                raise e
+
+            for row in rows:
+                yield self._row_to_product(row)
+
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1]['id']
+
+    def upsert_batch(self, products: List[Product]) -> Tuple[int, int, int]:
+        """
+        Diff e gravação na mesma transação: lê as linhas atuais do lote
+        (FOR UPDATE), descarta os produtos iguais e grava o resto com um
+        único INSERT ... ON DUPLICATE KEY UPDATE de várias linhas.
+        """
+        ids = tuple(dict.fromkeys(product.id for product in products if product.id))
+
+        try:
+            with self.pool.get_connection() as connection:
+                connection.start_transaction()
+
+                try:
+                    with connection.cursor(dictionary=True) as cursor:
+                        # 1. Linhas atuais (só as do lote)
+                        current: Dict[int, Product] = {}
+                        if ids:
+                            placeholders = ','.join(['%s'] * len(ids))
+                            cursor.execute(QUERY_PRODUCTS_BY_IDS_FOR_UPDATE.format(placeholders=placeholders), ids)
+                            current = {row['id']: self._row_to_product(row) for row in cursor.fetchall()}
+
+                        # 2. Só o que é novo ou mudou
+                        changed, inserted, updated, unchanged = diff_products(products, current)
+                        if changed:
+                            cursor.executemany(UPSERT_PRODUCT, [upsert_params(product) for product in changed])
+                            cursor.execute(BUMP_DATASET_VERSION, (MENU_DATASET,))
+
+                    connection.commit()
+                    return inserted, updated, unchanged
+
+                except Error as e:
+                    print(f"Erro ao gravar lote de {len(products)} produtos. (ROLLBACK)")
+                    connection.rollback()
+                    raise e
+
+        except Error as e:
+            print(f"Erro ao obter conexão para gravar produtos: {e}")
+            raise e
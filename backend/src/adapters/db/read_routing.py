@@ -0,0 +1,301 @@
+"""
+Separação de leituras e escritas entre o MySQL primário e uma réplica.
+
+Os repositórios gravam sempre pelo pool do primário ('self.pool') e leem
+por um ReadRouter ('self.read_pool'), que tem a mesma interface do pool
+(get_connection) e escolhe, a cada leitura, de qual pool emprestar:
+
+- Só usa a réplica dentro de um "escopo de leitura" aberto pela camada
+  web para requests GET/HEAD. Requests que gravam (POST, PUT...) leem do
+  primário: o que eles leem vira base de uma escrita (ex: fechar a mesa).
+  Fora de um request (CLI, scripts, testes) também lê do primário.
+- Read-your-writes: depois que um usuário grava (commit no primário),
+  as leituras DELE vão ao primário por 'read_your_writes_seconds'.
+- A réplica deixa de ser usada se o atraso dela (medido a cada
+  'lag_check_seconds') passar de 'max_lag_seconds', ou se não puder ser
+  medido (réplica fora do ar, replicação parada).
+- Um trecho pode exigir o primário com 'with primary_reads():' (ex: o
+  preenchimento dos caches, que guardariam um dado velho durante o TTL).
+
+NOTA: As janelas de read-your-writes vivem no processo (como o
+KitchenEventFeed): com vários workers, o request seguinte do garçom pode
+cair em outro worker e ler da réplica.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+from mysql.connector import Error
+
+from .db_config import pool_config, replica_config, read_routing_config
+from .connection_pool import ConnectionPool, connection_pool
+from .async_connection_pool import AsyncConnectionPool
+
+# Atraso da réplica (MySQL 8.0.22+; precisa de REPLICATION CLIENT)
+QUERY_REPLICA_STATUS = "SHOW REPLICA STATUS"
+
+
+# --- Escopo de Leitura (por request) ---
+
+class _ReadScope:
+    """Quem está lendo e se pode ler da réplica."""
+
+    __slots__ = ("replica_allowed", "session")
+
+    def __init__(self, replica_allowed: bool):
+        self.replica_allowed = replica_allowed
+        self.session: Any = None # Ex: ID do usuário autenticado
+
+
+_scope: ContextVar[Optional[_ReadScope]] = ContextVar("read_scope", default=None)
+_force_primary: ContextVar[bool] = ContextVar("force_primary", default=False)
+
+
+def begin_scope(replica_allowed: bool):
+    """Abre o escopo do request atual (chamado pelo middleware web)."""
+    _scope.set(_ReadScope(replica_allowed))
+
+
+def bind_session(session: Any):
+    """Associa o request atual a um usuário (para o read-your-writes)."""
+    scope = _scope.get()
+    if scope is not None:
+        scope.session = session
+
+
+def end_scope():
+    """Fecha o escopo do request atual."""
+    _scope.set(None)
+
+
+@contextmanager
+def primary_reads():
+    """Dentro do bloco 'with', todas as leituras vão ao primário."""
+    token = _force_primary.set(True)
+    try:
+        yield
+    finally:
+        _force_primary.reset(token)
+
+
+def _lag_from_status(row: Optional[dict]) -> Optional[float]:
+    """
+    Extrai o atraso (segundos) do SHOW REPLICA STATUS.
+    None = desconhecido (servidor não é réplica, ou a replicação parou).
+    """
+    if not row:
+        return None
+    lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+    return None if lag is None else float(lag)
+
+
+# --- Roteador ---
+
+class ReadRouter:
+    """
+    Pool "de leitura" dos repositórios: empresta conexões da réplica ou
+    do primário, conforme as regras do módulo. Sem réplica configurada,
+    é um repasse direto para o primário.
+    """
+
+    def __init__(
+        self,
+        primary: ConnectionPool,
+        replica: Optional[ConnectionPool] = None,
+        read_your_writes_seconds: float = 5.0,
+        max_lag_seconds: float = 2.0,
+        lag_check_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            primary: Pool do primário (recebe também as escritas).
+            replica: Pool da réplica (None = sem réplica).
+            read_your_writes_seconds: Janela de leitura no primário após uma escrita.
+            max_lag_seconds: Atraso máximo aceito da réplica.
+            lag_check_seconds: Intervalo entre medições do atraso.
+            clock: Relógio (substituível nos testes).
+        """
+        self.primary = primary
+        self.replica = replica
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self.lag_check_seconds = lag_check_seconds
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._last_write: Dict[Any, float] = {} # { sessão -> momento da última escrita }
+        self._lag_checked_at: Optional[float] = None
+        self.lag_seconds: Optional[float] = None
+
+        # Contadores (expostos em /metrics)
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.reads_after_write = 0 # Primário por causa do read-your-writes
+        self.lag_fallbacks = 0     # Primário por causa do atraso da réplica
+        self.replica_errors = 0
+        self.lag_checks = 0
+        self.lag_check_failures = 0
+
+        # Toda escrita confirmada no primário abre a janela do usuário
+        primary.commit_listeners.append(self.note_write)
+
+    # --- Escritas ---
+
+    def note_write(self):
+        """Registra uma escrita do usuário do request atual (após o commit)."""
+        scope = _scope.get()
+        if scope is None or scope.session is None:
+            return
+        now = self._clock()
+        with self._lock:
+            self._last_write[scope.session] = now
+            # Descarta janelas vencidas de vez em quando (memória limitada)
+            if len(self._last_write) > 1000:
+                self._last_write = {
+                    session: at for session, at in self._last_write.items()
+                    if now - at < self.read_your_writes_seconds
+                }
+
+    # --- Decisão ---
+
+    def _wants_replica(self) -> bool:
+        """Tudo que decide a leitura, menos o atraso da réplica."""
+        if self.replica is None or _force_primary.get():
+            return False
+        scope = _scope.get()
+        if scope is None or not scope.replica_allowed:
+            return False
+
+        if scope.session is not None:
+            last_write = self._last_write.get(scope.session)
+            if last_write is not None and self._clock() - last_write < self.read_your_writes_seconds:
+                self.reads_after_write += 1
+                return False
+        return True
+
+    def _lag_check_due(self) -> bool:
+        """True para UM chamador por intervalo: ele mede o atraso."""
+        now = self._clock()
+        with self._lock:
+            if self._lag_checked_at is not None and now - self._lag_checked_at < self.lag_check_seconds:
+                return False
+            self._lag_checked_at = now
+            return True
+
+    def _record_lag(self, lag: Optional[float]):
+        self.lag_checks += 1
+        self.lag_seconds = lag
+
+    def _lag_ok(self) -> bool:
+        if self.lag_seconds is not None and self.lag_seconds <= self.max_lag_seconds:
+            return True
+        self.lag_fallbacks += 1
+        return False
+
+    def _replica_failed(self, e: Error):
+        """A réplica não entregou conexão: volta ao primário até a próxima medição."""
+        print(f"Erro ao conectar na réplica (usando o primário): {e}")
+        self.replica_errors += 1
+        self.lag_seconds = None
+        with self._lock:
+            self._lag_checked_at = self._clock()
+
+    # --- Interface de Pool ---
+
+    def get_connection(self):
+        """Empresta uma conexão da réplica ou do primário (use com 'with')."""
+        if self._wants_replica():
+            if self._lag_check_due():
+                self._record_lag(self._measure_lag())
+            if self._lag_ok():
+                try:
+                    connection = self.replica.get_connection()
+                    self.replica_reads += 1
+                    return connection
+                except Error as e:
+                    self._replica_failed(e)
+
+        self.primary_reads += 1
+        return self.primary.get_connection()
+
+    def _measure_lag(self) -> Optional[float]:
+        try:
+            with self.replica.get_connection() as connection:
+                with connection.cursor(dictionary=True) as cursor:
+                    cursor.execute(QUERY_REPLICA_STATUS)
+                    return _lag_from_status(cursor.fetchone())
+        except Error as e:
+            print(f"Erro ao medir o atraso da réplica: {e}")
+            self.lag_check_failures += 1
+            return None
+
+    # --- Observabilidade ---
+
+    def stats(self) -> dict:
+        """Retorna os contadores do roteamento (e do pool da réplica)."""
+        return {
+            "replica_configured": self.replica is not None,
+            "lag_seconds": self.lag_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "reads_after_write": self.reads_after_write,
+            "lag_fallbacks": self.lag_fallbacks,
+            "replica_errors": self.replica_errors,
+            "lag_checks": self.lag_checks,
+            "lag_check_failures": self.lag_check_failures,
+            "replica_pool": self.replica.stats() if self.replica else None,
+        }
+
+
+class AsyncReadRouter(ReadRouter):
+    """Versão do ReadRouter para os pools assíncronos (app ASGI)."""
+
+    def __init__(self, primary: AsyncConnectionPool, replica: Optional[AsyncConnectionPool] = None, **kwargs):
+        super().__init__(primary, replica, **kwargs)
+
+    async def get_connection(self):
+        """Empresta uma conexão da réplica ou do primário (use com 'async with')."""
+        if self._wants_replica():
+            if self._lag_check_due():
+                self._record_lag(await self._measure_lag())
+            if self._lag_ok():
+                try:
+                    connection = await self.replica.get_connection()
+                    self.replica_reads += 1
+                    return connection
+                except Error as e:
+                    self._replica_failed(e)
+
+        self.primary_reads += 1
+        return await self.primary.get_connection()
+
+    async def _measure_lag(self) -> Optional[float]:
+        try:
+            async with await self.replica.get_connection() as connection:
+                async with await connection.cursor(dictionary=True) as cursor:
+                    await cursor.execute(QUERY_REPLICA_STATUS)
+                    return _lag_from_status(await cursor.fetchone())
+        except Error as e:
+            print(f"Erro ao medir o atraso da réplica: {e}")
+            self.lag_check_failures += 1
+            return None
+
+
+# --- Instâncias ---
+
+def create_async_read_router(primary: AsyncConnectionPool) -> AsyncReadRouter:
+    """Cria o roteador do app ASGI (réplica conforme DB_REPLICA_*)."""
+    replica = AsyncConnectionPool(replica_config, **pool_config) if replica_config['host'] else None
+    return AsyncReadRouter(primary, replica, **read_routing_config)
+
+
+# Roteador usado pelos repositórios síncronos (sobre o 'connection_pool')
+read_router = ReadRouter(
+    connection_pool,
+    ConnectionPool(replica_config, **pool_config) if replica_config['host'] else None,
+    **read_routing_config
+)
@@ -0,0 +1,184 @@
+from mysql.connector import Error
+from typing import List
+from datetime import date
+
+# Importa a PORTA (Interface)
+from domain.ports.sales_report_repository import SalesReportRepositoryPort
+
+# Importa os MODELOS de domínio
+from domain.models import SalesDimension, SalesReportLine
+
+from .connection_pool import register_prepared
+# Leituras (primário ou réplica)
+from .read_routing import read_router
+
+
+# --- Resumos de vendas (rollups) ---
+# Uma linha por (hora), (dia, produto), (dia, categoria) e (dia, garçom),
+# somada de forma incremental quando um pedido passa para 'completed'
+# (na mesma transação do UPDATE versionado do pedido, no
+# MySQLOrderRepository): cada conclusão é contada uma única vez, e os
+# relatórios leem só estas tabelas (ver database/migrations/006).
+#
+# Todas recebem (order_id,). O valor é o preço gravado no pedido
+# (order_items.price_at_order), não o preço atual do cardápio.
+# (O SELECT interno agrupa; o externo, sem GROUP BY, permite o
+# ON DUPLICATE KEY UPDATE com VALUES().)
+
+RECORD_HOURLY_SALES = """
+    INSERT INTO sales_hourly (hour, orders_count, items_count, revenue)
+    SELECT sale_hour, 1, sale_items, sale_revenue FROM (
+        SELECT TIMESTAMP(DATE(o.created_at), MAKETIME(HOUR(o.created_at), 0, 0)) AS sale_hour,
+               COALESCE(SUM(oi.quantity), 0) AS sale_items,
+               COALESCE(SUM(oi.quantity * oi.price_at_order), 0) AS sale_revenue
+        FROM orders o
+        LEFT JOIN order_items oi ON oi.order_id = o.id
+        WHERE o.id = %s
+        GROUP BY o.id, o.created_at
+    ) AS sale
+    ON DUPLICATE KEY UPDATE
+        orders_count = sales_hourly.orders_count + 1,
+        items_count = sales_hourly.items_count + VALUES(items_count),
+        revenue = sales_hourly.revenue + VALUES(revenue)
+"""
+
+RECORD_PRODUCT_SALES = """
+    INSERT INTO sales_by_product (day, product_id, orders_count, items_count, revenue)
+    SELECT sale_day, sale_product_id, 1, sale_items, sale_revenue FROM (
+        SELECT DATE(o.created_at) AS sale_day, oi.product_id AS sale_product_id,
+               SUM(oi.quantity) AS sale_items,
+               SUM(oi.quantity * oi.price_at_order) AS sale_revenue
+        FROM orders o
+        JOIN order_items oi ON oi.order_id = o.id
+        WHERE o.id = %s
+        GROUP BY DATE(o.created_at), oi.product_id
+    ) AS sale
+    ON DUPLICATE KEY UPDATE
+        orders_count = sales_by_product.orders_count + 1,
+        items_count = sales_by_product.items_count + VALUES(items_count),
+        revenue = sales_by_product.revenue + VALUES(revenue)
+"""
+
+RECORD_CATEGORY_SALES = """
+    INSERT INTO sales_by_category (day, category, orders_count, items_count, revenue)
+    SELECT sale_day, sale_category, 1, sale_items, sale_revenue FROM (
+        SELECT DATE(o.created_at) AS sale_day, COALESCE(p.category, '') AS sale_category,
+               SUM(oi.quantity) AS sale_items,
+               SUM(oi.quantity * oi.price_at_order) AS sale_revenue
+        FROM orders o
+        JOIN order_items oi ON oi.order_id = o.id
+        JOIN products p ON p.id = oi.product_id
+        WHERE o.id = %s
+        GROUP BY DATE(o.created_at), COALESCE(p.category, '')
+    ) AS sale
+    ON DUPLICATE KEY UPDATE
+        orders_count = sales_by_category.orders_count + 1,
+        items_count = sales_by_category.items_count + VALUES(items_count),
+        revenue = sales_by_category.revenue + VALUES(revenue)
+"""
+
+RECORD_WAITER_SALES = """
+    INSERT INTO sales_by_waiter (day, waiter_id, orders_count, items_count, revenue)
+    SELECT sale_day, sale_waiter_id, 1, sale_items, sale_revenue FROM (
+        SELECT DATE(o.created_at) AS sale_day, o.waiter_id AS sale_waiter_id,
+               COALESCE(SUM(oi.quantity), 0) AS sale_items,
+               COALESCE(SUM(oi.quantity * oi.price_at_order), 0) AS sale_revenue
+        FROM orders o
+        LEFT JOIN order_items oi ON oi.order_id = o.id
+        WHERE o.id = %s
+        GROUP BY o.id, o.created_at, o.waiter_id
+    ) AS sale
+    ON DUPLICATE KEY UPDATE
+        orders_count = sales_by_waiter.orders_count + 1,
+        items_count = sales_by_waiter.items_count + VALUES(items_count),
+        revenue = sales_by_waiter.revenue + VALUES(revenue)
+"""
+
+# Executadas em ordem, todas com (order_id,)
+RECORD_SALE_STATEMENTS = (
+    RECORD_HOURLY_SALES, RECORD_PRODUCT_SALES, RECORD_CATEGORY_SALES, RECORD_WAITER_SALES
+)
+
+# --- Relatórios (só os resumos; faixa na PK, que começa pela hora/dia) ---
+# Colunas comuns: sales_key, label, orders_count, items_count, revenue
+
+QUERY_SALES_BY_HOUR = """
+    SELECT hour AS sales_key, NULL AS label, orders_count, items_count, revenue
+    FROM sales_hourly
+    WHERE hour >= %s AND hour < %s
+    ORDER BY hour
+"""
+
+QUERY_SALES_BY_PRODUCT = """
+    SELECT s.product_id AS sales_key, p.name AS label,
+           SUM(s.orders_count) AS orders_count, SUM(s.items_count) AS items_count,
+           SUM(s.revenue) AS revenue
+    FROM sales_by_product s
+    JOIN products p ON p.id = s.product_id
+    WHERE s.day >= %s AND s.day < %s
+    GROUP BY s.product_id, p.name
+    ORDER BY SUM(s.revenue) DESC, s.product_id
+"""
+
+QUERY_SALES_BY_CATEGORY = """
+    SELECT category AS sales_key, NULL AS label,
+           SUM(orders_count) AS orders_count, SUM(items_count) AS items_count,
+           SUM(revenue) AS revenue
+    FROM sales_by_category
+    WHERE day >= %s AND day < %s
+    GROUP BY category
+    ORDER BY SUM(revenue) DESC, category
+"""
+
+QUERY_SALES_BY_WAITER = """
+    SELECT s.waiter_id AS sales_key, u.name AS label,
+           SUM(s.orders_count) AS orders_count, SUM(s.items_count) AS items_count,
+           SUM(s.revenue) AS revenue
+    FROM sales_by_waiter s
+    JOIN users u ON u.id = s.waiter_id
+    WHERE s.day >= %s AND s.day < %s
+    GROUP BY s.waiter_id, u.name
+    ORDER BY SUM(s.revenue) DESC, s.waiter_id
+"""
+
+SALES_QUERIES = {
+    SalesDimension.HOUR: QUERY_SALES_BY_HOUR,
+    SalesDimension.PRODUCT: QUERY_SALES_BY_PRODUCT,
+    SalesDimension.CATEGORY: QUERY_SALES_BY_CATEGORY,
+    SalesDimension.WAITER: QUERY_SALES_BY_WAITER,
+}
+
+# Comandos de texto fixo: prepared statements (ver connection_pool.py)
+register_prepared(*RECORD_SALE_STATEMENTS, *SALES_QUERIES.values())
+
+
+def row_to_sales_line(row: dict) -> SalesReportLine:
+    """Converte uma linha dos SALES_QUERIES (SUMs chegam como Decimal)."""
+    return SalesReportLine(
+        key=row['sales_key'],
+        label=row['label'],
+        orders=int(row['orders_count']),
+        items=int(row['items_count']),
+        revenue=float(row['revenue'])
+    )
+
+
+class MySQLSalesReportRepository(SalesReportRepositoryPort):
+    """
+    Implementação CONCRETA da SalesReportRepositoryPort.
+    Lê os resumos de vendas (de preferência na réplica).
+    """
+
+    def __init__(self):
+        self.read_pool = read_router # Leituras (primário ou réplica)
+
+    def find_sales(self, dimension: SalesDimension, date_from: date, date_to: date) -> List[SalesReportLine]:
+        try:
+            with self.read_pool.get_connection() as connection:
+                with connection.cursor(dictionary=True) as cursor:
+                    cursor.execute(SALES_QUERIES[dimension], (date_from, date_to))
+                    return [row_to_sales_line(row) for row in cursor.fetchall()]
+
+        except Error as e:
+            print(f"Erro ao buscar o relatório de vendas por {dimension.value}: {e}")
+            raise e
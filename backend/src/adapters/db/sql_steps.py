@@ -0,0 +1,52 @@
+"""
+Sequências de SQL comuns aos repositórios síncronos e assíncronos.
+
+Uma gravação com várias etapas (ex: arquivar a sessão e fechar a mesa,
+reservar a sessão e inserir o pedido) é escrita UMA vez, como um gerador
+que produz os comandos (Step) e recebe de volta o cursor depois de cada um
+(para ler 'rowcount'/'lastrowid' e decidir o próximo passo). O valor de
+'return' do gerador é o resultado da gravação.
+
+Os repositórios só executam os passos: run_steps (mysql.connector) ou
+run_steps_async (mysql.connector.aio, com await).
+"""
+from typing import Any, Generator, NamedTuple, Sequence
+
+
+class Step(NamedTuple):
+    """Um comando da sequência: cursor.execute ou cursor.executemany."""
+    statement: str
+    params: Sequence[Any] = ()
+    many: bool = False
+
+
+# Produz Steps, recebe o cursor após cada um e retorna o resultado
+StepGenerator = Generator[Step, Any, Any]
+
+
+def run_steps(cursor, steps: StepGenerator) -> Any:
+    """Executa a sequência num cursor síncrono e retorna o seu resultado."""
+    try:
+        step = next(steps)
+        while True:
+            if step.many:
+                cursor.executemany(step.statement, step.params)
+            else:
+                cursor.execute(step.statement, step.params)
+            step = steps.send(cursor)
+    except StopIteration as done:
+        return done.value
+
+
+async def run_steps_async(cursor, steps: StepGenerator) -> Any:
+    """Mesma execução do run_steps, num cursor assíncrono."""
+    try:
+        step = next(steps)
+        while True:
+            if step.many:
+                await cursor.executemany(step.statement, step.params)
+            else:
+                await cursor.execute(step.statement, step.params)
+            step = steps.send(cursor)
+    except StopIteration as done:
+        return done.value
@@ -12,9 +12,60 @@ from domain.models import (
     Order, OrderStatus, 
     ItemOrder, Product
 )
+from domain.exceptions import ConcurrencyConflictException
 
 # Importa o POOL de conexões
-from .connection_pool import connection_pool
+from .connection_pool import connection_pool, register_prepared
+from .read_routing import read_router
+from .order_archive import ARCHIVE_SESSION_STATEMENTS
+from .version_counter import BUMP_DATASET_VERSION, TABLES_DATASET
+from .sql_steps import Step, StepGenerator, run_steps
+
+
+# Mesa + pedidos da sessão atual + itens + produtos, em um único round trip.
+# Usa o índice de 'orders.session_id' (ver database/migrations/001).
+QUERY_TABLE_DETAILS = """
+    SELECT
+        t.id, t.status, t.number_of_people, t.current_session_id, t.version,
+        o.id as order_id, o.table_number as order_table_number,
+        o.waiter_id as order_waiter_id, o.status as order_status,
+        o.created_at as order_created_at, o.session_id as order_session_id,
+        o.version as order_version,
+        oi.quantity,
+        p.id as product_id, p.name as product_name, p.price as product_price,
+        p.availability as product_availability, p.category as product_category,
+        p.imageUrl as product_imageUrl, p.visibility as product_visibility
+    FROM tables t
+    LEFT JOIN orders o ON o.session_id = t.current_session_id
+    LEFT JOIN order_items oi ON oi.order_id = o.id
+    LEFT JOIN products p ON p.id = oi.product_id
+    WHERE t.id = %s
+    ORDER BY o.id, oi.id
+"""
+
+QUERY_ALL_TABLES = "SELECT id, status, number_of_people, current_session_id, version FROM tables"
+
+INSERT_TABLE_SESSION = "INSERT INTO table_sessions (table_id, number_of_people) VALUES (%s, %s)"
+
+# Índice: table_sessions(table_id, closed_at) (ver database/migrations/002)
+CLOSE_TABLE_SESSION = """
+    UPDATE table_sessions SET closed_at = NOW()
+    WHERE table_id = %s AND closed_at IS NULL
+"""
+
+# Controle otimista: só grava se a versão ainda for a lida na carga
+# (0 linhas alteradas = outra pessoa salvou antes, ou um pedido novo entrou)
+UPDATE_TABLE = """
+    UPDATE tables SET status = %s, number_of_people = %s, current_session_id = %s,
+        version = version + 1
+    WHERE id = %s AND version = %s
+"""
+
+# Comandos de texto fixo: prepared statements (ver connection_pool.py)
+register_prepared(
+    QUERY_TABLE_DETAILS, QUERY_ALL_TABLES, INSERT_TABLE_SESSION,
+    CLOSE_TABLE_SESSION, UPDATE_TABLE, *ARCHIVE_SESSION_STATEMENTS
+)
 
 class MySQLTableRepository(TableRepositoryPort):
     """
@@ -22,10 +73,11 @@ class MySQLTableRepository(TableRepositoryPort):
     """
     
     def __init__(self):
-        self.pool = connection_pool
+        self.pool = connection_pool      # Escritas (primário)
+        self.read_pool = read_router     # Leituras (primário ou réplica)
 
     # --- Funções de Mapeamento (Tradução DB -> Domínio) ---
-    # (Estas são as mesmas do OrderRepository, necessárias para
+    # (Equivalentes às do OrderRepository, necessárias para
     # construir os pedidos aninhados em find_by_id)
 
     def _row_to_table(self, row: dict) -> Table:
@@ -34,16 +86,24 @@ class MySQLTableRepository(TableRepositoryPort):
             id=row['id'],
             status=TableStatus(row['status']), # Converte string "available" para Enum
             number_of_people=row['number_of_people'],
+            session_id=row['current_session_id'],
+            version=row['version'],
             orders=[] # A lista de pedidos será preenchida depois
         )
 
     def _row_to_order_base(self, row: dict) -> Order:
-        """Converte uma linha da tabela 'orders' para um objeto Order (sem itens)."""
+        """
+        Converte as colunas 'order_*' de uma linha do JOIN (QUERY_TABLE_DETAILS)
+        para um objeto Order (sem itens).
+        """
         return Order(
-            id=row['id'],
-            table_number=row['table_number'],
-            status=OrderStatus(row['status']),
-            created_at=row['created_at'],
+            id=row['order_id'],
+            table_number=row['order_table_number'],
+            waiter_id=row['order_waiter_id'],
+            status=OrderStatus(row['order_status']),
+            created_at=row['order_created_at'],
+            session_id=row['order_session_id'],
+            version=row['order_version'],
             items=[]
         )
 
@@ -62,62 +122,58 @@ class MySQLTableRepository(TableRepositoryPort):
             product=product,
             quantity=row['quantity']
         )
+
+    def _rows_to_table_details(self, rows: List[dict]) -> Table:
+        """
+        "Costura" a mesa, seus pedidos e itens a partir das linhas do
+        QUERY_TABLE_DETAILS (uma linha por item, ordenadas por pedido).
+        """
+        table = self._row_to_table(rows[0])
+
+        orders_map: Dict[int, Order] = {}
+        for row in rows:
+            if row['order_id'] is None:
+                continue # Mesa sem pedidos nesta sessão
+
+            order = orders_map.get(row['order_id'])
+            if order is None:
+                order = self._row_to_order_base(row)
+                orders_map[order.id] = order
+                table.orders.append(order)
+
+            if row['product_id'] is not None:
+                order.attach_item(self._row_to_item_with_product(row))
+
+        # Marca o estado carregado como "igual ao banco"
+        for order in table.orders:
+            order.mark_as_persisted()
+        return table
     
     # --- Implementação dos Métodos da Porta (Leitura) ---
 
     def find_by_id(self, table_id: int) -> Optional[Table]:
         """
-        Busca uma mesa e todos os seus pedidos e itens associados.
-        (Busca "profunda" ou "eager loading").
-        """
-        query_table = "SELECT * FROM tables WHERE id = %s"
-        query_orders = "SELECT * FROM orders WHERE table_number = %s"
-        query_items = """
-            SELECT 
-                oi.order_id, oi.quantity,
-                p.id as product_id, p.name as product_name, p.price as product_price,
-                p.availability as product_availability, p.category as product_category,
-                p.imageUrl as product_imageUrl, p.visibility as product_visibility
-            FROM order_items oi
-            JOIN products p ON oi.product_id = p.id
-            WHERE oi.order_id IN %s
+        Busca uma mesa com os pedidos e itens da SESSÃO ATUAL.
+        (Busca "profunda" ou "eager loading", em uma única consulta).
+
+        Pedidos de sessões já fechadas não são lidos: o JOIN é feito por
+        'orders.session_id = tables.current_session_id' (mesa livre não
+        tem sessão, então volta sem pedidos).
         """
-        
         try:
-            with self.pool.get_connection() as connection:
+            with self.read_pool.get_connection() as connection:
                 with connection.cursor(dictionary=True) as cursor:
                     
-                    # 1. Busca a Mesa (Table)
-                    cursor.execute(query_table, (table_id,))
-                    table_row = cursor.fetchone()
-                    if not table_row:
+                    # 1. Busca mesa + pedidos + itens + produtos de uma vez
+                    # (uma linha por item; LEFT JOIN para trazer a mesa
+                    # mesmo sem pedidos e o pedido mesmo sem itens)
+                    cursor.execute(QUERY_TABLE_DETAILS, (table_id,))
+                    rows = cursor.fetchall()
+                    if not rows:
                         return None # Mesa não encontrada
-                    
-                    table = self._row_to_table(table_row)
-                    
-                    # 2. Busca os Pedidos (Orders) desta mesa
-                    cursor.execute(query_orders, (table_id,))
-                    order_rows = cursor.fetchall()
-                    if not order_rows:
-                        return table # Retorna a mesa (com lista de pedidos vazia)
-
-                    # 3. Mapeia pedidos e busca seus itens
-                    orders_map: Dict[int, Order] = {}
-                    for row in order_rows:
-                        order = self._row_to_order_base(row)
-                        orders_map[order.id] = order
-                        table.orders.append(order)
-                    
-                    order_ids = tuple(orders_map.keys())
-                    cursor.execute(query_items, (order_ids,))
-                    item_rows = cursor.fetchall()
-                    
-                    # 4. "Costura" os itens nos seus pedidos
-                    for item_row in item_rows:
-                        item = self._row_to_item_with_product(item_row)
-                        orders_map[item_row['order_id']].items.append(item)
-                        
-                    return table
+
+                    # 2. Monta a mesa com pedidos e itens
+                    return self._rows_to_table_details(rows)
 
         except Error as e:
             print(f"Erro ao buscar mesa por ID {table_id}: {e}")
@@ -129,12 +185,10 @@ class MySQLTableRepository(TableRepositoryPort):
         (Busca "rasa" ou "lazy loading").
         """
         tables_list: List[Table] = []
-        query = "SELECT * FROM tables"
-        
         try:
-            with self.pool.get_connection() as connection:
+            with self.read_pool.get_connection() as connection:
                 with connection.cursor(dictionary=True) as cursor:
-                    cursor.execute(query)
+                    cursor.execute(QUERY_ALL_TABLES)
                     results = cursor.fetchall()
                     
                     for row in results:
@@ -150,26 +204,83 @@ class MySQLTableRepository(TableRepositoryPort):
 
     def save(self, table: Table) -> Table:
         """
-        Salva o estado de uma mesa (status e número de pessoas).
+        Salva o estado de uma mesa (status, número de pessoas e sessão)
+        dentro de uma TRANSAÇÃO.
+
+        - Mesa ocupada sem sessão (acabou de ser aberta): cria a sessão.
+        - Mesa livre: move os pedidos da sessão aberta (se houver) para o
+          arquivo ('orders_archive'/'order_items_archive') e a encerra.
         
         VEJA A NOTA ABAIXO: Este método NÃO salva os pedidos em cascata.
+
+        Raises:
+            ConcurrencyConflictException: Se a mesa mudou desde a carga
+                                          (ex: outro garçom a abriu, ou um
+                                          pedido novo entrou na sessão).
         """
-        query = """
-            UPDATE tables SET status = %s, number_of_people = %s
-            WHERE id = %s
-        """
-        params = (
-            table.status.value, # Converte Enum para string
-            table.number_of_people,
-            table.id
-        )
-        
+        loaded_session_id = table.session_id
         try:
             with self.pool.get_connection() as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(query, params)
+                connection.start_transaction()
+                
+                try:
+                    with connection.cursor() as cursor:
+                        # Sessão, mesa e versão da lista (ver table_save_steps)
+                        run_steps(cursor, table_save_steps(table))
+
                     connection.commit()
+                    table.version += 1
                     return table
+
+                except ConcurrencyConflictException:
+                    connection.rollback()
+                    table.session_id = loaded_session_id # A sessão criada foi desfeita
+                    raise
+
+                except Error as e:
+                    print(f"Erro durante a transação da mesa {table.id}. (ROLLBACK)")
+                    connection.rollback()
+                    raise e
+
         except Error as e:
             print(f"Erro ao salvar mesa: {e}")
-            raise e
\ No newline at end of file
+            raise e
+
+
+# --- Gravação (comum às versões síncrona e assíncrona) ---
+
+def table_save_steps(table: Table) -> StepGenerator:
+    """
+    Passos do MySQLTableRepository.save (sem commit): abre ou encerra (e
+    arquiva) a sessão, grava a mesa e gera a nova versão da lista de mesas.
+
+    Raises:
+        ConcurrencyConflictException: Se a mesa mudou desde a carga.
+    """
+    # --- Passo 1: Abrir/Encerrar a sessão ---
+    if table.status == TableStatus.OCCUPIED and table.session_id is None:
+        cursor = yield Step(INSERT_TABLE_SESSION, (table.id, table.number_of_people))
+        table.session_id = cursor.lastrowid
+    elif table.status == TableStatus.AVAILABLE:
+        # Os pedidos da sessão vão para o arquivo antes
+        # de encerrá-la (as consultas acham a sessão aberta)
+        for statement in ARCHIVE_SESSION_STATEMENTS:
+            yield Step(statement, (table.id,))
+        yield Step(CLOSE_TABLE_SESSION, (table.id,))
+
+    # --- Passo 2: Salvar a mesa ---
+    params = (
+        table.status.value, # Converte Enum para string
+        table.number_of_people,
+        table.session_id,
+        table.id,
+        table.version
+    )
+    cursor = yield Step(UPDATE_TABLE, params)
+    if cursor.rowcount == 0:
+        raise ConcurrencyConflictException(
+            f"A Mesa {table.id} foi alterada por outra pessoa. Tente novamente."
+        )
+
+    # --- Passo 3: Nova versão da lista de mesas (ETag) ---
+    yield Step(BUMP_DATASET_VERSION, (TABLES_DATASET,))
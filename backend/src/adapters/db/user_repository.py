@@ -1,7 +1,7 @@
 import mysql.connector
 import json # Usaremos para converter a lista de 'roles'
 from mysql.connector import Error
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 # Importa a PORTA (Interface) que esta classe implementa
 from domain.ports.user_repository import UserRepositoryPort
@@ -10,7 +10,32 @@ from domain.ports.user_repository import UserRepositoryPort
 from domain.models import User, UserRole
 
 # Importa o POOL de conexões
-from .connection_pool import connection_pool
+from .connection_pool import connection_pool, register_prepared
+from .read_routing import read_router
+
+
+# --- Consultas (colunas explícitas; 'username' é UNIQUE, logo indexado) ---
+USER_COLUMNS = "id, username, name, hashed_password, roles"
+
+QUERY_USER_BY_ID = f"SELECT {USER_COLUMNS} FROM users WHERE id = %s"
+QUERY_USER_BY_USERNAME = f"SELECT {USER_COLUMNS} FROM users WHERE username = %s"
+
+INSERT_USER = """
+    INSERT INTO users (username, name, hashed_password, roles)
+    VALUES (%s, %s, %s, %s)
+"""
+
+# '{placeholders}' é trocado por '%s,%s,...' (um por username)
+QUERY_USER_IDS_BY_USERNAMES = "SELECT id, username FROM users WHERE username IN ({placeholders})"
+
+UPDATE_USER = """
+    UPDATE users SET username = %s, name = %s,
+                     hashed_password = %s, roles = %s
+    WHERE id = %s
+"""
+
+# Comandos de texto fixo: prepared statements (ver connection_pool.py)
+register_prepared(QUERY_USER_BY_ID, QUERY_USER_BY_USERNAME, INSERT_USER, UPDATE_USER)
 
 class MySQLUserRepository(UserRepositoryPort):
     """
@@ -19,9 +44,11 @@ class MySQLUserRepository(UserRepositoryPort):
 
     def __init__(self):
         """
-        O construtor armazena uma referência ao pool de conexões.
+        O construtor armazena uma referência ao pool de conexões
+        (escritas) e ao roteador de leituras (primário ou réplica).
         """
         self.pool = connection_pool
+        self.read_pool = read_router
 
     def _row_to_user(self, row: dict) -> User:
         """
@@ -48,11 +75,10 @@ class MySQLUserRepository(UserRepositoryPort):
     # --- Implementação dos Métodos da Porta ---
 
     def find_by_id(self, user_id: int) -> Optional[User]:
-        query = "SELECT * FROM users WHERE id = %s"
         try:
-            with self.pool.get_connection() as connection:
+            with self.read_pool.get_connection() as connection:
                 with connection.cursor(dictionary=True) as cursor:
-                    cursor.execute(query, (user_id,))
+                    cursor.execute(QUERY_USER_BY_ID, (user_id,))
                     row = cursor.fetchone()
                     if row:
                         return self._row_to_user(row)
@@ -62,11 +88,10 @@ class MySQLUserRepository(UserRepositoryPort):
             return None
 
     def find_by_username(self, username: str) -> Optional[User]:
-        query = "SELECT * FROM users WHERE username = %s"
         try:
-            with self.pool.get_connection() as connection:
+            with self.read_pool.get_connection() as connection:
                 with connection.cursor(dictionary=True) as cursor:
-                    cursor.execute(query, (username,))
+                    cursor.execute(QUERY_USER_BY_USERNAME, (username,))
                     row = cursor.fetchone()
                     if row:
                         return self._row_to_user(row)
@@ -75,29 +100,25 @@ class MySQLUserRepository(UserRepositoryPort):
             print(f"Erro ao buscar usuário por username {username}: {e}")
             return None
 
+    @staticmethod
+    def _roles_json(user: User) -> str:
+        """Os papéis como são gravados na coluna JSON 'roles'."""
+        return json.dumps([role.value for role in user.roles])
+
     def save(self, user: User) -> User:
         """
         Salva um usuário.
         """
-        # ... (lógica de roles continua igual) ...
-        roles_str_list = [role.value for role in user.roles]
-        roles_json = json.dumps(roles_str_list)
+        roles_json = self._roles_json(user)
 
         if user.id == 0:
-            query = """
-                INSERT INTO users (username, name, hashed_password, roles)
-                VALUES (%s, %s, %s, %s)
-            """
+            query = INSERT_USER
             params = (
                 user.username, user.name,
                 user.hashed_password, roles_json
             )
         else:
-            query = """
-                UPDATE users SET username = %s, name = %s,
-                                 hashed_password = %s, roles = %s
-                WHERE id = %s
-            """
+            query = UPDATE_USER
             params = (
                 user.username, user.name,
                 user.hashed_password, roles_json, user.id
@@ -113,4 +134,63 @@ class MySQLUserRepository(UserRepositoryPort):
                     return user
         except Error as e:
             print(f"Erro ao salvar usuário (pode ser username duplicado): {e}")
-            raise e
\ No newline at end of file
+            raise e
+
+    def find_existing_usernames(self, usernames: List[str]) -> Set[str]:
+        if not usernames:
+            return set()
+
+        placeholders = ','.join(['%s'] * len(usernames))
+        try:
+            with self.read_pool.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute(QUERY_USER_IDS_BY_USERNAMES.format(placeholders=placeholders), list(usernames))
+                    return {username for _, username in cursor.fetchall()}
+        except Error as e:
+            print(f"Erro ao buscar {len(usernames)} usernames: {e}")
+            raise e
+
+    def insert_batch(self, users: List[User]) -> List[User]:
+        """
+        Insere usuários novos numa única transação: um INSERT de várias
+        linhas (executemany) e uma consulta para os IDs gerados (com
+        innodb_autoinc_lock_mode=2 eles não são necessariamente seguidos).
+        Se qualquer linha falhar (ex: username duplicado), nada é gravado.
+        """
+        if not users:
+            return users
+
+        params = [
+            (user.username, user.name, user.hashed_password, self._roles_json(user))
+            for user in users
+        ]
+        usernames = [user.username for user in users]
+        placeholders = ','.join(['%s'] * len(users))
+
+        try:
+            with self.pool.get_connection() as connection:
+                connection.start_transaction()
+
+                try:
+                    with connection.cursor() as cursor:
+                        # 1. Todas as linhas do lote
+                        cursor.executemany(INSERT_USER, params)
+
+                        # 2. IDs gerados (pelo username, que é UNIQUE)
+                        cursor.execute(QUERY_USER_IDS_BY_USERNAMES.format(placeholders=placeholders), usernames)
+                        ids: Dict[str, int] = {username: user_id for user_id, username in cursor.fetchall()}
+
+                    connection.commit()
+
+                except Error as e:
+                    print(f"Erro ao inserir lote de {len(users)} usuários. (ROLLBACK)")
+                    connection.rollback()
+                    raise e
+
+        except Error as e:
+            print(f"Erro ao obter conexão para inserir usuários: {e}")
+            raise e
+
+        for user in users:
+            user.id = ids[user.username]
+        return users
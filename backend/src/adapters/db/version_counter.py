@@ -0,0 +1,171 @@
+import threading
+import time
+import uuid
+from typing import Optional, Union
+
+from mysql.connector import Error
+
+from .connection_pool import register_prepared
+
+
+# --- Versões compartilhadas (tabela 'dataset_versions', ver database/migrations/007) ---
+MENU_DATASET = "menu"
+TABLES_DATASET = "tables"
+
+QUERY_DATASET_VERSION = "SELECT version FROM dataset_versions WHERE name = %s"
+
+# Executado pelos repositórios DENTRO da transação da escrita: a versão
+# nova fica visível junto com os dados (e some com eles no ROLLBACK)
+BUMP_DATASET_VERSION = "UPDATE dataset_versions SET version = version + 1 WHERE name = %s"
+
+register_prepared(QUERY_DATASET_VERSION, BUMP_DATASET_VERSION)
+
+# Intervalo padrão (segundos) entre leituras da versão compartilhada
+DEFAULT_REFRESH_SECONDS = 1.0
+
+
+class VersionCounter:
+    """
+    Versão de um conjunto de dados servido às telas (ex: cardápio, mesas).
+
+    Os repositórios incrementam o contador a CADA escrita do conjunto; as
+    rotas de leitura usam etag() como ETag forte e respondem 304 quando o
+    cliente já tem a versão atual (sem ir ao banco nem serializar nada).
+
+    As versões têm o formato "<epoch>-<n>". O 'epoch' muda a cada início do
+    processo, então uma ETag de antes de um reinício nunca é aceita.
+
+    NOTA: Este contador vive no processo (usado nos testes e em ferramentas
+    de um processo só). Com vários workers, use o SharedVersionCounter.
+    """
+
+    def __init__(self):
+        self.epoch = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._value = 0
+
+    def bump(self):
+        """Registra uma escrita. Chame DEPOIS que ela foi gravada (e caches invalidados)."""
+        with self._lock:
+            self._value += 1
+
+    def etag(self) -> str:
+        """Versão atual. Leia ANTES de buscar os dados da resposta."""
+        return f"{self.epoch}-{self._value}"
+
+    async def etag_async(self) -> str:
+        """etag() para o app ASGI (aqui não há I/O)."""
+        return self.etag()
+
+
+class _SharedVersion:
+    """
+    Parte comum do SharedVersionCounter e do AsyncSharedVersionCounter (sem
+    I/O): a versão lida do banco fica guardada por 'refresh_seconds', e cada
+    bump() local a descarta. As subclasses só fazem a leitura (com ou sem await).
+    """
+
+    def __init__(self, dataset: str, pool, refresh_seconds: float = DEFAULT_REFRESH_SECONDS):
+        """
+        Args:
+            dataset: Nome da linha em 'dataset_versions' (ex: MENU_DATASET).
+            pool: Pool de conexões do primário.
+            refresh_seconds: Tempo máximo entre duas leituras da versão.
+        """
+        super().__init__()
+        self.dataset = dataset
+        self.pool = pool
+        self.refresh_seconds = refresh_seconds
+
+        self._lock = threading.Lock()
+        self._value = 0 # Geração: descarta leituras que começaram antes de um bump()
+        self._current: Optional[str] = None
+        self._expires_at = 0.0
+
+    def bump(self):
+        with self._lock:
+            self._value += 1
+            self._current = None
+
+    def _cached(self) -> Optional[str]:
+        with self._lock:
+            if self._current is not None and time.monotonic() < self._expires_at:
+                return self._current
+            return None
+
+    def _generation(self) -> int:
+        with self._lock:
+            return self._value
+
+    def _remember(self, generation: int, row) -> str:
+        """Formata e guarda a versão lida (se nenhum bump() aconteceu no meio)."""
+        if row is None:
+            etag = f"{uuid.uuid4().hex[:8]}-unversioned"
+        else:
+            etag = f"{self.dataset}-{row[0]}"
+
+        with self._lock:
+            if self._value == generation:
+                self._current = etag
+                self._expires_at = time.monotonic() + self.refresh_seconds
+        return etag
+
+
+class SharedVersionCounter(_SharedVersion, VersionCounter):
+    """
+    Versão guardada no banco: uma linha por conjunto em 'dataset_versions',
+    incrementada pelos repositórios na mesma transação da escrita
+    (BUMP_DATASET_VERSION). Todos os workers, e o cli.py, enxergam a mesma
+    versão, e a ETag continua valendo depois de um reinício.
+
+    Cada worker relê a versão (uma consulta pela PK, no primário) no máximo
+    a cada 'refresh_seconds'; o bump() de uma escrita feita neste worker
+    descarta o valor guardado. Uma escrita feita em outro worker aparece
+    aqui em até 'refresh_seconds'.
+
+    Se a leitura falhar (ex: banco fora, migração não aplicada), a ETag é
+    uma versão que nunca se repete: nenhum 304 é dado até a leitura voltar.
+    """
+
+    def etag(self) -> str:
+        etag = self._cached()
+        if etag is not None:
+            return etag
+
+        generation = self._generation()
+        try:
+            with self.pool.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute(QUERY_DATASET_VERSION, (self.dataset,))
+                    row = cursor.fetchone()
+        except Error as e:
+            print(f"Erro ao ler a versão de '{self.dataset}': {e}")
+            row = None
+        return self._remember(generation, row)
+
+
+class AsyncSharedVersionCounter(_SharedVersion):
+    """
+    Mesma versão do SharedVersionCounter, lida pelo pool assíncrono (app
+    ASGI). Só tem etag_async(): não há leitura síncrona neste pool.
+    """
+
+    async def etag_async(self) -> str:
+        etag = self._cached()
+        if etag is not None:
+            return etag
+
+        generation = self._generation()
+        try:
+            async with await self.pool.get_connection() as connection:
+                async with await connection.cursor() as cursor:
+                    await cursor.execute(QUERY_DATASET_VERSION, (self.dataset,))
+                    row = await cursor.fetchone()
+        except Error as e:
+            print(f"Erro ao ler a versão de '{self.dataset}': {e}")
+            row = None
+        return self._remember(generation, row)
+
+
+# Contadores aceitos pelo app ASGI (rotas e repositórios): etag_async() e bump()
+AsyncVersionCounter = Union[VersionCounter, AsyncSharedVersionCounter]
@@ -0,0 +1,59 @@
+from typing import List, Optional
+
+# Importa as PORTAS (Interfaces) que estas classes implementam
+from domain.ports.table_repository import TableRepositoryPort
+from domain.ports.async_table_repository import AsyncTableRepositoryPort
+
+# Importa o MODELO de domínio
+from domain.models import Table
+
+from .version_counter import VersionCounter, AsyncVersionCounter
+from .read_routing import primary_reads
+
+
+class VersionedTableRepository(TableRepositoryPort):
+    """
+    Repassa tudo a outro TableRepositoryPort (normalmente o
+    MySQLTableRepository) e incrementa 'version' a cada save().
+
+    save() é o único caminho de escrita das mesas (abrir, fechar, novo
+    pedido), então a versão muda sempre que a lista de mesas pode mudar.
+    """
+
+    def __init__(self, inner: TableRepositoryPort, version: VersionCounter):
+        self.inner = inner
+        self.version = version
+
+    def find_by_id(self, table_id: int) -> Optional[Table]:
+        return self.inner.find_by_id(table_id)
+
+    def get_all_tables(self) -> List[Table]:
+        # Do primário: a rota marca esta lista com a versão atual (ETag),
+        # e uma réplica atrasada entregaria dados mais velhos que ela
+        with primary_reads():
+            return self.inner.get_all_tables()
+
+    def save(self, table: Table) -> Table:
+        saved_table = self.inner.save(table)
+        self.version.bump()
+        return saved_table
+
+
+class AsyncVersionedTableRepository(AsyncTableRepositoryPort):
+    """Versão assíncrona do VersionedTableRepository (para o app ASGI)."""
+
+    def __init__(self, inner: AsyncTableRepositoryPort, version: AsyncVersionCounter):
+        self.inner = inner
+        self.version = version
+
+    async def find_by_id(self, table_id: int) -> Optional[Table]:
+        return await self.inner.find_by_id(table_id)
+
+    async def get_all_tables(self) -> List[Table]:
+        with primary_reads():
+            return await self.inner.get_all_tables()
+
+    async def save(self, table: Table) -> Table:
+        saved_table = await self.inner.save(table)
+        self.version.bump()
+        return saved_table
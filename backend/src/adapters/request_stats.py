@@ -0,0 +1,76 @@
+"""
+Medições do request atual (compartilhadas entre os adaptadores).
+
+O middleware web abre uma medição no início de cada request; os outros
+adaptadores apenas somam tempos a ela (ex: o cursor do banco soma o tempo
+de SQL, o pool soma a espera por conexão). Fora de um request (CLI,
+scripts, testes) não há medição aberta e as funções não fazem nada.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+
+class RequestStats:
+    """Tempos acumulados de um request."""
+
+    __slots__ = ("started_at", "sql_count", "phases")
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.sql_count = 0
+        self.phases: Dict[str, float] = {} # { fase -> segundos }, ex: "db", "auth"
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def begin() -> RequestStats:
+    """Abre a medição do request atual (chamado pelo middleware)."""
+    stats = RequestStats()
+    _current.set(stats)
+    return stats
+
+
+def end():
+    """Fecha a medição do request atual."""
+    _current.set(None)
+
+
+def current() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def record(phase: str, seconds: float):
+    """Soma 'seconds' à fase 'phase' do request atual (se houver)."""
+    stats = _current.get()
+    if stats is not None:
+        stats.add(phase, seconds)
+
+
+def record_sql(seconds: float):
+    """Registra UM comando SQL e seu tempo."""
+    stats = _current.get()
+    if stats is not None:
+        stats.sql_count += 1
+        stats.add("db", seconds)
+
+
+@contextmanager
+def timed(phase: str):
+    """Mede o bloco 'with' e soma à fase 'phase' do request atual."""
+    if _current.get() is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - start)
@@ -1 +1 @@
-from .security_service import BcryptPasswordHasher, JwtTokenGenerator
\ No newline at end of file
+from .security_service import BcryptPasswordHasher, JwtTokenGenerator, JwtTokenVerifier
\ No newline at end of file
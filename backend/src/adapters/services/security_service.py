@@ -1,4 +1,12 @@
 import bcrypt
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
 from typing import List
@@ -7,6 +15,7 @@ from typing import List
 from domain.ports.password_hasher import PasswordHasherPort
 from domain.ports.token_generator import TokenGeneratorPort
 from domain.models import UserRole # Necessário para o payload do token
+from domain.exceptions import ServiceBusyException
 
 # --- Configuração de Segurança ---
 # IMPORTANTE: Em produção, NUNCA deixe valores fixos no código.
@@ -14,36 +23,136 @@ from domain.models import UserRole # Necessário para o payload do token
 SECRET_KEY = "sua-chave-secreta-muito-forte-aqui-mude-isso"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 # 1 hora
+TOKEN_CACHE_MAX_ENTRIES = 10000 # Tokens já verificados mantidos em memória
+
+# Bcrypt: custo dos novos hashes e tamanho do pool de processos
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
+HASHER_WORKERS = int(os.environ.get('HASHER_WORKERS', max(1, (os.cpu_count() or 2) // 2)))
+HASHER_MAX_QUEUE = int(os.environ.get('HASHER_MAX_QUEUE', 16))
+
+# --- Funções executadas nos processos do pool de hash ---
+# (Ficam no nível do módulo para poderem ser enviadas a outro processo.)
+
+def _bcrypt_hash(password_plaintext: str, rounds: int) -> str:
+    # Converte a senha para bytes, gera o salt e o hash
+    salt = bcrypt.gensalt(rounds=rounds)
+    hashed_bytes = bcrypt.hashpw(password_plaintext.encode('utf-8'), salt)
+
+    # Retorna o hash como uma string decodificada
+    return hashed_bytes.decode('utf-8')
+
+
+def _bcrypt_check(password_plaintext: str, hashed_password: str) -> bool:
+    try:
+        # Compara a senha (em bytes) com o hash (em bytes)
+        return bcrypt.checkpw(
+            password_plaintext.encode('utf-8'),
+            hashed_password.encode('utf-8')
+        )
+    except ValueError:
+        # bcrypt.checkpw pode lançar ValueError se o hash for malformado
+        return False
+
 
 class BcryptPasswordHasher(PasswordHasherPort):
     """
     Implementação concreta da porta de hash usando a biblioteca Bcrypt.
+
+    O bcrypt é lento DE PROPÓSITO (CPU pura). Para não prender as threads
+    do Flask (e atrasar os pedidos dos outros garçons numa troca de turno),
+    o trabalho roda em um pool de processos dedicado e limitado:
+    - até 'workers' hashes em paralelo;
+    - até 'max_queue' esperando na fila;
+    - além disso, a chamada falha NA HORA com ServiceBusyException (429).
+
+    Com workers=0 o hash roda no próprio processo, sem pool e sem limite
+    (útil para scripts de linha de comando e testes).
     """
-    
+
+    def __init__(
+        self,
+        rounds: int = BCRYPT_ROUNDS,
+        workers: int = HASHER_WORKERS,
+        max_queue: int = HASHER_MAX_QUEUE
+    ):
+        """
+        Args:
+            rounds: Fator de custo (log2 das iterações) dos novos hashes.
+            workers: Processos dedicados ao bcrypt (0 = sem pool).
+            max_queue: Quantas chamadas podem esperar por um processo livre.
+        """
+        self.rounds = rounds
+        self.workers = workers
+        self.max_queue = max_queue
+
+        # Vagas = em execução + na fila
+        self._slots = threading.BoundedSemaphore(workers + max_queue) if workers else None
+        self._executor = None # Criado no primeiro uso (depois do fork do servidor)
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # 'spawn': não herda as threads/conexões do processo do Flask
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _run(self, fn, *args):
+        """Executa 'fn' no pool, respeitando o limite de vagas."""
+        if not self._slots:
+            return fn(*args)
+
+        if not self._slots.acquire(blocking=False):
+            raise ServiceBusyException(
+                "Muitas autenticações ao mesmo tempo. Tente novamente em instantes."
+            )
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
     def hash(self, password_plaintext: str) -> str:
         """
         Gera um hash a partir de uma senha em texto puro.
         """
-        # Converte a senha para bytes, gera o salt e o hash
-        salt = bcrypt.gensalt()
-        hashed_bytes = bcrypt.hashpw(password_plaintext.encode('utf-8'), salt)
-        
-        # Retorna o hash como uma string decodificada
-        return hashed_bytes.decode('utf-8')
+        return self._run(_bcrypt_hash, password_plaintext, self.rounds)
+
+    def hash_many(self, passwords_plaintext: List[str]) -> List[str]:
+        """
+        Gera os hashes de várias senhas, distribuídas pelos processos do
+        pool (um lote de N senhas leva ~N/workers hashes de tempo).
+
+        Para tarefas em lote (ex: 'cli.py import-staff'), não para
+        requests: não passa pelo limite de vagas do hash()/check().
+        """
+        if not self.workers:
+            return [_bcrypt_hash(password, self.rounds) for password in passwords_plaintext]
+
+        return list(self._get_executor().map(
+            _bcrypt_hash, passwords_plaintext, repeat(self.rounds)
+        ))
 
     def check(self, password_plaintext: str, hashed_password: str) -> bool:
         """
         Verifica se a senha em texto puro corresponde ao hash.
         """
-        try:
-            # Compara a senha (em bytes) com o hash (em bytes)
-            return bcrypt.checkpw(
-                password_plaintext.encode('utf-8'), 
-                hashed_password.encode('utf-8')
-            )
-        except ValueError:
-            # bcrypt.checkpw pode lançar ValueError se o hash for malformado
-            return False
+        return self._run(_bcrypt_check, password_plaintext, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Indica se o hash foi gerado com um custo diferente do configurado.
+        (Formato bcrypt: "$2b$<custo>$<salt+hash>")
+        """
+        parts = hashed_password.split('$')
+        if len(parts) != 4 or not parts[2].isdigit():
+            return False # Hash desconhecido/malformado: não mexemos
+        return int(parts[2]) != self.rounds
 
 class JwtTokenGenerator(TokenGeneratorPort):
     """
@@ -74,4 +183,70 @@ class JwtTokenGenerator(TokenGeneratorPort):
             algorithm=ALGORITHM
         )
         
-        return encoded_jwt
\ No newline at end of file
+        return encoded_jwt
+
+
+class JwtTokenVerifier:
+    """
+    Valida tokens de acesso (assinatura e expiração) para o 'auth_required'.
+
+    Cada token válido é verificado UMA vez; o payload fica em um cache LRU
+    limitado, indexado pelo SHA-256 do token (o token em si não é guardado).
+    A entrada só é usada até o 'exp' do próprio token: depois disso o token
+    é verificado de novo (e recusado por estar expirado).
+    Tokens inválidos nunca entram no cache.
+    """
+
+    def __init__(self, max_entries: int = TOKEN_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._cache: OrderedDict = OrderedDict() # { digest -> (payload, exp) }
+
+        # Contadores (expostos em /metrics)
+        self.hits = 0
+        self.misses = 0
+
+    def verify(self, token: str) -> dict:
+        """
+        Retorna o payload de um token válido.
+
+        Raises:
+            JWTError: Se o token for inválido, expirado ou malformado.
+        """
+        digest = hashlib.sha256(token.encode('utf-8')).digest()
+
+        # 1. Token já verificado e ainda não expirado?
+        with self._lock:
+            entry = self._cache.get(digest)
+            if entry and time.time() < entry[1]:
+                self._cache.move_to_end(digest)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # 2. Verificação completa (HMAC + expiração)
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+        # 3. Guarda até o 'exp' do token (sem 'exp', não guarda)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            with self._lock:
+                self._cache[digest] = (payload, exp)
+                self._cache.move_to_end(digest)
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        return payload
+
+    def stats(self) -> dict:
+        """Retorna os contadores do cache (para observabilidade)."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "cached_tokens": len(self._cache),
+                "max_entries": self.max_entries,
+            }
+
+
+# Instância única usada pelo decorador 'auth_required'
+token_verifier = JwtTokenVerifier()
@@ -0,0 +1,129 @@
+import os
+from quart import Quart, jsonify
+from quart_cors import cors
+from werkzeug.exceptions import HTTPException # Para tratar erros do abort()
+
+# 1. Importa o container assíncrono (criado dentro da fábrica)
+from .deps import AsyncAppContainer
+
+# Medição de requests (a mesma do app Flask)
+from .request_timing import RouteMetrics, install_async_request_timing
+from .read_scope import install_async_read_scope
+
+# 2. Importa as "fábricas" de rotas assíncronas
+from .async_routers.auth_router import create_async_auth_blueprint
+from .async_routers.admin_router import create_async_admin_blueprint
+from .async_routers.waiter_router import create_async_waiter_blueprint
+from .async_routers.kitchen_router import create_async_kitchen_blueprint
+
+
+# --- Criação da Aplicação ---
+
+def create_asgi_app():
+    """
+    Fábrica da aplicação ASGI (Quart), ao lado do create_app() do Flask.
+
+    Expõe as mesmas rotas, schemas e respostas de erro, mas os handlers
+    são corrotinas sobre os casos de uso e repositórios assíncronos: um
+    request esperando o banco (ou um stream da cozinha esperando eventos)
+    não ocupa uma thread.
+
+    Uso (a partir de 'backend/src'):
+        hypercorn 'adapters.web.asgi:create_asgi_app()' --bind 0.0.0.0:5000
+    """
+
+    app = Quart(__name__)
+
+    # Habilita o CORS para permitir que o frontend acesse a API
+    app = cors(app)
+
+    container = AsyncAppContainer()
+
+    route_metrics = RouteMetrics()
+    install_async_request_timing(
+        app, route_metrics,
+        log_requests=os.environ.get("REQUEST_LOG", "1") != "0"
+    )
+    install_async_read_scope(app)
+
+    # --- Injeção de Dependência e Registro de Rotas ---
+
+    print(">>> [ASGI] Conectando dependências e registrando blueprints...")
+
+    app.register_blueprint(create_async_auth_blueprint(
+        login_uc=container.login_uc,
+        get_auth_user_uc=container.get_auth_user_uc
+    ))
+    app.register_blueprint(create_async_admin_blueprint(
+        create_product_uc=container.create_product_uc,
+        update_product_uc=container.update_product_uc,
+        list_all_products_uc=container.list_all_products_uc,
+        create_user_uc=container.create_user_uc,
+        update_user_uc=container.update_user_uc,
+        search_order_history_uc=container.search_order_history_uc,
+        get_sales_report_uc=container.get_sales_report_uc,
+        export_products_uc=container.export_products_uc,
+        import_products_uc=container.import_products_uc
+    ))
+    app.register_blueprint(create_async_waiter_blueprint(
+        list_tables_uc=container.list_tables_uc,
+        open_table_uc=container.open_table_uc,
+        get_table_details_uc=container.get_table_details_uc,
+        close_table_uc=container.close_table_uc,
+        create_order_uc=container.create_order_uc,
+        add_item_to_order_uc=container.add_item_to_order_uc,
+        submit_order_batch_uc=container.submit_order_batch_uc,
+        get_visible_products_uc=container.get_visible_products_uc,
+        menu_version=container.menu_version,
+        tables_version=container.tables_version
+    ))
+    app.register_blueprint(create_async_kitchen_blueprint(
+        list_pending_orders_uc=container.list_pending_orders_uc,
+        start_order_preparation_uc=container.start_order_prep_uc,
+        complete_order_preparation_uc=container.complete_order_prep_uc,
+        kitchen_feed=container.kitchen_feed
+    ))
+
+    # --- Tratador de Erros Global ---
+    # (Mesmo corpo JSON do app Flask)
+
+    @app.errorhandler(HTTPException)
+    async def handle_exception(e):
+        """
+        Retorna respostas JSON para erros HTTP (ex: 404, 403, 401).
+        """
+        response = jsonify({
+            "code": e.code,
+            "name": e.name,
+            "description": e.description,
+        })
+        response.status_code = e.code
+        # Mantém cabeçalhos do erro (ex: Retry-After do 429)
+        for name, value in e.get_headers():
+            if name.lower() != "content-type":
+                response.headers[name] = value
+        return response
+
+    # Rota de "saúde"
+    @app.route("/")
+    async def home():
+        return jsonify({"status": "Mandaladaka API rodando!"})
+
+    # Rota de métricas (mesmas chaves do app Flask)
+    @app.route("/metrics")
+    async def metrics():
+        """
+        [GET /metrics] Contadores internos da aplicação
+        (caches em memória, pool de conexões, réplica, latência por rota).
+        """
+        return jsonify({
+            "product_cache": container.product_repo.stats(),
+            "user_cache": container.user_repo.stats(),
+            "token_cache": container.token_verifier.stats(),
+            "db_pool": container.db_pool.stats(),
+            "db_reads": container.db_reads.stats(),
+            "routes": route_metrics.snapshot()
+        })
+
+    print(">>> [ASGI] Aplicação criada com sucesso.")
+    return app
@@ -0,0 +1,265 @@
+import functools
+from quart import Blueprint, Response, current_app, request, abort, g, make_response
+
+# Importa os Casos de Uso assíncronos
+from domain.use_cases.admin import (
+    AsyncCreateProductUseCase,
+    AsyncUpdateProductUseCase,
+    AsyncListAllProductsUseCase,
+    AsyncCreateUserUseCase,
+    AsyncUpdateUserUseCase,
+    AsyncSearchOrderHistoryUseCase,
+    AsyncGetSalesReportUseCase,
+    AsyncExportProductsUseCase,
+    AsyncImportProductsUseCase
+)
+
+# Importa os Schemas (os mesmos do app Flask)
+from adapters.web.schemas import (
+    ProductCreateSchema,
+    ProductUpdateSchema,
+    ProductResponseSchema,
+    UserCreateSchema,
+    UserUpdateSchema,
+    UserResponseSchema,
+    OrderHistoryQuerySchema,
+    SalesReportQuerySchema,
+    SalesReportSchema,
+    ProductImportSummarySchema,
+    dump,
+    dump_many_json
+)
+from adapters.web.catalog_io import CATALOG_FORMATS, CatalogWriter, read_catalog_async, text_lines_async
+
+# Validação da entrada e erros HTTP (os mesmos do app Flask)
+from adapters.web.route_helpers import FORBIDDEN_ERRORS, parse_json, parse_query, error_response
+
+# Mesmos erros por rota e mesmas respostas do app Flask
+from adapters.web.routers.admin_router import (
+    PRODUCT_UPDATE_ERRORS,
+    USER_CREATE_ERRORS,
+    USER_UPDATE_ERRORS,
+    requested_catalog_format,
+    catalog_download_headers,
+    import_error_response,
+    dump_order_history
+)
+
+# Importa o decorador de autenticação base
+from adapters.web.async_routers.auth_router import async_auth_required
+
+admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
+
+
+def async_admin_required(f):
+    """Versão do 'admin_required' para rotas assíncronas."""
+    @functools.wraps(f)
+    @async_auth_required
+    async def decorated_function(*args, **kwargs):
+        if "admin" not in g.user_roles:
+            abort(403, description="Acesso negado. Requer permissão de administrador.")
+        return await f(*args, **kwargs)
+    return decorated_function
+
+
+def create_async_admin_blueprint(
+    create_product_uc: AsyncCreateProductUseCase,
+    update_product_uc: AsyncUpdateProductUseCase,
+    list_all_products_uc: AsyncListAllProductsUseCase,
+    create_user_uc: AsyncCreateUserUseCase,
+    update_user_uc: AsyncUpdateUserUseCase,
+    search_order_history_uc: AsyncSearchOrderHistoryUseCase,
+    get_sales_report_uc: AsyncGetSalesReportUseCase,
+    export_products_uc: AsyncExportProductsUseCase,
+    import_products_uc: AsyncImportProductsUseCase
+):
+    """
+    Fábrica para o Blueprint de Admin do app ASGI.
+    Mesmas rotas, schemas e códigos de erro do create_admin_blueprint.
+    """
+
+    # --- ROTAS DE PRODUTO ---
+
+    @admin_bp.route("/products", methods=["GET"])
+    @async_admin_required
+    async def list_all_products():
+        """
+        [GET /admin/products] Lista todos os produtos cadastrados no sistema.
+        """
+        try:
+            products = await list_all_products_uc.execute(admin_id=g.user_id)
+            body = dump_many_json(ProductResponseSchema, products, pretty=current_app.debug)
+            return Response(body, mimetype="application/json")
+        except Exception as e:
+            return error_response(e, FORBIDDEN_ERRORS)
+
+
+    @admin_bp.route("/products", methods=["POST"])
+    @async_admin_required
+    async def create_product():
+        """
+        [POST /admin/products] Cria um novo produto no cardápio.
+        """
+        try:
+            validated_data = parse_json(ProductCreateSchema, await request.get_json())
+            new_product = await create_product_uc.execute(
+                admin_id=g.user_id,
+                product_data=validated_data.model_dump()
+            )
+            return dump(ProductResponseSchema, new_product), 201
+
+        except Exception as e:
+            return error_response(e, FORBIDDEN_ERRORS)
+
+
+    @admin_bp.route("/products/<int:product_id>", methods=["PUT"])
+    @async_admin_required
+    async def update_product(product_id: int):
+        """
+        [PUT /admin/products/<id>] Atualiza os dados de um produto existente.
+        """
+        try:
+            validated_data = parse_json(ProductUpdateSchema, await request.get_json())
+            updated_product = await update_product_uc.execute(
+                admin_id=g.user_id,
+                product_id=product_id,
+                update_data=validated_data.model_dump(exclude_unset=True)
+            )
+            return dump(ProductResponseSchema, updated_product), 200
+
+        except Exception as e:
+            return error_response(e, PRODUCT_UPDATE_ERRORS)
+
+    @admin_bp.route("/products/export", methods=["GET"])
+    @async_admin_required
+    async def export_products():
+        """
+        [GET /admin/products/export?format=csv|ndjson] O cardápio inteiro
+        como arquivo, enviado em stream (lido do banco página a página).
+        """
+        fmt = requested_catalog_format(request.args.get("format"), "csv")
+
+        try:
+            products = await export_products_uc.execute(admin_id=g.user_id)
+        except Exception as e:
+            return error_response(e, FORBIDDEN_ERRORS)
+
+        async def generate():
+            writer = CatalogWriter(fmt)
+            header = writer.header()
+            if header:
+                yield header
+            async for product in products:
+                yield writer.row(product)
+
+        response = await make_response(
+            generate(),
+            {"Content-Type": CATALOG_FORMATS[fmt], **catalog_download_headers(fmt)}
+        )
+        # Cardápios grandes podem levar mais que o timeout padrão
+        response.timeout = None
+        return response
+
+
+    @admin_bp.route("/products/import", methods=["POST"])
+    @async_admin_required
+    async def import_products():
+        """
+        [POST /admin/products/import?format=csv|ndjson] Importa um cardápio
+        (o corpo é o arquivo, lido em stream): produtos iguais são
+        ignorados, novos e alterados são gravados em lotes.
+        """
+        fmt = requested_catalog_format(request.args.get("format"), request.mimetype)
+
+        try:
+            summary = await import_products_uc.execute(
+                read_catalog_async(text_lines_async(request.body), fmt),
+                admin_id=g.user_id
+            )
+            return dump(ProductImportSummarySchema, summary), 200
+
+        except Exception as e:
+            return import_error_response(e)
+
+    # --- ROTAS DE USUÁRIO ---
+
+    @admin_bp.route("/users", methods=["POST"])
+    @async_admin_required
+    async def create_user():
+        """
+        [POST /admin/users] Cria um novo usuário (admin, waiter ou kitchen).
+        """
+        try:
+            validated_data = parse_json(UserCreateSchema, await request.get_json())
+            new_user = await create_user_uc.execute(
+                admin_id=g.user_id,
+                user_data=validated_data.model_dump(mode="json")
+            )
+            return dump(UserResponseSchema, new_user), 201
+
+        except Exception as e:
+            return error_response(e, USER_CREATE_ERRORS)
+
+    @admin_bp.route("/users/<int:user_id>", methods=["PUT"])
+    @async_admin_required
+    async def update_user(user_id: int):
+        """
+        [PUT /admin/users/<id>] Atualiza os dados de um usuário existente.
+        """
+        try:
+            validated_data = parse_json(UserUpdateSchema, await request.get_json())
+            updated_user = await update_user_uc.execute(
+                admin_id=g.user_id,
+                user_id_to_update=user_id,
+                update_data=validated_data.model_dump(exclude_unset=True, mode="json")
+            )
+            return dump(UserResponseSchema, updated_user), 200
+
+        except Exception as e:
+            return error_response(e, USER_UPDATE_ERRORS)
+
+    # --- ROTAS DE HISTÓRICO DE PEDIDOS ---
+
+    @admin_bp.route("/orders/history", methods=["GET"])
+    @async_admin_required
+    async def search_order_history():
+        """
+        [GET /admin/orders/history] Busca no histórico de pedidos, com filtros
+        e paginação por cursor.
+        """
+        try:
+            query = parse_query(OrderHistoryQuerySchema, request.args.to_dict())
+            page = await search_order_history_uc.execute(
+                admin_id=g.user_id,
+                filters=query.to_filter(),
+                after=query.after(),
+                limit=query.limit
+            )
+            return dump_order_history(page), 200
+
+        except Exception as e:
+            return error_response(e, FORBIDDEN_ERRORS)
+
+    # --- ROTAS DE RELATÓRIOS ---
+
+    @admin_bp.route("/reports/sales/<dimension>", methods=["GET"])
+    @async_admin_required
+    async def get_sales_report(dimension: str):
+        """
+        [GET /admin/reports/sales/<hour|product|category|waiter>] Vendas do
+        período, lidas só dos resumos (nunca dos pedidos).
+        """
+        try:
+            query = parse_query(SalesReportQuerySchema, {**request.args.to_dict(), "dimension": dimension})
+            report = await get_sales_report_uc.execute(
+                admin_id=g.user_id,
+                dimension=query.dimension,
+                date_from=query.date_from,
+                date_to=query.date_to
+            )
+            return dump(SalesReportSchema, report), 200
+
+        except Exception as e:
+            return error_response(e, FORBIDDEN_ERRORS)
+
+    return admin_bp
@@ -0,0 +1,90 @@
+import functools
+from quart import Blueprint, request, g
+
+# Importa os Casos de Uso assíncronos (que serão injetados)
+from domain.use_cases.auth import (
+    AsyncLoginUseCase,
+    AsyncGetAuthenticatedUserUseCase
+)
+
+# Importa os Schemas (os mesmos do app Flask)
+from ..schemas import (
+    LoginSchema,
+    UserResponseSchema,
+    dump
+)
+
+# Validação da entrada e erros HTTP (os mesmos do app Flask)
+from ..route_helpers import parse_json, error_response
+
+# A validação do token e as respostas são as mesmas do app Flask
+from ..routers.auth_router import (
+    LOGIN_ERRORS,
+    CURRENT_USER_ERRORS,
+    authenticate_header,
+    token_response
+)
+from ...db import read_routing
+
+# Cria o Blueprint com um prefixo de URL
+auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
+
+
+# --- DECORADOR DE AUTENTICAÇÃO ---
+
+def async_auth_required(f):
+    """
+    Versão do 'auth_required' para rotas assíncronas (Quart).
+    Valida o token e armazena o ID e as roles do usuário no 'g'.
+    """
+    @functools.wraps(f)
+    async def decorated_function(*args, **kwargs):
+        g.user_id, g.user_roles = authenticate_header(request.headers.get("Authorization"))
+        read_routing.bind_session(g.user_id)
+        return await f(*args, **kwargs)
+    return decorated_function
+
+
+# --- FÁBRICA DO BLUEPRINT ---
+
+def create_async_auth_blueprint(
+    login_uc: AsyncLoginUseCase,
+    get_auth_user_uc: AsyncGetAuthenticatedUserUseCase
+):
+    """
+    Fábrica para o Blueprint de Autenticação do app ASGI.
+    Mesmas rotas, schemas e códigos de erro do create_auth_blueprint.
+    """
+
+    @auth_bp.route("/login", methods=["POST"])
+    async def login():
+        """
+        [POST /auth/login] Autentica o usuário no sistema e retorna um token de acesso JWT.
+        """
+        try:
+            validated_data = parse_json(LoginSchema, await request.get_json())
+            token = await login_uc.execute(
+                username=validated_data.username,
+                password_plaintext=validated_data.password
+            )
+            return token_response(token), 200
+
+        except Exception as e:
+            return error_response(e, LOGIN_ERRORS)
+
+
+    @auth_bp.route("/me", methods=["GET"])
+    @async_auth_required
+    async def get_current_user():
+        """
+        [GET /auth/me] Retorna as informações do usuário autenticado.
+        """
+        try:
+            user = await get_auth_user_uc.execute(user_id=g.user_id)
+            return dump(UserResponseSchema, user), 200
+
+        except Exception as e:
+            return error_response(e, CURRENT_USER_ERRORS)
+
+
+    return auth_bp
@@ -0,0 +1,146 @@
+import functools
+import time
+from quart import Blueprint, Response, current_app, request, abort, g, make_response, stream_with_context
+
+# Importa os Casos de Uso assíncronos (que serão injetados)
+from domain.use_cases.kitchen import (
+    AsyncListPendingOrdersUseCase,
+    AsyncStartOrderPreparationUseCase,
+    AsyncCompleteOrderPreparationUseCase
+)
+
+# Importa os Schemas (os mesmos do app Flask)
+from ..schemas import OrderResponseSchema, dump, dump_many_json
+
+# Importa o feed de eventos (Server-Sent Events) da cozinha
+from ..kitchen_feed import KitchenEventFeed
+from ..routers.kitchen_router import (
+    STREAM_HEARTBEAT_SECONDS,
+    STREAM_HEADERS,
+    ORDER_STATUS_ERRORS,
+    stream_deadline,
+    stream_start,
+    stream_chunks
+)
+from ..routers.auth_router import token_expiry
+
+# Erros HTTP (os mesmos do app Flask)
+from ..route_helpers import FORBIDDEN_ERRORS, error_response
+
+# Importa o decorador de autenticação base
+from adapters.web.async_routers.auth_router import async_auth_required
+
+kitchen_bp = Blueprint("kitchen", __name__, url_prefix="/kitchen")
+
+
+def async_kitchen_required(f):
+    """Versão do 'kitchen_required' para rotas assíncronas."""
+    @functools.wraps(f)
+    @async_auth_required
+    async def decorated_function(*args, **kwargs):
+        if "kitchen" not in g.user_roles and "admin" not in g.user_roles:
+            abort(403, description="Acesso negado. Requer permissão de Cozinha ou Administrador.")
+        return await f(*args, **kwargs)
+    return decorated_function
+
+
+def create_async_kitchen_blueprint(
+    list_pending_orders_uc: AsyncListPendingOrdersUseCase,
+    start_order_preparation_uc: AsyncStartOrderPreparationUseCase,
+    complete_order_preparation_uc: AsyncCompleteOrderPreparationUseCase,
+    kitchen_feed: KitchenEventFeed
+):
+    """
+    Fábrica para o Blueprint da Cozinha do app ASGI.
+    Mesmas rotas, schemas e códigos de erro do create_kitchen_blueprint.
+    """
+
+    @kitchen_bp.route("/orders/pending", methods=["GET"])
+    # @async_kitchen_required # <-- Quando o TODO for implementado, use este decorador!
+    async def list_pending_orders():
+        """
+        [GET /kitchen/orders/pending] Lista todos os pedidos que estão no status 'PENDING' (aguardando preparo).
+        """
+        try:
+            # 0. Cursor do feed ANTES de ler o banco (ver app Flask)
+            feed_cursor = kitchen_feed.cursor()
+
+            pending_orders = await list_pending_orders_uc.execute()
+
+            body = dump_many_json(OrderResponseSchema, pending_orders, pretty=current_app.debug)
+            response = Response(body, mimetype="application/json")
+            response.headers["X-Feed-Cursor"] = feed_cursor
+            return response
+
+        except Exception as e:
+            return error_response(e, FORBIDDEN_ERRORS)
+
+
+    @kitchen_bp.route("/orders/stream", methods=["GET"])
+    # @async_kitchen_required # <-- Quando o TODO for implementado, use este decorador!
+    async def stream_orders():
+        """
+        [GET /kitchen/orders/stream] Stream (Server-Sent Events) com os eventos de pedido.
+        Mesmo protocolo do app Flask, mas cada tela conectada espera no
+        event loop (wait_for_events_async) em vez de ocupar uma thread.
+        Também fecha ao fim do tempo de vida (ou do token), como no app Flask.
+        """
+        requested_cursor = request.headers.get("Last-Event-ID") or request.args.get("cursor")
+        deadline = stream_deadline(token_expiry(request.headers.get("Authorization")))
+
+        @stream_with_context
+        async def generate():
+            chunks, after_seq = stream_start(kitchen_feed, requested_cursor)
+            for chunk in chunks:
+                yield chunk
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return # Fim do tempo de vida: a tela reconecta com o Last-Event-ID
+
+                events, needs_resync = await kitchen_feed.wait_for_events_async(
+                    after_seq, timeout=min(STREAM_HEARTBEAT_SECONDS, remaining)
+                )
+                chunks, after_seq = stream_chunks(kitchen_feed, events, needs_resync, after_seq)
+                for chunk in chunks:
+                    yield chunk
+
+        response = await make_response(
+            generate(),
+            {"Content-Type": "text/event-stream", **STREAM_HEADERS}
+        )
+        # O stream tem seu próprio limite (stream_deadline): desliga o timeout de resposta do Quart
+        response.timeout = None
+        return response
+
+
+    @kitchen_bp.route("/orders/<int:order_id>/start", methods=["POST"])
+    # @async_kitchen_required # <-- Quando o TODO for implementado, use este decorador!
+    async def start_order_preparation(order_id: int):
+        """
+        [POST /kitchen/orders/<id>/start] Muda o status de um pedido para 'IN_PROGRESS' (em preparo).
+        """
+        try:
+            updated_order = await start_order_preparation_uc.execute(order_id=order_id)
+            return dump(OrderResponseSchema, updated_order), 200
+
+        except Exception as e:
+            return error_response(e, ORDER_STATUS_ERRORS)
+
+
+    @kitchen_bp.route("/orders/<int:order_id>/complete", methods=["POST"])
+    # @async_kitchen_required # <-- Quando o TODO for implementado, use este decorador!
+    async def complete_order_preparation(order_id: int):
+        """
+        [POST /kitchen/orders/<id>/complete] Muda o status de um pedido para 'READY_FOR_DELIVERY' (pronto para ser entregue).
+        """
+        try:
+            updated_order = await complete_order_preparation_uc.execute(order_id=order_id)
+            return dump(OrderResponseSchema, updated_order), 200
+
+        except Exception as e:
+            return error_response(e, ORDER_STATUS_ERRORS)
+
+
+    return kitchen_bp
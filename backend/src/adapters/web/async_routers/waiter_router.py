@@ -0,0 +1,228 @@
+import functools
+from quart import Blueprint, Response, current_app, jsonify, request, abort, g
+
+# Importa os Casos de Uso assíncronos (que serão injetados)
+from domain.use_cases.waiter import (
+    AsyncListTablesUseCase,
+    AsyncOpenTableUseCase,
+    AsyncGetTableDetailsUseCase,
+    AsyncCloseTableUseCase,
+    AsyncCreateOrderUseCase,
+    AsyncAddItemToOrderUseCase,
+    AsyncSubmitOrderBatchUseCase
+)
+
+from domain.use_cases.get_visible_products import AsyncGetVisibleProductsUseCase
+
+# Importa os Schemas (os mesmos do app Flask)
+from ..schemas import (
+    TableResponseSchema,
+    TableDetailsResponseSchema,
+    OpenTableSchema,
+    OrderResponseSchema,
+    CreateOrderSchema,
+    AddItemToOrderSchema,
+    dump,
+    dump_many_json
+)
+
+# Validação da entrada e erros HTTP (os mesmos do app Flask)
+from ..route_helpers import FORBIDDEN_ERRORS, parse_json, error_response
+
+# Versões do cardápio e das mesas (ETag / GET condicional)
+from adapters.db.version_counter import AsyncVersionCounter
+from ..conditional_get import is_not_modified, not_modified, with_etag
+
+# Importa o decorador de autenticação base
+from adapters.web.async_routers.auth_router import async_auth_required
+
+# Mesmos erros por rota e mesmas respostas do app Flask
+from adapters.web.routers.waiter_router import (
+    TABLE_READ_ERRORS,
+    TABLE_WRITE_ERRORS,
+    CREATE_ORDER_ERRORS,
+    ADD_ITEM_ERRORS,
+    ORDER_BATCH_ERRORS,
+    dump_menu,
+    dump_order_batch,
+    parse_order_batch
+)
+
+waiter_bp = Blueprint("waiter", __name__, url_prefix="/")
+
+
+def async_waiter_required(f):
+    """Versão do 'waiter_required' para rotas assíncronas."""
+    @functools.wraps(f)
+    @async_auth_required
+    async def decorated_function(*args, **kwargs):
+        if "waiter" not in g.user_roles and "admin" not in g.user_roles:
+            abort(403, description="Acesso negado. Requer permissão de Garçom ou Administrador.")
+        return await f(*args, **kwargs)
+    return decorated_function
+
+
+def create_async_waiter_blueprint(
+    list_tables_uc: AsyncListTablesUseCase,
+    open_table_uc: AsyncOpenTableUseCase,
+    get_table_details_uc: AsyncGetTableDetailsUseCase,
+    close_table_uc: AsyncCloseTableUseCase,
+    create_order_uc: AsyncCreateOrderUseCase,
+    add_item_to_order_uc: AsyncAddItemToOrderUseCase,
+    submit_order_batch_uc: AsyncSubmitOrderBatchUseCase,
+    get_visible_products_uc: AsyncGetVisibleProductsUseCase,
+    menu_version: AsyncVersionCounter,
+    tables_version: AsyncVersionCounter
+):
+    """
+    Fábrica para o Blueprint do Garçom do app ASGI.
+    Mesmas rotas, schemas e códigos de erro do create_waiter_blueprint.
+    """
+
+    # --- ROTAS DE MESA (TABLE) ---
+
+    @waiter_bp.route("/tables", methods=["GET"])
+    @async_waiter_required
+    async def list_tables():
+        """
+        [GET /tables] Lista todas as mesas do restaurante e seus status atuais.
+        Responde 304 se o cliente já tem a versão atual (If-None-Match).
+        """
+        try:
+            etag = await tables_version.etag_async()
+            if is_not_modified(request, etag):
+                return not_modified(Response, etag)
+
+            tables = await list_tables_uc.execute()
+            body = dump_many_json(TableResponseSchema, tables, pretty=current_app.debug)
+            return with_etag(Response(body, mimetype="application/json"), etag)
+
+        except Exception as e:
+            return error_response(e, FORBIDDEN_ERRORS)
+
+
+    @waiter_bp.route("/products", methods=["GET"])
+    @async_waiter_required
+    async def list_available_products():
+        """
+        [GET /products] Lista todos os produtos disponíveis no cardápio.
+        Responde 304 se o cliente já tem a versão atual (If-None-Match).
+        """
+        try:
+            etag = await menu_version.etag_async()
+            if is_not_modified(request, etag):
+                return not_modified(Response, etag)
+
+            products = await get_visible_products_uc.execute()
+            return with_etag(jsonify(dump_menu(products)), etag), 200
+
+        except Exception as e:
+            return error_response(e, {})
+
+
+    @waiter_bp.route("/tables/<int:table_id>/open", methods=["POST"])
+    @async_waiter_required
+    async def open_table(table_id: int):
+        """
+        [POST /tables/<id>/open] Abre uma mesa (muda o status para 'OCCUPIED').
+        """
+        try:
+            validated_data = parse_json(OpenTableSchema, await request.get_json())
+            updated_table = await open_table_uc.execute(
+                table_id=table_id,
+                number_of_people=validated_data.number_of_people
+            )
+            return dump(TableResponseSchema, updated_table), 200
+
+        except Exception as e:
+            return error_response(e, TABLE_WRITE_ERRORS)
+
+
+    @waiter_bp.route("/tables/<int:table_id>", methods=["GET"])
+    @async_waiter_required
+    async def get_table_details(table_id: int):
+        """
+        [GET /tables/<id>] Busca os detalhes de uma mesa, incluindo o pedido ativo.
+        """
+        try:
+            table = await get_table_details_uc.execute(table_id=table_id)
+            return dump(TableDetailsResponseSchema, table), 200
+
+        except Exception as e:
+            return error_response(e, TABLE_READ_ERRORS)
+
+
+    @waiter_bp.route("/tables/<int:table_id>/close", methods=["POST"])
+    @async_waiter_required
+    async def close_table(table_id: int):
+        """
+        [POST /tables/<id>/close] Fecha uma mesa. O pedido deve estar pago/concluído.
+        """
+        try:
+            updated_table = await close_table_uc.execute(table_id=table_id)
+            return dump(TableResponseSchema, updated_table), 200
+
+        except Exception as e:
+            return error_response(e, TABLE_WRITE_ERRORS)
+
+    # --- ROTAS DE PEDIDO (ORDER) ---
+
+    @waiter_bp.route("/tables/<int:table_id>/orders", methods=["POST"])
+    @async_waiter_required
+    async def create_order_for_table(table_id: int):
+        """
+        [POST /tables/<id>/orders] Cria um novo pedido para uma mesa ocupada.
+        """
+        try:
+            validated_data = parse_json(CreateOrderSchema, await request.get_json())
+            new_order = await create_order_uc.execute(
+                waiter_id=g.user_id,
+                table_id=table_id,
+                items_data=validated_data.model_dump().get("items", [])
+            )
+            return dump(OrderResponseSchema, new_order), 201
+
+        except Exception as e:
+            return error_response(e, CREATE_ORDER_ERRORS)
+
+
+    @waiter_bp.route("/orders/<int:order_id>/items", methods=["POST"])
+    @async_waiter_required
+    async def add_item_to_order(order_id: int):
+        """
+        [POST /orders/<id>/items] Adiciona um item a um pedido existente.
+        """
+        try:
+            validated_data = parse_json(AddItemToOrderSchema, await request.get_json())
+            updated_order = await add_item_to_order_uc.execute(
+                order_id=order_id,
+                product_id=validated_data.product_id,
+                quantity=validated_data.quantity
+            )
+            return dump(OrderResponseSchema, updated_order), 200
+
+        except Exception as e:
+            return error_response(e, ADD_ITEM_ERRORS)
+
+
+    @waiter_bp.route("/orders/batch", methods=["POST"])
+    @async_waiter_required
+    async def submit_order_batch():
+        """
+        [POST /orders/batch] Vários pedidos novos e itens para pedidos
+        existentes, numa única transação (resultado por entrada).
+        """
+        try:
+            data = parse_order_batch(await request.get_json())
+            result = await submit_order_batch_uc.execute(
+                waiter_id=g.user_id,
+                new_orders=data["new_orders"],
+                additions=data["add_items"]
+            )
+            return dump_order_batch(result), 200
+
+        except Exception as e:
+            return error_response(e, ORDER_BATCH_ERRORS)
+
+
+    return waiter_bp
@@ -0,0 +1,195 @@
+"""
+Arquivos do cardápio (exportação e importação em lote).
+
+Dois formatos, ambos com um produto por linha, para que o arquivo possa
+ser escrito e lido aos poucos (stream), sem montar o cardápio em memória:
+
+- csv: cabeçalho com as colunas de CATALOG_COLUMNS;
+- ndjson: um objeto JSON por linha, com as mesmas chaves.
+
+Na leitura, cada linha é validada com o ProductCatalogSchema e vira um
+ProductImportRow (o produto, ou o motivo da recusa com o número da linha).
+"""
+import codecs
+import csv
+import io
+import json
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Tuple
+
+from pydantic import ValidationError
+
+from domain.models import Product, ProductImportRow
+from .schemas import ProductCatalogSchema
+
+CATALOG_COLUMNS = ("id", "name", "price", "availability", "category", "imageUrl", "visibility")
+
+# Formato -> Content-Type
+CATALOG_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+_FORMAT_ALIASES = {
+    "csv": "csv", "text/csv": "csv", ".csv": "csv",
+    "ndjson": "ndjson", "jsonl": "ndjson", "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson", ".ndjson": "ndjson", ".jsonl": "ndjson",
+}
+
+
+def catalog_format(*candidates: Optional[str]) -> str:
+    """
+    O formato ('csv' ou 'ndjson') do primeiro valor informado: um nome
+    de formato, um Content-Type ou um nome de arquivo.
+
+    Raises:
+        ValueError: Se o formato não for reconhecido (ou nenhum for informado).
+    """
+    for value in candidates:
+        if not value:
+            continue
+        key = value.strip().lower()
+        if key not in _FORMAT_ALIASES:
+            key = "." + key.rsplit(".", 1)[-1] if "." in key else key
+        if key in _FORMAT_ALIASES:
+            return _FORMAT_ALIASES[key]
+        raise ValueError(f"Formato de cardápio desconhecido: '{value}' (use csv ou ndjson).")
+    raise ValueError("Informe o formato do cardápio (csv ou ndjson).")
+
+
+# --- Escrita ---
+
+class CatalogWriter:
+    """Converte produtos em linhas do arquivo, uma por vez."""
+
+    def __init__(self, fmt: str):
+        self.fmt = fmt
+        self._buffer = io.StringIO()
+        self._csv = csv.writer(self._buffer, lineterminator="\n")
+
+    def header(self) -> str:
+        """A primeira linha do arquivo ('' no NDJSON, que não tem cabeçalho)."""
+        return self._csv_line(CATALOG_COLUMNS) if self.fmt == "csv" else ""
+
+    def row(self, product: Product) -> str:
+        values = [getattr(product, column) for column in CATALOG_COLUMNS]
+        if self.fmt == "csv":
+            return self._csv_line(["true" if v is True else "false" if v is False else v for v in values])
+        return json.dumps(dict(zip(CATALOG_COLUMNS, values)), ensure_ascii=False) + "\n"
+
+    def _csv_line(self, values) -> str:
+        self._buffer.seek(0)
+        self._buffer.truncate(0)
+        self._csv.writerow(values)
+        return self._buffer.getvalue()
+
+
+def write_catalog(products: Iterable[Product], fmt: str) -> Iterator[str]:
+    """O arquivo inteiro, linha a linha (para um Response em stream ou um arquivo)."""
+    writer = CatalogWriter(fmt)
+    header = writer.header()
+    if header:
+        yield header
+    for product in products:
+        yield writer.row(product)
+
+
+# --- Leitura ---
+
+class CatalogReader:
+    """
+    Converte as linhas do arquivo em ProductImportRow, uma por vez.
+    (No CSV, a primeira linha não vazia é o cabeçalho.)
+    """
+
+    def __init__(self, fmt: str):
+        self.fmt = fmt
+        self.columns: Optional[list] = None
+
+    def read_line(self, line_number: int, text: str) -> Optional[ProductImportRow]:
+        """A linha lida, ou None se ela não é um produto (cabeçalho, em branco)."""
+        if not text.strip():
+            return None
+
+        try:
+            if self.fmt == "csv":
+                values = next(csv.reader([text]))
+                if self.columns is None:
+                    self.columns = [column.strip() for column in values]
+                    return None
+                data = dict(zip(self.columns, values))
+                if not data.get("id"):
+                    data.pop("id", None) # Sem ID: produto novo
+                for column in ("availability", "visibility"):
+                    if data.get(column) == "":
+                        data.pop(column) # Vazio: o padrão do schema
+            else:
+                data = json.loads(text)
+                if not isinstance(data, dict):
+                    raise ValueError("cada linha deve ser um objeto JSON")
+
+            product = ProductCatalogSchema.model_validate(data)
+
+        except ValidationError as e:
+            return ProductImportRow(line=line_number, error=describe_errors(e))
+        except (csv.Error, ValueError) as e:
+            return ProductImportRow(line=line_number, error=f"Linha malformada: {e}")
+
+        return ProductImportRow(
+            line=line_number,
+            product=Product(id=product.id or 0, **product.model_dump(exclude={"id"}))
+        )
+
+
+def describe_errors(error: ValidationError) -> str:
+    """Os erros do pydantic numa linha só ('campo: mensagem; ...')."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+    )
+
+
+def read_catalog(lines: Iterable[Tuple[int, str]], fmt: str) -> Iterator[ProductImportRow]:
+    """As linhas de produto de um arquivo, a partir de (número, texto)."""
+    reader = CatalogReader(fmt)
+    for line_number, text in lines:
+        row = reader.read_line(line_number, text)
+        if row is not None:
+            yield row
+
+
+async def read_catalog_async(lines: AsyncIterable[Tuple[int, str]], fmt: str) -> AsyncIterator[ProductImportRow]:
+    """Versão de 'read_catalog' para o app ASGI."""
+    reader = CatalogReader(fmt)
+    async for line_number, text in lines:
+        row = reader.read_line(line_number, text)
+        if row is not None:
+            yield row
+
+
+def _decode_line(line_number: int, raw: bytes) -> str:
+    """Uma linha do arquivo em texto (UTF-8, com ou sem BOM no início)."""
+    if line_number == 1 and raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
+    return raw.decode("utf-8").rstrip("\r\n")
+
+
+def text_lines(byte_lines: Iterable[bytes]) -> Iterator[Tuple[int, str]]:
+    """
+    Numera e decodifica as linhas de um arquivo aberto em modo binário
+    ou do corpo de um request WSGI (que já é lido linha a linha).
+    """
+    for line_number, raw in enumerate(byte_lines, start=1):
+        yield line_number, _decode_line(line_number, raw)
+
+
+async def text_lines_async(chunks: AsyncIterable[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Versão de 'text_lines' para o corpo de um request ASGI, que chega em
+    pedaços de tamanho qualquer (uma linha pode vir partida em dois).
+    """
+    pending = b""
+    line_number = 0
+    async for chunk in chunks:
+        *complete, pending = (pending + chunk).split(b"\n")
+        for raw in complete:
+            line_number += 1
+            yield line_number, _decode_line(line_number, raw)
+    if pending:
+        line_number += 1
+        yield line_number, _decode_line(line_number, pending)
@@ -0,0 +1,31 @@
+"""
+GET condicional (ETag / If-None-Match) para as listagens que as telas
+recarregam o tempo todo (cardápio e mesas).
+
+A rota lê a versão dos dados (SharedVersionCounter.etag(), a mesma em
+todos os workers) ANTES de buscá-los:
+se o cliente já tem essa versão, responde 304 sem ir ao banco nem
+serializar nada. Funciona com os objetos request/response do Flask e
+do Quart (mesma interface do werkzeug).
+"""
+
+# O cliente (tablet) pode guardar a resposta, mas deve revalidá-la
+# (If-None-Match) antes de cada uso. 'private': a resposta depende do login.
+CACHE_CONTROL = "private, no-cache"
+
+
+def is_not_modified(request, etag: str) -> bool:
+    """True se o cabeçalho If-None-Match do cliente inclui 'etag' (ou é '*')."""
+    return request.if_none_match.contains(etag)
+
+
+def with_etag(response, etag: str):
+    """Adiciona ETag (forte) e Cache-Control à resposta."""
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def not_modified(response_class, etag: str):
+    """Resposta 304 (sem corpo) para a versão 'etag'."""
+    return with_etag(response_class(status=304), etag)
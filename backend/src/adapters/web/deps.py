@@ -1,4 +1,6 @@
 #adapters/web/deps.py
+import threading
+
 # --- 1. Importar todas as implementações CONCRETAS (Adaptadores) ---
 
 # Adaptadores de Banco de Dados
@@ -6,21 +8,51 @@ from ..db import (
     MySQLProductRepository,
     MySQLUserRepository,
     MySQLOrderRepository,
-    MySQLTableRepository
+    MySQLTableRepository,
+    CachedProductRepository,
+    CachedUserRepository,
+    AsyncMySQLProductRepository,
+    AsyncMySQLUserRepository,
+    AsyncMySQLOrderRepository,
+    AsyncMySQLTableRepository,
+    AsyncCachedProductRepository,
+    AsyncCachedUserRepository,
+    MySQLSalesReportRepository,
+    AsyncMySQLSalesReportRepository
+)
+from ..db.versioned_table_repository import (
+    VersionedTableRepository,
+    AsyncVersionedTableRepository
+)
+from ..db.version_counter import (
+    SharedVersionCounter,
+    AsyncSharedVersionCounter,
+    MENU_DATASET,
+    TABLES_DATASET
 )
+from ..db.db_config import cache_config
+from ..db.connection_pool import connection_pool
+from ..db.async_connection_pool import create_async_connection_pool
+from ..db.read_routing import read_router, create_async_read_router
 
 # Adaptadores de Serviço
 from ..services import (
     BcryptPasswordHasher,
     JwtTokenGenerator
 )
+from ..services.security_service import token_verifier
+
+# (O KitchenEventFeed, que traz o Flask e os schemas, é importado só
+# quando o 'kitchen_feed' é criado: o cli.py não precisa dele.)
 
 # --- 2. Importar todas as classes de CASOS DE USO ---
 
 # Casos de Uso de Autenticação
 from domain.use_cases.auth import (
     LoginUseCase,
-    GetAuthenticatedUserUseCase
+    GetAuthenticatedUserUseCase,
+    AsyncLoginUseCase,
+    AsyncGetAuthenticatedUserUseCase
 )
 
 # Casos de Uso de Admin
@@ -29,16 +61,36 @@ from domain.use_cases.admin import (
     UpdateProductUseCase,
     ListAllProductsUseCase,
     CreateUserUseCase,
-    UpdateUserUseCase
+    UpdateUserUseCase,
+    SearchOrderHistoryUseCase,
+    GetSalesReportUseCase,
+    ImportUsersUseCase,
+    ExportProductsUseCase,
+    ImportProductsUseCase,
+    AsyncCreateProductUseCase,
+    AsyncUpdateProductUseCase,
+    AsyncListAllProductsUseCase,
+    AsyncCreateUserUseCase,
+    AsyncUpdateUserUseCase,
+    AsyncSearchOrderHistoryUseCase,
+    AsyncGetSalesReportUseCase,
+    AsyncExportProductsUseCase,
+    AsyncImportProductsUseCase
 )
 
-from domain.use_cases.get_visible_products import GetVisibleProductsUseCase
+from domain.use_cases.get_visible_products import (
+    GetVisibleProductsUseCase,
+    AsyncGetVisibleProductsUseCase
+)
 
 # Casos de Uso da Cozinha
 from domain.use_cases.kitchen import (
     ListPendingOrdersUseCase,
     StartOrderPreparationUseCase,
-    CompleteOrderPreparationUseCase
+    CompleteOrderPreparationUseCase,
+    AsyncListPendingOrdersUseCase,
+    AsyncStartOrderPreparationUseCase,
+    AsyncCompleteOrderPreparationUseCase
 )
 
 # Casos de Uso do Garçom
@@ -48,10 +100,48 @@ from domain.use_cases.waiter import (
     GetTableDetailsUseCase,
     CloseTableUseCase,
     CreateOrderUseCase,
-    AddItemToOrderUseCase
+    AddItemToOrderUseCase,
+    SubmitOrderBatchUseCase,
+    AsyncListTablesUseCase,
+    AsyncOpenTableUseCase,
+    AsyncGetTableDetailsUseCase,
+    AsyncCloseTableUseCase,
+    AsyncCreateOrderUseCase,
+    AsyncAddItemToOrderUseCase,
+    AsyncSubmitOrderBatchUseCase
 )
 
 
+class provider:
+    """
+    Dependência do container criada só no primeiro acesso (como um
+    functools.cached_property): o valor fica no __dict__ do container,
+    então os acessos seguintes não passam mais por aqui, e atribuir
+    'container.x = ...' (ex: nos testes) substitui a dependência.
+
+    A criação é feita sob o lock do container (reentrante, pois uma
+    dependência pede as suas), para que duas threads não criem duas
+    instâncias do mesmo repositório ou cache.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, container, owner=None):
+        if container is None:
+            return self
+
+        with container._build_lock:
+            if self.name not in container.__dict__:
+                container.__dict__[self.name] = self.factory(container)
+            return container.__dict__[self.name]
+
+
 class AppContainer:
     """
     Container de Injeção de Dependência.
@@ -59,95 +149,521 @@ class AppContainer:
     Este é o ÚNICO lugar que "sabe" qual implementação concreta
     (ex: MySQLUserRepository) está sendo usada para uma interface
     (ex: UserRepositoryPort).
+
+    Cada dependência é um @provider: nada é criado no import nem no
+    AppContainer(), só no primeiro acesso (o cli.py, que usa apenas o
+    create_user_uc, cria só o user_repo e o password_hasher).
+    Nenhuma delas abre conexões ao ser criada: o pool conecta no
+    primeiro get_connection().
     """
     
     def __init__(self):
-        
-        # --- 1. Instanciar Adaptadores (Folhas da Árvore) ---
-        
-        # Serviços
-        self.password_hasher = BcryptPasswordHasher()
-        self.token_generator = JwtTokenGenerator()
-        
-        # Repositórios
-        self.user_repo = MySQLUserRepository()
-        self.product_repo = MySQLProductRepository()
-        self.order_repo = MySQLOrderRepository()
-        self.table_repo = MySQLTableRepository()
-
-        # --- 2. Instanciar Casos de Uso (Injetando os Adaptadores) ---
-        
-        # Casos de Uso de Auth
-        self.login_uc = LoginUseCase(
+        self._build_lock = threading.RLock()
+
+    # --- 1. Instanciar Adaptadores (Folhas da Árvore) ---
+
+    # Serviços
+    @provider
+    def password_hasher(self):
+        return BcryptPasswordHasher()
+
+    @provider
+    def token_generator(self):
+        return JwtTokenGenerator()
+
+    # Verificador usado pelo 'auth_required' (exposto em /metrics)
+    @provider
+    def token_verifier(self):
+        return token_verifier
+
+    # Pool de conexões compartilhado pelos repositórios (exposto em /metrics)
+    @provider
+    def db_pool(self):
+        return connection_pool
+
+    # Roteador das leituras entre primário e réplica (exposto em /metrics)
+    @provider
+    def db_reads(self):
+        return read_router
+
+    # Repositórios
+    # Usuários por ID também vêm de um cache (checagem de admin e
+    # /auth/me), invalidado a cada save() de usuário.
+    @provider
+    def user_repo(self):
+        return CachedUserRepository(
+            inner=MySQLUserRepository(),
+            ttl_seconds=cache_config['user_ttl_seconds']
+        )
+
+    # Versões do cardápio e das mesas (ETags de GET /products e
+    # GET /tables), guardadas no banco e incrementadas pelos save() dos
+    # repositórios na transação da escrita (as mesmas em todos os workers).
+    @provider
+    def menu_version(self):
+        return SharedVersionCounter(
+            MENU_DATASET, self.db_pool,
+            refresh_seconds=cache_config['version_refresh_seconds']
+        )
+
+    @provider
+    def tables_version(self):
+        return SharedVersionCounter(
+            TABLES_DATASET, self.db_pool,
+            refresh_seconds=cache_config['version_refresh_seconds']
+        )
+
+    # O cardápio é servido de um cache em memória, invalidado
+    # a cada save() de produto (Create/UpdateProductUseCase).
+    @provider
+    def product_repo(self):
+        return CachedProductRepository(
+            inner=MySQLProductRepository(),
+            ttl_seconds=cache_config['product_ttl_seconds'],
+            version=self.menu_version
+        )
+
+    @provider
+    def order_repo(self):
+        return MySQLOrderRepository()
+
+    # Resumos de vendas (somados pelo order_repo ao concluir pedidos)
+    @provider
+    def sales_report_repo(self):
+        return MySQLSalesReportRepository()
+
+    @provider
+    def table_repo(self):
+        return VersionedTableRepository(
+            inner=MySQLTableRepository(),
+            version=self.tables_version
+        )
+
+    # Eventos de pedido (stream da cozinha)
+    @provider
+    def kitchen_feed(self):
+        from .kitchen_feed import KitchenEventFeed
+        return KitchenEventFeed()
+
+    # --- 2. Instanciar Casos de Uso (Injetando os Adaptadores) ---
+
+    # Casos de Uso de Auth
+    @provider
+    def login_uc(self):
+        return LoginUseCase(
             user_repository=self.user_repo,
             password_hasher=self.password_hasher,
             token_generator=self.token_generator
         )
-        self.get_auth_user_uc = GetAuthenticatedUserUseCase(
+
+    @provider
+    def get_auth_user_uc(self):
+        return GetAuthenticatedUserUseCase(
             user_repository=self.user_repo
         )
-        
-        # Casos de Uso de Admin
-        self.create_product_uc = CreateProductUseCase(
+
+    # Casos de Uso de Admin
+    @provider
+    def create_product_uc(self):
+        return CreateProductUseCase(
             product_repository=self.product_repo,
             user_repository=self.user_repo
         )
-        self.update_product_uc = UpdateProductUseCase(
+
+    @provider
+    def update_product_uc(self):
+        return UpdateProductUseCase(
             product_repository=self.product_repo,
             user_repository=self.user_repo
         )
-        self.list_all_products_uc = ListAllProductsUseCase(
+
+    @provider
+    def list_all_products_uc(self):
+        return ListAllProductsUseCase(
             product_repository=self.product_repo,
             user_repository=self.user_repo
         )
 
-        self.get_visible_products_uc = GetVisibleProductsUseCase(
+    @provider
+    def get_visible_products_uc(self):
+        return GetVisibleProductsUseCase(
             repository=self.product_repo
         )
 
-        self.create_user_uc = CreateUserUseCase(
+    @provider
+    def create_user_uc(self):
+        return CreateUserUseCase(
             user_repository=self.user_repo,
             password_hasher=self.password_hasher
         )
-        self.update_user_uc = UpdateUserUseCase(
+
+    @provider
+    def update_user_uc(self):
+        return UpdateUserUseCase(
             user_repository=self.user_repo,
             password_hasher=self.password_hasher
         )
-        
-        # Casos de Uso da Cozinha
-        self.list_pending_orders_uc = ListPendingOrdersUseCase(
-            order_repository=self.order_repo
+
+    # Importação da equipe em lote (cli.py import-staff)
+    @provider
+    def import_users_uc(self):
+        return ImportUsersUseCase(
+            user_repository=self.user_repo,
+            password_hasher=self.password_hasher
         )
-        self.start_order_prep_uc = StartOrderPreparationUseCase(
-            order_repository=self.order_repo
+
+    @provider
+    def search_order_history_uc(self):
+        return SearchOrderHistoryUseCase(
+            order_repository=self.order_repo,
+            user_repository=self.user_repo
+        )
+
+    @provider
+    def get_sales_report_uc(self):
+        return GetSalesReportUseCase(
+            sales_report_repository=self.sales_report_repo,
+            user_repository=self.user_repo
+        )
+
+    @provider
+    def export_products_uc(self):
+        return ExportProductsUseCase(
+            product_repository=self.product_repo,
+            user_repository=self.user_repo
+        )
+
+    @provider
+    def import_products_uc(self):
+        return ImportProductsUseCase(
+            product_repository=self.product_repo,
+            user_repository=self.user_repo
         )
-        self.complete_order_prep_uc = CompleteOrderPreparationUseCase(
+
+    # Casos de Uso da Cozinha
+    @provider
+    def list_pending_orders_uc(self):
+        return ListPendingOrdersUseCase(
             order_repository=self.order_repo
         )
-        
-        # Casos de Uso do Garçom
-        self.list_tables_uc = ListTablesUseCase(
+
+    @provider
+    def start_order_prep_uc(self):
+        return StartOrderPreparationUseCase(
+            order_repository=self.order_repo,
+            event_publisher=self.kitchen_feed
+        )
+
+    @provider
+    def complete_order_prep_uc(self):
+        return CompleteOrderPreparationUseCase(
+            order_repository=self.order_repo,
+            event_publisher=self.kitchen_feed
+        )
+
+    # Casos de Uso do Garçom
+    @provider
+    def list_tables_uc(self):
+        return ListTablesUseCase(
             table_repository=self.table_repo
         )
-        self.open_table_uc = OpenTableUseCase(
+
+    @provider
+    def open_table_uc(self):
+        return OpenTableUseCase(
             table_repository=self.table_repo
         )
-        self.get_table_details_uc = GetTableDetailsUseCase(
+
+    @provider
+    def get_table_details_uc(self):
+        return GetTableDetailsUseCase(
             table_repository=self.table_repo
         )
-        self.close_table_uc = CloseTableUseCase(
+
+    @provider
+    def close_table_uc(self):
+        return CloseTableUseCase(
             table_repository=self.table_repo
         )
-        self.create_order_uc = CreateOrderUseCase( # O caso de uso corrigido
+
+    @provider
+    def create_order_uc(self):
+        return CreateOrderUseCase( # O caso de uso corrigido
+            table_repository=self.table_repo,
+            product_repository=self.product_repo,
+            order_repository=self.order_repo,
+            event_publisher=self.kitchen_feed
+        )
+
+    @provider
+    def add_item_to_order_uc(self):
+        return AddItemToOrderUseCase(
+            order_repository=self.order_repo,
+            product_repository=self.product_repo,
+            event_publisher=self.kitchen_feed
+        )
+
+    @provider
+    def submit_order_batch_uc(self):
+        return SubmitOrderBatchUseCase(
             table_repository=self.table_repo,
             product_repository=self.product_repo,
+            order_repository=self.order_repo,
+            event_publisher=self.kitchen_feed
+        )
+
+
+class AsyncAppContainer:
+    """
+    Container de Injeção de Dependência do app ASGI (asgi.py).
+
+    Mesma montagem do AppContainer, mas com os repositórios e casos de uso
+    assíncronos sobre um pool 'mysql.connector.aio' próprio. Os serviços
+    (hasher, tokens) são os mesmos. É criado pelo create_asgi_app(), e não
+    no import, para que o app Flask não abra um segundo pool. As
+    dependências também são @provider (criadas no primeiro acesso).
+    """
+
+    def __init__(self):
+        self._build_lock = threading.RLock()
+
+    # --- 1. Instanciar Adaptadores (Folhas da Árvore) ---
+
+    # Serviços
+    @provider
+    def password_hasher(self):
+        return BcryptPasswordHasher()
+
+    @provider
+    def token_generator(self):
+        return JwtTokenGenerator()
+
+    @provider
+    def token_verifier(self):
+        return token_verifier
+
+    # Pool de conexões assíncrono e roteador de leituras (expostos em /metrics)
+    @provider
+    def db_pool(self):
+        return create_async_connection_pool()
+
+    @provider
+    def db_reads(self):
+        return create_async_read_router(self.db_pool)
+
+    # Versões do cardápio e das mesas (ETags), as mesmas do app Flask
+    @provider
+    def menu_version(self):
+        return AsyncSharedVersionCounter(
+            MENU_DATASET, self.db_pool,
+            refresh_seconds=cache_config['version_refresh_seconds']
+        )
+
+    @provider
+    def tables_version(self):
+        return AsyncSharedVersionCounter(
+            TABLES_DATASET, self.db_pool,
+            refresh_seconds=cache_config['version_refresh_seconds']
+        )
+
+    # Repositórios (mesmos caches do app Flask)
+    @provider
+    def user_repo(self):
+        return AsyncCachedUserRepository(
+            inner=AsyncMySQLUserRepository(self.db_pool, self.db_reads),
+            ttl_seconds=cache_config['user_ttl_seconds']
+        )
+
+    @provider
+    def product_repo(self):
+        return AsyncCachedProductRepository(
+            inner=AsyncMySQLProductRepository(self.db_pool, self.db_reads),
+            ttl_seconds=cache_config['product_ttl_seconds'],
+            version=self.menu_version
+        )
+
+    @provider
+    def order_repo(self):
+        return AsyncMySQLOrderRepository(self.db_pool, self.db_reads)
+
+    @provider
+    def sales_report_repo(self):
+        return AsyncMySQLSalesReportRepository(self.db_pool, self.db_reads)
+
+    @provider
+    def table_repo(self):
+        return AsyncVersionedTableRepository(
+            inner=AsyncMySQLTableRepository(self.db_pool, self.db_reads),
+            version=self.tables_version
+        )
+
+    # Eventos de pedido (stream da cozinha)
+    @provider
+    def kitchen_feed(self):
+        from .kitchen_feed import KitchenEventFeed
+        return KitchenEventFeed()
+
+    # --- 2. Instanciar Casos de Uso (Injetando os Adaptadores) ---
+
+    # Casos de Uso de Auth
+    @provider
+    def login_uc(self):
+        return AsyncLoginUseCase(
+            user_repository=self.user_repo,
+            password_hasher=self.password_hasher,
+            token_generator=self.token_generator
+        )
+
+    @provider
+    def get_auth_user_uc(self):
+        return AsyncGetAuthenticatedUserUseCase(
+            user_repository=self.user_repo
+        )
+
+    # Casos de Uso de Admin
+    @provider
+    def create_product_uc(self):
+        return AsyncCreateProductUseCase(
+            product_repository=self.product_repo,
+            user_repository=self.user_repo
+        )
+
+    @provider
+    def update_product_uc(self):
+        return AsyncUpdateProductUseCase(
+            product_repository=self.product_repo,
+            user_repository=self.user_repo
+        )
+
+    @provider
+    def list_all_products_uc(self):
+        return AsyncListAllProductsUseCase(
+            product_repository=self.product_repo,
+            user_repository=self.user_repo
+        )
+
+    @provider
+    def get_visible_products_uc(self):
+        return AsyncGetVisibleProductsUseCase(
+            repository=self.product_repo
+        )
+
+    @provider
+    def create_user_uc(self):
+        return AsyncCreateUserUseCase(
+            user_repository=self.user_repo,
+            password_hasher=self.password_hasher
+        )
+
+    @provider
+    def update_user_uc(self):
+        return AsyncUpdateUserUseCase(
+            user_repository=self.user_repo,
+            password_hasher=self.password_hasher
+        )
+
+    @provider
+    def search_order_history_uc(self):
+        return AsyncSearchOrderHistoryUseCase(
+            order_repository=self.order_repo,
+            user_repository=self.user_repo
+        )
+
+    @provider
+    def get_sales_report_uc(self):
+        return AsyncGetSalesReportUseCase(
+            sales_report_repository=self.sales_report_repo,
+            user_repository=self.user_repo
+        )
+
+    @provider
+    def export_products_uc(self):
+        return AsyncExportProductsUseCase(
+            product_repository=self.product_repo,
+            user_repository=self.user_repo
+        )
+
+    @provider
+    def import_products_uc(self):
+        return AsyncImportProductsUseCase(
+            product_repository=self.product_repo,
+            user_repository=self.user_repo
+        )
+
+    # Casos de Uso da Cozinha
+    @provider
+    def list_pending_orders_uc(self):
+        return AsyncListPendingOrdersUseCase(
             order_repository=self.order_repo
         )
-        self.add_item_to_order_uc = AddItemToOrderUseCase(
+
+    @provider
+    def start_order_prep_uc(self):
+        return AsyncStartOrderPreparationUseCase(
+            order_repository=self.order_repo,
+            event_publisher=self.kitchen_feed
+        )
+
+    @provider
+    def complete_order_prep_uc(self):
+        return AsyncCompleteOrderPreparationUseCase(
             order_repository=self.order_repo,
-            product_repository=self.product_repo
+            event_publisher=self.kitchen_feed
+        )
+
+    # Casos de Uso do Garçom
+    @provider
+    def list_tables_uc(self):
+        return AsyncListTablesUseCase(
+            table_repository=self.table_repo
         )
 
+    @provider
+    def open_table_uc(self):
+        return AsyncOpenTableUseCase(
+            table_repository=self.table_repo
+        )
+
+    @provider
+    def get_table_details_uc(self):
+        return AsyncGetTableDetailsUseCase(
+            table_repository=self.table_repo
+        )
+
+    @provider
+    def close_table_uc(self):
+        return AsyncCloseTableUseCase(
+            table_repository=self.table_repo
+        )
+
+    @provider
+    def create_order_uc(self):
+        return AsyncCreateOrderUseCase(
+            table_repository=self.table_repo,
+            product_repository=self.product_repo,
+            order_repository=self.order_repo,
+            event_publisher=self.kitchen_feed
+        )
+
+    @provider
+    def add_item_to_order_uc(self):
+        return AsyncAddItemToOrderUseCase(
+            order_repository=self.order_repo,
+            product_repository=self.product_repo,
+            event_publisher=self.kitchen_feed
+        )
+
+    @provider
+    def submit_order_batch_uc(self):
+        return AsyncSubmitOrderBatchUseCase(
+            table_repository=self.table_repo,
+            product_repository=self.product_repo,
+            order_repository=self.order_repo,
+            event_publisher=self.kitchen_feed
+        )
+
+
 # --- Ponto de Entrada Global ---
 # Cria uma instância única do container que o main.py irá importar.
-container = AppContainer()
\ No newline at end of file
+# (Barato: as dependências só são criadas quando usadas.)
+container = AppContainer()
@@ -0,0 +1,150 @@
+import asyncio
+import itertools
+import threading
+import uuid
+from collections import deque
+from typing import List, NamedTuple, Optional, Tuple
+
+from flask import json
+
+# Importa a PORTA (Interface) que esta classe implementa
+from domain.ports.order_event_publisher import OrderEventPublisherPort, OrderEventType
+from domain.models import Order
+
+# Importa o Schema usado para formatar o pedido (o mesmo da API REST)
+from .schemas import OrderResponseSchema, dump
+
+
+class FeedEvent(NamedTuple):
+    """Um evento já serializado, pronto para ser enviado às telas."""
+    seq: int
+    type: str
+    data: str
+
+
+class KitchenEventFeed(OrderEventPublisherPort):
+    """
+    Implementação CONCRETA da OrderEventPublisherPort para as telas da cozinha.
+
+    Guarda os últimos eventos em um buffer circular em memória. Cada tela
+    conectada ao stream (Server-Sent Events) espera por novos eventos sem
+    consultar o banco; ao reconectar, informa o último ID recebido
+    (cabeçalho 'Last-Event-ID') e recebe apenas o que perdeu.
+
+    Os IDs têm o formato "<epoch>-<seq>". O 'epoch' muda a cada início do
+    processo: um cursor de outro epoch (ex: servidor reiniciado), ou mais
+    antigo que o buffer, não pode ser retomado e a tela recebe um evento
+    'resync' para recarregar a lista completa.
+
+    As telas podem esperar de dois jeitos: wait_for_events() (app Flask,
+    uma thread por tela) ou wait_for_events_async() (app ASGI, sem thread).
+
+    NOTA: O buffer vive no processo. Com vários workers, as telas precisam
+    estar no mesmo worker que publica (ou trocar este adaptador por um
+    broker externo que implemente a mesma porta).
+    """
+
+    RESYNC = 'resync'
+
+    def __init__(self, buffer_size: int = 1000):
+        self.epoch = uuid.uuid4().hex[:8]
+        self._events: deque = deque(maxlen=buffer_size)
+        self._last_seq = 0
+        self._condition = threading.Condition()
+        # Telas do app ASGI esperando eventos: { (loop, asyncio.Event) }
+        self._async_waiters: set = set()
+
+    # --- Implementação da Porta ---
+
+    def publish(self, event_type: OrderEventType, order: Order) -> None:
+        # Serializa UMA vez, no momento da publicação (e não uma vez por tela)
+        payload = dump(OrderResponseSchema, order)
+        data = json.dumps(payload)
+
+        with self._condition:
+            self._last_seq += 1
+            self._events.append(FeedEvent(self._last_seq, event_type.value, data))
+            self._condition.notify_all()
+            async_waiters = list(self._async_waiters)
+
+        # publish() pode ser chamado de qualquer thread (ou do próprio loop)
+        for loop, event in async_waiters:
+            loop.call_soon_threadsafe(event.set)
+
+    # --- Leitura (usada pelo stream) ---
+
+    def cursor(self) -> str:
+        """Cursor que aponta para o evento mais recente."""
+        with self._condition:
+            return self._format_id(self._last_seq)
+
+    def parse_cursor(self, cursor: Optional[str]) -> Optional[int]:
+        """
+        Converte um cursor recebido da tela em um 'seq' deste processo.
+        Retorna None se o cursor for inválido ou de outro epoch.
+        """
+        if not cursor:
+            return None
+        epoch, _, seq = cursor.partition('-')
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def wait_for_events(self, after_seq: int, timeout: float) -> Tuple[List[FeedEvent], bool]:
+        """
+        Espera (até 'timeout' segundos) por eventos posteriores a 'after_seq'.
+
+        Returns:
+            (eventos, precisa_resync). 'precisa_resync' é True quando parte
+            dos eventos pedidos já saiu do buffer.
+        """
+        with self._condition:
+            if self._last_seq <= after_seq:
+                self._condition.wait(timeout)
+            return self._events_after(after_seq)
+
+    async def wait_for_events_async(self, after_seq: int, timeout: float) -> Tuple[List[FeedEvent], bool]:
+        """Versão de wait_for_events() para o app ASGI: espera sem ocupar uma thread."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._condition:
+            if self._last_seq > after_seq:
+                return self._events_after(after_seq)
+            self._async_waiters.add(waiter)
+
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._condition:
+                self._async_waiters.discard(waiter)
+
+        with self._condition:
+            return self._events_after(after_seq)
+
+    def _events_after(self, after_seq: int) -> Tuple[List[FeedEvent], bool]:
+        """Eventos posteriores a 'after_seq' (chamado com o lock em mãos)."""
+        if not self._events or self._last_seq <= after_seq:
+            return [], False
+
+        oldest_seq = self._events[0].seq
+        if after_seq < oldest_seq - 1:
+            return [], True
+
+        # Os eventos estão em ordem: pula direto para o primeiro que falta
+        start = after_seq - oldest_seq + 1
+        return list(itertools.islice(self._events, start, None)), False
+
+    # --- Formatação SSE ---
+
+    def _format_id(self, seq: int) -> str:
+        return f"{self.epoch}-{seq}"
+
+    def format_event(self, event: FeedEvent) -> str:
+        """Formata um evento no protocolo text/event-stream."""
+        data_lines = ''.join(f"data: {line}\n" for line in event.data.splitlines())
+        return f"id: {self._format_id(event.seq)}\nevent: {event.type}\n{data_lines}\n"
+
+    def format_resync(self) -> str:
+        """Evento que pede à tela para recarregar a lista completa de pedidos."""
+        return f"id: {self.cursor()}\nevent: {self.RESYNC}\ndata: {{}}\n\n"
@@ -6,6 +6,10 @@ from werkzeug.exceptions import HTTPException # Para tratar erros do abort()
 # 1. Importa o "cérebro": o container de dependências já pronto
 from .deps import container
 
+# Medição de requests (Server-Timing, log por request, histogramas)
+from .request_timing import RouteMetrics, install_request_timing
+from .read_scope import install_read_scope
+
 # 2. Importa as "fábricas" de rotas
 from .routers.auth_router import create_auth_blueprint
 from .routers.admin_router import create_admin_blueprint
@@ -25,6 +29,17 @@ def create_app():
     
     # Habilita o CORS para permitir que o frontend acesse a API
     CORS(app) 
+
+    # Mede cada request: tempo total, SQL, pool, auth e serialização.
+    # (REQUEST_LOG=0 desliga a linha de log por request)
+    route_metrics = RouteMetrics()
+    install_request_timing(
+        app, route_metrics,
+        log_requests=os.environ.get("REQUEST_LOG", "1") != "0"
+    )
+
+    # Leituras de GET/HEAD podem ir à réplica (ver db/read_routing.py)
+    install_read_scope(app)
     
     # --- Injeção de Dependência e Registro de Rotas ---
     
@@ -42,7 +57,11 @@ def create_app():
         update_product_uc=container.update_product_uc,
         list_all_products_uc=container.list_all_products_uc,
         create_user_uc=container.create_user_uc,
-        update_user_uc=container.update_user_uc
+        update_user_uc=container.update_user_uc,
+        search_order_history_uc=container.search_order_history_uc,
+        get_sales_report_uc=container.get_sales_report_uc,
+        export_products_uc=container.export_products_uc,
+        import_products_uc=container.import_products_uc
     )
     
     # Cria o blueprint do Garçom
@@ -53,14 +72,18 @@ def create_app():
         close_table_uc=container.close_table_uc,
         create_order_uc=container.create_order_uc,
         add_item_to_order_uc=container.add_item_to_order_uc,
-        get_visible_products_uc=container.get_visible_products_uc
+        submit_order_batch_uc=container.submit_order_batch_uc,
+        get_visible_products_uc=container.get_visible_products_uc,
+        menu_version=container.menu_version,
+        tables_version=container.tables_version
     )
     
     # Cria o blueprint da Cozinha
     kitchen_bp = create_kitchen_blueprint(
         list_pending_orders_uc=container.list_pending_orders_uc,
         start_order_preparation_uc=container.start_order_prep_uc,
-        complete_order_preparation_uc=container.complete_order_prep_uc
+        complete_order_preparation_uc=container.complete_order_prep_uc,
+        kitchen_feed=container.kitchen_feed
     )
     
     # Registra todos os blueprints na aplicação
@@ -90,6 +113,22 @@ def create_app():
     @app.route("/")
     def home():
         return jsonify({"status": "Mandaladaka API rodando!"})
+
+    # Rota de métricas (para scraping / diagnóstico)
+    @app.route("/metrics")
+    def metrics():
+        """
+        [GET /metrics] Contadores internos da aplicação
+        (caches em memória, pool de conexões, réplica, latência por rota).
+        """
+        return jsonify({
+            "product_cache": container.product_repo.stats(),
+            "user_cache": container.user_repo.stats(),
+            "token_cache": container.token_verifier.stats(),
+            "db_pool": container.db_pool.stats(),
+            "db_reads": container.db_reads.stats(),
+            "routes": route_metrics.snapshot()
+        })
         
     print(">>> Aplicação criada com sucesso.")
     return app
@@ -97,8 +136,8 @@ def create_app():
 # --- Ponto de Entrada para Execução ---
 
 if __name__ == "__main__":
-    # O 'connection_pool' é criado no 'deps.py'
-    # assim que este arquivo é executado.
+    # O 'connection_pool' é criado no 'deps.py' assim que este arquivo
+    # é executado, mas só abre conexões no primeiro uso.
     
     app = create_app()
     
@@ -0,0 +1,38 @@
+"""
+Escopo de leitura de cada request (ver adapters/db/read_routing.py).
+
+Só requests GET/HEAD podem ler da réplica; os demais leem do primário,
+porque o que leem serve de base para uma escrita. Os decoradores de
+autenticação associam o request ao usuário (read-your-writes).
+"""
+from flask import Flask, request
+
+from ..db import read_routing
+
+# Métodos que não gravam nada (podem ler da réplica)
+SAFE_METHODS = ("GET", "HEAD")
+
+
+def install_read_scope(app: Flask):
+    """Abre e fecha o escopo de leitura em cada request do app Flask."""
+
+    @app.before_request
+    def open_read_scope():
+        read_routing.begin_scope(replica_allowed=request.method in SAFE_METHODS)
+
+    @app.teardown_request
+    def close_read_scope(exc=None):
+        read_routing.end_scope()
+
+
+def install_async_read_scope(app):
+    """Versão de install_read_scope() para o app ASGI (Quart)."""
+    from quart import request as quart_request
+
+    @app.before_request
+    async def open_read_scope():
+        read_routing.begin_scope(replica_allowed=quart_request.method in SAFE_METHODS)
+
+    @app.teardown_request
+    async def close_read_scope(exc=None):
+        read_routing.end_scope()
@@ -0,0 +1,211 @@
+import json
+import logging
+import sys
+import threading
+from datetime import datetime
+from typing import Dict, List
+
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+
+# Medições do request atual (preenchidas também pelo pool/cursor do banco)
+from .. import request_stats
+
+# Fases medidas (na ordem em que aparecem no Server-Timing)
+PHASES = ("auth", "pool", "db", "serialize")
+
+# Limites (ms) dos "baldes" dos histogramas de latência
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+request_logger = logging.getLogger("mandaladaka.requests")
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Provider JSON do Flask que mede o tempo do jsonify() como 'serialize'."""
+
+    def response(self, *args, **kwargs) -> Response:
+        with request_stats.timed("serialize"):
+            return super().response(*args, **kwargs)
+
+
+class _RouteHistogram:
+    """Acumulado de uma rota (ex: 'GET /tables/<int:table_id>')."""
+
+    __slots__ = ("count", "errors", "total_ms", "sql_count", "phase_ms", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0 # Respostas 5xx
+        self.total_ms = 0.0
+        self.sql_count = 0
+        self.phase_ms: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.buckets: List[int] = [0] * (len(BUCKETS_MS) + 1) # Último = acima do maior limite
+
+
+class RouteMetrics:
+    """
+    Histogramas de latência por rota, para o /metrics.
+
+    Guardamos só contadores por "balde" (e não cada amostra): a memória
+    é fixa, independente do número de requests.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, _RouteHistogram] = {}
+
+    def observe(self, route: str, status: int, total_ms: float, stats: request_stats.RequestStats):
+        bucket = next((i for i, limit in enumerate(BUCKETS_MS) if total_ms <= limit), len(BUCKETS_MS))
+        with self._lock:
+            histogram = self._routes.get(route)
+            if histogram is None:
+                histogram = self._routes[route] = _RouteHistogram()
+            histogram.count += 1
+            histogram.errors += status >= 500
+            histogram.total_ms += total_ms
+            histogram.sql_count += stats.sql_count
+            for phase in PHASES:
+                histogram.phase_ms[phase] += stats.phases.get(phase, 0.0) * 1000
+            histogram.buckets[bucket] += 1
+
+    def snapshot(self) -> dict:
+        """Retorna os histogramas (baldes cumulativos, como no Prometheus)."""
+        with self._lock:
+            result = {}
+            for route, h in sorted(self._routes.items()):
+                cumulative, running = {}, 0
+                for limit, n in zip([*map(str, BUCKETS_MS), "+Inf"], h.buckets):
+                    running += n
+                    cumulative[limit] = running
+                result[route] = {
+                    "count": h.count,
+                    "errors": h.errors,
+                    "avg_ms": round(h.total_ms / h.count, 2),
+                    "p50_ms_le": self._quantile_bound(cumulative, h.count, 0.50),
+                    "p95_ms_le": self._quantile_bound(cumulative, h.count, 0.95),
+                    "avg_sql_statements": round(h.sql_count / h.count, 2),
+                    "avg_phase_ms": {p: round(v / h.count, 2) for p, v in h.phase_ms.items()},
+                    "buckets_ms": cumulative,
+                }
+            return result
+
+    @staticmethod
+    def _quantile_bound(cumulative: Dict[str, int], count: int, q: float) -> str:
+        """Limite superior do balde onde cai o quantil 'q'."""
+        for limit, running in cumulative.items():
+            if running >= q * count:
+                return limit
+        return "+Inf"
+
+
+def _server_timing(stats: request_stats.RequestStats, total: float) -> str:
+    """
+    Monta o cabeçalho Server-Timing (visível no DevTools do navegador).
+    'app' é o que sobra: lógica de domínio, Flask, etc.
+    """
+    parts = []
+    for phase in PHASES:
+        seconds = stats.phases.get(phase)
+        if seconds is None:
+            continue
+        part = f"{phase};dur={seconds * 1000:.2f}"
+        if phase == "db":
+            part += f';desc="{stats.sql_count} queries"'
+        parts.append(part)
+    app_time = max(0.0, total - sum(stats.phases.values()))
+    parts.append(f"app;dur={app_time * 1000:.2f}")
+    parts.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(parts)
+
+
+def _setup_request_logger():
+    if not request_logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        request_logger.addHandler(handler)
+        request_logger.setLevel(logging.INFO)
+        request_logger.propagate = False
+
+
+def _finish(request, response, metrics: RouteMetrics, log_requests: bool):
+    """
+    Fecha a medição do request atual: Server-Timing, histograma e log.
+    ('request'/'response' podem ser do Flask ou do Quart: mesma interface.)
+    """
+    stats = request_stats.current()
+    if stats is None:
+        return response
+
+    total = stats.elapsed()
+    total_ms = total * 1000
+    rule = request.url_rule.rule if request.url_rule else "<sem rota>"
+    route = f"{request.method} {rule}"
+
+    response.headers["Server-Timing"] = _server_timing(stats, total)
+    metrics.observe(route, response.status_code, total_ms, stats)
+
+    if log_requests:
+        line = {
+            "ts": datetime.now().isoformat(timespec="milliseconds"),
+            "method": request.method,
+            "route": rule,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": round(total_ms, 2),
+            "sql_count": stats.sql_count,
+        }
+        for phase in PHASES:
+            line[f"{phase}_ms"] = round(stats.phases.get(phase, 0.0) * 1000, 2)
+        request_logger.info(json.dumps(line))
+    return response
+
+
+def install_request_timing(app: Flask, metrics: RouteMetrics, log_requests: bool = True):
+    """
+    Liga a medição de requests na aplicação:
+    - cabeçalho 'Server-Timing' em toda resposta;
+    - uma linha de log JSON por request (logger 'mandaladaka.requests');
+    - histogramas por rota em 'metrics'.
+    """
+    app.json = TimedJSONProvider(app)
+
+    if log_requests:
+        _setup_request_logger()
+
+    @app.before_request
+    def start_timing():
+        request_stats.begin()
+
+    @app.after_request
+    def finish_timing(response: Response) -> Response:
+        return _finish(request, response, metrics, log_requests)
+
+    @app.teardown_request
+    def clear_timing(exc=None):
+        request_stats.end()
+
+
+def install_async_request_timing(app, metrics: RouteMetrics, log_requests: bool = True):
+    """
+    Versão de install_request_timing() para o app ASGI (Quart).
+
+    Os ganchos precisam ser corrotinas: o Quart roda funções síncronas em
+    threads auxiliares, e a medição (um ContextVar) ficaria presa lá.
+    A fase 'serialize' cobre apenas os helpers de schemas.py usados nas rotas.
+    """
+    from quart import request as quart_request
+
+    if log_requests:
+        _setup_request_logger()
+
+    @app.before_request
+    async def start_timing():
+        request_stats.begin()
+
+    @app.after_request
+    async def finish_timing(response):
+        return _finish(quart_request, response, metrics, log_requests)
+
+    @app.teardown_request
+    async def clear_timing(exc=None):
+        request_stats.end()
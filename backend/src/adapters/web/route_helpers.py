@@ -0,0 +1,107 @@
+"""
+Partes das rotas comuns ao app Flask (routers/) e ao ASGI (async_routers/):
+validação da entrada e conversão das exceções em respostas HTTP.
+
+Nada aqui depende do framework: os erros são as exceções HTTP do werkzeug
+(as mesmas que o abort() do Flask e o do Quart lançam) e as respostas são
+pares (dados, status), que os dois frameworks convertem em JSON.
+Uma rota fica assim, nas duas versões:
+
+    try:
+        data = parse_json(OpenTableSchema, request.get_json())
+        table = open_table_uc.execute(...)   # (await, no app ASGI)
+        return dump(TableResponseSchema, table), 200
+    except Exception as e:
+        return error_response(e, TABLE_WRITE_ERRORS)
+"""
+from typing import Any, Dict, List, Mapping, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from werkzeug.exceptions import HTTPException, abort
+
+from domain.exceptions import (
+    BusinessRuleException,
+    UserNotFoundException,
+    ServiceBusyException
+)
+
+NO_JSON_DATA = "Nenhum dado JSON recebido."
+
+# Segundos que o cliente espera antes de tentar de novo (429)
+RETRY_AFTER_SECONDS = 1
+
+# Mapa de erros das rotas que só checam a permissão (ex: as de admin):
+# o usuário do token não existe ou não pode executar a ação.
+FORBIDDEN_ERRORS: Mapping[Type[Exception], int] = {
+    UserNotFoundException: 403,
+    BusinessRuleException: 403,
+}
+
+
+class InvalidRequest(Exception):
+    """Entrada recusada pelo schema: vira um 400 com a lista de erros."""
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        super().__init__("Dados inválidos.")
+        self.errors = errors
+
+
+def parse_json(schema: Type[BaseModel], json_data: Any) -> BaseModel:
+    """
+    Valida o corpo JSON da requisição com o schema.
+
+    Raises:
+        HTTPException: 400, se o corpo estiver vazio.
+        InvalidRequest: Se o schema recusar os dados.
+    """
+    if not json_data:
+        abort(400, description=NO_JSON_DATA)
+
+    try:
+        return schema.model_validate(json_data)
+    except ValidationError as e:
+        raise InvalidRequest(e.errors()) from e
+
+
+def parse_query(schema: Type[BaseModel], args: Dict[str, Any]) -> BaseModel:
+    """
+    Valida os parâmetros da URL (query string) com o schema. Os erros não
+    levam a URL da documentação nem o contexto (valores nem sempre
+    serializáveis, como datas).
+    """
+    try:
+        return schema.model_validate(args)
+    except ValidationError as e:
+        raise InvalidRequest(e.errors(include_url=False, include_context=False)) from e
+
+
+def error_response(error: Exception, statuses: Mapping[Type[Exception], int]) -> Tuple[Any, int]:
+    """
+    Converte a exceção de uma rota na resposta HTTP.
+
+    Args:
+        error: A exceção capturada pela rota.
+        statuses: Erro de domínio -> status HTTP, na ordem dos antigos
+                  'except' (vale o primeiro tipo que casar).
+
+    Returns:
+        (corpo, status) para os erros que levam corpo JSON: 400 (schema)
+        e 500 (qualquer erro inesperado).
+
+    Raises:
+        HTTPException: Para os erros HTTP já lançados pela rota e para os
+                       erros de domínio do mapa (abort com a mensagem).
+    """
+    if isinstance(error, HTTPException):
+        raise error
+    if isinstance(error, InvalidRequest):
+        return error.errors, 400
+
+    for error_type, status in statuses.items():
+        if isinstance(error, error_type):
+            if isinstance(error, ServiceBusyException):
+                # Ex: pool de hash saturado: o cliente tenta de novo
+                abort(status, description=str(error), retry_after=RETRY_AFTER_SECONDS)
+            abort(status, description=str(error))
+
+    return {"error": str(error)}, 500
@@ -1,12 +1,13 @@
 import functools
-from flask import Blueprint, jsonify, request, abort, g
-from pydantic import ValidationError
+from flask import Blueprint, Response, current_app, request, abort, g, stream_with_context
+from typing import Any, Dict, Optional, Tuple
 
 # Importa as Exceções de Domínio
 from domain.exceptions import (
     BusinessRuleException,
     UserNotFoundException,
-    ProductNotFoundException
+    ProductNotFoundException,
+    ServiceBusyException
 )
 
 # Importa os Casos de Uso
@@ -15,8 +16,13 @@ from domain.use_cases.admin import (
     UpdateProductUseCase,
     ListAllProductsUseCase,
     CreateUserUseCase,
-    UpdateUserUseCase
+    UpdateUserUseCase,
+    SearchOrderHistoryUseCase,
+    GetSalesReportUseCase,
+    ExportProductsUseCase,
+    ImportProductsUseCase
 )
+from domain.models import OrderHistoryPage
 
 # Importa os Schemas
 from adapters.web.schemas import (
@@ -25,15 +31,74 @@ from adapters.web.schemas import (
     ProductResponseSchema,
     UserCreateSchema,
     UserUpdateSchema,
-    UserResponseSchema
+    UserResponseSchema,
+    OrderHistoryQuerySchema,
+    SalesReportQuerySchema,
+    SalesReportSchema,
+    OrderHistoryEntrySchema,
+    ProductImportSummarySchema,
+    encode_history_cursor,
+    dump,
+    dump_many,
+    dump_many_json
 )
 
+# Arquivos do cardápio (CSV / NDJSON, em stream)
+from adapters.web.catalog_io import CATALOG_FORMATS, catalog_format, write_catalog, read_catalog, text_lines
+
+# Validação da entrada e erros HTTP (comuns ao app ASGI)
+from adapters.web.route_helpers import FORBIDDEN_ERRORS, parse_json, parse_query, error_response
+
 # Importa o decorador de autenticação base
 from adapters.web.routers.auth_router import auth_required
 
 admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
 
 
+# --- PARTES COMUNS ÀS DUAS VERSÕES (ver async_routers/admin_router.py) ---
+
+# Status HTTP de cada erro de domínio, por rota (na ordem dos 'except')
+PRODUCT_UPDATE_ERRORS = {ProductNotFoundException: 404, **FORBIDDEN_ERRORS}
+USER_CREATE_ERRORS = {
+    BusinessRuleException: 409,
+    ServiceBusyException: 429, # Pool de hash de senhas saturado: o cliente tenta de novo
+    UserNotFoundException: 403,
+}
+USER_UPDATE_ERRORS = {
+    UserNotFoundException: 404,
+    BusinessRuleException: 409,
+    ServiceBusyException: 429,
+}
+
+
+def requested_catalog_format(*candidates: Optional[str]) -> str:
+    """O formato do arquivo do cardápio (ver catalog_format); 400 se não for reconhecido."""
+    try:
+        return catalog_format(*candidates)
+    except ValueError as e:
+        abort(400, description=str(e))
+
+
+def catalog_download_headers(fmt: str) -> Dict[str, str]:
+    """Cabeçalhos do GET /admin/products/export (arquivo para download)."""
+    return {"Content-Disposition": f'attachment; filename="cardapio.{fmt}"'}
+
+
+def import_error_response(error: Exception) -> Tuple[Any, int]:
+    """error_response do POST /admin/products/import (o arquivo deve ser UTF-8)."""
+    if isinstance(error, UnicodeDecodeError):
+        abort(400, description="O arquivo deve estar em UTF-8.")
+    return error_response(error, FORBIDDEN_ERRORS)
+
+
+def dump_order_history(page: OrderHistoryPage) -> dict:
+    """Resposta do GET /admin/orders/history: os pedidos e o cursor da próxima página."""
+    return {
+        "orders": dump_many(OrderHistoryEntrySchema, page.orders),
+        "next_cursor": encode_history_cursor(page.next_cursor),
+    }
+
+
 # Decorador de Autorização Específico para Admin
 def admin_required(f):
     """
@@ -56,7 +121,11 @@ def create_admin_blueprint(
     update_product_uc: UpdateProductUseCase,
     list_all_products_uc: ListAllProductsUseCase,
     create_user_uc: CreateUserUseCase,
-    update_user_uc: UpdateUserUseCase
+    update_user_uc: UpdateUserUseCase,
+    search_order_history_uc: SearchOrderHistoryUseCase,
+    get_sales_report_uc: GetSalesReportUseCase,
+    export_products_uc: ExportProductsUseCase,
+    import_products_uc: ImportProductsUseCase
 ):
     """
     Fábrica para o Blueprint de Admin (Versão Segura).
@@ -70,17 +139,12 @@ def create_admin_blueprint(
         """
         [GET /admin/products] Lista todos os produtos cadastrados no sistema.
         """
-        admin_id = g.user_id
-        
         try:
-            products = list_all_products_uc.execute(admin_id=admin_id)
-            response_data = [
-                ProductResponseSchema.model_validate(p).model_dump() 
-                for p in products
-            ]
-            return jsonify(response_data)
-        except (UserNotFoundException, BusinessRuleException) as e:
-            abort(403, description=str(e))
+            products = list_all_products_uc.execute(admin_id=g.user_id)
+            body = dump_many_json(ProductResponseSchema, products, pretty=current_app.debug)
+            return Response(body, mimetype="application/json")
+        except Exception as e:
+            return error_response(e, FORBIDDEN_ERRORS)
     
     
     @admin_bp.route("/products", methods=["POST"])
@@ -89,29 +153,16 @@ def create_admin_blueprint(
         """
         [POST /admin/products] Cria um novo produto no cardápio.
         """
-        admin_id = g.user_id
-        
-        json_data = request.get_json()
-        if not json_data:
-            abort(400, description="Nenhum dado JSON recebido.")
-            
-        try:
-            validated_data = ProductCreateSchema.model_validate(json_data)
-        except ValidationError as e:
-            return jsonify(e.errors()), 400
-        
         try:
+            validated_data = parse_json(ProductCreateSchema, request.get_json())
             new_product = create_product_uc.execute(
-                admin_id=admin_id,
+                admin_id=g.user_id,
                 product_data=validated_data.model_dump()
             )
-            response_data = ProductResponseSchema.model_validate(new_product)
-            return jsonify(response_data.model_dump()), 201
+            return dump(ProductResponseSchema, new_product), 201
         
-        except (UserNotFoundException, BusinessRuleException) as e:
-            abort(403, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, FORBIDDEN_ERRORS)
             
     
     @admin_bp.route("/products/<int:product_id>", methods=["PUT"])
@@ -120,32 +171,58 @@ def create_admin_blueprint(
         """
         [PUT /admin/products/<id>] Atualiza os dados de um produto existente.
         """
-        admin_id = g.user_id
-        
-        json_data = request.get_json()
-        if not json_data:
-            abort(400, description="Nenhum dado JSON recebido.")
-
-        try:
-            validated_data = ProductUpdateSchema.model_validate(json_data)
-        except ValidationError as e:
-            return jsonify(e.errors()), 400
-        
         try:
+            validated_data = parse_json(ProductUpdateSchema, request.get_json())
             updated_product = update_product_uc.execute(
-                admin_id=admin_id,
+                admin_id=g.user_id,
                 product_id=product_id,
                 update_data=validated_data.model_dump(exclude_unset=True)
             )
-            response_data = ProductResponseSchema.model_validate(updated_product)
-            return jsonify(response_data.model_dump()), 200
+            return dump(ProductResponseSchema, updated_product), 200
         
-        except ProductNotFoundException as e:
-            abort(404, description=str(e))
-        except (UserNotFoundException, BusinessRuleException) as e:
-            abort(403, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, PRODUCT_UPDATE_ERRORS)
+
+    @admin_bp.route("/products/export", methods=["GET"])
+    @admin_required
+    def export_products():
+        """
+        [GET /admin/products/export?format=csv|ndjson] O cardápio inteiro
+        como arquivo, enviado em stream (lido do banco página a página).
+        """
+        fmt = requested_catalog_format(request.args.get("format"), "csv")
+
+        try:
+            products = export_products_uc.execute(admin_id=g.user_id)
+        except Exception as e:
+            return error_response(e, FORBIDDEN_ERRORS)
+
+        return Response(
+            stream_with_context(write_catalog(products, fmt)),
+            mimetype=CATALOG_FORMATS[fmt],
+            headers=catalog_download_headers(fmt)
+        )
+
+
+    @admin_bp.route("/products/import", methods=["POST"])
+    @admin_required
+    def import_products():
+        """
+        [POST /admin/products/import?format=csv|ndjson] Importa um cardápio
+        (o corpo é o arquivo, lido em stream): produtos iguais são
+        ignorados, novos e alterados são gravados em lotes.
+        """
+        fmt = requested_catalog_format(request.args.get("format"), request.mimetype)
+
+        try:
+            summary = import_products_uc.execute(
+                read_catalog(text_lines(request.stream), fmt),
+                admin_id=g.user_id
+            )
+            return dump(ProductImportSummarySchema, summary), 200
+
+        except Exception as e:
+            return import_error_response(e)
 
     # --- ROTAS DE USUÁRIO ---
 
@@ -155,31 +232,16 @@ def create_admin_blueprint(
         """
         [POST /admin/users] Cria um novo usuário (admin, waiter ou kitchen).
         """
-        admin_id = g.user_id
-        
-        json_data = request.get_json()
-        if not json_data:
-            abort(400, description="Nenhum dado JSON recebido.")
-            
-        try:
-            validated_data = UserCreateSchema.model_validate(json_data)
-        except ValidationError as e:
-            return jsonify(e.errors()), 400
-        
         try:
+            validated_data = parse_json(UserCreateSchema, request.get_json())
             new_user = create_user_uc.execute(
-                admin_id=admin_id,
+                admin_id=g.user_id,
                 user_data=validated_data.model_dump(mode="json")
             )
-            response_data = UserResponseSchema.model_validate(new_user)
-            return jsonify(response_data.model_dump()), 201
+            return dump(UserResponseSchema, new_user), 201
         
-        except BusinessRuleException as e:
-            abort(409, description=str(e))
-        except (UserNotFoundException) as e:
-            abort(403, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, USER_CREATE_ERRORS)
 
     @admin_bp.route("/users/<int:user_id>", methods=["PUT"])
     @admin_required
@@ -187,31 +249,60 @@ def create_admin_blueprint(
         """
         [PUT /admin/users/<id>] Atualiza os dados de um usuário existente.
         """
-        admin_id = g.user_id
-        
-        json_data = request.get_json()
-        if not json_data:
-            abort(400, description="Nenhum dado JSON recebido.")
-
-        try:
-            validated_data = UserUpdateSchema.model_validate(json_data)
-        except ValidationError as e:
-            return jsonify(e.errors()), 400
-        
         try:
+            validated_data = parse_json(UserUpdateSchema, request.get_json())
             updated_user = update_user_uc.execute(
-                admin_id=admin_id,
+                admin_id=g.user_id,
                 user_id_to_update=user_id,
                 update_data=validated_data.model_dump(exclude_unset=True, mode="json")
             )
-            response_data = UserResponseSchema.model_validate(updated_user)
-            return jsonify(response_data.model_dump()), 200
+            return dump(UserResponseSchema, updated_user), 200
         
-        except UserNotFoundException as e:
-            abort(404, description=str(e))
-        except BusinessRuleException as e:
-            abort(409, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, USER_UPDATE_ERRORS)
+
+    # --- ROTAS DE HISTÓRICO DE PEDIDOS ---
+
+    @admin_bp.route("/orders/history", methods=["GET"])
+    @admin_required
+    def search_order_history():
+        """
+        [GET /admin/orders/history] Busca no histórico de pedidos, com filtros
+        e paginação por cursor ('next_cursor' da resposta -> '?cursor=').
+        """
+        try:
+            query = parse_query(OrderHistoryQuerySchema, request.args.to_dict())
+            page = search_order_history_uc.execute(
+                admin_id=g.user_id,
+                filters=query.to_filter(),
+                after=query.after(),
+                limit=query.limit
+            )
+            return dump_order_history(page), 200
+
+        except Exception as e:
+            return error_response(e, FORBIDDEN_ERRORS)
+
+    # --- ROTAS DE RELATÓRIOS ---
+
+    @admin_bp.route("/reports/sales/<dimension>", methods=["GET"])
+    @admin_required
+    def get_sales_report(dimension: str):
+        """
+        [GET /admin/reports/sales/<hour|product|category|waiter>] Vendas do
+        período, lidas só dos resumos (nunca dos pedidos).
+        """
+        try:
+            query = parse_query(SalesReportQuerySchema, {**request.args.to_dict(), "dimension": dimension})
+            report = get_sales_report_uc.execute(
+                admin_id=g.user_id,
+                dimension=query.dimension,
+                date_from=query.date_from,
+                date_to=query.date_to
+            )
+            return dump(SalesReportSchema, report), 200
+
+        except Exception as e:
+            return error_response(e, FORBIDDEN_ERRORS)
 
     return admin_bp
@@ -1,13 +1,13 @@
 import functools
-from flask import Blueprint, jsonify, request, abort, g
-from pydantic import ValidationError
-from jose import jwt, JWTError
+from typing import List, Optional, Tuple
+from flask import Blueprint, request, abort, g
+from jose import JWTError
 
 # Importa as Exceções de Domínio para tratamento de erro
 from domain.exceptions import (
-    BusinessRuleException,
     UserNotFoundException,
-    InvalidCredentialsException
+    InvalidCredentialsException,
+    ServiceBusyException
 )
 
 # Importa os Casos de Uso (que serão injetados)
@@ -20,19 +20,100 @@ from domain.use_cases.auth import (
 from ..schemas import (
     LoginSchema,
     TokenResponseSchema,
-    UserResponseSchema
+    UserResponseSchema,
+    dump
 )
 
-# Importa os segredos do serviço para VALIDAR tokens
-from ...services.security_service import SECRET_KEY, ALGORITHM
+# Validação da entrada e erros HTTP (comuns ao app ASGI)
+from ..route_helpers import parse_json, error_response
+
+# Importa o verificador de tokens (com cache dos tokens já validados)
+from ...services.security_service import token_verifier
+
+# Medição do tempo de autenticação (Server-Timing / métricas)
+from ... import request_stats
+
+# Leituras do usuário que acabou de gravar vão ao primário
+from ...db import read_routing
 
 # Cria o Blueprint com um prefixo de URL
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
 
+# --- PARTES COMUNS ÀS DUAS VERSÕES (ver async_routers/auth_router.py) ---
+
+# Status HTTP de cada erro de domínio, por rota
+LOGIN_ERRORS = {
+    InvalidCredentialsException: 401, # Usuário/senha errados
+    # Muitos logins ao mesmo tempo (ex: troca de turno): recusa
+    # rápido em vez de prender esta thread na fila do bcrypt
+    ServiceBusyException: 429,
+}
+CURRENT_USER_ERRORS = {
+    # Acontece se o token é válido, mas o usuário foi deletado
+    UserNotFoundException: 404,
+}
+
+
+def token_response(token: str) -> dict:
+    """Resposta do POST /auth/login."""
+    return TokenResponseSchema(access_token=token).model_dump()
+
+
 # --- DECORADOR DE AUTENTICAÇÃO ---
 # Esta é a lógica que protege suas rotas
 
+def authenticate_header(auth_header: Optional[str]) -> Tuple[int, List[str]]:
+    """
+    Valida o cabeçalho 'Authorization: Bearer <token>' e retorna
+    (user_id, roles). Aborta com 401 se o token for inválido.
+    (Compartilhado com o app ASGI, ver async_routers/auth_router.py.)
+    """
+    if not auth_header:
+        abort(401, description="Token de autorização ausente.")
+        
+    parts = auth_header.split()
+        
+    if parts[0].lower() != "bearer" or len(parts) != 2:
+        abort(401, description="Formato do token inválido (esperado: 'Bearer <token>').")
+        
+    token = parts[1]
+        
+    try:
+        # 1. Valida o token (assinatura e expiração)
+        # (Tokens já validados vêm do cache, sem refazer o HMAC)
+        with request_stats.timed("auth"):
+            payload = token_verifier.verify(token)
+        
+        # 2. Extrai os dados do payload
+        user_id = int(payload.get("sub"))
+        roles = payload.get("roles", [])
+            
+        if not user_id:
+            raise JWTError("Payload do token inválido.")
+        return user_id, roles
+        
+    except (JWTError, ValueError, TypeError):
+        abort(401, description="Token inválido, expirado ou malformado.")
+
+
+def token_expiry(auth_header: Optional[str]) -> Optional[float]:
+    """
+    Retorna o 'exp' (timestamp) do token 'Bearer <token>' do cabeçalho, ou
+    None se não houver um token válido. Usado pelo stream da cozinha, que
+    dura mais que um request e deve fechar quando o token vence.
+    """
+    parts = (auth_header or "").split()
+    if len(parts) != 2 or parts[0].lower() != "bearer":
+        return None
+
+    try:
+        exp = token_verifier.verify(parts[1]).get("exp")
+    except JWTError:
+        return None
+    return exp if isinstance(exp, (int, float)) else None
+
+
 def auth_required(f):
     """
     Decorador para proteger rotas. Verifica o token JWT,
@@ -41,35 +122,9 @@ def auth_required(f):
     """
     @functools.wraps(f)
     def decorated_function(*args, **kwargs):
-        auth_header = request.headers.get("Authorization")
-        if not auth_header:
-            abort(401, description="Token de autorização ausente.")
-            
-        parts = auth_header.split()
-            
-        if parts[0].lower() != "bearer" or len(parts) != 2:
-            abort(401, description="Formato do token inválido (esperado: 'Bearer <token>').")
-            
-        token = parts[1]
-            
-        try:
-            # 1. Valida o token (assinatura e expiração)
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            
-            # 2. Extrai os dados do payload
-            user_id = int(payload.get("sub"))
-            roles = payload.get("roles", [])
-                
-            if not user_id:
-                raise JWTError("Payload do token inválido.")
-                    
-            # 3. Armazena os dados no contexto 'g' do Flask
-            g.user_id = user_id
-            g.user_roles = roles
-            
-        except (JWTError, ValueError, TypeError):
-            abort(401, description="Token inválido, expirado ou malformado.")
-            
+        # Armazena os dados do token no contexto 'g' do Flask
+        g.user_id, g.user_roles = authenticate_header(request.headers.get("Authorization"))
+        read_routing.bind_session(g.user_id)
         return f(*args, **kwargs)
     return decorated_function
 
@@ -90,17 +145,10 @@ def create_auth_blueprint(
         """
         [POST /auth/login] Autentica o usuário no sistema e retorna um token de acesso JWT.
         """
-        json_data = request.get_json()
-        if not json_data:
-            abort(400, description="Nenhum dado JSON recebido.")
-            
         try:
             # 1. Valida o JSON de entrada (username, password)
-            validated_data = LoginSchema.model_validate(json_data)
-        except ValidationError as e:
-            return jsonify(e.errors()), 400
-        
-        try:
+            validated_data = parse_json(LoginSchema, request.get_json())
+
             # 2. Chama o caso de uso de login
             token = login_uc.execute(
                 username=validated_data.username,
@@ -108,14 +156,10 @@ def create_auth_blueprint(
             )
             
             # 3. Formata a resposta com o token
-            response_data = TokenResponseSchema(access_token=token)
-            return jsonify(response_data.model_dump()), 200
+            return token_response(token), 200
         
-        except InvalidCredentialsException as e:
-            # Erro de negócio (usuário/senha errados)
-            abort(401, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, LOGIN_ERRORS)
 
 
     @auth_bp.route("/me", methods=["GET"])
@@ -135,14 +179,10 @@ def create_auth_blueprint(
             user = get_auth_user_uc.execute(user_id=user_id)
             
             # 3. Formata a resposta
-            response_data = UserResponseSchema.model_validate(user)
-            return jsonify(response_data.model_dump()), 200
+            return dump(UserResponseSchema, user), 200
         
-        except UserNotFoundException as e:
-            # Acontece se o token é válido, mas o usuário foi deletado
-            abort(404, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, CURRENT_USER_ERRORS)
 
 
     # Retorna o blueprint configurado para o main.py registrar
@@ -1,7 +1,7 @@
 import functools
-from flask import Blueprint, jsonify, request, abort, g
-from pydantic import ValidationError
-from typing import List
+import time
+from flask import Blueprint, Response, current_app, request, abort, g, stream_with_context
+from typing import List, Optional, Tuple
 
 # Importa as Exceções de Domínio para tratamento de erro
 from domain.exceptions import (
@@ -18,14 +18,90 @@ from domain.use_cases.kitchen import (
 )
 
 # Importa os Schemas (DTOs da Web) para formatar a resposta
-from ..schemas import OrderResponseSchema
+from ..schemas import OrderResponseSchema, dump, dump_many_json
+
+# Importa o feed de eventos (Server-Sent Events) da cozinha
+from ..kitchen_feed import FeedEvent, KitchenEventFeed
+
+# Erros HTTP (comuns ao app ASGI)
+from ..route_helpers import FORBIDDEN_ERRORS, error_response
 
 # Importa o decorador de autenticação base
-from adapters.web.routers.auth_router import auth_required
+from adapters.web.routers.auth_router import auth_required, token_expiry
 
 # Cria o Blueprint com um prefixo de URL
 kitchen_bp = Blueprint("kitchen", __name__, url_prefix="/kitchen")
 
+# Intervalo (segundos) entre comentários "keep-alive" no stream,
+# para que proxies não derrubem conexões ociosas.
+STREAM_HEARTBEAT_SECONDS = 15
+
+# Tempo máximo (segundos) de uma conexão do stream. Ao fim, o servidor fecha
+# o stream e o EventSource reconecta sozinho (após o 'retry:') com o
+# Last-Event-ID, sem perder eventos; a reconexão passa de novo pela
+# autenticação. O stream também fecha antes, quando o token da tela vence.
+STREAM_MAX_LIFETIME_SECONDS = 30 * 60
+
+
+def stream_deadline(token_expires_at: Optional[float]) -> float:
+    """
+    Instante (no relógio do time.monotonic()) em que o stream deve ser
+    encerrado: o que vier primeiro entre o tempo máximo e o 'exp' do token.
+    (Compartilhado com o app ASGI, ver async_routers/kitchen_router.py.)
+    """
+    lifetime = STREAM_MAX_LIFETIME_SECONDS
+    if token_expires_at is not None:
+        lifetime = min(lifetime, token_expires_at - time.time())
+    return time.monotonic() + max(lifetime, 0)
+
+
+# --- PARTES COMUNS ÀS DUAS VERSÕES (ver async_routers/kitchen_router.py) ---
+
+# Status HTTP de cada erro de domínio nas mudanças de status
+ORDER_STATUS_ERRORS = {
+    OrderNotFoundException: 404,
+    BusinessRuleException: 409, # Ex: "Pedido não está 'PENDING'"
+    UserNotFoundException: 403,
+}
+
+# Cabeçalhos da resposta do stream
+STREAM_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no" # Evita buffering em proxies (nginx)
+}
+
+
+def stream_start(kitchen_feed: KitchenEventFeed, requested_cursor: Optional[str]) -> Tuple[List[str], int]:
+    """
+    Primeiras mensagens do stream e a sequência de onde ele continua.
+    Sem cursor: começa "de agora". Cursor inválido/antigo: pede resync.
+    """
+    chunks = []
+    if not requested_cursor:
+        after_seq = kitchen_feed.parse_cursor(kitchen_feed.cursor())
+    else:
+        after_seq = kitchen_feed.parse_cursor(requested_cursor)
+        if after_seq is None:
+            chunks.append(kitchen_feed.format_resync())
+            after_seq = kitchen_feed.parse_cursor(kitchen_feed.cursor())
+
+    chunks.append("retry: 3000\n\n")
+    return chunks, after_seq
+
+
+def stream_chunks(
+    kitchen_feed: KitchenEventFeed,
+    events: List[FeedEvent],
+    needs_resync: bool,
+    after_seq: int
+) -> Tuple[List[str], int]:
+    """Mensagens de uma espera pelo feed e a sequência de onde o stream continua."""
+    if needs_resync:
+        return [kitchen_feed.format_resync()], kitchen_feed.parse_cursor(kitchen_feed.cursor())
+    if not events:
+        return [": keep-alive\n\n"], after_seq
+    return [kitchen_feed.format_event(event) for event in events], events[-1].seq
+
 
 # --- DECORADOR DE AUTORIZAÇÃO ESPECÍFICO ---
 
@@ -46,11 +122,12 @@ def kitchen_required(f):
 def create_kitchen_blueprint(
     list_pending_orders_uc: ListPendingOrdersUseCase,
     start_order_preparation_uc: StartOrderPreparationUseCase,
-    complete_order_preparation_uc: CompleteOrderPreparationUseCase
+    complete_order_preparation_uc: CompleteOrderPreparationUseCase,
+    kitchen_feed: KitchenEventFeed
 ):
     """
     Fábrica para o Blueprint da Cozinha.
-    Recebe os casos de uso por Injeção de Dependência.
+    Recebe os casos de uso (e o feed de eventos) por Injeção de Dependência.
     """
 
     @kitchen_bp.route("/orders/pending", methods=["GET"])
@@ -59,23 +136,61 @@ def create_kitchen_blueprint(
         """
         [GET /kitchen/orders/pending] Lista todos os pedidos que estão no status 'PENDING' (aguardando preparo).
         """
-        kitchen_user_id = 1 # PLACEHOLDER
-        
         try:
+            # 0. Guarda o cursor do feed ANTES de ler o banco: a tela passa
+            # este valor para /orders/stream e não perde eventos no meio.
+            feed_cursor = kitchen_feed.cursor()
+
             # 1. Chama o caso de uso
             pending_orders = list_pending_orders_uc.execute()
             
-            # 2. Formata a resposta
-            response_data = [
-                OrderResponseSchema.model_validate(o).model_dump()
-                for o in pending_orders
-            ]
-            return jsonify(response_data)
+            # 2. Formata a resposta direto em bytes
+            body = dump_many_json(OrderResponseSchema, pending_orders, pretty=current_app.debug)
+            response = Response(body, mimetype="application/json")
+            response.headers["X-Feed-Cursor"] = feed_cursor
+            return response
         
-        except (UserNotFoundException, BusinessRuleException) as e:
-            abort(403, description=str(e)) # 403 Forbidden
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, FORBIDDEN_ERRORS)
+
+
+    @kitchen_bp.route("/orders/stream", methods=["GET"])
+    # @kitchen_required # <-- Quando o TODO for implementado, use este decorador!
+    def stream_orders():
+        """
+        [GET /kitchen/orders/stream] Stream (Server-Sent Events) com os eventos de pedido
+        (criado, itens adicionados, mudança de status). Não consulta o banco.
+
+        Para retomar de onde parou, a tela envia o cabeçalho 'Last-Event-ID'
+        (o EventSource do navegador faz isso sozinho ao reconectar) ou o
+        parâmetro '?cursor=' (ex: o 'X-Feed-Cursor' de /orders/pending).
+
+        A conexão dura no máximo STREAM_MAX_LIFETIME_SECONDS (ou até o token
+        vencer); depois disso a tela reconecta e continua do mesmo ponto.
+        """
+        requested_cursor = request.headers.get("Last-Event-ID") or request.args.get("cursor")
+        deadline = stream_deadline(token_expiry(request.headers.get("Authorization")))
+
+        def generate():
+            chunks, after_seq = stream_start(kitchen_feed, requested_cursor)
+            yield from chunks
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return # Fim do tempo de vida: a tela reconecta com o Last-Event-ID
+
+                events, needs_resync = kitchen_feed.wait_for_events(
+                    after_seq, timeout=min(STREAM_HEARTBEAT_SECONDS, remaining)
+                )
+                chunks, after_seq = stream_chunks(kitchen_feed, events, needs_resync, after_seq)
+                yield from chunks
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype="text/event-stream",
+            headers=STREAM_HEADERS
+        )
 
 
     @kitchen_bp.route("/orders/<int:order_id>/start", methods=["POST"])
@@ -84,25 +199,15 @@ def create_kitchen_blueprint(
         """
         [POST /kitchen/orders/<id>/start] Muda o status de um pedido para 'IN_PROGRESS' (em preparo).
         """
-        kitchen_user_id = 1 # PLACEHOLDER
-        
         try:
             # 1. Chama o caso de uso para mudar o status
             updated_order = start_order_preparation_uc.execute(order_id=order_id)
             
             # 2. Formata a resposta
-            response_data = OrderResponseSchema.model_validate(updated_order)
-            return jsonify(response_data.model_dump()), 200
+            return dump(OrderResponseSchema, updated_order), 200
         
-        except OrderNotFoundException as e:
-            abort(404, description=str(e)) # 404 Not Found
-        except BusinessRuleException as e:
-            # Ex: "Pedido não está 'PENDING'"
-            abort(409, description=str(e)) # 409 Conflict
-        except (UserNotFoundException) as e:
-            abort(403, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, ORDER_STATUS_ERRORS)
 
     
     @kitchen_bp.route("/orders/<int:order_id>/complete", methods=["POST"])
@@ -111,25 +216,15 @@ def create_kitchen_blueprint(
         """
         [POST /kitchen/orders/<id>/complete] Muda o status de um pedido para 'READY_FOR_DELIVERY' (pronto para ser entregue).
         """
-        kitchen_user_id = 1 # PLACEHOLDER
-        
         try:
             # 1. Chama o caso de uso
             updated_order = complete_order_preparation_uc.execute(order_id=order_id)
             
             # 2. Formata a resposta
-            response_data = OrderResponseSchema.model_validate(updated_order)
-            return jsonify(response_data.model_dump()), 200
+            return dump(OrderResponseSchema, updated_order), 200
         
-        except OrderNotFoundException as e:
-            abort(404, description=str(e))
-        except BusinessRuleException as e:
-            # Ex: "Pedido não está 'IN_PROGRESS'"
-            abort(409, description=str(e)) # 409 Conflict
-        except (UserNotFoundException) as e:
-            abort(403, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, ORDER_STATUS_ERRORS)
     
 
     # Retorna o blueprint configurado para o main.py registrar
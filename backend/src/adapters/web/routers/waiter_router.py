@@ -1,6 +1,5 @@
 import functools
-from flask import Blueprint, jsonify, request, abort, g
-from pydantic import ValidationError
+from flask import Blueprint, Response, current_app, jsonify, request, abort, g
 from typing import List
 
 # Importa as Exceções de Domínio para tratamento de erro
@@ -9,7 +8,8 @@ from domain.exceptions import (
     UserNotFoundException,
     TableNotFoundException,
     OrderNotFoundException,
-    ProductNotFoundException
+    ProductNotFoundException,
+    ConcurrencyConflictException
 )
 
 # Importa os Casos de Uso (que serão injetados)
@@ -19,10 +19,13 @@ from domain.use_cases.waiter import (
     GetTableDetailsUseCase,
     CloseTableUseCase,
     CreateOrderUseCase,
-    AddItemToOrderUseCase
+    AddItemToOrderUseCase,
+    SubmitOrderBatchUseCase,
+    OrderBatchResult
 )
 
 from domain.use_cases.get_visible_products import GetVisibleProductsUseCase
+from domain.models import Product
 
 # Importa os Schemas (DTOs da Web) que este router precisará
 from ..schemas import (
@@ -32,8 +35,18 @@ from ..schemas import (
     OrderResponseSchema,
     CreateOrderSchema,
     AddItemToOrderSchema,
+    OrderBatchSchema,
+    dump,
+    dump_many_json
 )
 
+# Validação da entrada e erros HTTP (comuns ao app ASGI)
+from ..route_helpers import FORBIDDEN_ERRORS, parse_json, error_response
+
+# Versões do cardápio e das mesas (ETag / GET condicional)
+from adapters.db.version_counter import VersionCounter
+from ..conditional_get import is_not_modified, not_modified, with_etag
+
 # Importa o decorador de autenticação base
 from adapters.web.routers.auth_router import auth_required
 
@@ -60,6 +73,84 @@ def waiter_required(f):
     return decorated_function
 
 
+# --- PARTES COMUNS ÀS DUAS VERSÕES (ver async_routers/waiter_router.py) ---
+
+# Status HTTP de cada erro de domínio, por rota (na ordem dos 'except')
+TABLE_READ_ERRORS = {TableNotFoundException: 404, **FORBIDDEN_ERRORS}
+TABLE_WRITE_ERRORS = {
+    TableNotFoundException: 404,
+    BusinessRuleException: 409, # Ex: "Mesa já ocupada", "Pedidos pendentes"
+    UserNotFoundException: 403,
+}
+CREATE_ORDER_ERRORS = {
+    TableNotFoundException: 404,
+    ProductNotFoundException: 404,
+    BusinessRuleException: 409, # Ex: "Mesa não está ocupada"
+    UserNotFoundException: 403,
+}
+ADD_ITEM_ERRORS = {
+    OrderNotFoundException: 404,
+    ProductNotFoundException: 404,
+    BusinessRuleException: 409, # Ex: "Pedido já está concluído"
+    UserNotFoundException: 403,
+}
+ORDER_BATCH_ERRORS = {
+    # Outra pessoa alterou as mesmas mesas/pedidos (já tentado de novo)
+    ConcurrencyConflictException: 409,
+    UserNotFoundException: 403,
+}
+
+# Status HTTP de cada erro de domínio, nas entradas do envio em lote
+# (os mesmos das rotas individuais)
+BATCH_ERROR_STATUS = {
+    TableNotFoundException: 404,
+    OrderNotFoundException: 404,
+    ProductNotFoundException: 404,
+    BusinessRuleException: 409,
+}
+
+
+def dump_order_batch(result: OrderBatchResult) -> dict:
+    """
+    Monta a resposta do POST /orders/batch: uma entrada por item do lote,
+    com o status que a rota individual daria e o pedido ou o erro.
+    """
+    def entry(entry_result, ok_status: int) -> dict:
+        if entry_result.ok:
+            return {"status": ok_status, "order": dump(OrderResponseSchema, entry_result.order)}
+        error = entry_result.error
+        return {"status": BATCH_ERROR_STATUS.get(type(error), 409), "error": str(error)}
+
+    return {
+        "new_orders": [entry(r, 201) for r in result.new_orders],
+        "add_items": [entry(r, 200) for r in result.additions],
+    }
+
+
+def dump_menu(products: List[Product]) -> List[dict]:
+    """Resposta do GET /products: os campos do cardápio que o garçom usa."""
+    return [
+        {
+            "id": p.id,
+            "name": p.name,
+            "price": float(p.price),
+            #"description": p.description, não existe descrição
+            "category": p.category,
+            "imageUrl": p.imageUrl,
+            "availability": p.availability
+        }
+        for p in products
+    ]
+
+
+def parse_order_batch(json_data) -> dict:
+    """Valida o corpo do POST /orders/batch (400 se o lote estiver vazio)."""
+    validated_data = parse_json(OrderBatchSchema, json_data)
+    if not validated_data.new_orders and not validated_data.add_items:
+        abort(400, description="O lote está vazio.")
+    return validated_data.model_dump()
+
+
 def create_waiter_blueprint(
     list_tables_uc: ListTablesUseCase,
     open_table_uc: OpenTableUseCase,
@@ -67,11 +158,15 @@ def create_waiter_blueprint(
     close_table_uc: CloseTableUseCase,
     create_order_uc: CreateOrderUseCase,
     add_item_to_order_uc: AddItemToOrderUseCase,
-    get_visible_products_uc: GetVisibleProductsUseCase
+    submit_order_batch_uc: SubmitOrderBatchUseCase,
+    get_visible_products_uc: GetVisibleProductsUseCase,
+    menu_version: VersionCounter,
+    tables_version: VersionCounter
 ):
     """
     Fábrica para o Blueprint do Garçom (Waiter).
-    Recebe todos os casos de uso de atendimento por Injeção de Dependência.
+    Recebe todos os casos de uso de atendimento por Injeção de Dependência,
+    e as versões do cardápio e das mesas (ETags de /products e /tables).
     """
 
     # --- ROTAS DE MESA (TABLE) ---
@@ -81,59 +176,43 @@ def create_waiter_blueprint(
     def list_tables():
         """
         [GET /tables] Lista todas as mesas do restaurante e seus status atuais.
+        Responde 304 se o cliente já tem a versão atual (If-None-Match).
         """
-        waiter_id = 1 # PLACEHOLDER
-        
         try:
+            # 0. Versão ANTES de ler o banco (uma escrita no meio muda a versão)
+            etag = tables_version.etag()
+            if is_not_modified(request, etag):
+                return not_modified(Response, etag)
+
             # 1. Chama o caso de uso (que busca no db)
             tables = list_tables_uc.execute()
             
-            # 2. Formata a resposta (lista de mesas "rasa")
-            response_data = [
-                TableResponseSchema.model_validate(t).model_dump() 
-                for t in tables
-            ]
-            return jsonify(response_data)
+            # 2. Formata a resposta (lista de mesas "rasa") direto em bytes
+            body = dump_many_json(TableResponseSchema, tables, pretty=current_app.debug)
+            return with_etag(Response(body, mimetype="application/json"), etag)
         
-        except (UserNotFoundException, BusinessRuleException) as e:
-            abort(403, description=str(e)) # 403 Forbidden
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
-
+            return error_response(e, FORBIDDEN_ERRORS)
 
 
-    # No waiter_router.py, corrija a função list_available_products():
     @waiter_bp.route("/products", methods=["GET"])
     @waiter_required
     def list_available_products():
         """
         [GET /products] Lista todos os produtos disponíveis no cardápio.
+        Responde 304 se o cliente já tem a versão atual (If-None-Match).
         """
         try:
+            etag = menu_version.etag()
+            if is_not_modified(request, etag):
+                return not_modified(Response, etag)
+
             # Reutiliza o caso de uso existente
             products = get_visible_products_uc.execute()
-            
-            # Formata a resposta
-            response_data = [
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "price": float(p.price),
-                    #"description": p.description, não existe descrição
-                    "category": p.category,
-                    "imageUrl": p.imageUrl,
-                    "availability": p.availability
-                }
-                for p in products
-            ]
-            return jsonify(response_data), 200
+            return with_etag(jsonify(dump_menu(products)), etag), 200
         
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
-
-        # E REMOVA o "return waiter_bp" que está dentro da função acima
-        # O return waiter_bp deve estar no FINAL da create_waiter_blueprint()
-
+            return error_response(e, {})
 
 
     @waiter_bp.route("/tables/<int:table_id>/open", methods=["POST"])
@@ -142,19 +221,10 @@ def create_waiter_blueprint(
         """
         [POST /tables/<id>/open] Abre uma mesa (muda o status para 'OCCUPIED').
         """
-        waiter_id = 1 # PLACEHOLDER
-        
-        json_data = request.get_json()
-        if not json_data:
-            abort(400, description="Nenhum dado JSON recebido.")
-            
         try:
             # 1. Valida o JSON de entrada
-            validated_data = OpenTableSchema.model_validate(json_data)
-        except ValidationError as e:
-            return jsonify(e.errors()), 400
-        
-        try:
+            validated_data = parse_json(OpenTableSchema, request.get_json())
+
             # 2. Chama o caso de uso
             updated_table = open_table_uc.execute(
                 table_id=table_id,
@@ -162,18 +232,10 @@ def create_waiter_blueprint(
             )
             
             # 3. Formata a resposta
-            response_data = TableResponseSchema.model_validate(updated_table)
-            return jsonify(response_data.model_dump()), 200
+            return dump(TableResponseSchema, updated_table), 200
         
-        except TableNotFoundException as e:
-            abort(404, description=str(e)) # 404 Not Found
-        except BusinessRuleException as e:
-            # Ex: "Mesa já ocupada"
-            abort(409, description=str(e)) # 409 Conflict
-        except (UserNotFoundException) as e:
-            abort(403, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, TABLE_WRITE_ERRORS)
 
 
     @waiter_bp.route("/tables/<int:table_id>", methods=["GET"])
@@ -182,22 +244,15 @@ def create_waiter_blueprint(
         """
         [GET /tables/<id>] Busca os detalhes de uma mesa, incluindo o pedido ativo.
         """
-        waiter_id = 1 # PLACEHOLDER
-        
         try:
             # 1. Chama o caso de uso
             table = get_table_details_uc.execute(table_id=table_id)
             
             # 2. Formata a resposta (mesa "profunda" com pedidos)
-            response_data = TableDetailsResponseSchema.model_validate(table)
-            return jsonify(response_data.model_dump()), 200
+            return dump(TableDetailsResponseSchema, table), 200
         
-        except TableNotFoundException as e:
-            abort(404, description=str(e))
-        except (UserNotFoundException, BusinessRuleException) as e:
-            abort(403, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, TABLE_READ_ERRORS)
 
 
     @waiter_bp.route("/tables/<int:table_id>/close", methods=["POST"])
@@ -206,25 +261,15 @@ def create_waiter_blueprint(
         """
         [POST /tables/<id>/close] Fecha uma mesa. O pedido deve estar pago/concluído.
         """
-        waiter_id = 1 # PLACEHOLDER
-        
         try:
             # 1. Chama o caso de uso
             updated_table = close_table_uc.execute(table_id=table_id)
             
             # 2. Formata a resposta
-            response_data = TableResponseSchema.model_validate(updated_table)
-            return jsonify(response_data.model_dump()), 200
+            return dump(TableResponseSchema, updated_table), 200
         
-        except TableNotFoundException as e:
-            abort(404, description=str(e))
-        except BusinessRuleException as e:
-            # Ex: "Pedidos pendentes"
-            abort(409, description=str(e))
-        except (UserNotFoundException) as e:
-            abort(403, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, TABLE_WRITE_ERRORS)
 
     # --- ROTAS DE PEDIDO (ORDER) ---
 
@@ -234,39 +279,22 @@ def create_waiter_blueprint(
         """
         [POST /tables/<id>/orders] Cria um novo pedido para uma mesa ocupada.
         """
-        waiter_id = g.user_id
-        
-        json_data = request.get_json()
-        if not json_data:
-            abort(400, description="Nenhum dado JSON recebido.")
-            
         try:
             # 1. Valida o JSON de entrada
-            validated_data = CreateOrderSchema.model_validate(json_data)
-        except ValidationError as e:
-            return jsonify(e.errors()), 400
-        
-        try:
+            validated_data = parse_json(CreateOrderSchema, request.get_json())
+
             # 2. Chama o caso de uso
             new_order = create_order_uc.execute(
-                waiter_id=waiter_id,
+                waiter_id=g.user_id,
                 table_id=table_id,
                 items_data=validated_data.model_dump().get("items", [])
             )
             
             # 3. Formata a resposta
-            response_data = OrderResponseSchema.model_validate(new_order)
-            return jsonify(response_data.model_dump()), 201
+            return dump(OrderResponseSchema, new_order), 201
         
-        except (TableNotFoundException, ProductNotFoundException) as e:
-            abort(404, description=str(e))
-        except BusinessRuleException as e:
-            # Ex: "Mesa não está ocupada"
-            abort(409, description=str(e))
-        except (UserNotFoundException) as e:
-            abort(403, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, CREATE_ORDER_ERRORS)
 
 
     @waiter_bp.route("/orders/<int:order_id>/items", methods=["POST"])
@@ -275,19 +303,10 @@ def create_waiter_blueprint(
         """
         [POST /orders/<id>/items] Adiciona um item a um pedido existente.
         """
-        waiter_id = 1 # PLACEHOLDER
-        
-        json_data = request.get_json()
-        if not json_data:
-            abort(400, description="Nenhum dado JSON recebido.")
-
         try:
             # 1. Valida o JSON de entrada
-            validated_data = AddItemToOrderSchema.model_validate(json_data)
-        except ValidationError as e:
-            return jsonify(e.errors()), 400
-            
-        try:
+            validated_data = parse_json(AddItemToOrderSchema, request.get_json())
+
             # 2. Chama o caso de uso
             updated_order = add_item_to_order_uc.execute(
                 order_id=order_id,
@@ -296,18 +315,35 @@ def create_waiter_blueprint(
             )
             
             # 3. Formata a resposta
-            response_data = OrderResponseSchema.model_validate(updated_order)
-            return jsonify(response_data.model_dump()), 200
+            return dump(OrderResponseSchema, updated_order), 200
         
-        except (OrderNotFoundException, ProductNotFoundException) as e:
-            abort(404, description=str(e))
-        except BusinessRuleException as e:
-            # Ex: "Pedido já está concluído"
-            abort(409, description=str(e))
-        except (UserNotFoundException) as e:
-            abort(403, description=str(e))
         except Exception as e:
-            return jsonify({"error": str(e)}), 500
+            return error_response(e, ADD_ITEM_ERRORS)
+
+
+    @waiter_bp.route("/orders/batch", methods=["POST"])
+    @waiter_required
+    def submit_order_batch():
+        """
+        [POST /orders/batch] Envia de uma vez vários pedidos novos e itens
+        para pedidos existentes (uma ou mais mesas), numa única transação.
+        """
+        try:
+            # 1. Valida o JSON de entrada
+            data = parse_order_batch(request.get_json())
+
+            # 2. Chama o caso de uso (erros de cada entrada vêm no resultado)
+            result = submit_order_batch_uc.execute(
+                waiter_id=g.user_id,
+                new_orders=data["new_orders"],
+                additions=data["add_items"]
+            )
+
+            # 3. Formata a resposta (um resultado por entrada)
+            return dump_order_batch(result), 200
+
+        except Exception as e:
+            return error_response(e, ORDER_BATCH_ERRORS)
 
 
     # Retorna o blueprint configurado para o main.py registrar
@@ -1,11 +1,26 @@
 # src/adapters/web/schemas.py
-from pydantic import BaseModel, Field
-from typing import List, Optional
-from datetime import datetime
+import base64
+import binascii
+import json
+import re
+from functools import lru_cache
+from pydantic import (
+    BaseModel, ConfigDict, Field, PlainSerializer, TypeAdapter, create_model,
+    field_validator, model_validator
+)
+from typing import Annotated, Any, Iterable, List, Optional, Type, Union, get_args, get_origin
+from datetime import date, datetime, timedelta, timezone
+from werkzeug.http import http_date
+
+# Medição do tempo de serialização (Server-Timing / métricas)
+from .. import request_stats
 
 # Importa os Enums do domínio para validação
 # (Assumindo que domain/__init__.py exporta todos eles)
 from domain import UserRole, OrderStatus, TableStatus
+from domain.models import OrderHistoryFilter, OrderHistoryCursor, SalesDimension
+from domain.use_cases.admin.search_order_history_use_case import MAX_HISTORY_PAGE_SIZE
+from domain.use_cases.admin.get_sales_report_use_case import MAX_SALES_REPORT_DAYS
 
 # ==================================================
 # Schemas de Produto (para o Admin)
@@ -40,6 +55,32 @@ class ProductResponseSchema(ProductBase):
     class Config:
         from_attributes = True 
 
+class ProductCatalogSchema(ProductBase):
+    """
+    Schema de uma linha do arquivo do cardápio (importação em lote).
+    Sem 'id', o produto é novo; com 'id', é inserido ou atualizado.
+    """
+    id: Optional[int] = Field(None, gt=0)
+
+class ProductImportErrorSchema(BaseModel):
+    """Uma linha recusada na importação do cardápio."""
+    line: int
+    error: str
+
+    class Config:
+        from_attributes = True
+
+class ProductImportSummarySchema(BaseModel):
+    """Schema de SAÍDA da importação do cardápio."""
+    inserted: int
+    updated: int
+    unchanged: int
+    rejected: int
+    errors: List[ProductImportErrorSchema] # Só as primeiras
+
+    class Config:
+        from_attributes = True
+
 # ==================================================
 # Schemas de Usuário
 # ==================================================
@@ -132,6 +173,146 @@ class AddItemToOrderSchema(CreateOrderItemSchema):
     """Schema de ENTRADA para adicionar um item a um pedido existente."""
     pass
 
+# Limite de entradas por lista no envio em lote
+MAX_BATCH_ENTRIES = 50
+
+class BatchNewOrderSchema(CreateOrderSchema):
+    """Schema de ENTRADA para um pedido novo dentro do lote."""
+    table_id: int = Field(..., gt=0)
+
+class BatchAddItemsSchema(BaseModel):
+    """Schema de ENTRADA para itens adicionados a um pedido existente, no lote."""
+    order_id: int = Field(..., gt=0)
+    items: List[CreateOrderItemSchema] = Field(..., min_length=1)
+
+class OrderBatchSchema(BaseModel):
+    """Schema de ENTRADA do envio em lote (POST /orders/batch)."""
+    new_orders: List[BatchNewOrderSchema] = Field(default_factory=list, max_length=MAX_BATCH_ENTRIES)
+    add_items: List[BatchAddItemsSchema] = Field(default_factory=list, max_length=MAX_BATCH_ENTRIES)
+
+# ==================================================
+# Schemas do Histórico de Pedidos (para o Admin)
+# ==================================================
+
+def encode_history_cursor(cursor: Optional[OrderHistoryCursor]) -> Optional[str]:
+    """Cursor opaco para o cliente: base64url de 'created_at|id'."""
+    if cursor is None:
+        return None
+    raw = f"{cursor.created_at.isoformat()}|{cursor.id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_history_cursor(token: str) -> OrderHistoryCursor:
+    """Inverso de encode_history_cursor. ValueError se o cursor for inválido."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("ascii")
+        created_at, _, order_id = raw.partition("|")
+        return OrderHistoryCursor(created_at=datetime.fromisoformat(created_at), id=int(order_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Cursor inválido.")
+
+
+class OrderHistoryQuerySchema(BaseModel):
+    """
+    Schema de ENTRADA (query string) do GET /admin/orders/history.
+    O período é [date_from, date_to); datas sem hora valem 00:00.
+    """
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    table_id: Optional[int] = Field(None, gt=0)
+    waiter_id: Optional[int] = Field(None, gt=0)
+    status: Optional[OrderStatus] = None
+    limit: int = Field(50, ge=1, le=MAX_HISTORY_PAGE_SIZE)
+    cursor: Optional[str] = None
+
+    @field_validator("date_from", "date_to")
+    @classmethod
+    def to_local_time(cls, value: Optional[datetime]) -> Optional[datetime]:
+        # 'orders.created_at' é gravado na hora local, sem fuso
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone().replace(tzinfo=None)
+        return value
+
+    @field_validator("cursor")
+    @classmethod
+    def check_cursor(cls, value: Optional[str]) -> Optional[str]:
+        if value:
+            decode_history_cursor(value)
+        return value or None
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.date_from and self.date_to and self.date_from >= self.date_to:
+            raise ValueError("'date_from' deve ser anterior a 'date_to'.")
+        return self
+
+    def to_filter(self) -> OrderHistoryFilter:
+        return OrderHistoryFilter(
+            date_from=self.date_from,
+            date_to=self.date_to,
+            table_id=self.table_id,
+            waiter_id=self.waiter_id,
+            status=self.status
+        )
+
+    def after(self) -> Optional[OrderHistoryCursor]:
+        return decode_history_cursor(self.cursor) if self.cursor else None
+
+class OrderHistoryEntrySchema(OrderResponseSchema):
+    """Schema de SAÍDA de um pedido no histórico (com o garçom)."""
+    waiter_id: int
+
+# ==================================================
+# Schemas de Relatórios de Vendas (para o Admin)
+# ==================================================
+
+class SalesReportQuerySchema(BaseModel):
+    """
+    Schema de ENTRADA dos relatórios de vendas (dimensão na rota, período na
+    query string). O período é [date_from, date_to), em dias; sem datas,
+    vale o mês corrente até hoje.
+    """
+    dimension: SalesDimension
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+
+    @model_validator(mode="after")
+    def fill_and_check_range(self):
+        if self.date_to is None:
+            self.date_to = date.today() + timedelta(days=1)
+        if self.date_from is None:
+            # Primeiro dia do mês do último dia do período
+            self.date_from = (self.date_to - timedelta(days=1)).replace(day=1)
+
+        if self.date_from >= self.date_to:
+            raise ValueError("'date_from' deve ser anterior a 'date_to'.")
+        if (self.date_to - self.date_from).days > MAX_SALES_REPORT_DAYS:
+            raise ValueError(f"O período máximo de um relatório é de {MAX_SALES_REPORT_DAYS} dias.")
+        return self
+
+class SalesReportLineSchema(BaseModel):
+    """Schema de SAÍDA de uma linha do relatório (hora, produto, categoria ou garçom)."""
+    key: Union[datetime, int, str]
+    label: Optional[str] = None
+    orders: int
+    items: int
+    revenue: float
+
+    class Config:
+        from_attributes = True
+
+class SalesReportSchema(BaseModel):
+    """Schema de SAÍDA de um relatório de vendas."""
+    dimension: SalesDimension
+    date_from: date
+    date_to: date
+    total_items: int
+    total_revenue: float
+    lines: List[SalesReportLineSchema]
+
+    class Config:
+        from_attributes = True
+
 # ==================================================
 # Schemas de Mesa (Table)
 # ==================================================
@@ -155,4 +336,152 @@ class TableDetailsResponseSchema(TableResponseSchema):
     total_bill: float
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+# ==================================================
+# Helpers de Serialização (Domínio -> dict da resposta)
+# ==================================================
+# Use estes helpers nas rotas (em vez de model_validate().model_dump()),
+# para que o tempo gasto no pydantic apareça como 'serialize'.
+
+def dump(schema: Type[BaseModel], obj: Any) -> dict:
+    """Converte um objeto de domínio no dict de resposta do 'schema'."""
+    with request_stats.timed("serialize"):
+        return schema.model_validate(obj).model_dump()
+
+
+def dump_many(schema: Type[BaseModel], objs: Iterable[Any]) -> List[dict]:
+    """Versão de 'dump' para listas (valida a lista inteira de uma vez)."""
+    with request_stats.timed("serialize"):
+        adapter = _list_adapter(schema)
+        return adapter.dump_python(adapter.validate_python(list(objs), from_attributes=True))
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+# ==================================================
+# Caminho rápido: listas direto para bytes JSON
+# ==================================================
+# As rotas de listagem (mesas, pedidos pendentes, cardápio do admin) usam
+# dump_many_json(): a lista inteira é validada num único passo e codificada
+# em bytes pelo pydantic (Rust), sem dicts intermediários nem jsonify().
+#
+# O resultado precisa ser IDÊNTICO (byte a byte) ao do jsonify() do
+# Flask/Quart. Para isso, cada schema de resposta ganha uma cópia "de fio"
+# (_wire_schema) com os campos em ordem alfabética (o jsonify ordena as
+# chaves) e datas no formato HTTP (o do jsonify). O pydantic só difere do
+# 'json' da biblioteca padrão em casos raros (floats fora de [1e-4, 1e16),
+# que ele escreve sem expoente ou com 'e16' em vez de 'e+16', e o caractere
+# DEL, que ele não escapa): se algum aparecer, a lista é recodificada pelo
+# caminho lento (_encode_like_jsonify).
+
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _http_datetime(dt: datetime) -> str:
+    """Mesmo texto do http_date() do werkzeug (datas "ingênuas" = UTC), mais rápido."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return "%s, %02d %s %04d %02d:%02d:%02d GMT" % (
+        _WEEKDAYS[dt.weekday()], dt.day, _MONTHS[dt.month - 1],
+        dt.year, dt.hour, dt.minute, dt.second
+    )
+
+
+_HttpDateTime = Annotated[datetime, PlainSerializer(_http_datetime, return_type=str)]
+
+# Um 'e' logo após um dígito: expoente de um float grande (ou texto como
+# "1e3f.jpg": um falso positivo só custa o caminho lento).
+_DIGIT_EXPONENT = re.compile(rb"e(?<=[0-9]e)")
+
+
+def _differs_from_jsonify(body: bytes) -> bool:
+    """True se o JSON do pydantic PODE diferir do 'json' padrão (ver acima)."""
+    return (
+        b"\x7f" in body
+        or b"0.0000" in body # Float < 1e-4 escrito sem expoente
+        or _DIGIT_EXPONENT.search(body) is not None
+    )
+
+
+def _wire_type(annotation: Any) -> Any:
+    """Troca, dentro de uma anotação, schemas e datas por suas versões "de fio"."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _wire_schema(annotation)
+    if annotation is datetime:
+        return _HttpDateTime
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is list:
+        return List[_wire_type(args[0])]
+    if origin is Union:
+        return Union[tuple(_wire_type(arg) for arg in args)]
+    return annotation
+
+
+@lru_cache(maxsize=None)
+def _wire_schema(schema: Type[BaseModel]) -> Type[BaseModel]:
+    """Cópia do 'schema' com os campos em ordem alfabética (mesmas validações)."""
+    fields = {}
+    for name in sorted(schema.model_fields):
+        field = schema.model_fields[name]
+        fields[name] = (_wire_type(field.annotation), field)
+    return create_model(
+        f"{schema.__name__}Wire",
+        __config__=ConfigDict(from_attributes=True, ser_json_inf_nan="constants"),
+        **fields
+    )
+
+
+@lru_cache(maxsize=None)
+def _wire_list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[_wire_schema(schema)])
+
+
+def _json_default(o: Any) -> Any:
+    """Tipos extras, como no provider JSON padrão do Flask."""
+    if isinstance(o, datetime):
+        return _http_datetime(o)
+    if isinstance(o, date):
+        return http_date(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+_compact_encoder = json.JSONEncoder(
+    default=_json_default, ensure_ascii=True, sort_keys=True, separators=(",", ":")
+)
+_pretty_encoder = json.JSONEncoder(
+    default=_json_default, ensure_ascii=True, sort_keys=True, indent=2
+)
+
+
+def _encode_like_jsonify(schema: Type[BaseModel], objs: list, pretty: bool) -> bytes:
+    """Caminho lento (e exato): dicts + 'json' da biblioteca padrão."""
+    adapter = _list_adapter(schema)
+    data = adapter.dump_python(adapter.validate_python(objs, from_attributes=True))
+    encoder = _pretty_encoder if pretty else _compact_encoder
+    return (encoder.encode(data) + "\n").encode("ascii")
+
+
+def dump_many_json(schema: Type[BaseModel], objs: Iterable[Any], pretty: bool = False) -> bytes:
+    """
+    Corpo JSON (bytes) de uma lista de objetos de domínio, idêntico ao
+    jsonify(dump_many(schema, objs)).
+
+    Args:
+        pretty: Indenta a saída (o jsonify() faz isso com o app em modo debug).
+    """
+    with request_stats.timed("serialize"):
+        objs = list(objs)
+        if pretty:
+            return _encode_like_jsonify(schema, objs, pretty)
+
+        adapter = _wire_list_adapter(schema)
+        body = adapter.dump_json(adapter.validate_python(objs, from_attributes=True), ensure_ascii=True)
+        if _differs_from_jsonify(body):
+            return _encode_like_jsonify(schema, objs, pretty)
+        return body + b"\n"
@@ -9,7 +9,7 @@ from domain.models import (  # <-- Make sure this line is exactly 'from domain.m
 from domain.exceptions import (
     DomainException, InvalidCredentialsException, UserNotFoundException,
     ProductNotFoundException, TableNotFoundException, OrderNotFoundException,
-    BusinessRuleException
+    BusinessRuleException, ServiceBusyException, ConcurrencyConflictException
 )
 
 # Exporta ports (interfaces)
@@ -18,4 +18,5 @@ from domain.ports.product_repository import ProductRepositoryPort
 from domain.ports.order_repository import OrderRepositoryPort
 from domain.ports.table_repository import TableRepositoryPort
 from domain.ports.password_hasher import PasswordHasherPort
-from domain.ports.token_generator import TokenGeneratorPort
\ No newline at end of file
+from domain.ports.token_generator import TokenGeneratorPort
+from domain.ports.order_event_publisher import OrderEventPublisherPort, OrderEventType
\ No newline at end of file
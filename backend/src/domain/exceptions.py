@@ -57,4 +57,25 @@ class BusinessRuleException(DomainException):
     nos seus Modelos (ex: order.add_item()).
     """
     def __init__(self, message: str):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+
+class ServiceBusyException(DomainException):
+    """
+    Lançada quando um serviço está saturado e recusa trabalho novo
+    (ex: pool de hash de senhas cheio). O cliente pode tentar de novo.
+    """
+    def __init__(self, message: str = "Serviço ocupado. Tente novamente em instantes."):
+        super().__init__(message)
+
+
+class ConcurrencyConflictException(BusinessRuleException):
+    """
+    Lançada pelo repositório quando o agregado mudou no banco depois de
+    carregado (a 'version' gravada não é mais a lida): outra pessoa
+    salvou antes. Os casos de uso de escrita recarregam e tentam de novo
+    (ver use_cases/conflict_retry.py); esgotadas as tentativas, a API
+    responde 409, como qualquer outra regra de negócio violada.
+    """
+    def __init__(self, message: str = "O registro foi alterado por outra pessoa. Tente novamente."):
+        super().__init__(message)
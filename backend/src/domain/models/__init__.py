@@ -10,7 +10,16 @@ from .product import Product
 from .item_order import ItemOrder
 
 # Exporta Order e OrderStatus do order.py
-from .order import Order, OrderStatus
+from .order import Order, OrderStatus, OrderItemChanges
 
 # Exporta Table e TableStatus do table.py
-from .table import Table, TableStatus
\ No newline at end of file
+from .table import Table, TableStatus
+
+# Exporta os tipos da busca no histórico de pedidos
+from .order_history import OrderHistoryFilter, OrderHistoryCursor, OrderHistoryPage
+# Exporta os tipos do relatório de vendas
+from .sales_report import SalesDimension, SalesReportLine, SalesReport
+# Exporta o resultado da importação de usuários em lote
+from .user_import import UserImportResult
+# Exporta os tipos da importação do cardápio em lote
+from .product_import import ProductImportRow, ProductImportSummary
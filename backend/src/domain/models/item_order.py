@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from .product import Product  # Importa o Product do arquivo vizinho
 
-@dataclass
+@dataclass(slots=True)
 class ItemOrder:
     """
     Representa um item específico dentro de um Pedido (Order).
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, NamedTuple, Optional
 from enum import Enum
 from datetime import datetime
 
@@ -17,11 +17,27 @@ class OrderStatus(str, Enum):
     COMPLETED = 'completed'      # Concluído, pronto para entregar/pagar
     CANCELLED = 'cancelled'      # Cancelado
 
-@dataclass
+class OrderItemChanges(NamedTuple):
+    """
+    Diferença entre os itens do pedido em memória e os itens
+    como estavam no banco na última carga/gravação.
+    """
+    added: List[ItemOrder]     # Itens novos (INSERT)
+    changed: List[ItemOrder]   # Itens com quantidade alterada (UPDATE)
+    removed: List[int]         # product_ids removidos do pedido (DELETE)
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+@dataclass(slots=True)
 class Order:
     """
     Representa um Pedido (Order) no domínio.
     É uma 'Raiz de Agregado' que gerencia uma lista de ItemOrders.
+
+    Os itens devem ser alterados pelos métodos do pedido (add_item,
+    remove_product, attach_item): eles mantêm um índice product_id -> item
+    (buscas em O(1)) e o total do pedido em cache.
     """
     # --- Atributos de Dados ---
     
@@ -37,12 +53,71 @@ class Order:
     # (Opcional: ID do usuário que criou o pedido)
     # waiter_id: int 
 
+    # Sessão da mesa (abertura -> fechamento) à qual o pedido pertence.
+    # Definida por Table.add_new_order.
+    session_id: Optional[int] = None
+
+    # Versão da linha no banco (controle de concorrência otimista): o
+    # repositório só grava se ela não mudou desde a carga, e a incrementa.
+    version: int = 0
+
+    # --- Estado de Persistência (controlado pelo repositório) ---
+    # Foto dos itens como estão no banco: { product_id -> quantidade }.
+    # Permite ao repositório gravar apenas o que mudou desde a carga.
+    _persisted_quantities: Dict[int, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _persisted_status: Optional[OrderStatus] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # --- Estado Derivado (índice e total em cache) ---
+    # Índice { product_id -> ItemOrder } da lista 'items' indexada.
+    _item_index: Dict[int, ItemOrder] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_items: Optional[List[ItemOrder]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Soma dos itens; None = recalcular na próxima leitura.
+    _total: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._reindex()
+
+    def _reindex(self):
+        """Reconstrói o índice a partir de 'items' e descarta o total."""
+        self._item_index = {item.product.id: item for item in self.items}
+        self._indexed_items = self.items
+        self._total = None
+
+    def _index(self) -> Dict[int, ItemOrder]:
+        """
+        Retorna o índice de itens, reconstruindo-o se 'items' foi trocada
+        ou alterada por fora (ex: order.items.append). Verificação em O(1).
+        """
+        if self._indexed_items is not self.items or len(self._item_index) != len(self.items):
+            self._reindex()
+        return self._item_index
+
     # --- Propriedades (Lógica de Leitura) ---
     
     @property
     def total_price(self) -> float:
-        """Calcula o preço total do pedido somando todos os itens."""
-        return sum(item.total_price for item in self.items)
+        """
+        Preço total do pedido (soma de todos os itens).
+        Calculado uma vez e mantido em cache até os itens mudarem.
+        """
+        self._index() # Descarta o cache se 'items' mudou por fora
+        if self._total is None:
+            self._total = sum(item.total_price for item in self.items)
+        return self._total
+
+    def find_item(self, product_id: int) -> Optional[ItemOrder]:
+        """Retorna o item do produto 'product_id' (ou None), em O(1)."""
+        return self._index().get(product_id)
 
     # --- Métodos de Comportamento (Lógica de Escrita) ---
 
@@ -60,18 +135,29 @@ class Order:
             raise ValueError("A quantidade deve ser positiva.")
 
         # Verifica se o item (baseado no produto) já está no pedido
-        existing_item = next(
-            (item for item in self.items if item.product.id == product.id), 
-            None
-        )
+        existing_item = self.find_item(product.id)
         
         if existing_item:
             # Se já existe, só adiciona a quantidade
             existing_item.add_quantity(quantity)
+            # Recalcula na próxima leitura: somar a diferença ao total
+            # acumularia erros de arredondamento do float.
+            self._total = None
         else:
             # Se não existe, cria um novo ItemOrder
-            new_item = ItemOrder(product=product, quantity=quantity)
-            self.items.append(new_item)
+            self.attach_item(ItemOrder(product=product, quantity=quantity))
+
+    def attach_item(self, item: ItemOrder):
+        """
+        Anexa um ItemOrder ao final do pedido, sem as regras de negócio
+        do add_item (usado pelos repositórios ao carregar do banco).
+        """
+        index = self._index()
+        self.items.append(item)
+        index[item.product.id] = item
+        if self._total is not None:
+            # Mesmo resultado do sum(): os itens são somados em ordem
+            self._total += item.total_price
 
     def remove_product(self, product_id: int):
         """
@@ -81,17 +167,55 @@ class Order:
         if self.status in [OrderStatus.COMPLETED, OrderStatus.CANCELLED]:
             raise ValueError("Não é possível remover itens de um pedido finalizado ou cancelado.")
         
-        item_to_remove = next(
-            (item for item in self.items if item.product.id == product_id), 
-            None
-        )
+        item_to_remove = self._index().pop(product_id, None)
         
         if item_to_remove:
             self.items.remove(item_to_remove)
+            self._total = None
         else:
             # Lança um erro se tentar remover algo que não está lá
             raise ValueError(f"Produto com id {product_id} não encontrado no pedido.")
 
+    # --- Rastreamento de Mudanças (usado pelos repositórios) ---
+
+    def mark_as_persisted(self):
+        """
+        Registra o estado atual como "igual ao banco".
+        Deve ser chamado pelo repositório após carregar ou salvar o pedido.
+        """
+        self._persisted_quantities = {
+            item.product.id: item.quantity for item in self.items
+        }
+        self._persisted_status = self.status
+
+    def has_status_change(self) -> bool:
+        """Indica se o status mudou desde a última carga/gravação."""
+        return self.status != self._persisted_status
+
+    def pending_item_changes(self) -> OrderItemChanges:
+        """
+        Calcula quais itens foram adicionados, alterados ou removidos
+        desde a última carga/gravação.
+        """
+        added: List[ItemOrder] = []
+        changed: List[ItemOrder] = []
+        current_ids = self._index()
+
+        for item in self.items:
+            product_id = item.product.id
+            persisted_quantity = self._persisted_quantities.get(product_id)
+
+            if persisted_quantity is None:
+                added.append(item)
+            elif persisted_quantity != item.quantity:
+                changed.append(item)
+
+        removed = [
+            product_id for product_id in self._persisted_quantities
+            if product_id not in current_ids
+        ]
+        return OrderItemChanges(added=added, changed=changed, removed=removed)
+
     # --- Métodos de Transição de Status (Lógica de Negócio) ---
 
     def mark_as_in_progress(self):
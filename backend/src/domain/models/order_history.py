@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from datetime import datetime
+
+from .order import Order, OrderStatus
+
+
+@dataclass(frozen=True, slots=True)
+class OrderHistoryFilter:
+    """
+    Filtros da busca no histórico de pedidos (todos opcionais).
+    O período é [date_from, date_to): início incluído, fim excluído.
+    """
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    table_id: Optional[int] = None
+    waiter_id: Optional[int] = None
+    status: Optional[OrderStatus] = None
+
+
+@dataclass(frozen=True, slots=True)
+class OrderHistoryCursor:
+    """
+    Posição na busca: o último pedido (created_at, id) já entregue.
+    A próxima página começa logo DEPOIS dele, na ordem do histórico
+    (do mais recente para o mais antigo), sem OFFSET.
+    """
+    created_at: datetime
+    id: int
+
+    @classmethod
+    def after(cls, order: Order) -> "OrderHistoryCursor":
+        return cls(created_at=order.created_at, id=order.id)
+
+
+@dataclass(slots=True)
+class OrderHistoryPage:
+    """Uma página do histórico; 'next_cursor' é None na última página."""
+    orders: List[Order]
+    next_cursor: Optional[OrderHistoryCursor] = None
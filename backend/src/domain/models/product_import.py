@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .product import Product
+
+# Linhas recusadas guardadas no resumo (as demais só entram na contagem)
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass(slots=True)
+class ProductImportRow:
+    """
+    Uma linha do arquivo do cardápio (importação em lote):
+    o produto lido, ou o motivo da recusa.
+    """
+    line: int                          # Linha do arquivo (para o relatório)
+    product: Optional[Product] = None  # ID 0: produto novo
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ProductImportSummary:
+    """
+    Resultado de uma importação do cardápio. Só guarda contadores e as
+    primeiras recusas, para a memória não crescer com o arquivo.
+    """
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0   # Iguais ao banco: nem chegam a ser gravados
+    rejected: int = 0
+    errors: List[ProductImportRow] = field(default_factory=list) # Até MAX_REPORTED_ERRORS
+
+    def reject(self, line: int, reason: str):
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ProductImportRow(line=line, error=reason))
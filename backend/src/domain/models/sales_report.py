@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Union
+from datetime import date, datetime
+from enum import Enum
+
+
+class SalesDimension(str, Enum):
+    """
+    Como as vendas são agrupadas no relatório.
+    (Uma tabela de resumo por dimensão, atualizada a cada pedido concluído.)
+    """
+    HOUR = 'hour'          # Por hora do dia
+    PRODUCT = 'product'    # Por produto
+    CATEGORY = 'category'  # Por categoria do cardápio
+    WAITER = 'waiter'      # Por garçom
+
+
+@dataclass(frozen=True, slots=True)
+class SalesReportLine:
+    """
+    Uma linha do relatório: as vendas de uma hora, produto, categoria ou garçom.
+    Só pedidos concluídos entram nas vendas.
+    """
+    # A hora (datetime), o ID do produto/garçom (int) ou a categoria (str)
+    key: Union[datetime, int, str]
+    # Nome do produto/garçom (None para hora e categoria)
+    label: Optional[str]
+    orders: int     # Pedidos concluídos com esta chave
+    items: int      # Unidades vendidas
+    revenue: float  # Faturamento (preço no momento do pedido x quantidade)
+
+
+@dataclass(slots=True)
+class SalesReport:
+    """Relatório de vendas no período [date_from, date_to)."""
+    dimension: SalesDimension
+    date_from: date
+    date_to: date
+    lines: List[SalesReportLine] = field(default_factory=list)
+
+    @property
+    def total_revenue(self) -> float:
+        return round(sum(line.revenue for line in self.lines), 2)
+
+    @property
+    def total_items(self) -> int:
+        return sum(line.items for line in self.lines)
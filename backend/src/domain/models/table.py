@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 from enum import Enum
 #from datetime import datetime
 
@@ -13,7 +13,7 @@ class TableStatus(str, Enum):
     AVAILABLE = 'available'  # Disponível (livre)
     OCCUPIED = 'occupied'    # Ocupada (com clientes, com ou sem pedidos)
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """
     Representa uma Mesa no restaurante.
@@ -30,13 +30,21 @@ class Table:
     # A lista de pedidos ATIVOS para esta mesa.
     orders: List[Order] = field(default_factory=list)
 
+    # ID da sessão atual (da abertura até o fechamento da mesa).
+    # None quando a mesa está livre, ou quando acabou de ser aberta
+    # e a sessão ainda não foi gravada (o repositório a cria no save).
+    session_id: Optional[int] = None
+
+    # Versão da linha no banco (controle de concorrência otimista, ver Order)
+    version: int = 0
+
     # --- Propriedades (Lógica de Leitura) ---
 
     @property
     def total_bill(self) -> float:
         """
         Calcula a conta total da mesa, somando todos os pedidos
-        que não foram cancelados.
+        que não foram cancelados (o total de cada pedido fica em cache).
         """
         return sum(
             order.total_price 
@@ -60,6 +68,7 @@ class Table:
         self.status = TableStatus.OCCUPIED
         self.number_of_people = number_of_people  # Define o número de pessoas
         self.orders = []  # Limpa pedidos de sessões anteriores
+        self.session_id = None  # Uma nova sessão será criada ao salvar
 
     def add_new_order(self, order: Order):
         """
@@ -74,6 +83,8 @@ class Table:
         if order.status != OrderStatus.PENDING:
             raise ValueError("Só é possível adicionar pedidos com status 'Pendente' à mesa.")
             
+        # O pedido pertence à sessão atual da mesa
+        order.session_id = self.session_id
         self.orders.append(order)
 
     def close_table(self) -> List[Order]:
@@ -103,5 +114,6 @@ class Table:
         self.status = TableStatus.AVAILABLE
         self.number_of_people = 0  # Zera o número de pessoas
         self.orders = []
+        self.session_id = None  # Encerra a sessão
         
         return completed_orders
\ No newline at end of file
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class UserImportResult:
+    """
+    O resultado de uma linha da importação de usuários em lote:
+    o ID do usuário criado, ou o motivo da recusa.
+    """
+    line: int                      # Linha do arquivo (para o relatório)
+    username: str
+    user_id: Optional[int] = None  # Preenchido quando o usuário foi criado
+    error: Optional[str] = None    # Motivo da recusa
+
+    @property
+    def created(self) -> bool:
+        return self.user_id is not None
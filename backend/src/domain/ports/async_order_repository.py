@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from ..models import Order, OrderStatus, OrderHistoryFilter, OrderHistoryCursor, OrderHistoryPage
+
+class AsyncOrderRepositoryPort(ABC):
+    """
+    Versão assíncrona da OrderRepositoryPort (para o app ASGI).
+    Mesmos métodos e contratos, mas com 'await'.
+    """
+
+    @abstractmethod
+    async def find_by_id(self, order_id: int) -> Optional[Order]:
+        """Encontra um pedido pelo seu ID."""
+        pass
+
+    @abstractmethod
+    async def find_by_status(self, status: OrderStatus) -> List[Order]:
+        """Encontra todos os pedidos com um status específico (para a cozinha)."""
+        pass
+
+    @abstractmethod
+    async def find_history(
+        self,
+        filters: OrderHistoryFilter,
+        after: Optional[OrderHistoryCursor] = None,
+        limit: int = 50
+    ) -> OrderHistoryPage:
+        """Busca uma página do histórico de pedidos, arquivados inclusive (paginação por cursor)."""
+        pass
+
+    @abstractmethod
+    async def save(self, order: Order) -> Order:
+        """Salva um pedido (novo ou existente) e seus ItemOrders."""
+        pass
+
+    @abstractmethod
+    async def save_all(self, orders: List[Order]) -> List[Order]:
+        """Salva vários pedidos em UMA transação (todos ou nenhum)."""
+        pass
@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from ..models import Product
+
+class AsyncProductRepositoryPort(ABC):
+    """
+    Versão assíncrona da ProductRepositoryPort (para o app ASGI).
+    Mesmos métodos e contratos, mas com 'await'.
+    """
+
+    @abstractmethod
+    async def get_visible_products(self) -> List[Product]:
+        """Busca todos os produtos visíveis (para o cardápio)."""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, product_id: int) -> Optional[Product]:
+        """Encontra um produto pelo seu ID."""
+        pass
+
+    @abstractmethod
+    async def find_by_ids(self, product_ids: List[int]) -> Dict[int, Product]:
+        """
+        Encontra vários produtos de uma só vez.
+        Retorna { product_id -> Product }; IDs inexistentes não aparecem.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> List[Product]:
+        """Busca TODOS os produtos (para o painel do admin)."""
+        pass
+
+    @abstractmethod
+    async def save(self, product: Product) -> Product:
+        """Salva um produto (novo ou existente)."""
+        pass
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Product]:
+        """Percorre TODOS os produtos em ordem de ID ('async for'), em lotes."""
+        pass
+
+    @abstractmethod
+    async def upsert_batch(self, products: List[Product]) -> Tuple[int, int, int]:
+        """Grava um lote (novos, alterados; iguais ignorados). Retorna (inseridos, atualizados, iguais)."""
+        pass
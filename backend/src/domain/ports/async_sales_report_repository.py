@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List
+from datetime import date
+from ..models import SalesDimension, SalesReportLine
+
+class AsyncSalesReportRepositoryPort(ABC):
+    """
+    Versão assíncrona da SalesReportRepositoryPort (para o app ASGI).
+    Mesmos métodos e contratos, mas com 'await'.
+    """
+
+    @abstractmethod
+    async def find_sales(self, dimension: SalesDimension, date_from: date, date_to: date) -> List[SalesReportLine]:
+        """Vendas do período [date_from, date_to) agrupadas pela 'dimension'."""
+        pass
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from ..models import Table
+
+class AsyncTableRepositoryPort(ABC):
+    """
+    Versão assíncrona da TableRepositoryPort (para o app ASGI).
+    Mesmos métodos e contratos, mas com 'await'.
+    """
+
+    @abstractmethod
+    async def find_by_id(self, table_id: int) -> Optional[Table]:
+        """
+        Encontra uma mesa pelo seu ID (número), com os pedidos
+        (e itens) da sessão atual.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all_tables(self) -> List[Table]:
+        """Lista todas as mesas do restaurante."""
+        pass
+
+    @abstractmethod
+    async def save(self, table: Table) -> Table:
+        """
+        Salva o estado de uma mesa, abrindo ou encerrando (e arquivando) sua sessão.
+        NOTA: Este método salva APENAS a mesa, não seus pedidos.
+        """
+        pass
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..models import User
+
+class AsyncUserRepositoryPort(ABC):
+    """
+    Versão assíncrona da UserRepositoryPort (para o app ASGI).
+    Mesmos métodos e contratos, mas com 'await'.
+    """
+
+    @abstractmethod
+    async def find_by_id(self, user_id: int) -> Optional[User]:
+        """Encontra um usuário pelo seu ID."""
+        pass
+
+    @abstractmethod
+    async def find_by_username(self, username: str) -> Optional[User]:
+        """Encontra um usuário pelo seu nome de usuário (para login)."""
+        pass
+
+    @abstractmethod
+    async def save(self, user: User) -> User:
+        """Salva um usuário (novo ou existente)."""
+        pass
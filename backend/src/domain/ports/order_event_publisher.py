@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from ..models import Order
+
+class OrderEventType(str, Enum):
+    """
+    Tipos de evento de pedido que interessam às telas (ex: cozinha).
+    """
+    CREATED = 'order_created'                # Novo pedido criado
+    UPDATED = 'order_updated'                # Itens adicionados a um pedido
+    STATUS_CHANGED = 'order_status_changed'  # Pedido mudou de status
+
+class OrderEventPublisherPort(ABC):
+    """
+    Define a "Porta" (Interface) para publicar eventos de pedido.
+    Abstrai o mecanismo de entrega (ex: fila em memória + SSE, broker externo).
+    """
+
+    @abstractmethod
+    def publish(self, event_type: OrderEventType, order: Order) -> None:
+        """Publica um evento com o estado atual do pedido."""
+        pass
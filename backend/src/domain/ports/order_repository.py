@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from ..models import Order, OrderStatus
+from ..models import Order, OrderStatus, OrderHistoryFilter, OrderHistoryCursor, OrderHistoryPage
 
 class OrderRepositoryPort(ABC):
     """
@@ -9,7 +9,7 @@ class OrderRepositoryPort(ABC):
 
     @abstractmethod
     def find_by_id(self, order_id: int) -> Optional[Order]:
-        """Encontra um pedido pelo seu ID."""
+        """Encontra um pedido (de uma sessão aberta) pelo seu ID."""
         pass
     
     @abstractmethod
@@ -17,10 +17,37 @@ class OrderRepositoryPort(ABC):
         """Encontra todos os pedidos com um status específico (para a cozinha)."""
         pass
 
+    @abstractmethod
+    def find_history(
+        self,
+        filters: OrderHistoryFilter,
+        after: Optional[OrderHistoryCursor] = None,
+        limit: int = 50
+    ) -> OrderHistoryPage:
+        """
+        Busca uma página do histórico de pedidos (com itens), do mais
+        recente para o mais antigo, começando logo depois de 'after'.
+        Inclui os pedidos arquivados (de sessões já encerradas).
+        Paginação por cursor (created_at, id): o custo de uma página não
+        cresce com o tamanho do histórico nem com o número da página.
+        """
+        pass
+
     @abstractmethod
     def save(self, order: Order) -> Order:
         """
         Salva um pedido (novo ou existente).
         A implementação deve ser inteligente para salvar os ItemOrders associados.
+        Lança ConcurrencyConflictException se o pedido mudou no banco desde
+        a carga ('order.version'), ou se a sessão da mesa de um pedido novo
+        não está mais aberta.
+        """
+        pass
+
+    @abstractmethod
+    def save_all(self, orders: List[Order]) -> List[Order]:
+        """
+        Salva vários pedidos (novos ou existentes) em UMA transação:
+        ou todos são gravados, ou nenhum.
         """
         pass
\ No newline at end of file
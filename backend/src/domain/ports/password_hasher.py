@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 class PasswordHasherPort(ABC):
     """
@@ -11,7 +12,23 @@ class PasswordHasherPort(ABC):
         """Gera um hash a partir de uma senha em texto puro."""
         pass
 
+    @abstractmethod
+    def hash_many(self, passwords_plaintext: List[str]) -> List[str]:
+        """
+        Gera os hashes de várias senhas (na mesma ordem), para cargas em
+        lote como a importação de usuários.
+        """
+        pass
+
     @abstractmethod
     def check(self, password_plaintext: str, hashed_password: str) -> bool:
         """Verifica se a senha em texto puro corresponde ao hash."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Indica se o hash deve ser refeito (ex: gerado com um custo
+        diferente do configurado atualmente).
+        """
+        pass
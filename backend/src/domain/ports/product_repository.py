@@ -1,6 +1,6 @@
 #domain/ports/product_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from ..models import Product # (Corrigido o import para ..models)
 
 class ProductRepositoryPort(ABC):
@@ -17,6 +17,15 @@ class ProductRepositoryPort(ABC):
     def find_by_id(self, product_id: int) -> Optional[Product]:
         """Encontra um produto pelo seu ID."""
         pass
+
+    @abstractmethod
+    def find_by_ids(self, product_ids: List[int]) -> Dict[int, Product]:
+        """
+        Encontra vários produtos de uma só vez (ex: itens de um pedido).
+        Retorna um dicionário { product_id -> Product }; IDs inexistentes
+        simplesmente não aparecem no resultado.
+        """
+        pass
         
     @abstractmethod
     def get_all(self) -> List[Product]:
@@ -26,4 +35,21 @@ class ProductRepositoryPort(ABC):
     @abstractmethod
     def save(self, product: Product) -> Product:
         """Salva um produto (novo ou existente)."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> Iterator[Product]:
+        """
+        Percorre TODOS os produtos em ordem de ID, lendo 'batch_size' por
+        vez (exportação: a memória não cresce com o cardápio).
+        """
+        pass
+
+    @abstractmethod
+    def upsert_batch(self, products: List[Product]) -> Tuple[int, int, int]:
+        """
+        Grava um lote de produtos numa transação: insere os novos (ID 0 ou
+        inexistente), atualiza os que mudaram e ignora os iguais ao banco.
+        Retorna (inseridos, atualizados, iguais).
+        """
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import List
+from datetime import date
+from ..models import SalesDimension, SalesReportLine
+
+class SalesReportRepositoryPort(ABC):
+    """
+    Define a "Porta" (Interface) para a leitura dos resumos de vendas.
+    Os resumos são atualizados pelo repositório de pedidos quando um
+    pedido é concluído; esta porta só os lê.
+    """
+
+    @abstractmethod
+    def find_sales(self, dimension: SalesDimension, date_from: date, date_to: date) -> List[SalesReportLine]:
+        """
+        Vendas do período [date_from, date_to) agrupadas pela 'dimension':
+        por hora (em ordem cronológica) ou por produto/categoria/garçom
+        (do maior para o menor faturamento).
+        O custo depende do número de linhas do resumo no período, e não do
+        número de pedidos.
+        """
+        pass
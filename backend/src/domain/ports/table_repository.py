@@ -9,7 +9,10 @@ class TableRepositoryPort(ABC):
 
     @abstractmethod
     def find_by_id(self, table_id: int) -> Optional[Table]:
-        """Encontra uma mesa pelo seu ID (número)."""
+        """
+        Encontra uma mesa pelo seu ID (número), com os pedidos
+        (e itens) da sessão atual.
+        """
         pass
 
     @abstractmethod
@@ -20,7 +23,11 @@ class TableRepositoryPort(ABC):
     @abstractmethod
     def save(self, table: Table) -> Table:
         """
-        Salva o estado de uma mesa (status, nro de pessoas).
+        Salva o estado de uma mesa (status, nro de pessoas),
+        abrindo ou encerrando sua sessão. Ao encerrar, os pedidos da
+        sessão saem das tabelas ativas e vão para o arquivo (histórico).
         NOTA: Este método salva APENAS a mesa, não seus pedidos.
+        Lança ConcurrencyConflictException se a mesa mudou no banco desde
+        a carga ('table.version').
         """
         pass
\ No newline at end of file
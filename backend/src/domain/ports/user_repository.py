@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Set
 from ..models import User
 
 class UserRepositoryPort(ABC):
@@ -20,4 +20,17 @@ class UserRepositoryPort(ABC):
     @abstractmethod
     def save(self, user: User) -> User:
         """Salva um usuário (novo ou existente)."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def find_existing_usernames(self, usernames: List[str]) -> Set[str]:
+        """Dentre 'usernames', os que já estão cadastrados (uma consulta)."""
+        pass
+
+    @abstractmethod
+    def insert_batch(self, users: List[User]) -> List[User]:
+        """
+        Insere usuários novos numa única transação (todos ou nenhum)
+        e preenche os IDs gerados.
+        """
+        pass
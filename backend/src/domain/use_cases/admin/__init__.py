@@ -2,4 +2,20 @@ from .create_product_use_case import CreateProductUseCase
 from .update_product_use_case import UpdateProductUseCase
 from .list_all_products_use_case import ListAllProductsUseCase
 from .create_user_use_case import CreateUserUseCase
-from .update_user_use_case import UpdateUserUseCase
\ No newline at end of file
+from .update_user_use_case import UpdateUserUseCase
+from .search_order_history_use_case import SearchOrderHistoryUseCase
+from .get_sales_report_use_case import GetSalesReportUseCase
+from .import_users_use_case import ImportUsersUseCase
+from .export_products_use_case import ExportProductsUseCase
+from .import_products_use_case import ImportProductsUseCase
+
+# Versões assíncronas (app ASGI)
+from .create_product_use_case import AsyncCreateProductUseCase
+from .update_product_use_case import AsyncUpdateProductUseCase
+from .list_all_products_use_case import AsyncListAllProductsUseCase
+from .create_user_use_case import AsyncCreateUserUseCase
+from .update_user_use_case import AsyncUpdateUserUseCase
+from .search_order_history_use_case import AsyncSearchOrderHistoryUseCase
+from .get_sales_report_use_case import AsyncGetSalesReportUseCase
+from .export_products_use_case import AsyncExportProductsUseCase
+from .import_products_use_case import AsyncImportProductsUseCase
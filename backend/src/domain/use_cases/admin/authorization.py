@@ -0,0 +1,35 @@
+#domain/use_cases/admin/authorization.py
+from typing import Optional
+
+from domain.models import User
+from domain.exceptions import UserNotFoundException, BusinessRuleException
+
+
+def ensure_admin(admin_user: Optional[User], admin_id: int, action: str) -> User:
+    """
+    Autorização comum aos casos de uso de admin (versões síncrona e assíncrona).
+
+    Quem chama busca o usuário no repositório (com ou sem await) e passa o
+    resultado aqui; esta função não faz I/O.
+
+    Args:
+        admin_user: O usuário carregado pelo ID do token (ou None).
+        admin_id: O ID do usuário que está executando a ação.
+        action: O que ele tenta fazer, para a mensagem de erro
+                (ex: "criar produtos").
+
+    Returns:
+        O próprio usuário, já verificado.
+
+    Raises:
+        UserNotFoundException: Se o ID do admin não for encontrado.
+        BusinessRuleException: Se o usuário não for um admin.
+    """
+    if not admin_user:
+        raise UserNotFoundException(f"Usuário {admin_id} não encontrado.")
+
+    if not admin_user.is_admin():
+        raise BusinessRuleException(
+            f"Usuário {admin_user.name} não tem permissão para {action}."
+        )
+    return admin_user
@@ -3,10 +3,15 @@ from typing import Dict, Any
 # Importa as PORTAS (abstrações) do domínio
 from domain.ports.product_repository import ProductRepositoryPort
 from domain.ports.user_repository import UserRepositoryPort
+from domain.ports.async_product_repository import AsyncProductRepositoryPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
 
 # Importa os Modelos e Exceções
 from domain.models import Product
-from domain.exceptions import UserNotFoundException, BusinessRuleException
+from domain.exceptions import BusinessRuleException
+
+# Autorização comum aos casos de uso de admin
+from domain.use_cases.admin.authorization import ensure_admin
 
 
 class CreateProductUseCase:
@@ -52,38 +57,61 @@ class CreateProductUseCase:
         
         # 1. Autorização: Verificar se o usuário é um admin
         admin_user = self.user_repository.find_by_id(admin_id)
-        if not admin_user:
-            raise UserNotFoundException(f"Usuário {admin_id} não encontrado.")
-        
-        if not admin_user.is_admin():
-            raise BusinessRuleException(
-                f"Usuário {admin_user.name} não tem permissão para criar produtos."
-            )
-
-        # 2. Validação de Dados
-        price = product_data.get("price", 0)
-        if price <= 0:
-            raise BusinessRuleException("O preço do produto deve ser positivo.")
-        
-        if not product_data.get("name"):
-            raise BusinessRuleException("O nome do produto é obrigatório.")
-
-        # 3. Criar a entidade em memória
-        try:
-            new_product = Product(
-                id=0,  # '0' ou 'None' para indicar "novo"
-                name=product_data["name"],
-                price=product_data["price"],
-                category=product_data.get("category", "Sem Categoria"),
-                imageUrl=product_data.get("imageUrl", ""),
-                availability=product_data.get("availability", True),
-                visibility=product_data.get("visibility", True)
-            )
-        except KeyError as e:
-            raise BusinessRuleException(f"Campo obrigatório ausente: {e}")
-
-        # 4. Persistir a nova entidade
+        ensure_admin(admin_user, admin_id, "criar produtos")
+
+        # 2. Validar os dados e criar a entidade em memória
+        new_product = _new_product(product_data)
+
+        # 3. Persistir a nova entidade
         created_product = self.product_repository.save(new_product)
         
-        # 5. Retornar a entidade criada (agora com ID)
-        return created_product
\ No newline at end of file
+        # 4. Retornar a entidade criada (agora com ID)
+        return created_product
+
+
+class AsyncCreateProductUseCase:
+    """Versão assíncrona do CreateProductUseCase (mesmas regras e exceções)."""
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepositoryPort,
+        user_repository: AsyncUserRepositoryPort
+    ):
+        self.product_repository = product_repository
+        self.user_repository = user_repository
+
+    async def execute(self, admin_id: int, product_data: Dict[str, Any]) -> Product:
+        # 1. Autorização: Verificar se o usuário é um admin
+        admin_user = await self.user_repository.find_by_id(admin_id)
+        ensure_admin(admin_user, admin_id, "criar produtos")
+
+        # 2. Validar os dados e criar a entidade em memória
+        new_product = _new_product(product_data)
+
+        # 3. Persistir a nova entidade
+        return await self.product_repository.save(new_product)
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def _new_product(product_data: Dict[str, Any]) -> Product:
+    """Valida os dados recebidos e monta o produto novo (ainda sem ID)."""
+    price = product_data.get("price", 0)
+    if price <= 0:
+        raise BusinessRuleException("O preço do produto deve ser positivo.")
+
+    if not product_data.get("name"):
+        raise BusinessRuleException("O nome do produto é obrigatório.")
+
+    try:
+        return Product(
+            id=0,  # '0' ou 'None' para indicar "novo"
+            name=product_data["name"],
+            price=product_data["price"],
+            category=product_data.get("category", "Sem Categoria"),
+            imageUrl=product_data.get("imageUrl", ""),
+            availability=product_data.get("availability", True),
+            visibility=product_data.get("visibility", True)
+        )
+    except KeyError as e:
+        raise BusinessRuleException(f"Campo obrigatório ausente: {e}")
@@ -1,12 +1,17 @@
-from typing import List, Dict, Any, Optional  # (ALTERADO) Importa Optional
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple  # (ALTERADO) Importa Optional
 
 # Importa as PORTAS (abstrações) do domínio
 from domain.ports.user_repository import UserRepositoryPort
 from domain.ports.password_hasher import PasswordHasherPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
 
 # Importa os Modelos e Exceções
 from domain.models import User, UserRole
-from domain.exceptions import UserNotFoundException, BusinessRuleException
+from domain.exceptions import BusinessRuleException
+
+# Autorização comum aos casos de uso de admin
+from domain.use_cases.admin.authorization import ensure_admin
 
 
 class CreateUserUseCase:
@@ -48,30 +53,13 @@ class CreateUserUseCase:
         if admin_id is not None:
             # 1. Autorização: Verificar se o usuário é um admin
             admin_user = self.user_repository.find_by_id(admin_id)
-            if not admin_user:
-                raise UserNotFoundException(f"Usuário {admin_id} não encontrado.")
-            
-            if not admin_user.is_admin():
-                raise BusinessRuleException(
-                    f"Usuário {admin_user.name} não tem permissão para criar usuários."
-                )
+            ensure_admin(admin_user, admin_id, "criar usuários")
 
         # 2. Extrair e Validar Dados
-        try:
-            username = user_data["username"]
-            password_plaintext = user_data["password"]
-            name = user_data.get("name", "")
-            roles_str = user_data.get("roles", ["waiter"])
-            roles = [UserRole(role_str) for role_str in roles_str]
-        except (KeyError, ValueError) as e:
-            raise BusinessRuleException(f"Dados de usuário inválidos ou ausentes: {e}")
-        
-        if not username or not password_plaintext:
-            raise BusinessRuleException("Username e password são obrigatórios.")
+        username, password_plaintext, name, roles = parse_user_data(user_data)
 
         # 3. Validar Regra de Negócio (Unicidade)
-        if self.user_repository.find_by_username(username):
-            raise BusinessRuleException(f"O username '{username}' já está em uso.")
+        _ensure_username_free(self.user_repository.find_by_username(username), username)
 
         # 4. Chamar Serviço (Hash da Senha)
         hashed_password = self.password_hasher.hash(password_plaintext)
@@ -94,4 +82,71 @@ class CreateUserUseCase:
         
         # 7. Limpar e Retornar (SEGURANÇA)
         created_user.hashed_password = ""
-        return created_user
\ No newline at end of file
+        return created_user
+
+
+class AsyncCreateUserUseCase:
+    """
+    Versão assíncrona do CreateUserUseCase (mesmas regras e exceções).
+    O hash da senha é aguardado em uma thread auxiliar (ver AsyncLoginUseCase).
+    """
+
+    def __init__(
+        self,
+        user_repository: AsyncUserRepositoryPort,
+        password_hasher: PasswordHasherPort
+    ):
+        self.user_repository = user_repository
+        self.password_hasher = password_hasher
+
+    async def execute(self, user_data: Dict[str, Any], admin_id: Optional[int] = None) -> User:
+        if admin_id is not None:
+            # 1. Autorização: Verificar se o usuário é um admin
+            admin_user = await self.user_repository.find_by_id(admin_id)
+            ensure_admin(admin_user, admin_id, "criar usuários")
+
+        # 2. Extrair e Validar Dados
+        username, password_plaintext, name, roles = parse_user_data(user_data)
+
+        # 3. Validar Regra de Negócio (Unicidade)
+        _ensure_username_free(await self.user_repository.find_by_username(username), username)
+
+        # 4. Chamar Serviço (Hash da Senha)
+        hashed_password = await asyncio.to_thread(self.password_hasher.hash, password_plaintext)
+
+        # 5. Criar e persistir a entidade
+        new_user = User(id=0, username=username, name=name, hashed_password=hashed_password, roles=roles)
+        try:
+            created_user = await self.user_repository.save(new_user)
+        except Exception as e:
+            raise BusinessRuleException(f"Não foi possível salvar o usuário. {e}")
+
+        # 6. Limpar e Retornar (SEGURANÇA)
+        created_user.hashed_password = ""
+        return created_user
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def parse_user_data(user_data: Dict[str, Any]) -> Tuple[str, str, str, List[UserRole]]:
+    """
+    Extrai e valida (username, senha, nome, papéis) dos dados recebidos.
+    Também usado pelo ImportUsersUseCase, linha a linha.
+    """
+    try:
+        username = user_data["username"]
+        password_plaintext = user_data["password"]
+        name = user_data.get("name", "")
+        roles_str = user_data.get("roles", ["waiter"])
+        roles = [UserRole(role_str) for role_str in roles_str]
+    except (KeyError, ValueError) as e:
+        raise BusinessRuleException(f"Dados de usuário inválidos ou ausentes: {e}")
+
+    if not username or not password_plaintext:
+        raise BusinessRuleException("Username e password são obrigatórios.")
+    return username, password_plaintext, name, roles
+
+
+def _ensure_username_free(existing_user: Optional[User], username: str):
+    if existing_user:
+        raise BusinessRuleException(f"O username '{username}' já está em uso.")
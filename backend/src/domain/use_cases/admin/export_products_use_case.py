@@ -0,0 +1,83 @@
+from typing import AsyncIterator, Iterator, Optional
+
+# Importa as PORTAS (abstrações) do domínio
+from domain.ports.product_repository import ProductRepositoryPort
+from domain.ports.user_repository import UserRepositoryPort
+from domain.ports.async_product_repository import AsyncProductRepositoryPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
+
+# Importa os Modelos
+from domain.models import Product
+
+# Autorização comum aos casos de uso de admin
+from domain.use_cases.admin.authorization import ensure_admin
+
+# Produtos lidos do banco por vez
+DEFAULT_EXPORT_BATCH_SIZE = 500
+
+
+class ExportProductsUseCase:
+    """
+    Caso de uso para exportar o cardápio inteiro (ex: para editar numa
+    planilha e importar de volta com o ImportProductsUseCase).
+    Os produtos são entregues aos poucos, página a página, nunca numa lista.
+    """
+
+    def __init__(
+        self,
+        product_repository: ProductRepositoryPort,
+        user_repository: UserRepositoryPort
+    ):
+        self.product_repository = product_repository
+        self.user_repository = user_repository
+
+    def execute(
+        self,
+        admin_id: Optional[int] = None,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE
+    ) -> Iterator[Product]:
+        """
+        Verifica a permissão (na hora) e devolve o iterador dos produtos.
+
+        Args:
+            admin_id: (Opcional) O ID do admin que está executando a ação.
+                      Se None, a verificação de permissão é pulada (CLI).
+            batch_size: Produtos lidos do banco por vez.
+
+        Raises:
+            UserNotFoundException: Se o ID do admin não for encontrado.
+            BusinessRuleException: Se o usuário não for um admin.
+        """
+
+        # 1. Autorização: Verificar se o usuário é um admin
+        if admin_id is not None:
+            admin_user = self.user_repository.find_by_id(admin_id)
+            ensure_admin(admin_user, admin_id, "exportar o cardápio")
+
+        # 2. Chamar a porta do repositório (leitura em páginas)
+        return self.product_repository.iter_all(batch_size)
+
+
+class AsyncExportProductsUseCase:
+    """Versão assíncrona do ExportProductsUseCase (mesmas regras e exceções)."""
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepositoryPort,
+        user_repository: AsyncUserRepositoryPort
+    ):
+        self.product_repository = product_repository
+        self.user_repository = user_repository
+
+    async def execute(
+        self,
+        admin_id: Optional[int] = None,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Product]:
+        # 1. Autorização: Verificar se o usuário é um admin
+        if admin_id is not None:
+            admin_user = await self.user_repository.find_by_id(admin_id)
+            ensure_admin(admin_user, admin_id, "exportar o cardápio")
+
+        # 2. Chamar a porta do repositório ('async for' no resultado)
+        return self.product_repository.iter_all(batch_size)
@@ -0,0 +1,91 @@
+from datetime import date
+
+# Importa as PORTAS (abstrações) do domínio
+from domain.ports.sales_report_repository import SalesReportRepositoryPort
+from domain.ports.user_repository import UserRepositoryPort
+from domain.ports.async_sales_report_repository import AsyncSalesReportRepositoryPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
+
+# Importa os Modelos
+from domain.models import SalesDimension, SalesReport
+
+# Autorização comum aos casos de uso de admin
+from domain.use_cases.admin.authorization import ensure_admin
+
+# Período máximo de um relatório (o resumo por hora tem até 24 linhas por dia)
+MAX_SALES_REPORT_DAYS = 366
+
+
+class GetSalesReportUseCase:
+    """
+    Caso de uso para um Admin consultar as vendas de um período, agrupadas
+    por hora, produto, categoria ou garçom.
+    Lê apenas as tabelas de resumo, nunca os pedidos.
+    """
+
+    def __init__(
+        self,
+        sales_report_repository: SalesReportRepositoryPort,
+        user_repository: UserRepositoryPort
+    ):
+        self.sales_report_repository = sales_report_repository
+        self.user_repository = user_repository
+
+    def execute(
+        self,
+        admin_id: int,
+        dimension: SalesDimension,
+        date_from: date,
+        date_to: date
+    ) -> SalesReport:
+        """
+        Monta o relatório de vendas.
+
+        Args:
+            admin_id: O ID do usuário (admin) que está executando a ação.
+            dimension: Como agrupar as vendas.
+            date_from: Primeiro dia do período (incluído).
+            date_to: Dia seguinte ao último do período (excluído).
+
+        Returns:
+            O relatório, com uma linha por hora/produto/categoria/garçom.
+
+        Raises:
+            UserNotFoundException: Se o ID do admin não for encontrado.
+            BusinessRuleException: Se o usuário não for um admin.
+        """
+
+        # 1. Autorização: Verificar se o usuário é um admin
+        admin_user = self.user_repository.find_by_id(admin_id)
+        ensure_admin(admin_user, admin_id, "consultar relatórios de vendas")
+
+        # 2. Ler o resumo do período
+        lines = self.sales_report_repository.find_sales(dimension, date_from, date_to)
+        return SalesReport(dimension=dimension, date_from=date_from, date_to=date_to, lines=lines)
+
+
+class AsyncGetSalesReportUseCase:
+    """Versão assíncrona do GetSalesReportUseCase (mesmas regras e exceções)."""
+
+    def __init__(
+        self,
+        sales_report_repository: AsyncSalesReportRepositoryPort,
+        user_repository: AsyncUserRepositoryPort
+    ):
+        self.sales_report_repository = sales_report_repository
+        self.user_repository = user_repository
+
+    async def execute(
+        self,
+        admin_id: int,
+        dimension: SalesDimension,
+        date_from: date,
+        date_to: date
+    ) -> SalesReport:
+        # 1. Autorização: Verificar se o usuário é um admin
+        admin_user = await self.user_repository.find_by_id(admin_id)
+        ensure_admin(admin_user, admin_id, "consultar relatórios de vendas")
+
+        # 2. Ler o resumo do período
+        lines = await self.sales_report_repository.find_sales(dimension, date_from, date_to)
+        return SalesReport(dimension=dimension, date_from=date_from, date_to=date_to, lines=lines)
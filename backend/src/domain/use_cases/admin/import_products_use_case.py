@@ -0,0 +1,157 @@
+from typing import AsyncIterable, Iterable, List, Optional
+
+# Importa as PORTAS (abstrações) do domínio
+from domain.ports.product_repository import ProductRepositoryPort
+from domain.ports.user_repository import UserRepositoryPort
+from domain.ports.async_product_repository import AsyncProductRepositoryPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
+
+# Importa os Modelos
+from domain.models import ProductImportRow, ProductImportSummary
+
+# Autorização comum aos casos de uso de admin
+from domain.use_cases.admin.authorization import ensure_admin
+
+# Produtos por transação (um diff e um INSERT ... ON DUPLICATE KEY UPDATE)
+DEFAULT_IMPORT_BATCH_SIZE = 500
+
+
+class ImportProductsUseCase:
+    """
+    Caso de uso para importar um cardápio inteiro de um arquivo, como um
+    diff: produtos iguais ao banco são ignorados, os alterados e os novos
+    são gravados em lotes (um lote por transação).
+
+    As linhas são consumidas aos poucos e só um lote fica em memória, seja
+    qual for o tamanho do arquivo. Uma linha recusada (na leitura, ou num
+    lote que o banco recusou) não impede as outras.
+    """
+
+    def __init__(
+        self,
+        product_repository: ProductRepositoryPort,
+        user_repository: UserRepositoryPort
+    ):
+        self.product_repository = product_repository
+        self.user_repository = user_repository
+
+    def execute(
+        self,
+        rows: Iterable[ProductImportRow],
+        admin_id: Optional[int] = None,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE
+    ) -> ProductImportSummary:
+        """
+        Executa a importação.
+
+        Args:
+            rows: As linhas do arquivo, já lidas pelo adaptador.
+            admin_id: (Opcional) O ID do admin que está executando a ação.
+                      Se None, a verificação de permissão é pulada (CLI).
+            batch_size: Produtos por transação.
+
+        Returns:
+            Os contadores da importação e as primeiras linhas recusadas.
+
+        Raises:
+            UserNotFoundException: Se o ID do admin não for encontrado.
+            BusinessRuleException: Se o usuário não for um admin.
+        """
+
+        # 1. Autorização: Verificar se o usuário é um admin
+        if admin_id is not None:
+            admin_user = self.user_repository.find_by_id(admin_id)
+            ensure_admin(admin_user, admin_id, "importar o cardápio")
+
+        # 2. Consumir as linhas, gravando um lote sempre que ele enche
+        summary = ProductImportSummary()
+        batch: List[ProductImportRow] = []
+        for row in rows:
+            if _collect(row, batch, summary, batch_size):
+                self._save_batch(batch, summary)
+                batch = []
+
+        if batch:
+            self._save_batch(batch, summary)
+        return summary
+
+    def _save_batch(self, batch: List[ProductImportRow], summary: ProductImportSummary):
+        try:
+            counts = self.product_repository.upsert_batch([row.product for row in batch])
+        except Exception as e:
+            # Captura erros do banco: o lote inteiro foi desfeito
+            _reject_batch(summary, batch, e)
+            return
+        _add_counts(summary, counts)
+
+
+class AsyncImportProductsUseCase:
+    """Versão assíncrona do ImportProductsUseCase (linhas lidas com 'async for')."""
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepositoryPort,
+        user_repository: AsyncUserRepositoryPort
+    ):
+        self.product_repository = product_repository
+        self.user_repository = user_repository
+
+    async def execute(
+        self,
+        rows: AsyncIterable[ProductImportRow],
+        admin_id: Optional[int] = None,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE
+    ) -> ProductImportSummary:
+        # 1. Autorização: Verificar se o usuário é um admin
+        if admin_id is not None:
+            admin_user = await self.user_repository.find_by_id(admin_id)
+            ensure_admin(admin_user, admin_id, "importar o cardápio")
+
+        # 2. Consumir as linhas, gravando um lote sempre que ele enche
+        summary = ProductImportSummary()
+        batch: List[ProductImportRow] = []
+        async for row in rows:
+            if _collect(row, batch, summary, batch_size):
+                await self._save_batch(batch, summary)
+                batch = []
+
+        if batch:
+            await self._save_batch(batch, summary)
+        return summary
+
+    async def _save_batch(self, batch: List[ProductImportRow], summary: ProductImportSummary):
+        try:
+            counts = await self.product_repository.upsert_batch([row.product for row in batch])
+        except Exception as e:
+            _reject_batch(summary, batch, e)
+            return
+        _add_counts(summary, counts)
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def _collect(
+    row: ProductImportRow,
+    batch: List[ProductImportRow],
+    summary: ProductImportSummary,
+    batch_size: int
+) -> bool:
+    """Recusa a linha inválida ou a põe no lote. True quando o lote encheu."""
+    if row.error:
+        summary.reject(row.line, row.error)
+        return False
+
+    batch.append(row)
+    return len(batch) >= batch_size
+
+
+def _reject_batch(summary: ProductImportSummary, batch: List[ProductImportRow], error: Exception):
+    for row in batch:
+        summary.reject(row.line, f"Não foi possível salvar o produto. {error}")
+
+
+def _add_counts(summary: ProductImportSummary, counts):
+    inserted, updated, unchanged = counts
+    summary.inserted += inserted
+    summary.updated += updated
+    summary.unchanged += unchanged
@@ -0,0 +1,133 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+# Importa as PORTAS (abstrações) do domínio
+from domain.ports.user_repository import UserRepositoryPort
+from domain.ports.password_hasher import PasswordHasherPort
+
+# Importa os Modelos e Exceções
+from domain.models import User, UserImportResult
+from domain.exceptions import BusinessRuleException
+
+# Autorização e validação comuns aos casos de uso de admin
+from domain.use_cases.admin.authorization import ensure_admin
+from domain.use_cases.admin.create_user_use_case import parse_user_data
+
+# Usuários por transação (INSERT de várias linhas)
+DEFAULT_IMPORT_BATCH_SIZE = 50
+
+
+class ImportUsersUseCase:
+    """
+    Caso de uso para cadastrar vários usuários de uma vez (ex: a equipe
+    de uma nova unidade), a partir das linhas de um arquivo.
+
+    Mesmas regras do CreateUserUseCase, mas:
+    - as senhas aceitas são "hasheadas" juntas (hash_many, em paralelo);
+    - os INSERTs vão em lotes, um lote por transação;
+    - uma linha recusada não impede as outras: o resultado diz, linha a
+      linha, o ID criado ou o motivo da recusa.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        password_hasher: PasswordHasherPort
+    ):
+        self.user_repository = user_repository
+        self.password_hasher = password_hasher
+
+    def execute(
+        self,
+        rows: List[Tuple[int, Dict[str, Any]]],
+        admin_id: Optional[int] = None,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE
+    ) -> List[UserImportResult]:
+        """
+        Executa a importação.
+
+        Args:
+            rows: Pares (linha do arquivo, dados do usuário), com os mesmos
+                  campos do CreateUserUseCase (username, password, name, roles).
+            admin_id: (Opcional) O ID do admin que está executando a ação.
+                      Se None, a verificação de permissão é pulada (CLI).
+            batch_size: Usuários por transação.
+
+        Returns:
+            Um resultado por linha, na ordem recebida.
+
+        Raises:
+            UserNotFoundException: Se o ID do admin não for encontrado.
+            BusinessRuleException: Se o usuário não for admin.
+        """
+
+        # 1. Autorização (como no CreateUserUseCase)
+        if admin_id is not None:
+            admin_user = self.user_repository.find_by_id(admin_id)
+            ensure_admin(admin_user, admin_id, "criar usuários")
+
+        # 2. Extrair e Validar cada linha (usernames repetidos no arquivo
+        #    ficam com a primeira ocorrência; o MySQL compara sem caixa)
+        results: List[UserImportResult] = []
+        accepted: List[Tuple[UserImportResult, User, str]] = []
+        seen = set()
+        for line, user_data in rows:
+            result = UserImportResult(line=line, username=str(user_data.get("username") or ""))
+            results.append(result)
+            try:
+                username, password_plaintext, name, roles = parse_user_data(user_data)
+            except BusinessRuleException as e:
+                result.error = str(e)
+                continue
+
+            if username.casefold() in seen:
+                result.error = f"O username '{username}' se repete no arquivo."
+            else:
+                seen.add(username.casefold())
+                user = User(id=0, username=username, name=name, hashed_password="", roles=roles)
+                accepted.append((result, user, password_plaintext))
+
+        # 3. Validar Regra de Negócio (Unicidade), numa consulta só
+        existing = {
+            username.casefold()
+            for username in self.user_repository.find_existing_usernames([user.username for _, user, _ in accepted])
+        }
+        new_users = []
+        for result, user, password_plaintext in accepted:
+            if user.username.casefold() in existing:
+                result.error = f"O username '{user.username}' já está em uso."
+            else:
+                new_users.append((result, user, password_plaintext))
+
+        # 4. Chamar Serviço (Hash das Senhas, todas de uma vez)
+        hashes = self.password_hasher.hash_many([password for _, _, password in new_users])
+        for (_, user, _), hashed_password in zip(new_users, hashes):
+            user.hashed_password = hashed_password
+
+        # 5. Persistir em lotes
+        batch_size = max(1, batch_size)
+        for start in range(0, len(new_users), batch_size):
+            self._save_batch(new_users[start:start + batch_size])
+
+        return results
+
+    def _save_batch(self, batch: List[Tuple[UserImportResult, User, str]]):
+        """
+        Grava um lote numa transação. Se ele falhar (ex: um username
+        cadastrado por outro processo durante a importação), as linhas do
+        lote são gravadas uma a uma, para apontar qual delas foi recusada.
+        """
+        try:
+            self.user_repository.insert_batch([user for _, user, _ in batch])
+            for result, user, _ in batch:
+                result.user_id = user.id
+            return
+        except Exception:
+            pass
+
+        for result, user, _ in batch:
+            try:
+                result.user_id = self.user_repository.save(user).id
+            except Exception as e:
+                # Captura erros do banco
+                user.id = 0
+                result.error = f"Não foi possível salvar o usuário. {e}"
@@ -3,10 +3,14 @@ from typing import List
 # Importa as PORTAS (abstrações) do domínio
 from domain.ports.product_repository import ProductRepositoryPort
 from domain.ports.user_repository import UserRepositoryPort
+from domain.ports.async_product_repository import AsyncProductRepositoryPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
 
-# Importa os Modelos e Exceções
+# Importa os Modelos
 from domain.models import Product
-from domain.exceptions import UserNotFoundException, BusinessRuleException
+
+# Autorização comum aos casos de uso de admin
+from domain.use_cases.admin.authorization import ensure_admin
 
 
 class ListAllProductsUseCase:
@@ -43,17 +47,31 @@ class ListAllProductsUseCase:
         
         # 1. Autorização: Verificar se o usuário é um admin
         admin_user = self.user_repository.find_by_id(admin_id)
-        if not admin_user:
-            raise UserNotFoundException(f"Usuário {admin_id} não encontrado.")
-        
-        if not admin_user.is_admin():
-            raise BusinessRuleException(
-                f"Usuário {admin_user.name} não tem permissão para listar todos os produtos."
-            )
+        ensure_admin(admin_user, admin_id, "listar todos os produtos")
 
         # 2. Chamar a porta do repositório
         # Usamos o método 'get_all()' em vez de 'get_visible_products()'
         all_products = self.product_repository.get_all()
         
         # 3. Retornar a lista completa
-        return all_products
\ No newline at end of file
+        return all_products
+
+
+class AsyncListAllProductsUseCase:
+    """Versão assíncrona do ListAllProductsUseCase (mesmas regras e exceções)."""
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepositoryPort,
+        user_repository: AsyncUserRepositoryPort
+    ):
+        self.product_repository = product_repository
+        self.user_repository = user_repository
+
+    async def execute(self, admin_id: int) -> List[Product]:
+        # 1. Autorização: Verificar se o usuário é um admin
+        admin_user = await self.user_repository.find_by_id(admin_id)
+        ensure_admin(admin_user, admin_id, "listar todos os produtos")
+
+        # 2. Chamar a porta do repositório
+        return await self.product_repository.get_all()
@@ -0,0 +1,93 @@
+from typing import Optional
+
+# Importa as PORTAS (abstrações) do domínio
+from domain.ports.order_repository import OrderRepositoryPort
+from domain.ports.user_repository import UserRepositoryPort
+from domain.ports.async_order_repository import AsyncOrderRepositoryPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
+
+# Importa os Modelos
+from domain.models import OrderHistoryFilter, OrderHistoryCursor, OrderHistoryPage
+
+# Autorização comum aos casos de uso de admin
+from domain.use_cases.admin.authorization import ensure_admin
+
+# Tamanho máximo de uma página do histórico
+MAX_HISTORY_PAGE_SIZE = 200
+
+
+class SearchOrderHistoryUseCase:
+    """
+    Caso de uso para um Admin navegar no histórico de pedidos, com filtros
+    (período, mesa, garçom, status), uma página por vez.
+    """
+
+    def __init__(
+        self,
+        order_repository: OrderRepositoryPort,
+        user_repository: UserRepositoryPort
+    ):
+        self.order_repository = order_repository
+        self.user_repository = user_repository
+
+    def execute(
+        self,
+        admin_id: int,
+        filters: OrderHistoryFilter,
+        after: Optional[OrderHistoryCursor] = None,
+        limit: int = 50
+    ) -> OrderHistoryPage:
+        """
+        Busca uma página do histórico.
+
+        Args:
+            admin_id: O ID do usuário (admin) que está executando a ação.
+            filters: Os filtros da busca.
+            after: O 'next_cursor' da página anterior (None = primeira página).
+            limit: Pedidos por página (até MAX_HISTORY_PAGE_SIZE).
+
+        Returns:
+            Os pedidos da página, do mais recente para o mais antigo, e o
+            cursor da próxima página (None na última).
+
+        Raises:
+            UserNotFoundException: Se o ID do admin não for encontrado.
+            BusinessRuleException: Se o usuário não for um admin.
+        """
+
+        # 1. Autorização: Verificar se o usuário é um admin
+        admin_user = self.user_repository.find_by_id(admin_id)
+        ensure_admin(admin_user, admin_id, "consultar o histórico de pedidos")
+
+        # 2. Buscar a página (o repositório pagina por cursor, sem OFFSET)
+        return self.order_repository.find_history(
+            filters, after, min(limit, MAX_HISTORY_PAGE_SIZE)
+        )
+
+
+class AsyncSearchOrderHistoryUseCase:
+    """Versão assíncrona do SearchOrderHistoryUseCase (mesmas regras e exceções)."""
+
+    def __init__(
+        self,
+        order_repository: AsyncOrderRepositoryPort,
+        user_repository: AsyncUserRepositoryPort
+    ):
+        self.order_repository = order_repository
+        self.user_repository = user_repository
+
+    async def execute(
+        self,
+        admin_id: int,
+        filters: OrderHistoryFilter,
+        after: Optional[OrderHistoryCursor] = None,
+        limit: int = 50
+    ) -> OrderHistoryPage:
+        # 1. Autorização: Verificar se o usuário é um admin
+        admin_user = await self.user_repository.find_by_id(admin_id)
+        ensure_admin(admin_user, admin_id, "consultar o histórico de pedidos")
+
+        # 2. Buscar a página
+        return await self.order_repository.find_history(
+            filters, after, min(limit, MAX_HISTORY_PAGE_SIZE)
+        )
@@ -1,16 +1,17 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Importa as PORTAS (abstrações) do domínio
 from domain.ports.product_repository import ProductRepositoryPort
 from domain.ports.user_repository import UserRepositoryPort
+from domain.ports.async_product_repository import AsyncProductRepositoryPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
 
 # Importa os Modelos e Exceções
 from domain.models import Product
-from domain.exceptions import (
-    UserNotFoundException, 
-    ProductNotFoundException, 
-    BusinessRuleException
-)
+from domain.exceptions import ProductNotFoundException, BusinessRuleException
+
+# Autorização comum aos casos de uso de admin
+from domain.use_cases.admin.authorization import ensure_admin
 
 
 class UpdateProductUseCase:
@@ -56,41 +57,67 @@ class UpdateProductUseCase:
         
         # 1. Autorização: Verificar se o usuário é um admin
         admin_user = self.user_repository.find_by_id(admin_id)
-        if not admin_user:
-            raise UserNotFoundException(f"Usuário {admin_id} não encontrado.")
-        
-        if not admin_user.is_admin():
-            raise BusinessRuleException(
-                f"Usuário {admin_user.name} não tem permissão para atualizar produtos."
-            )
+        ensure_admin(admin_user, admin_id, "atualizar produtos")
 
         # 2. Buscar a entidade a ser atualizada
         product = self.product_repository.find_by_id(product_id)
-        if not product:
-            raise ProductNotFoundException(f"Produto {product_id} não encontrado.")
 
         # 3. Aplicar as atualizações (com validação)
-        try:
-            for key, value in update_data.items():
-                if hasattr(product, key):
-                    # Validação de regras de negócio
-                    if key == "price" and float(value) <= 0:
-                        raise ValueError("O preço deve ser positivo.")
-                    if key == "name" and not value:
-                        raise ValueError("O nome do produto é obrigatório.")
-                    
-                    # Atualiza o atributo no objeto
-                    setattr(product, key, value)
-                else:
-                    # Ignora chaves desconhecidas para evitar erros
-                    pass 
-
-        except (ValueError, TypeError) as e:
-            # Captura erros de tipo (ex: 'price' como string) ou de valor
-            raise BusinessRuleException(f"Dado de atualização inválido: {e}")
+        _apply_product_update(product, product_id, update_data)
 
         # 4. Persistir a entidade "suja"
         updated_product = self.product_repository.save(product)
         
         # 5. Retornar a entidade atualizada
-        return updated_product
\ No newline at end of file
+        return updated_product
+
+
+class AsyncUpdateProductUseCase:
+    """Versão assíncrona do UpdateProductUseCase (mesmas regras e exceções)."""
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepositoryPort,
+        user_repository: AsyncUserRepositoryPort
+    ):
+        self.product_repository = product_repository
+        self.user_repository = user_repository
+
+    async def execute(self, admin_id: int, product_id: int, update_data: Dict[str, Any]) -> Product:
+        # 1. Autorização: Verificar se o usuário é um admin
+        admin_user = await self.user_repository.find_by_id(admin_id)
+        ensure_admin(admin_user, admin_id, "atualizar produtos")
+
+        # 2. Buscar a entidade a ser atualizada
+        product = await self.product_repository.find_by_id(product_id)
+
+        # 3. Aplicar as atualizações (com validação)
+        _apply_product_update(product, product_id, update_data)
+
+        # 4. Persistir a entidade "suja"
+        return await self.product_repository.save(product)
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def _apply_product_update(product: Optional[Product], product_id: int, update_data: Dict[str, Any]):
+    """Valida o produto carregado e aplica os campos recebidos, em memória."""
+    if not product:
+        raise ProductNotFoundException(f"Produto {product_id} não encontrado.")
+
+    try:
+        for key, value in update_data.items():
+            if hasattr(product, key):
+                # Validação de regras de negócio
+                if key == "price" and float(value) <= 0:
+                    raise ValueError("O preço deve ser positivo.")
+                if key == "name" and not value:
+                    raise ValueError("O nome do produto é obrigatório.")
+
+                # Atualiza o atributo no objeto
+                setattr(product, key, value)
+            # Chaves desconhecidas são ignoradas para evitar erros
+
+    except (ValueError, TypeError) as e:
+        # Captura erros de tipo (ex: 'price' como string) ou de valor
+        raise BusinessRuleException(f"Dado de atualização inválido: {e}")
@@ -1,16 +1,23 @@
+import asyncio
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 
 # Importa as PORTAS (abstrações) do domínio (Absoluto)
 from domain.ports.user_repository import UserRepositoryPort
 from domain.ports.password_hasher import PasswordHasherPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
 
 # Importa os Modelos e Exceções (Absoluto)
 from domain.models import User, UserRole
 from domain.exceptions import (
     UserNotFoundException,
-    BusinessRuleException
+    BusinessRuleException,
+    ServiceBusyException
 )
 
+# Autorização comum aos casos de uso de admin
+from domain.use_cases.admin.authorization import ensure_admin
+
 
 class UpdateUserUseCase:
     """
@@ -54,55 +61,22 @@ class UpdateUserUseCase:
 
         # 1. Autorização: Verificar se o usuário é um admin
         admin_user = self.user_repository.find_by_id(admin_id)
-        if not admin_user:
-            raise UserNotFoundException(f"Usuário admin {admin_id} não encontrado.")
-
-        if not admin_user.is_admin():
-            raise BusinessRuleException(
-                f"Usuário {admin_user.name} não tem permissão para atualizar usuários."
-            )
+        ensure_admin(admin_user, admin_id, "atualizar usuários")
 
         # 2. Buscar a entidade a ser atualizada
         user = self.user_repository.find_by_id(user_id_to_update)
-        if not user:
-            raise UserNotFoundException(f"Usuário {user_id_to_update} não encontrado.")
 
-        # 3. Aplicar as atualizações (com validação)
+        # 3. Validar e aplicar as atualizações. A unicidade do username e o
+        # hash da senha nova são as únicas partes que dependem de I/O.
         try:
-            for key, value in update_data.items():
-
-                # Campos com lógica especial
-                if key == "password":
-                    if value: # Só atualiza a senha se ela não for vazia
-                        user.hashed_password = self.password_hasher.hash(value)
-
-                elif key == "roles":
-                    # Converte a lista de strings (vindo do JSON) para Enums
-                    user.roles = [UserRole(role_str) for role_str in value]
-
-                elif key == "username":
-                    if not value:
-                        raise ValueError("Username não pode ser vazio.")
-                    # Verifica se o username mudou e se o novo já existe
-                    if value != user.username and self.user_repository.find_by_username(value):
-                        raise BusinessRuleException(f"O username '{value}' já está em uso.")
-                    user.username = value
-
-                # Campos simples que existem no modelo (name)
-                elif hasattr(user, key):
-                    # Ignora 'id' e 'hashed_password' (tratado acima)
-                    # O campo 'email' será ignorado aqui porque hasattr(user, 'email') é False
-                    if key not in ["id", "hashed_password"]:
-                        setattr(user, key, value)
-
-                # Ignora chaves desconhecidas (como 'email') silenciosamente
-
-        except (ValueError, TypeError) as e:
-            # Captura erros de tipo ou valor (ex: roles não é lista, price inválido se existisse)
-            raise BusinessRuleException(f"Dado de atualização inválido: {e}")
+            changes = _parse_changes(user, user_id_to_update, update_data)
+            if changes.username_to_check and self.user_repository.find_by_username(changes.username_to_check):
+                raise BusinessRuleException(f"O username '{changes.username_to_check}' já está em uso.")
+            hashed_password = self.password_hasher.hash(changes.password) if changes.password else None
         except Exception as e:
-             # Captura outros erros inesperados durante o processamento
-             raise BusinessRuleException(f"Erro ao processar atualização: {e}")
+            raise _as_update_error(e)
+
+        _apply_changes(user, changes, hashed_password)
 
         # 4. Persistir a entidade "suja"
         try:
@@ -114,4 +88,115 @@ class UpdateUserUseCase:
 
         # 5. Limpar e Retornar (SEGURANÇA)
         updated_user.hashed_password = ""
-        return updated_user
\ No newline at end of file
+        return updated_user
+
+
+class AsyncUpdateUserUseCase:
+    """
+    Versão assíncrona do UpdateUserUseCase (mesmas regras e exceções).
+    O hash da senha é aguardado em uma thread auxiliar (ver AsyncLoginUseCase).
+    """
+
+    def __init__(
+        self,
+        user_repository: AsyncUserRepositoryPort,
+        password_hasher: PasswordHasherPort
+    ):
+        self.user_repository = user_repository
+        self.password_hasher = password_hasher
+
+    async def execute(self, admin_id: int, user_id_to_update: int, update_data: Dict[str, Any]) -> User:
+        # 1. Autorização: Verificar se o usuário é um admin
+        admin_user = await self.user_repository.find_by_id(admin_id)
+        ensure_admin(admin_user, admin_id, "atualizar usuários")
+
+        # 2. Buscar a entidade a ser atualizada
+        user = await self.user_repository.find_by_id(user_id_to_update)
+
+        # 3. Validar e aplicar as atualizações
+        try:
+            changes = _parse_changes(user, user_id_to_update, update_data)
+            if changes.username_to_check and await self.user_repository.find_by_username(changes.username_to_check):
+                raise BusinessRuleException(f"O username '{changes.username_to_check}' já está em uso.")
+            hashed_password = (
+                await asyncio.to_thread(self.password_hasher.hash, changes.password)
+                if changes.password else None
+            )
+        except Exception as e:
+            raise _as_update_error(e)
+
+        _apply_changes(user, changes, hashed_password)
+
+        # 4. Persistir a entidade "suja"
+        try:
+            updated_user = await self.user_repository.save(user)
+        except Exception as e:
+            raise BusinessRuleException(f"Não foi possível salvar o usuário. {e}")
+
+        # 5. Limpar e Retornar (SEGURANÇA)
+        updated_user.hashed_password = ""
+        return updated_user
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+@dataclass
+class _UserChanges:
+    """Mudanças pedidas, já validadas e convertidas (ex: papéis em Enum)."""
+    fields: Dict[str, Any] = field(default_factory=dict)
+    password: Optional[str] = None          # Senha nova, em texto puro (precisa do hash)
+    username_to_check: Optional[str] = None # Username novo (precisa checar a unicidade)
+
+
+def _parse_changes(user: Optional[User], user_id: int, update_data: Dict[str, Any]) -> _UserChanges:
+    if not user:
+        raise UserNotFoundException(f"Usuário {user_id} não encontrado.")
+
+    changes = _UserChanges()
+    for key, value in update_data.items():
+
+        # Campos com lógica especial
+        if key == "password":
+            if value: # Só atualiza a senha se ela não for vazia
+                changes.password = value
+
+        elif key == "roles":
+            # Converte a lista de strings (vindo do JSON) para Enums
+            changes.fields["roles"] = [UserRole(role_str) for role_str in value]
+
+        elif key == "username":
+            if not value:
+                raise ValueError("Username não pode ser vazio.")
+            if value != user.username:
+                changes.username_to_check = value
+            changes.fields["username"] = value
+
+        # Campos simples que existem no modelo (name)
+        elif hasattr(user, key):
+            # Ignora 'id' e 'hashed_password' (tratado acima)
+            # O campo 'email' será ignorado aqui porque hasattr(user, 'email') é False
+            if key not in ["id", "hashed_password"]:
+                changes.fields[key] = value
+
+        # Ignora chaves desconhecidas (como 'email') silenciosamente
+
+    return changes
+
+
+def _as_update_error(error: Exception) -> Exception:
+    """Converte um erro da validação/preparo da atualização na exceção de domínio."""
+    if isinstance(error, (UserNotFoundException, BusinessRuleException, ServiceBusyException)):
+        # Já são exceções de domínio (ex: username em uso, hash saturado)
+        return error
+    if isinstance(error, (ValueError, TypeError)):
+        # Erros de tipo ou valor (ex: roles não é lista)
+        return BusinessRuleException(f"Dado de atualização inválido: {error}")
+    # Outros erros inesperados durante o processamento
+    return BusinessRuleException(f"Erro ao processar atualização: {error}")
+
+
+def _apply_changes(user: User, changes: _UserChanges, hashed_password: Optional[str]):
+    for key, value in changes.fields.items():
+        setattr(user, key, value)
+    if hashed_password:
+        user.hashed_password = hashed_password
@@ -1,4 +1,8 @@
 # src/usecases/auth/__init__.py
 
 from .login_use_case import LoginUseCase
-from .get_authenticated_user import GetAuthenticatedUserUseCase
\ No newline at end of file
+from .get_authenticated_user import GetAuthenticatedUserUseCase
+
+# Versões assíncronas (app ASGI)
+from .login_use_case import AsyncLoginUseCase
+from .get_authenticated_user import AsyncGetAuthenticatedUserUseCase
@@ -1,5 +1,8 @@
+from typing import Optional
+
 # Importa a PORTA (abstração) do domínio
 from domain.ports.user_repository import UserRepositoryPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
 
 # Importa o Modelo e a Exceção
 from domain.models import User
@@ -36,18 +39,34 @@ class GetAuthenticatedUserUseCase:
         # 1. Buscar o usuário no repositório
         user = self.user_repository.find_by_id(user_id)
         
-        # 2. Validar se o usuário realmente existe
-        if not user:
-            # Isso pode acontecer se um token ainda for válido,
-            # mas o usuário tiver sido excluído do banco.
-            raise UserNotFoundException(
-                f"Usuário com ID {user_id} não encontrado."
-            )
-            
-        # 3. MEDIDA DE SEGURANÇA: Remover o hash da senha
-        # Antes de retornar o objeto para fora da camada de aplicação,
-        # garantimos que o hash nunca seja exposto.
-        user.hashed_password = "" 
-        
-        # 4. Retornar o objeto de usuário "limpo"
-        return user
\ No newline at end of file
+        # 2. Validar e retornar o objeto de usuário "limpo"
+        return _without_password(user, user_id)
+
+
+class AsyncGetAuthenticatedUserUseCase:
+    """Versão assíncrona do GetAuthenticatedUserUseCase (mesmas regras e exceções)."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort):
+        self.user_repository = user_repository
+
+    async def execute(self, user_id: int) -> User:
+        # 1. Buscar o usuário no repositório
+        user = await self.user_repository.find_by_id(user_id)
+        return _without_password(user, user_id)
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def _without_password(user: Optional[User], user_id: int) -> User:
+    """Valida o usuário carregado e remove o hash da senha."""
+    if not user:
+        # Isso pode acontecer se um token ainda for válido,
+        # mas o usuário tiver sido excluído do banco.
+        raise UserNotFoundException(
+            f"Usuário com ID {user_id} não encontrado."
+        )
+
+    # MEDIDA DE SEGURANÇA: Antes de retornar o objeto para fora da camada
+    # de aplicação, garantimos que o hash nunca seja exposto.
+    user.hashed_password = ""
+    return user
@@ -1,11 +1,17 @@
+import asyncio
+from typing import Optional
+
+from mysql.connector import Error
+
 # Importa as ABSTRAÇÕES (Portas) do domínio
 from domain.ports.user_repository import UserRepositoryPort
 from domain.ports.password_hasher import PasswordHasherPort
 from domain.ports.token_generator import TokenGeneratorPort
+from domain.ports.async_user_repository import AsyncUserRepositoryPort
 
 # Importa as Exceções e Modelos do domínio
-from domain.exceptions import InvalidCredentialsException
-from domain.models import UserRole # Necessário para o payload do token
+from domain.exceptions import InvalidCredentialsException, ServiceBusyException
+from domain.models import User
 
 
 class LoginUseCase:
@@ -40,30 +46,106 @@ class LoginUseCase:
         Raises:
             InvalidCredentialsException: Se o usuário não for encontrado
                                         ou a senha estiver incorreta.
+            ServiceBusyException: Se o serviço de hash estiver saturado.
         """
         
         # 1. Buscar o usuário no repositório
         user = self.user_repository.find_by_username(username)
-        
-        if not user:
-            # Nota de Segurança: Não informe se foi o usuário ou a senha
-            # que falhou. Use uma mensagem genérica.
-            raise InvalidCredentialsException("Usuário ou senha inválidos.")
+        _ensure_user(user)
             
         # 2. Verificar o hash da senha usando a porta
         is_password_correct = self.password_hasher.check(
             password_plaintext=password_plaintext,
             hashed_password=user.hashed_password
         )
-        
-        if not is_password_correct:
-            raise InvalidCredentialsException("Usuário ou senha inválidos.")
+        _ensure_password(is_password_correct)
+
+        # 3. Atualizar o hash se ele foi gerado com outro custo
+        # (ex: BCRYPT_ROUNDS mudou). Só é possível agora, com a senha
+        # em texto puro em mãos. Uma falha do banco ou do hasher aqui não
+        # impede o login: o hash antigo continua válido e será refeito no próximo.
+        if self.password_hasher.needs_rehash(user.hashed_password):
+            old_hash = user.hashed_password
+            try:
+                user.hashed_password = self.password_hasher.hash(password_plaintext)
+                self.user_repository.save(user)
+            except REHASH_ERRORS as e:
+                _rehash_failed(user, old_hash, e)
             
-        # 3. Gerar e retornar o token usando a porta
+        # 4. Gerar e retornar o token usando a porta
         # Passamos os 'roles' para que o token possa carregá-los
-        token = self.token_generator.generate(
-            user_id=user.id, 
-            roles=user.roles
+        return _token_for(self.token_generator, user)
+
+class AsyncLoginUseCase:
+    """
+    Versão assíncrona do LoginUseCase (mesmas regras e exceções).
+
+    O hasher continua síncrono (o bcrypt roda no pool de processos): a
+    espera pelo resultado acontece em uma thread auxiliar, para não travar
+    o event loop durante o hash.
+    """
+
+    def __init__(
+        self,
+        user_repository: AsyncUserRepositoryPort,
+        password_hasher: PasswordHasherPort,
+        token_generator: TokenGeneratorPort
+    ):
+        self.user_repository = user_repository
+        self.password_hasher = password_hasher
+        self.token_generator = token_generator
+
+    async def execute(self, username: str, password_plaintext: str) -> str:
+        # 1. Buscar o usuário no repositório
+        user = await self.user_repository.find_by_username(username)
+        _ensure_user(user)
+
+        # 2. Verificar o hash da senha usando a porta
+        is_password_correct = await asyncio.to_thread(
+            self.password_hasher.check,
+            password_plaintext=password_plaintext,
+            hashed_password=user.hashed_password
         )
-        
-        return token
\ No newline at end of file
+        _ensure_password(is_password_correct)
+
+        # 3. Atualizar o hash se ele foi gerado com outro custo
+        # (uma falha aqui não impede o login)
+        if self.password_hasher.needs_rehash(user.hashed_password):
+            old_hash = user.hashed_password
+            try:
+                user.hashed_password = await asyncio.to_thread(self.password_hasher.hash, password_plaintext)
+                await self.user_repository.save(user)
+            except REHASH_ERRORS as e:
+                _rehash_failed(user, old_hash, e)
+
+        # 4. Gerar e retornar o token usando a porta
+        return _token_for(self.token_generator, user)
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+# Falhas esperadas ao refazer o hash (banco fora ou hasher saturado).
+# Qualquer outro erro é um bug e deve aparecer.
+REHASH_ERRORS = (Error, ServiceBusyException)
+
+
+def _ensure_user(user: Optional[User]):
+    if not user:
+        # Nota de Segurança: Não informe se foi o usuário ou a senha
+        # que falhou. Use uma mensagem genérica.
+        raise InvalidCredentialsException("Usuário ou senha inválidos.")
+
+
+def _ensure_password(is_password_correct: bool):
+    if not is_password_correct:
+        raise InvalidCredentialsException("Usuário ou senha inválidos.")
+
+
+def _rehash_failed(user: User, old_hash: str, error: Exception):
+    """Volta ao hash antigo (ainda válido) e registra a falha."""
+    user.hashed_password = old_hash
+    print(f"Erro ao atualizar o hash da senha do usuário {user.id}: {error}")
+
+
+def _token_for(token_generator: TokenGeneratorPort, user: User) -> str:
+    return token_generator.generate(user_id=user.id, roles=user.roles)
@@ -0,0 +1,55 @@
+#domain/use_cases/conflict_retry.py
+import asyncio
+import functools
+import inspect
+import random
+import time
+
+from ..exceptions import ConcurrencyConflictException
+
+# Tentativas por execução (a primeira + as repetições)
+MAX_ATTEMPTS = 3
+# Espera antes da 2ª, 3ª... tentativa (segundos), com variação aleatória
+# para que os dois lados de um conflito não colidam de novo
+BACKOFF_SECONDS = 0.01
+
+
+def retry_on_conflict(execute):
+    """
+    Decorador para o 'execute' dos casos de uso de escrita.
+
+    Os repositórios gravam com "controle otimista": o UPDATE só acontece
+    se a 'version' do registro ainda for a que foi lida. Se outra pessoa
+    salvou antes, o repositório lança ConcurrencyConflictException e nada
+    é gravado. Como cada 'execute' começa carregando o agregado, basta
+    rodá-lo de novo: as regras do domínio são reavaliadas sobre o estado
+    novo (ex: o pedido que a cozinha acabou de concluir recusa o item).
+
+    Funciona para 'execute' síncrono e assíncrono. Depois de MAX_ATTEMPTS
+    conflitos seguidos, a exceção chega ao chamador (a API responde 409).
+    """
+    def backoff(attempt: int) -> float:
+        return BACKOFF_SECONDS * attempt * (1 + random.random())
+
+    if inspect.iscoroutinefunction(execute):
+        @functools.wraps(execute)
+        async def async_wrapper(*args, **kwargs):
+            for attempt in range(1, MAX_ATTEMPTS + 1):
+                try:
+                    return await execute(*args, **kwargs)
+                except ConcurrencyConflictException:
+                    if attempt == MAX_ATTEMPTS:
+                        raise
+                    await asyncio.sleep(backoff(attempt))
+        return async_wrapper
+
+    @functools.wraps(execute)
+    def wrapper(*args, **kwargs):
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                return execute(*args, **kwargs)
+            except ConcurrencyConflictException:
+                if attempt == MAX_ATTEMPTS:
+                    raise
+                time.sleep(backoff(attempt))
+    return wrapper
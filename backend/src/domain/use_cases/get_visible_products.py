@@ -3,6 +3,7 @@ from typing import List
 from ..models.product import Product
 #from ..ports.product_repository import AbstractProductRepository
 from ..ports.product_repository import ProductRepositoryPort  # ← NOME CORRETO
+from ..ports.async_product_repository import AsyncProductRepositoryPort
 
 class GetVisibleProductsUseCase:
     """
@@ -18,4 +19,14 @@ class GetVisibleProductsUseCase:
         (Neste caso, é simples, mas poderia ter filtros, regras, etc.)
         """
         products = self.repository.get_visible_products()
-        return products
\ No newline at end of file
+        return products
+
+
+class AsyncGetVisibleProductsUseCase:
+    """Versão assíncrona do GetVisibleProductsUseCase (para o app ASGI)."""
+
+    def __init__(self, repository: AsyncProductRepositoryPort):
+        self.repository = repository
+
+    async def execute(self) -> List[Product]:
+        return await self.repository.get_visible_products()
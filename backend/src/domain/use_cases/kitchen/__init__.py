@@ -2,4 +2,9 @@
 
 from .list_pending_orders_use_case import ListPendingOrdersUseCase
 from .start_order_preparation import StartOrderPreparationUseCase
-from .complete_order_preparation import CompleteOrderPreparationUseCase
\ No newline at end of file
+from .complete_order_preparation import CompleteOrderPreparationUseCase
+
+# Versões assíncronas (app ASGI)
+from .list_pending_orders_use_case import AsyncListPendingOrdersUseCase
+from .start_order_preparation import AsyncStartOrderPreparationUseCase
+from .complete_order_preparation import AsyncCompleteOrderPreparationUseCase
@@ -2,6 +2,7 @@ from typing import List
 
 # Importa a PORTA (abstração) do domínio
 from domain.ports.order_repository import OrderRepositoryPort
+from domain.ports.async_order_repository import AsyncOrderRepositoryPort
 
 # Importa os Modelos (incluindo o Enum de status)
 from domain.models import Order, OrderStatus
@@ -36,4 +37,15 @@ class ListPendingOrdersUseCase:
         )
         
         # 2. Retornar a lista
-        return pending_orders
\ No newline at end of file
+        return pending_orders
+
+
+class AsyncListPendingOrdersUseCase:
+    """Versão assíncrona do ListPendingOrdersUseCase (para o app ASGI)."""
+
+    def __init__(self, order_repository: AsyncOrderRepositoryPort):
+        self.order_repository = order_repository
+
+    async def execute(self) -> List[Order]:
+        # 1. Chamar a porta do repositório
+        return await self.order_repository.find_by_status(OrderStatus.PENDING)
@@ -1,10 +1,17 @@
-# Importa a PORTA (abstração) do domínio
+from typing import Optional
+
+# Importa as PORTAS (abstrações) do domínio
 from domain.ports.order_repository import OrderRepositoryPort
+from domain.ports.order_event_publisher import OrderEventPublisherPort, OrderEventType
+from domain.ports.async_order_repository import AsyncOrderRepositoryPort
 
 # Importa o Modelo e as Exceções
 from domain.models import Order
 from domain.exceptions import OrderNotFoundException, BusinessRuleException
 
+# Recarrega e tenta de novo quando outra pessoa salvou antes
+from domain.use_cases.conflict_retry import retry_on_conflict
+
 
 class StartOrderPreparationUseCase:
     """
@@ -12,12 +19,19 @@ class StartOrderPreparationUseCase:
     'IN_PROGRESS' (em preparo).
     """
     
-    def __init__(self, order_repository: OrderRepositoryPort):
+    def __init__(
+        self,
+        order_repository: OrderRepositoryPort,
+        event_publisher: Optional[OrderEventPublisherPort] = None
+    ):
         """
-        O construtor recebe o repositório de pedidos.
+        O construtor recebe o repositório de pedidos e, opcionalmente,
+        o publicador de eventos (para avisar as telas conectadas).
         """
         self.order_repository = order_repository
+        self.event_publisher = event_publisher
 
+    @retry_on_conflict
     def execute(self, order_id: int) -> Order:
         """
         Executa a lógica de negócio para iniciar o preparo de um pedido.
@@ -37,21 +51,58 @@ class StartOrderPreparationUseCase:
         # 1. Buscar o Agregado Raiz (o Pedido)
         order = self.order_repository.find_by_id(order_id)
         
-        # 2. Validar se a entidade existe
-        if not order:
-            raise OrderNotFoundException(f"Pedido {order_id} não encontrado.")
-            
-        # 3. Chamar a lógica de negócio (que está no Domínio)
-        try:
-            # O caso de uso "comanda" o modelo de domínio
-            order.mark_as_in_progress()
-            
-        except ValueError as e:
-            # Captura exceções de regras de negócio (ex: "Pedido não está pendente")
-            raise BusinessRuleException(str(e))
-            
-        # 4. Persistir a mudança de estado
+        # 2. Chamar a lógica de negócio (que está no Domínio)
+        _start(order, order_id)
+
+        # 3. Persistir a mudança de estado
         updated_order = self.order_repository.save(order)
+
+        # 4. Avisar as telas sobre a mudança de status
+        if self.event_publisher:
+            self.event_publisher.publish(OrderEventType.STATUS_CHANGED, updated_order)
         
         # 5. Retornar a entidade atualizada
-        return updated_order
\ No newline at end of file
+        return updated_order
+
+
+class AsyncStartOrderPreparationUseCase:
+    """Versão assíncrona do StartOrderPreparationUseCase (mesmas regras e exceções)."""
+
+    def __init__(
+        self,
+        order_repository: AsyncOrderRepositoryPort,
+        event_publisher: Optional[OrderEventPublisherPort] = None
+    ):
+        self.order_repository = order_repository
+        self.event_publisher = event_publisher
+
+    @retry_on_conflict
+    async def execute(self, order_id: int) -> Order:
+        # 1. Buscar o Agregado Raiz (o Pedido)
+        order = await self.order_repository.find_by_id(order_id)
+
+        # 2. Chamar a lógica de negócio (muda o status para 'IN_PROGRESS')
+        _start(order, order_id)
+
+        # 3. Persistir a mudança de estado
+        updated_order = await self.order_repository.save(order)
+
+        # 4. Avisar as telas sobre a mudança de status
+        if self.event_publisher:
+            self.event_publisher.publish(OrderEventType.STATUS_CHANGED, updated_order)
+        return updated_order
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def _start(order: Optional[Order], order_id: int):
+    """Valida o pedido carregado e muda o status para 'IN_PROGRESS', em memória."""
+    if not order:
+        raise OrderNotFoundException(f"Pedido {order_id} não encontrado.")
+
+    try:
+        # O caso de uso "comanda" o modelo de domínio
+        order.mark_as_in_progress()
+    except ValueError as e:
+        # Captura exceções de regras de negócio (ex: "Pedido não está pendente")
+        raise BusinessRuleException(str(e))
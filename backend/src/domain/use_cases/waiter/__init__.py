@@ -5,4 +5,14 @@ from .open_table_use_case import OpenTableUseCase
 from .get_table_details_use_case import GetTableDetailsUseCase
 from .create_order_use_case import CreateOrderUseCase
 from .add_item_to_order_use_case import AddItemToOrderUseCase
-from .close_table_use_case import CloseTableUseCase
\ No newline at end of file
+from .close_table_use_case import CloseTableUseCase
+from .submit_order_batch_use_case import SubmitOrderBatchUseCase, BatchEntryResult, OrderBatchResult
+
+# Versões assíncronas (app ASGI)
+from .list_tables_use_case import AsyncListTablesUseCase
+from .open_table_use_case import AsyncOpenTableUseCase
+from .get_table_details_use_case import AsyncGetTableDetailsUseCase
+from .create_order_use_case import AsyncCreateOrderUseCase
+from .add_item_to_order_use_case import AsyncAddItemToOrderUseCase
+from .close_table_use_case import AsyncCloseTableUseCase
+from .submit_order_batch_use_case import AsyncSubmitOrderBatchUseCase
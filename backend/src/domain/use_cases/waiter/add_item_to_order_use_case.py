@@ -1,6 +1,11 @@
+from typing import Optional
+
 # Importa as PORTAS (abstrações) do domínio
 from domain.ports.order_repository import OrderRepositoryPort
 from domain.ports.product_repository import ProductRepositoryPort
+from domain.ports.order_event_publisher import OrderEventPublisherPort, OrderEventType
+from domain.ports.async_order_repository import AsyncOrderRepositoryPort
+from domain.ports.async_product_repository import AsyncProductRepositoryPort
 
 # Importa os Modelos e Exceções
 from domain.models import Order, Product
@@ -10,6 +15,9 @@ from domain.exceptions import (
     BusinessRuleException
 )
 
+# Recarrega e tenta de novo quando outra pessoa salvou antes
+from domain.use_cases.conflict_retry import retry_on_conflict
+
 
 class AddItemToOrderUseCase:
     """
@@ -20,14 +28,18 @@ class AddItemToOrderUseCase:
     def __init__(
         self, 
         order_repository: OrderRepositoryPort,
-        product_repository: ProductRepositoryPort
+        product_repository: ProductRepositoryPort,
+        event_publisher: Optional[OrderEventPublisherPort] = None
     ):
         """
-        O construtor recebe os repositórios necessários.
+        O construtor recebe os repositórios necessários e, opcionalmente,
+        o publicador de eventos (para avisar as telas conectadas).
         """
         self.order_repository = order_repository
         self.product_repository = product_repository
+        self.event_publisher = event_publisher
 
+    @retry_on_conflict
     def execute(self, order_id: int, product_id: int, quantity: int) -> Order:
         """
         Executa a lógica de adicionar o item ao pedido.
@@ -47,29 +59,66 @@ class AddItemToOrderUseCase:
                                    (ex: pedido já concluído, 0 produtos).
         """
         
-        # 1. Buscar o Agregado Raiz (o Pedido)
+        # 1. Buscar o Agregado Raiz (o Pedido) e o Produto
         order = self.order_repository.find_by_id(order_id)
         if not order:
             raise OrderNotFoundException(f"Pedido {order_id} não encontrado.")
-
-        # 2. Buscar a entidade Produto
         product = self.product_repository.find_by_id(product_id)
-        if not product:
-            raise ProductNotFoundException(f"Produto {product_id} não encontrado.")
 
-        # 3. Chamar a lógica de negócio (que está no Domínio)
-        try:
-            # O caso de uso "comanda" o modelo de domínio
-            order.add_item(product, quantity)
-            
-        except ValueError as e:
-            # Captura exceções de regras de negócio (ex: "Pedido já concluído")
-            raise BusinessRuleException(str(e))
-            
-        # 4. Persistir a mudança de estado
+        # 2. Chamar a lógica de negócio (que está no Domínio)
+        _add_item(order, product, product_id, quantity)
+
+        # 3. Persistir a mudança de estado
         # O repositório salva o objeto 'order' que agora está "sujo"
         # (com um novo ItemOrder ou um ItemOrder existente atualizado)
         updated_order = self.order_repository.save(order)
-        
-        # 5. Retornar a entidade atualizada
-        return updated_order
\ No newline at end of file
+
+        # 4. Avisar as telas (a cozinha exibe os itens do pedido)
+        if self.event_publisher:
+            self.event_publisher.publish(OrderEventType.UPDATED, updated_order)
+        return updated_order
+
+
+class AsyncAddItemToOrderUseCase:
+    """Versão assíncrona do AddItemToOrderUseCase (mesmas regras e exceções)."""
+
+    def __init__(
+        self,
+        order_repository: AsyncOrderRepositoryPort,
+        product_repository: AsyncProductRepositoryPort,
+        event_publisher: Optional[OrderEventPublisherPort] = None
+    ):
+        self.order_repository = order_repository
+        self.product_repository = product_repository
+        self.event_publisher = event_publisher
+
+    @retry_on_conflict
+    async def execute(self, order_id: int, product_id: int, quantity: int) -> Order:
+        # 1. Buscar o Agregado Raiz (o Pedido) e o Produto
+        order = await self.order_repository.find_by_id(order_id)
+        if not order:
+            raise OrderNotFoundException(f"Pedido {order_id} não encontrado.")
+        product = await self.product_repository.find_by_id(product_id)
+
+        # 2. Chamar a lógica de negócio e 3. persistir
+        _add_item(order, product, product_id, quantity)
+        updated_order = await self.order_repository.save(order)
+
+        # 4. Avisar as telas (a cozinha exibe os itens do pedido)
+        if self.event_publisher:
+            self.event_publisher.publish(OrderEventType.UPDATED, updated_order)
+        return updated_order
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def _add_item(order: Order, product: Optional[Product], product_id: int, quantity: int):
+    """Adiciona o produto carregado ao pedido, em memória."""
+    if not product:
+        raise ProductNotFoundException(f"Produto {product_id} não encontrado.")
+
+    try:
+        order.add_item(product, quantity)
+    except ValueError as e:
+        # Captura exceções de regras de negócio (ex: "Pedido já concluído")
+        raise BusinessRuleException(str(e))
@@ -1,10 +1,16 @@
+from typing import Optional
+
 # Importa a PORTA (abstração) do domínio
 from domain.ports.table_repository import TableRepositoryPort
+from domain.ports.async_table_repository import AsyncTableRepositoryPort
 
 # Importa o Modelo e as Exceções
 from domain.models import Table
 from domain.exceptions import TableNotFoundException, BusinessRuleException
 
+# Recarrega e tenta de novo quando outra pessoa salvou antes
+from domain.use_cases.conflict_retry import retry_on_conflict
+
 
 class CloseTableUseCase:
     """
@@ -18,6 +24,7 @@ class CloseTableUseCase:
         """
         self.table_repository = table_repository
 
+    @retry_on_conflict
     def execute(self, table_id: int) -> Table:
         """
         Executa a lógica de negócio para fechar uma mesa.
@@ -37,25 +44,43 @@ class CloseTableUseCase:
         # 1. Buscar o Agregado Raiz (a Mesa)
         # Precisamos dos pedidos para a lógica de validação
         table = self.table_repository.find_by_id(table_id)
-        
-        # 2. Validar se a entidade existe
-        if not table:
-            raise TableNotFoundException(f"Mesa {table_id} não encontrada.")
-            
-        # 3. Chamar a lógica de negócio (que está no Domínio)
-        try:
-            # O caso de uso "comanda" o modelo de domínio
-            # O método .close_table() fará a validação de pedidos pendentes
-            # e mudará o status, o nro de pessoas e limpará a lista de pedidos.
-            table.close_table()
-            
-        except ValueError as e:
-            # Captura exceções de regras de negócio (ex: "Pedidos pendentes")
-            raise BusinessRuleException(str(e))
-            
-        # 4. Persistir a mudança de estado
+
+        # 2. Chamar a lógica de negócio (que está no Domínio)
+        _close(table, table_id)
+
+        # 3. Persistir a mudança de estado
         # O repositório salva o objeto 'table' que agora está "sujo"
-        updated_table = self.table_repository.save(table)
-        
-        # 5. Retornar a entidade atualizada
-        return updated_table
\ No newline at end of file
+        return self.table_repository.save(table)
+
+
+class AsyncCloseTableUseCase:
+    """Versão assíncrona do CloseTableUseCase (mesmas regras e exceções)."""
+
+    def __init__(self, table_repository: AsyncTableRepositoryPort):
+        self.table_repository = table_repository
+
+    @retry_on_conflict
+    async def execute(self, table_id: int) -> Table:
+        # 1. Buscar o Agregado Raiz (com os pedidos, para a validação)
+        table = await self.table_repository.find_by_id(table_id)
+
+        # 2. Chamar a lógica de negócio e 3. persistir
+        _close(table, table_id)
+        return await self.table_repository.save(table)
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def _close(table: Optional[Table], table_id: int):
+    """
+    Valida a mesa carregada e a fecha, em memória. O .close_table() valida
+    os pedidos pendentes e muda o status, o nro de pessoas e a lista de pedidos.
+    """
+    if not table:
+        raise TableNotFoundException(f"Mesa {table_id} não encontrada.")
+
+    try:
+        table.close_table()
+    except ValueError as e:
+        # Captura exceções de regras de negócio (ex: "Pedidos pendentes")
+        raise BusinessRuleException(str(e))
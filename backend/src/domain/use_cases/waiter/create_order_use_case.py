@@ -1,9 +1,13 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Importa as PORTAS (abstrações) do domínio
 from domain.ports.table_repository import TableRepositoryPort
 from domain.ports.product_repository import ProductRepositoryPort
 from domain.ports.order_repository import OrderRepositoryPort # (NOVO) Importa a porta do pedido
+from domain.ports.order_event_publisher import OrderEventPublisherPort, OrderEventType
+from domain.ports.async_table_repository import AsyncTableRepositoryPort
+from domain.ports.async_product_repository import AsyncProductRepositoryPort
+from domain.ports.async_order_repository import AsyncOrderRepositoryPort
 
 # Importa os Modelos e Exceções
 from domain.models import Order, Product, Table
@@ -13,6 +17,9 @@ from domain.exceptions import (
     BusinessRuleException
 )
 
+# Recarrega e tenta de novo quando outra pessoa salvou antes
+from domain.use_cases.conflict_retry import retry_on_conflict
+
 
 class CreateOrderUseCase:
     """
@@ -23,15 +30,19 @@ class CreateOrderUseCase:
         self, 
         table_repository: TableRepositoryPort,
         product_repository: ProductRepositoryPort,
-        order_repository: OrderRepositoryPort  # (NOVO) Adiciona o repositório de pedidos
+        order_repository: OrderRepositoryPort,  # (NOVO) Adiciona o repositório de pedidos
+        event_publisher: Optional[OrderEventPublisherPort] = None
     ):
         """
-        O construtor recebe todos os repositórios necessários.
+        O construtor recebe todos os repositórios necessários e, opcionalmente,
+        o publicador de eventos (para avisar a cozinha do novo pedido).
         """
         self.table_repository = table_repository
         self.product_repository = product_repository
         self.order_repository = order_repository # (NOVO) Salva o repositório
+        self.event_publisher = event_publisher
 
+    @retry_on_conflict
     def execute(self, waiter_id: int,table_id: int, items_data: List[Dict[str, Any]]) -> Order:
         """
         Executa a lógica de criação do pedido.
@@ -51,50 +62,102 @@ class CreateOrderUseCase:
                                    (ex: mesa não está ocupada, 0 produtos).
         """
         
-        # 1. Buscar o Agregado Raiz (a Mesa)
+        # 1. Buscar o Agregado Raiz (a Mesa) e validar a requisição
         table = self.table_repository.find_by_id(table_id)
-        if not table:
-            raise TableNotFoundException(f"Mesa {table_id} não encontrada.")
+        _check_request(table, table_id, items_data)
 
-        # 2. Criar a nova entidade Order em memória
-        new_order = Order(id=0, table_number=table_id, waiter_id=waiter_id)  # id=0 como placeholder
-        
-        if not items_data:
-            raise BusinessRuleException("Não é possível criar um pedido vazio.")
-
-        try:
-            # 3. Buscar produtos e popular o pedido (usando lógica de domínio)
-            for item in items_data:
-                product_id = item.get("product_id")
-                quantity = item.get("quantity")
-                
-                product = self.product_repository.find_by_id(product_id)
-                if not product:
-                    raise ProductNotFoundException(f"Produto {product_id} não encontrado.")
-                
-                # Chama a lógica de domínio para adicionar o item
-                new_order.add_item(product, quantity)
-
-            # 4. Adicionar o novo pedido ao Agregado Raiz (Mesa) em MEMÓRIA
-            # A mesa validará se pode aceitar um novo pedido
-            table.add_new_order(new_order)
-
-        except (ValueError, ProductNotFoundException) as e:
-            # Captura erros de lógica (ex: "pedido já concluído")
-            # ou o ProductNotFoundException
-            raise BusinessRuleException(str(e))
-            
-        # 5. Persistir o Agregado Raiz (Mesa)
-        # (ALTERADO): Isto salva APENAS o estado da mesa (ex: se o status mudasse)
-        # Na prática, a mesa não muda neste caso de uso, 
-        # mas manter isso não é prejudicial.
-        self.table_repository.save(table)
-        
-        # 6. Persistir o NOVO Agregado (Pedido)
-        # (NOVO): Chamamos explicitamente o repositório de pedidos
-        # para salvar o novo pedido e seus itens.
+        # 2. Buscar TODOS os produtos do pedido numa única consulta
+        # (em vez de um find_by_id por item)
+        products = self.product_repository.find_by_ids(_product_ids(items_data))
+
+        # 3. Criar o pedido e associá-lo à mesa em MEMÓRIA (regras do domínio)
+        new_order = _build_order(waiter_id, table, items_data, products)
+
+        # 4. Persistir o NOVO Agregado (Pedido)
         # O new_order (que tinha id=0) é salvo e recebe seu ID real.
+        # A mesa não muda neste caso de uso, por isso não é salva: o
+        # repositório só confere, na mesma transação, que a sessão da mesa
+        # ainda está aberta (ConcurrencyConflictException se ela foi fechada).
         saved_order = self.order_repository.save(new_order)
-        
-        # 7. Retornar o novo pedido
-        return saved_order # (ALTERADO) Retorna o objeto com o ID atualizado
\ No newline at end of file
+
+        # 5. Avisar a cozinha do novo pedido
+        if self.event_publisher:
+            self.event_publisher.publish(OrderEventType.CREATED, saved_order)
+        return saved_order
+
+
+class AsyncCreateOrderUseCase:
+    """Versão assíncrona do CreateOrderUseCase (mesmas regras e exceções)."""
+
+    def __init__(
+        self,
+        table_repository: AsyncTableRepositoryPort,
+        product_repository: AsyncProductRepositoryPort,
+        order_repository: AsyncOrderRepositoryPort,
+        event_publisher: Optional[OrderEventPublisherPort] = None
+    ):
+        self.table_repository = table_repository
+        self.product_repository = product_repository
+        self.order_repository = order_repository
+        self.event_publisher = event_publisher
+
+    @retry_on_conflict
+    async def execute(self, waiter_id: int, table_id: int, items_data: List[Dict[str, Any]]) -> Order:
+        # 1. Buscar o Agregado Raiz (a Mesa) e validar a requisição
+        table = await self.table_repository.find_by_id(table_id)
+        _check_request(table, table_id, items_data)
+
+        # 2. Buscar TODOS os produtos do pedido numa única consulta
+        products = await self.product_repository.find_by_ids(_product_ids(items_data))
+
+        # 3. Criar o pedido em memória e 4. persistir (a mesa não muda)
+        new_order = _build_order(waiter_id, table, items_data, products)
+        saved_order = await self.order_repository.save(new_order)
+
+        # 5. Avisar a cozinha do novo pedido
+        if self.event_publisher:
+            self.event_publisher.publish(OrderEventType.CREATED, saved_order)
+        return saved_order
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def _check_request(table: Optional[Table], table_id: int, items_data: List[Dict[str, Any]]):
+    """Valida a mesa carregada e a lista de itens, antes de buscar os produtos."""
+    if not table:
+        raise TableNotFoundException(f"Mesa {table_id} não encontrada.")
+
+    if not items_data:
+        raise BusinessRuleException("Não é possível criar um pedido vazio.")
+
+
+def _product_ids(items_data: List[Dict[str, Any]]) -> List[int]:
+    return [item.get("product_id") for item in items_data]
+
+
+def _build_order(
+    waiter_id: int,
+    table: Table,
+    items_data: List[Dict[str, Any]],
+    products: Dict[int, Product]
+) -> Order:
+    """
+    Cria o pedido (id=0) com os itens e o adiciona à mesa, em memória.
+    A mesa valida se pode aceitar um novo pedido.
+    """
+    product_ids = _product_ids(items_data)
+    missing_ids = [pid for pid in dict.fromkeys(product_ids) if pid not in products]
+    if missing_ids:
+        raise ProductNotFoundException(
+            f"Produto(s) {', '.join(map(str, missing_ids))} não encontrado(s)."
+        )
+
+    new_order = Order(id=0, table_number=table.id, waiter_id=waiter_id)  # id=0 como placeholder
+    try:
+        for item in items_data:
+            new_order.add_item(products[item.get("product_id")], item.get("quantity"))
+        table.add_new_order(new_order)
+    except ValueError as e:
+        # Captura erros de lógica (ex: "mesa não está ocupada", quantidade inválida)
+        raise BusinessRuleException(str(e))
+    return new_order
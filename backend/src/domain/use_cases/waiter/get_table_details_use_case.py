@@ -1,5 +1,8 @@
+from typing import Optional
+
 # Importa a PORTA (abstração) do domínio
 from domain.ports.table_repository import TableRepositoryPort
+from domain.ports.async_table_repository import AsyncTableRepositoryPort
 
 # Importa o Modelo e as Exceções
 from domain.models import Table
@@ -38,9 +41,25 @@ class GetTableDetailsUseCase:
         # trará a mesa E seus pedidos associados (eager loading).
         table = self.table_repository.find_by_id(table_id)
         
-        # 2. Validar se a entidade existe
-        if not table:
-            raise TableNotFoundException(f"Mesa {table_id} não encontrada.")
-            
-        # 3. Retornar a entidade completa
-        return table
\ No newline at end of file
+        # 2. Validar se a entidade existe e retorná-la completa
+        return _found(table, table_id)
+
+
+class AsyncGetTableDetailsUseCase:
+    """Versão assíncrona do GetTableDetailsUseCase (mesmas regras e exceções)."""
+
+    def __init__(self, table_repository: AsyncTableRepositoryPort):
+        self.table_repository = table_repository
+
+    async def execute(self, table_id: int) -> Table:
+        # 1. Buscar a mesa com os pedidos da sessão atual
+        table = await self.table_repository.find_by_id(table_id)
+        return _found(table, table_id)
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def _found(table: Optional[Table], table_id: int) -> Table:
+    if not table:
+        raise TableNotFoundException(f"Mesa {table_id} não encontrada.")
+    return table
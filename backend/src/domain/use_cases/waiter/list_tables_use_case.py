@@ -2,6 +2,7 @@ from typing import List
 
 # Importa a PORTA (abstração) do domínio
 from domain.ports.table_repository import TableRepositoryPort
+from domain.ports.async_table_repository import AsyncTableRepositoryPort
 
 # Importa o Modelo que será retornado
 from domain.models import Table
@@ -37,4 +38,15 @@ class ListTablesUseCase:
         
         # 2. Retornar a lista
         # (Se a lista estiver vazia, retorna [], o que está correto)
-        return tables
\ No newline at end of file
+        return tables
+
+
+class AsyncListTablesUseCase:
+    """Versão assíncrona do ListTablesUseCase (para o app ASGI)."""
+
+    def __init__(self, table_repository: AsyncTableRepositoryPort):
+        self.table_repository = table_repository
+
+    async def execute(self) -> List[Table]:
+        # 1. Chamar a porta do repositório
+        return await self.table_repository.get_all_tables()
@@ -1,10 +1,16 @@
+from typing import Optional
+
 # Importa a PORTA (abstração) do domínio
 from domain.ports.table_repository import TableRepositoryPort
+from domain.ports.async_table_repository import AsyncTableRepositoryPort
 
 # Importa o Modelo e as Exceções
 from domain.models import Table
 from domain.exceptions import TableNotFoundException, BusinessRuleException
 
+# Recarrega e tenta de novo quando outra pessoa salvou antes
+from domain.use_cases.conflict_retry import retry_on_conflict
+
 
 class OpenTableUseCase:
     """
@@ -18,6 +24,7 @@ class OpenTableUseCase:
         """
         self.table_repository = table_repository
 
+    @retry_on_conflict
     def execute(self, table_id: int, number_of_people: int) -> Table:
         """
         Executa a lógica de negócio para abrir uma mesa.
@@ -37,24 +44,41 @@ class OpenTableUseCase:
         
         # 1. Buscar a entidade "Raiz de Agregado"
         table = self.table_repository.find_by_id(table_id)
-        
-        # 2. Validar se a entidade existe
-        if not table:
-            raise TableNotFoundException(f"Mesa {table_id} não encontrada.")
-            
-        # 3. Chamar a lógica de negócio (que está no Domínio)
-        try:
-            # O caso de uso "comanda" o modelo de domínio
-            table.open_table(number_of_people)
-            
-        except ValueError as e:
-            # Captura exceções de regras de negócio (ex: "Mesa já ocupada")
-            # e as transforma em exceções de domínio mais limpas.
-            raise BusinessRuleException(str(e))
-            
-        # 4. Persistir a mudança de estado
+
+        # 2. Chamar a lógica de negócio (que está no Domínio)
+        _open(table, table_id, number_of_people)
+
+        # 3. Persistir a mudança de estado
         # O repositório salva o objeto 'table' que agora está "sujo"
-        updated_table = self.table_repository.save(table)
-        
-        # 5. Retornar a entidade atualizada
-        return updated_table
\ No newline at end of file
+        return self.table_repository.save(table)
+
+
+class AsyncOpenTableUseCase:
+    """Versão assíncrona do OpenTableUseCase (mesmas regras e exceções)."""
+
+    def __init__(self, table_repository: AsyncTableRepositoryPort):
+        self.table_repository = table_repository
+
+    @retry_on_conflict
+    async def execute(self, table_id: int, number_of_people: int) -> Table:
+        # 1. Buscar a entidade "Raiz de Agregado"
+        table = await self.table_repository.find_by_id(table_id)
+
+        # 2. Chamar a lógica de negócio e 3. persistir
+        _open(table, table_id, number_of_people)
+        return await self.table_repository.save(table)
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def _open(table: Optional[Table], table_id: int, number_of_people: int):
+    """Valida a mesa carregada e a abre, em memória."""
+    if not table:
+        raise TableNotFoundException(f"Mesa {table_id} não encontrada.")
+
+    try:
+        table.open_table(number_of_people)
+    except ValueError as e:
+        # Captura exceções de regras de negócio (ex: "Mesa já ocupada")
+        # e as transforma em exceções de domínio mais limpas.
+        raise BusinessRuleException(str(e))
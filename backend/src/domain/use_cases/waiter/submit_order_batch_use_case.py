@@ -0,0 +1,259 @@
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
+
+# Importa as PORTAS (abstrações) do domínio
+from domain.ports.table_repository import TableRepositoryPort
+from domain.ports.product_repository import ProductRepositoryPort
+from domain.ports.order_repository import OrderRepositoryPort
+from domain.ports.order_event_publisher import OrderEventPublisherPort, OrderEventType
+from domain.ports.async_table_repository import AsyncTableRepositoryPort
+from domain.ports.async_product_repository import AsyncProductRepositoryPort
+from domain.ports.async_order_repository import AsyncOrderRepositoryPort
+
+# Importa os Modelos e Exceções
+from domain.models import Order, Product, Table
+from domain.exceptions import (
+    DomainException,
+    TableNotFoundException,
+    OrderNotFoundException,
+    ProductNotFoundException,
+    BusinessRuleException
+)
+
+# Recarrega e tenta de novo quando outra pessoa salvou antes
+from domain.use_cases.conflict_retry import retry_on_conflict
+
+
+@dataclass
+class BatchEntryResult:
+    """Resultado de UMA entrada do lote: o pedido gravado, ou o erro."""
+    order: Optional[Order] = None
+    error: Optional[DomainException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class OrderBatchResult:
+    """Resultados na mesma ordem das entradas recebidas."""
+    new_orders: List[BatchEntryResult]
+    additions: List[BatchEntryResult]
+
+
+class SubmitOrderBatchUseCase:
+    """
+    Caso de uso para o envio em lote do garçom: vários pedidos novos
+    (em uma ou mais mesas) e itens adicionados a pedidos existentes.
+
+    Equivale a vários CreateOrderUseCase / AddItemToOrderUseCase, mas:
+    - todos os produtos do lote são buscados numa única consulta;
+    - cada mesa e cada pedido é carregado uma única vez;
+    - tudo é gravado numa única transação (OrderRepositoryPort.save_all).
+
+    Cada entrada é validada pelas regras do domínio (Table.add_new_order,
+    Order.add_item). Uma entrada inválida não impede as outras: ela volta
+    com o seu erro e não é gravada.
+    """
+
+    def __init__(
+        self,
+        table_repository: TableRepositoryPort,
+        product_repository: ProductRepositoryPort,
+        order_repository: OrderRepositoryPort,
+        event_publisher: Optional[OrderEventPublisherPort] = None
+    ):
+        self.table_repository = table_repository
+        self.product_repository = product_repository
+        self.order_repository = order_repository
+        self.event_publisher = event_publisher
+
+    @retry_on_conflict
+    def execute(
+        self,
+        waiter_id: int,
+        new_orders: List[Dict[str, Any]],
+        additions: List[Dict[str, Any]]
+    ) -> OrderBatchResult:
+        """
+        Executa o lote.
+
+        Args:
+            waiter_id: O garçom que envia o lote.
+            new_orders: Pedidos novos: {"table_id": int, "items": [...]}
+            additions: Itens para pedidos existentes: {"order_id": int, "items": [...]}
+                       (cada item: {"product_id": int, "quantity": int})
+
+        Returns:
+            Um BatchEntryResult por entrada, na ordem recebida.
+
+        Raises:
+            mysql.connector.Error: Se a transação falhar (nada é gravado).
+        """
+        # 1. Carregar produtos (uma consulta), mesas e pedidos (uma vez cada)
+        products = self.product_repository.find_by_ids(_product_ids(new_orders, additions))
+        tables = {
+            table_id: self.table_repository.find_by_id(table_id)
+            for table_id in dict.fromkeys(entry.get("table_id") for entry in new_orders)
+        }
+        orders = {
+            order_id: self.order_repository.find_by_id(order_id)
+            for order_id in dict.fromkeys(entry.get("order_id") for entry in additions)
+        }
+
+        # 2. Aplicar as entradas em MEMÓRIA (regras do domínio)
+        result, created, updated = _apply_batch(
+            waiter_id, new_orders, additions, products, tables, orders
+        )
+
+        # 3. Persistir tudo numa única transação
+        self.order_repository.save_all(created + updated)
+
+        # 4. Avisar a cozinha
+        _publish(self.event_publisher, created, updated)
+        return result
+
+
+class AsyncSubmitOrderBatchUseCase:
+    """Versão assíncrona do SubmitOrderBatchUseCase (mesmas regras e resultados)."""
+
+    def __init__(
+        self,
+        table_repository: AsyncTableRepositoryPort,
+        product_repository: AsyncProductRepositoryPort,
+        order_repository: AsyncOrderRepositoryPort,
+        event_publisher: Optional[OrderEventPublisherPort] = None
+    ):
+        self.table_repository = table_repository
+        self.product_repository = product_repository
+        self.order_repository = order_repository
+        self.event_publisher = event_publisher
+
+    @retry_on_conflict
+    async def execute(
+        self,
+        waiter_id: int,
+        new_orders: List[Dict[str, Any]],
+        additions: List[Dict[str, Any]]
+    ) -> OrderBatchResult:
+        # 1. Carregar produtos (uma consulta), mesas e pedidos (uma vez cada)
+        products = await self.product_repository.find_by_ids(_product_ids(new_orders, additions))
+        tables = {}
+        for table_id in dict.fromkeys(entry.get("table_id") for entry in new_orders):
+            tables[table_id] = await self.table_repository.find_by_id(table_id)
+        orders = {}
+        for order_id in dict.fromkeys(entry.get("order_id") for entry in additions):
+            orders[order_id] = await self.order_repository.find_by_id(order_id)
+
+        # 2. Aplicar as entradas em memória e 3. persistir numa transação
+        result, created, updated = _apply_batch(
+            waiter_id, new_orders, additions, products, tables, orders
+        )
+        await self.order_repository.save_all(created + updated)
+
+        # 4. Avisar a cozinha
+        _publish(self.event_publisher, created, updated)
+        return result
+
+
+# --- Lógica comum às duas versões (sem I/O) ---
+
+def _product_ids(new_orders: List[Dict[str, Any]], additions: List[Dict[str, Any]]) -> List[int]:
+    """Todos os product_ids do lote, sem repetição."""
+    return list(dict.fromkeys(
+        item.get("product_id")
+        for entry in (*new_orders, *additions)
+        for item in entry.get("items", [])
+    ))
+
+
+def _resolve_products(items_data: List[Dict[str, Any]], products: Dict[int, Product]) -> List[tuple]:
+    """Troca os product_ids da entrada pelos Produtos: [(produto, quantidade), ...]."""
+    if not items_data:
+        raise BusinessRuleException("Nenhum item informado.")
+
+    product_ids = [item.get("product_id") for item in items_data]
+    missing_ids = [pid for pid in dict.fromkeys(product_ids) if pid not in products]
+    if missing_ids:
+        raise ProductNotFoundException(
+            f"Produto(s) {', '.join(map(str, missing_ids))} não encontrado(s)."
+        )
+
+    # Validada antes de alterar o pedido: uma entrada é aplicada inteira ou não é
+    if any(item.get("quantity", 0) <= 0 for item in items_data):
+        raise BusinessRuleException("A quantidade deve ser positiva.")
+    return [(products[item.get("product_id")], item.get("quantity")) for item in items_data]
+
+
+def _apply_batch(
+    waiter_id: int,
+    new_orders: List[Dict[str, Any]],
+    additions: List[Dict[str, Any]],
+    products: Dict[int, Product],
+    tables: Dict[int, Optional[Table]],
+    orders: Dict[int, Optional[Order]]
+):
+    """
+    Aplica as entradas aos agregados carregados.
+    Retorna (OrderBatchResult, pedidos novos, pedidos existentes alterados).
+    """
+    created: List[Order] = []
+    updated: Dict[int, Order] = {} # Um pedido pode aparecer em várias entradas
+
+    # 1. Pedidos novos
+    new_results: List[BatchEntryResult] = []
+    for entry in new_orders:
+        table_id = entry.get("table_id")
+        try:
+            table = tables.get(table_id)
+            if not table:
+                raise TableNotFoundException(f"Mesa {table_id} não encontrada.")
+
+            items = _resolve_products(entry.get("items", []), products)
+            new_order = Order(id=0, table_number=table_id, waiter_id=waiter_id)
+            try:
+                for product, quantity in items:
+                    new_order.add_item(product, quantity)
+                table.add_new_order(new_order)
+            except ValueError as e:
+                raise BusinessRuleException(str(e))
+
+            created.append(new_order)
+            new_results.append(BatchEntryResult(order=new_order))
+        except DomainException as e:
+            new_results.append(BatchEntryResult(error=e))
+
+    # 2. Itens adicionados a pedidos existentes
+    addition_results: List[BatchEntryResult] = []
+    for entry in additions:
+        order_id = entry.get("order_id")
+        try:
+            order = orders.get(order_id)
+            if not order:
+                raise OrderNotFoundException(f"Pedido {order_id} não encontrado.")
+
+            items = _resolve_products(entry.get("items", []), products)
+            try:
+                for product, quantity in items:
+                    order.add_item(product, quantity)
+            except ValueError as e:
+                raise BusinessRuleException(str(e))
+
+            updated[order.id] = order
+            addition_results.append(BatchEntryResult(order=order))
+        except DomainException as e:
+            addition_results.append(BatchEntryResult(error=e))
+
+    result = OrderBatchResult(new_orders=new_results, additions=addition_results)
+    return result, created, list(updated.values())
+
+
+def _publish(event_publisher: Optional[OrderEventPublisherPort], created: List[Order], updated: List[Order]):
+    """Publica os eventos do lote (depois do commit)."""
+    if not event_publisher:
+        return
+    for order in created:
+        event_publisher.publish(OrderEventType.CREATED, order)
+    for order in updated:
+        event_publisher.publish(OrderEventType.UPDATED, order)
@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+from mysql.connector import Error
+
+from adapters.db.async_connection_pool import AsyncConnectionPool
+from adapters.db.connection_pool import PoolExhaustedError
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class FakeAsyncConnection:
+    """Conexão assíncrona falsa: registra as chamadas feitas pelo pool."""
+
+    def __init__(self):
+        self.closed = False
+        self.alive = True
+        self.in_transaction = False
+        self.rollbacks = 0
+
+    async def ping(self, reconnect=False):
+        if not self.alive:
+            raise Error("MySQL server has gone away")
+
+    async def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def created():
+    return []
+
+
+@pytest.fixture
+def make_pool(created):
+    def factory(**kwargs):
+        async def connect(**config):
+            connection = FakeAsyncConnection()
+            created.append(connection)
+            return connection
+        options = dict(pool_size=2, max_overflow=1, checkout_timeout=0.2, health_check_seconds=0)
+        options.update(kwargs)
+        return AsyncConnectionPool({}, connection_factory=connect, **options)
+    return factory
+
+
+# ---------------------------
+# Testes
+# ---------------------------
+
+def test_connection_is_reused_after_release(make_pool, created):
+    pool = make_pool()
+
+    async def scenario():
+        async with await pool.get_connection():
+            pass
+        async with await pool.get_connection():
+            pass
+
+    asyncio.run(scenario())
+    assert len(created) == 1
+    assert pool.stats()["checkouts"] == 2
+
+
+def test_overflow_connection_is_closed_on_release(make_pool, created):
+    pool = make_pool()
+
+    async def scenario():
+        connections = [await pool.get_connection() for _ in range(3)]
+        for connection in connections:
+            await connection.close()
+
+    asyncio.run(scenario())
+    assert len(created) == 3
+    assert [c.closed for c in created].count(True) == 1
+    assert pool.stats()["open"] == 2
+
+
+def test_waiter_gets_connection_released_by_another_task(make_pool, created):
+    pool = make_pool(pool_size=1, max_overflow=0, checkout_timeout=1.0)
+
+    async def scenario():
+        held = await pool.get_connection()
+
+        async def release_later():
+            await asyncio.sleep(0.05)
+            await held.close()
+
+        asyncio.get_running_loop().create_task(release_later())
+        async with await pool.get_connection():
+            pass
+
+    asyncio.run(scenario())
+    assert len(created) == 1
+    assert pool.stats()["wait_time_max_ms"] > 0
+
+
+def test_exhausted_pool_raises_after_timeout(make_pool):
+    pool = make_pool(pool_size=1, max_overflow=0, checkout_timeout=0.05)
+
+    async def scenario():
+        async with await pool.get_connection():
+            with pytest.raises(PoolExhaustedError):
+                await pool.get_connection()
+
+    asyncio.run(scenario())
+    assert pool.stats()["exhausted"] == 1
+
+
+def test_open_transaction_is_rolled_back_on_release(make_pool, created):
+    pool = make_pool()
+
+    async def scenario():
+        async with await pool.get_connection():
+            created[0].in_transaction = True
+
+    asyncio.run(scenario())
+    assert created[0].rollbacks == 1
+    assert pool.stats()["idle"] == 1
+
+
+def test_dead_idle_connection_is_replaced(make_pool, created):
+    pool = make_pool()
+
+    async def scenario():
+        async with await pool.get_connection():
+            pass
+        created[0].alive = False
+        async with await pool.get_connection():
+            pass
+
+    asyncio.run(scenario())
+    assert len(created) == 2
+    assert created[0].closed
+    assert pool.stats()["health_check_failures"] == 1
@@ -0,0 +1,152 @@
+import dataclasses
+
+import pytest
+
+import adapters.db.cached_product_repository as cached_module
+from adapters.db.cached_product_repository import CachedProductRepository
+from domain.models import Product
+from domain.ports.product_repository import ProductRepositoryPort
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class InMemoryProductRepository(ProductRepositoryPort):
+    """Repositório em memória que conta as cargas do cardápio."""
+
+    def __init__(self, products):
+        self.products = {p.id: p for p in products}
+        self.get_all_calls = 0
+        self.find_by_ids_calls = []
+
+    def _copy(self, product):
+        return dataclasses.replace(product)
+
+    def get_visible_products(self):
+        return [self._copy(p) for p in self.products.values() if p.visibility]
+
+    def find_by_id(self, product_id):
+        product = self.products.get(product_id)
+        return self._copy(product) if product else None
+
+    def find_by_ids(self, product_ids):
+        self.find_by_ids_calls.append(list(product_ids))
+        return {i: self._copy(self.products[i]) for i in product_ids if i in self.products}
+
+    def get_all(self):
+        self.get_all_calls += 1
+        return [self._copy(p) for p in self.products.values()]
+
+    def save(self, product):
+        if product.id == 0:
+            product.id = max(self.products, default=0) + 1
+        self.products[product.id] = self._copy(product)
+        return product
+
+    def iter_all(self, batch_size=500):
+        return iter(self.get_all())
+
+    def upsert_batch(self, products):
+        for product in products:
+            self.save(product)
+        return len(products), 0, 0
+
+
+def _product(product_id, name, visibility=True):
+    return Product(id=product_id, name=name, price=39.9, availability=True,
+                   category="pizza", imageUrl="", visibility=visibility)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cached_module.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def inner():
+    return InMemoryProductRepository([_product(1, "Mussarela"), _product(2, "Oculta", visibility=False)])
+
+
+@pytest.fixture
+def repo(inner, clock):
+    return CachedProductRepository(inner, ttl_seconds=60)
+
+
+# ---------------------------
+# Testes do cache
+# ---------------------------
+
+def test_all_reads_are_served_from_one_load(repo, inner):
+    assert [p.name for p in repo.get_visible_products()] == ["Mussarela"]
+    assert len(repo.get_all()) == 2
+    assert repo.find_by_id(2).name == "Oculta"
+
+    assert inner.get_all_calls == 1
+    assert repo.stats()["hits"] == 2
+    assert repo.stats()["misses"] == 1
+    assert repo.stats()["cached_products"] == 2
+
+
+def test_snapshot_expires_after_ttl(repo, inner, clock):
+    repo.get_all()
+
+    clock.now += 59
+    repo.get_all()
+    assert inner.get_all_calls == 1
+
+    clock.now += 2 # Passou dos 60s
+    repo.get_all()
+    assert inner.get_all_calls == 2
+    assert repo.stats()["misses"] == 2
+
+
+def test_save_invalidates_snapshot(repo, inner):
+    product = repo.find_by_id(1)
+    product.name = "Mussarela Grande"
+
+    repo.save(product)
+
+    assert repo.find_by_id(1).name == "Mussarela Grande"
+    assert inner.get_all_calls == 2
+    assert repo.stats()["invalidations"] == 1
+
+
+def test_mutating_returned_products_does_not_corrupt_snapshot(repo):
+    repo.find_by_id(1).price = 0.0 # Ex: UpdateProductUseCase antes do save
+    repo.get_all()[0].name = "Alterado"
+    repo.get_visible_products()[0].visibility = False
+    repo.find_by_ids([1])[1].availability = False
+
+    cached = repo.find_by_id(1)
+    assert (cached.name, cached.price, cached.visibility, cached.availability) == ("Mussarela", 39.9, True, True)
+
+
+def test_find_by_ids_only_queries_products_missing_from_snapshot(repo, inner):
+    repo.get_all()
+    inner.products[3] = _product(3, "Nova") # Criado por outro processo
+
+    products = repo.find_by_ids([1, 3, 99])
+
+    assert sorted(products) == [1, 3]
+    assert inner.find_by_ids_calls == [[3, 99]]
+
+
+def test_empty_load_is_not_cached(inner, clock):
+    inner.products.clear() # Ex: o repositório MySQL devolve [] se o banco cair
+    repo = CachedProductRepository(inner, ttl_seconds=60)
+
+    repo.get_all()
+    repo.get_all()
+
+    assert inner.get_all_calls == 2
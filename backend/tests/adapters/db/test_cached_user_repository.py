@@ -0,0 +1,93 @@
+import pytest
+
+from adapters.db.cached_user_repository import CachedUserRepository
+from domain.models import User, UserRole
+from domain.ports.user_repository import UserRepositoryPort
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class InMemoryUserRepository(UserRepositoryPort):
+    """Repositório em memória que conta as leituras por ID."""
+
+    def __init__(self, users):
+        self.users = {u.id: u for u in users}
+        self.find_by_id_calls = 0
+
+    def find_by_id(self, user_id):
+        self.find_by_id_calls += 1
+        user = self.users.get(user_id)
+        return User(**vars(user)) if user else None
+
+    def find_by_username(self, username):
+        return next((u for u in self.users.values() if u.username == username), None)
+
+    def save(self, user):
+        self.users[user.id] = User(**vars(user))
+        return user
+
+    def find_existing_usernames(self, usernames):
+        return {u.username for u in self.users.values() if u.username in usernames}
+
+    def insert_batch(self, users):
+        for user in users:
+            user.id = max(self.users, default=0) + 1
+            self.save(user)
+        return users
+
+
+@pytest.fixture
+def inner():
+    return InMemoryUserRepository([
+        User(id=1, username="admin", name="Admin", hashed_password="h", roles=[UserRole.ADMIN])
+    ])
+
+
+@pytest.fixture
+def repo(inner):
+    return CachedUserRepository(inner, ttl_seconds=60)
+
+
+# ---------------------------
+# Testes do cache
+# ---------------------------
+
+def test_find_by_id_reads_database_once(repo, inner):
+    assert repo.find_by_id(1).is_admin()
+    assert repo.find_by_id(1).is_admin()
+    assert inner.find_by_id_calls == 1
+    assert repo.stats()["hits"] == 1
+
+
+def test_returned_user_is_a_copy(repo):
+    user = repo.find_by_id(1)
+    user.hashed_password = ""  # Ex: GetAuthenticatedUserUseCase
+    user.roles.append(UserRole.WAITER)
+
+    cached = repo.find_by_id(1)
+    assert cached.hashed_password == "h"
+    assert cached.roles == [UserRole.ADMIN]
+
+
+def test_save_invalidates_user(repo, inner):
+    user = repo.find_by_id(1)
+    user.roles = [UserRole.WAITER]
+    repo.save(user)
+
+    assert not repo.find_by_id(1).is_admin()
+    assert inner.find_by_id_calls == 2
+
+
+def test_missing_user_is_not_cached(repo, inner):
+    assert repo.find_by_id(99) is None
+    assert repo.find_by_id(99) is None
+    assert inner.find_by_id_calls == 2
+
+
+def test_expired_entry_is_reloaded(inner):
+    repo = CachedUserRepository(inner, ttl_seconds=0)
+    repo.find_by_id(1)
+    repo.find_by_id(1)
+    assert inner.find_by_id_calls == 2
@@ -0,0 +1,159 @@
+import threading
+
+import pytest
+from mysql.connector import Error
+
+from adapters.db.connection_pool import ConnectionPool, PoolExhaustedError
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class FakeConnection:
+    """Conexão falsa: registra as chamadas feitas pelo pool."""
+
+    def __init__(self):
+        self.closed = False
+        self.alive = True
+        self.in_transaction = False
+        self.rollbacks = 0
+        self.pings = 0
+
+    def ping(self, reconnect=False):
+        self.pings += 1
+        if not self.alive:
+            raise Error("MySQL server has gone away")
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def created():
+    return []
+
+
+@pytest.fixture
+def make_pool(created):
+    def factory(**kwargs):
+        def connect(**config):
+            connection = FakeConnection()
+            created.append(connection)
+            return connection
+        options = dict(pool_size=2, max_overflow=1, checkout_timeout=0.2, health_check_seconds=0)
+        options.update(kwargs)
+        return ConnectionPool({}, connection_factory=connect, **options)
+    return factory
+
+
+# ---------------------------
+# Testes de criação e reuso
+# ---------------------------
+
+def test_pool_is_lazy(make_pool, created):
+    pool = make_pool()
+    assert created == []
+    assert pool.stats()["open"] == 0
+
+
+def test_connection_is_reused_after_release(make_pool, created):
+    pool = make_pool()
+    with pool.get_connection():
+        pass
+    with pool.get_connection():
+        pass
+
+    assert len(created) == 1
+    assert pool.stats()["checkouts"] == 2
+    assert pool.stats()["idle"] == 1
+
+
+def test_release_rolls_back_open_transaction(make_pool, created):
+    pool = make_pool()
+    with pool.get_connection():
+        created[0].in_transaction = True  # Transação esquecida aberta
+
+    assert created[0].rollbacks == 1
+
+
+def test_overflow_connection_is_closed_on_release(make_pool, created):
+    pool = make_pool()
+    connections = [pool.get_connection() for _ in range(3)]
+    assert pool.stats()["in_use"] == 3
+
+    for connection in connections:
+        connection.close()
+
+    assert sum(c.closed for c in created) == 1
+    assert pool.stats()["open"] == 2
+
+
+# ---------------------------
+# Testes de espera e esgotamento
+# ---------------------------
+
+def test_checkout_times_out_when_exhausted(make_pool):
+    pool = make_pool(pool_size=1, max_overflow=0, checkout_timeout=0.05)
+    with pool.get_connection():
+        with pytest.raises(PoolExhaustedError):
+            pool.get_connection()
+
+    assert pool.stats()["exhausted"] == 1
+
+
+def test_checkout_waits_for_released_connection(make_pool):
+    pool = make_pool(pool_size=1, max_overflow=0, checkout_timeout=2)
+    first = pool.get_connection()
+    threading.Timer(0.05, first.close).start()
+
+    with pool.get_connection():
+        pass
+
+    assert pool.stats()["exhausted"] == 0
+    assert pool.stats()["wait_time_max_ms"] > 0
+
+
+# ---------------------------
+# Testes de health check
+# ---------------------------
+
+def test_dead_idle_connection_is_replaced(make_pool, created):
+    pool = make_pool()
+    with pool.get_connection():
+        pass
+    created[0].alive = False
+
+    with pool.get_connection():
+        pass
+
+    assert len(created) == 2
+    assert created[0].closed
+    assert pool.stats()["health_check_failures"] == 1
+
+
+def test_recently_used_connection_skips_ping(make_pool, created):
+    pool = make_pool(health_check_seconds=60)
+    with pool.get_connection():
+        pass
+    with pool.get_connection():
+        pass
+
+    assert created[0].pings == 0
+
+
+def test_failed_connect_frees_the_slot():
+    def connect(**config):
+        raise Error("Can't connect to MySQL server")
+
+    pool = ConnectionPool({}, pool_size=1, max_overflow=0, connection_factory=connect)
+    for _ in range(2):
+        with pytest.raises(Error):
+            pool.get_connection()
+
+    assert pool.stats()["open"] == 0
+    assert pool.stats()["in_use"] == 0
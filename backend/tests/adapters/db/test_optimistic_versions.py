@@ -0,0 +1,178 @@
+import pytest
+
+from domain.models import Order, Product, Table, TableStatus
+from domain.exceptions import ConcurrencyConflictException
+from adapters.db.order_repository import MySQLOrderRepository, UPDATE_ORDER, CLAIM_TABLE_SESSION
+from adapters.db.table_repository import MySQLTableRepository, UPDATE_TABLE
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class FakeCursor:
+    """Cursor falso: registra o SQL e responde 'rowcount' conforme 'matches'."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = 0
+        self.lastrowid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=()):
+        self.connection.statements.append((query, params))
+        self.rowcount = self.connection.matches.get(query, 1)
+        self.lastrowid = 42
+
+    def executemany(self, query, rows):
+        self.connection.statements.append((query, list(rows)))
+
+
+class FakeConnection:
+    def __init__(self, matches):
+        self.matches = matches # { consulta -> linhas alteradas } (padrão: 1)
+        self.statements = []
+        self.committed = False
+        self.rolled_back = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def start_transaction(self):
+        pass
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+class FakePool:
+    def __init__(self, **matches):
+        self.connection = FakeConnection({globals()[name]: rows for name, rows in matches.items()})
+
+    def get_connection(self):
+        return self.connection
+
+
+def _repository(cls, **matches):
+    repo = cls.__new__(cls) # Sem o pool global
+    repo.pool = repo.read_pool = FakePool(**matches)
+    return repo, repo.pool.connection
+
+
+def _loaded_order(version=3):
+    order = Order(id=7, table_number=1, waiter_id=1, version=version)
+    order.add_item(Product(id=1, name="Suco", price=8.0, availability=True,
+                           category="Bebidas", imageUrl="", visibility=True), 1)
+    order.mark_as_persisted()
+    return order
+
+
+# ---------------------------
+# Pedidos
+# ---------------------------
+
+def test_order_update_checks_and_bumps_version():
+    repo, connection = _repository(MySQLOrderRepository)
+    order = _loaded_order()
+    order.mark_as_in_progress()
+
+    repo.save(order)
+
+    assert (UPDATE_ORDER, (1, "in_progress", 7, 3)) in connection.statements
+    assert order.version == 4
+
+
+def test_item_only_change_is_versioned_too():
+    repo, connection = _repository(MySQLOrderRepository)
+    order = _loaded_order()
+    order.add_item(order.items[0].product, 1)
+
+    repo.save(order)
+
+    assert connection.statements[0] == (UPDATE_ORDER, (1, "pending", 7, 3))
+    assert order.version == 4
+
+
+def test_stale_order_raises_conflict_and_rolls_back():
+    repo, connection = _repository(MySQLOrderRepository, UPDATE_ORDER=0)
+    order = _loaded_order()
+    order.add_item(order.items[0].product, 1)
+
+    with pytest.raises(ConcurrencyConflictException):
+        repo.save(order)
+
+    assert connection.rolled_back and not connection.committed
+    assert len(connection.statements) == 1 # Nenhum item gravado
+    assert order.version == 3
+
+
+def test_unchanged_order_writes_nothing():
+    repo, connection = _repository(MySQLOrderRepository)
+
+    repo.save(_loaded_order())
+
+    assert connection.statements == []
+
+
+def test_new_order_requires_open_table_session():
+    repo, connection = _repository(MySQLOrderRepository, CLAIM_TABLE_SESSION=0)
+    order = Order(id=0, table_number=1, waiter_id=1, session_id=5)
+
+    with pytest.raises(ConcurrencyConflictException):
+        repo.save(order)
+
+    assert connection.statements == [(CLAIM_TABLE_SESSION, (1, 5))]
+    assert order.id == 0
+
+
+def test_batch_conflict_undoes_generated_ids():
+    repo, connection = _repository(MySQLOrderRepository, UPDATE_ORDER=0)
+    new_order = Order(id=0, table_number=1, waiter_id=1, session_id=5)
+    stale = _loaded_order()
+    stale.add_item(stale.items[0].product, 1)
+
+    with pytest.raises(ConcurrencyConflictException):
+        repo.save_all([new_order, stale])
+
+    assert new_order.id == 0
+    assert connection.rolled_back
+
+
+# ---------------------------
+# Mesas
+# ---------------------------
+
+def test_table_update_checks_and_bumps_version():
+    repo, connection = _repository(MySQLTableRepository)
+    table = Table(id=1, status=TableStatus.OCCUPIED, number_of_people=2, session_id=5, version=8)
+
+    repo.save(table)
+
+    assert (UPDATE_TABLE, ("occupied", 2, 5, 1, 8)) in connection.statements
+    assert table.version == 9
+
+
+def test_stale_table_raises_conflict_and_forgets_new_session():
+    repo, connection = _repository(MySQLTableRepository, UPDATE_TABLE=0)
+    table = Table(id=1, version=8)
+    table.open_table(2) # Outro garçom abriu a mesa antes
+
+    with pytest.raises(ConcurrencyConflictException):
+        repo.save(table)
+
+    assert connection.rolled_back
+    assert table.session_id is None and table.version == 8
@@ -0,0 +1,221 @@
+import asyncio
+
+import pytest
+
+from domain.models import Table, TableStatus
+from domain.exceptions import ConcurrencyConflictException
+from adapters.db.table_repository import MySQLTableRepository, CLOSE_TABLE_SESSION, UPDATE_TABLE
+from adapters.db.async_table_repository import AsyncMySQLTableRepository
+from adapters.db.version_counter import BUMP_DATASET_VERSION
+from adapters.db.order_archive import (
+    OrderArchiver,
+    ARCHIVE_SESSION_ORDERS, ARCHIVE_SESSION_ITEMS, DELETE_SESSION_ORDERS,
+    QUERY_ARCHIVABLE_ORDER_IDS, DELETE_ORDERS_BY_IDS
+)
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class FakeCursor:
+    """
+    Cursor falso: registra o SQL; 'archivable' são os IDs que o
+    QUERY_ARCHIVABLE_ORDER_IDS encontra (e que somem ao serem apagados).
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = 0
+        self.lastrowid = None
+        self.result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=()):
+        connection = self.connection
+        connection.statements.append((query, tuple(params)))
+        self.rowcount = connection.matches.get(query, len(params))
+        if query == QUERY_ARCHIVABLE_ORDER_IDS:
+            after_id, limit = params
+            self.result = [(order_id,) for order_id in connection.archivable if order_id > after_id][:limit]
+        elif query.startswith("DELETE FROM orders"):
+            connection.pending_deletes.update(params)
+
+    def fetchall(self):
+        return self.result
+
+
+class FakeConnection:
+    def __init__(self, matches=None, archivable=()):
+        self.matches = matches or {}
+        self.archivable = list(archivable)
+        self.pending_deletes = set()
+        self.statements = []
+        self.commits = 0
+        self.rolled_back = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def start_transaction(self):
+        self.pending_deletes = set()
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+        self.archivable = [order_id for order_id in self.archivable if order_id not in self.pending_deletes]
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+class FakePool:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def get_connection(self):
+        return self.connection
+
+
+def _table_repository(**matches):
+    repo = MySQLTableRepository.__new__(MySQLTableRepository) # Sem o pool global
+    connection = FakeConnection(matches)
+    repo.pool = repo.read_pool = FakePool(connection)
+    return repo, connection
+
+
+def _occupied_table():
+    return Table(id=3, status=TableStatus.OCCUPIED, number_of_people=2, session_id=11, version=5)
+
+
+def _queries(connection):
+    return [query for query, _ in connection.statements]
+
+
+# ---------------------------
+# Fechamento da mesa
+# ---------------------------
+
+def test_closing_table_archives_session_orders_in_the_same_transaction():
+    repo, connection = _table_repository()
+    table = _occupied_table()
+    table.close_table()
+
+    repo.save(table)
+
+    assert _queries(connection) == [
+        ARCHIVE_SESSION_ORDERS, ARCHIVE_SESSION_ITEMS, DELETE_SESSION_ORDERS,
+        CLOSE_TABLE_SESSION, UPDATE_TABLE, BUMP_DATASET_VERSION
+    ]
+    assert all(params == (3,) for _, params in connection.statements[:4])
+    assert connection.commits == 1
+
+
+def test_opening_table_archives_nothing():
+    repo, connection = _table_repository()
+    table = Table(id=3)
+    table.open_table(2)
+
+    repo.save(table)
+
+    assert ARCHIVE_SESSION_ORDERS not in _queries(connection)
+
+
+def test_conflict_on_close_rolls_back_the_archive():
+    repo, connection = _table_repository(**{UPDATE_TABLE: 0})
+    table = _occupied_table()
+    table.close_table()
+
+    with pytest.raises(ConcurrencyConflictException):
+        repo.save(table)
+
+    assert connection.rolled_back and connection.commits == 0
+
+
+class FakeAsyncCursor(FakeCursor):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=()):
+        super().execute(query, params)
+
+
+class FakeAsyncConnection(FakeConnection):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def start_transaction(self):
+        super().start_transaction()
+
+    async def cursor(self, *args, **kwargs):
+        return FakeAsyncCursor(self)
+
+    async def commit(self):
+        super().commit()
+
+    async def rollback(self):
+        super().rollback()
+
+
+class FakeAsyncPool(FakePool):
+    async def get_connection(self):
+        return self.connection
+
+
+def test_async_close_archives_too():
+    connection = FakeAsyncConnection()
+    repo = AsyncMySQLTableRepository(FakeAsyncPool(connection))
+    table = _occupied_table()
+    table.close_table()
+
+    asyncio.run(repo.save(table))
+
+    assert _queries(connection)[:4] == [
+        ARCHIVE_SESSION_ORDERS, ARCHIVE_SESSION_ITEMS, DELETE_SESSION_ORDERS, CLOSE_TABLE_SESSION
+    ]
+
+
+# ---------------------------
+# Back-fill
+# ---------------------------
+
+def test_backfill_moves_history_in_small_transactions():
+    connection = FakeConnection(archivable=range(1, 8))
+    pauses, progress = [], []
+    archiver = OrderArchiver(FakePool(connection), sleep=pauses.append)
+
+    total = archiver.backfill(batch_size=3, pause_seconds=0.5,
+                              on_batch=lambda moved, total: progress.append(total))
+
+    assert total == 7
+    assert progress == [3, 6, 7]
+    assert connection.commits == 3 # Um lote por transação
+    assert pauses == [0.5] * 3
+    deletes = [params for query, params in connection.statements if query.startswith("DELETE")]
+    assert deletes == [(1, 2, 3), (4, 5, 6), (7,)]
+    assert DELETE_ORDERS_BY_IDS.format(placeholders="%s") in _queries(connection)
+
+
+def test_backfill_continues_after_the_last_batch_id():
+    connection = FakeConnection(archivable=[10, 20, 30])
+    archiver = OrderArchiver(FakePool(connection), sleep=lambda seconds: None)
+
+    assert archiver.archive_batch(after_id=0, batch_size=2) == (2, 20)
+    assert archiver.archive_batch(after_id=20, batch_size=2) == (1, 30)
+    assert archiver.archive_batch(after_id=30, batch_size=2) == (0, None)
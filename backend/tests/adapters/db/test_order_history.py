@@ -0,0 +1,167 @@
+from datetime import datetime
+
+import pytest
+
+from domain.models import OrderHistoryFilter, OrderHistoryCursor, OrderStatus, User, UserRole
+from domain.exceptions import BusinessRuleException
+from domain.use_cases.admin import SearchOrderHistoryUseCase
+from domain.use_cases.admin.search_order_history_use_case import MAX_HISTORY_PAGE_SIZE
+from adapters.db.order_repository import MySQLOrderRepository, history_query, QUERY_HISTORY_ITEMS_BY_ORDERS
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class FakeCursor:
+    """Responde a consulta do histórico com 'order_rows' e a dos itens com 'item_rows'."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=()):
+        self.connection.statements.append((query, params))
+        if "FROM order_items" in query:
+            self.result = self.connection.item_rows
+        else:
+            self.result = self.connection.order_rows[:params[-1]] # LIMIT
+
+    def fetchall(self):
+        return self.result
+
+
+class FakeConnection:
+    def __init__(self, order_rows, item_rows):
+        self.order_rows = order_rows
+        self.item_rows = item_rows
+        self.statements = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+
+class FakePool:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def get_connection(self):
+        return self.connection
+
+
+def _order_row(order_id, day):
+    return {"id": order_id, "table_number": 1, "waiter_id": 2, "status": "completed",
+            "created_at": datetime(2025, 1, day, 20, 0), "session_id": 1, "version": 0}
+
+
+def _repository(order_rows, item_rows=()):
+    repo = MySQLOrderRepository.__new__(MySQLOrderRepository) # Sem o pool global
+    connection = FakeConnection(order_rows, list(item_rows))
+    repo.pool = repo.read_pool = FakePool(connection)
+    return repo, connection
+
+
+# ---------------------------
+# Consulta
+# ---------------------------
+
+def test_history_query_without_filters_only_limits():
+    query, params = history_query(OrderHistoryFilter(), None, 50)
+
+    assert "WHERE TRUE" in query
+    assert "ORDER BY created_at DESC, id DESC" in query
+    assert "OFFSET" not in query
+    assert "FROM orders_archive" in query # Pedidos de sessões encerradas
+    assert params == (51, 51, 51) # Uma linha a mais: há próxima página?
+
+
+def test_history_query_combines_filters_and_keyset():
+    filters = OrderHistoryFilter(
+        date_from=datetime(2025, 1, 1), date_to=datetime(2026, 1, 1),
+        table_id=4, waiter_id=2, status=OrderStatus.COMPLETED
+    )
+    after = OrderHistoryCursor(created_at=datetime(2025, 6, 1, 12, 0), id=900)
+
+    query, params = history_query(filters, after, 20)
+
+    assert "created_at >= %s AND created_at < %s AND table_number = %s" in query
+    assert "(created_at < %s OR (created_at = %s AND id < %s))" in query
+    side = (datetime(2025, 1, 1), datetime(2026, 1, 1), 4, 2, "completed",
+            after.created_at, after.created_at, 900, 21)
+    assert params == side + side + (21,) # Ativos, arquivados e o limite final
+
+
+# ---------------------------
+# Páginas
+# ---------------------------
+
+def test_find_history_returns_page_and_next_cursor():
+    rows = [_order_row(30, 3), _order_row(20, 2), _order_row(10, 1)]
+    items = [{"order_id": 30, "quantity": 2, "product_id": 5, "product_name": "Suco",
+              "product_price": 8.0, "product_availability": 1, "product_category": "Bebidas",
+              "product_imageUrl": "", "product_visibility": 1}]
+    repo, connection = _repository(rows, items)
+
+    page = repo.find_history(OrderHistoryFilter(), None, limit=2)
+
+    assert [order.id for order in page.orders] == [30, 20]
+    assert page.orders[0].total_price == 16.0
+    assert page.next_cursor == OrderHistoryCursor(created_at=datetime(2025, 1, 2, 20, 0), id=20)
+    # Itens da página inteira (ativos ou arquivados) numa única consulta
+    assert connection.statements[1] == (
+        QUERY_HISTORY_ITEMS_BY_ORDERS.format(placeholders="%s,%s"), (30, 20, 30, 20)
+    )
+
+
+def test_last_page_has_no_cursor():
+    repo, _ = _repository([_order_row(10, 1)])
+
+    page = repo.find_history(OrderHistoryFilter(), None, limit=2)
+
+    assert [order.id for order in page.orders] == [10]
+    assert page.next_cursor is None
+
+
+def test_empty_history_skips_items_query():
+    repo, connection = _repository([])
+
+    page = repo.find_history(OrderHistoryFilter(table_id=9), None, limit=50)
+
+    assert page.orders == [] and page.next_cursor is None
+    assert len(connection.statements) == 1
+
+
+# ---------------------------
+# Caso de uso
+# ---------------------------
+
+class FakeUserRepository:
+    def __init__(self, roles):
+        self.user = User(id=1, username="ana", name="Ana", hashed_password="-", roles=roles)
+
+    def find_by_id(self, user_id):
+        return self.user
+
+
+def test_use_case_requires_admin_and_caps_page_size():
+    repo, connection = _repository([])
+
+    with pytest.raises(BusinessRuleException):
+        SearchOrderHistoryUseCase(repo, FakeUserRepository([UserRole.WAITER])).execute(1, OrderHistoryFilter())
+
+    SearchOrderHistoryUseCase(repo, FakeUserRepository([UserRole.ADMIN])).execute(
+        1, OrderHistoryFilter(), limit=10_000
+    )
+    assert connection.statements[-1][1][-1] == MAX_HISTORY_PAGE_SIZE + 1
@@ -0,0 +1,213 @@
+import asyncio
+
+import pytest
+from mysql.connector import Error
+
+from adapters.db.async_connection_pool import AsyncConnectionPool
+from adapters.db.connection_pool import ConnectionPool, TimedCursor, register_prepared
+
+QUERY_HOT = "SELECT id, name FROM products WHERE id = %s"
+INSERT_HOT = "INSERT INTO products (name) VALUES (%s)"
+QUERY_COLD = "SELECT id FROM products WHERE id IN (%s,%s)"
+
+register_prepared(QUERY_HOT, INSERT_HOT)
+
+
+class FakeCursor:
+    """Cursor falso: 'prepared' conta os prepares (o conector compara o texto por identidade)."""
+
+    def __init__(self, connection, prepared):
+        self.connection = connection
+        self.prepared = prepared
+        self.executed = None
+        self.rows = []
+        self.with_rows = False
+        self.lastrowid = None
+        self.closed = False
+
+    def execute(self, query, params=()):
+        if self.prepared and query is not self.executed:
+            self.connection.prepares.append(query)
+        self.executed = query
+        self.connection.executions.append(("prepared" if self.prepared else "texto", query))
+        self.with_rows = query.startswith("SELECT")
+        self.rows = [{"id": params[0], "name": "Mussarela"}] if self.with_rows else []
+        self.lastrowid = None if self.with_rows else 77
+
+    def executemany(self, query, params):
+        self.connection.executions.append(("texto-many", query))
+
+    def fetchone(self):
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self):
+        self.prepares = []
+        self.executions = []
+        self.cursors = []
+        self.in_transaction = False
+        self.closed = False
+        self.alive = True
+
+    def cursor(self, prepared=False, dictionary=False):
+        cursor = FakeCursor(self, prepared)
+        self.cursors.append(cursor)
+        return cursor
+
+    def ping(self, reconnect=False):
+        if not self.alive:
+            raise Error("MySQL server has gone away")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def created():
+    return []
+
+
+@pytest.fixture
+def make_pool(created):
+    def factory(**kwargs):
+        def connect(**config):
+            connection = FakeConnection()
+            created.append(connection)
+            return connection
+        options = dict(pool_size=1, max_overflow=0, checkout_timeout=0.2, health_check_seconds=60)
+        options.update(kwargs)
+        return ConnectionPool({}, connection_factory=connect, **options)
+    return factory
+
+
+def _lookup(pool, query, product_id):
+    with pool.get_connection() as connection:
+        with connection.cursor(dictionary=True) as cursor:
+            cursor.execute(query, (product_id,))
+            return cursor.fetchone()
+
+
+def test_registered_query_is_prepared_once_per_connection(make_pool, created):
+    pool = make_pool()
+
+    rows = [_lookup(pool, QUERY_HOT, product_id) for product_id in (1, 2, 3)]
+
+    assert [row["id"] for row in rows] == [1, 2, 3]
+    assert created[0].prepares == [QUERY_HOT] # Nos 3 requests, um prepare só
+    assert pool.stats()["prepared_statements"] == 1
+
+
+def test_equal_text_reuses_the_statement(make_pool, created):
+    pool = make_pool()
+    _lookup(pool, QUERY_HOT, 1)
+
+    _lookup(pool, "".join(QUERY_HOT), 2) # Mesmo texto, outro objeto
+
+    assert created[0].prepares == [QUERY_HOT]
+
+
+def test_unregistered_queries_and_executemany_use_the_text_cursor(make_pool, created):
+    pool = make_pool()
+
+    with pool.get_connection() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(QUERY_COLD, (1, 2))
+            cursor.executemany(INSERT_HOT, [("a",), ("b",)])
+            cursor.execute(INSERT_HOT, ("c",))
+            assert cursor.lastrowid == 77 # Do cursor preparado
+
+    assert created[0].executions == [
+        ("texto", QUERY_COLD), ("texto-many", INSERT_HOT), ("prepared", INSERT_HOT)
+    ]
+
+
+def test_prepared_rows_are_read_at_once_and_cursor_stays_open(make_pool, created):
+    pool = make_pool()
+
+    with pool.get_connection() as connection:
+        with connection.cursor(dictionary=True) as cursor:
+            cursor.execute(QUERY_HOT, (5,))
+            prepared_cursor = created[0].cursors[-1]
+            assert prepared_cursor.rows == [] # Nada pendente na conexão
+            assert cursor.fetchall() == [{"id": 5, "name": "Mussarela"}]
+            assert cursor.fetchone() is None
+
+    text_cursor, prepared_cursor = created[0].cursors
+    assert text_cursor.closed and not prepared_cursor.closed
+
+
+def test_closed_connection_drops_its_statements(make_pool, created):
+    pool = make_pool(health_check_seconds=0)
+    _lookup(pool, QUERY_HOT, 1)
+    created[0].alive = False
+
+    _lookup(pool, QUERY_HOT, 2) # A conexão morta é trocada por outra
+
+    assert created[0].closed
+    assert created[1].prepares == [QUERY_HOT]
+    assert pool.stats()["prepared_statements"] == 1
+
+
+def test_disabled_pool_sends_everything_as_text(make_pool, created):
+    pool = make_pool(prepared_statements=False)
+
+    with pool.get_connection() as connection:
+        cursor = connection.cursor(dictionary=True)
+        assert type(cursor) is TimedCursor
+        cursor.execute(QUERY_HOT, (1,))
+
+    assert created[0].prepares == []
+    assert pool.stats()["prepared_statements"] == 0
+
+
+def test_async_pool_prepares_once_per_connection():
+    connection = FakeConnection()
+
+    class AsyncFakeCursor:
+        def __init__(self, cursor):
+            self._cursor = cursor
+
+        def __getattr__(self, name):
+            return getattr(self._cursor, name)
+
+        async def execute(self, *args):
+            self._cursor.execute(*args)
+
+        async def fetchall(self):
+            return self._cursor.fetchall()
+
+        async def close(self):
+            self._cursor.close()
+
+    class AsyncFakeConnection:
+        in_transaction = False
+
+        async def cursor(self, prepared=False, dictionary=False):
+            return AsyncFakeCursor(connection.cursor(prepared, dictionary))
+
+    async def connect(**config):
+        return AsyncFakeConnection()
+
+    pool = AsyncConnectionPool({}, pool_size=1, max_overflow=0, connection_factory=connect)
+
+    async def lookup(product_id):
+        async with await pool.get_connection() as pooled:
+            async with await pooled.cursor(dictionary=True) as cursor:
+                await cursor.execute(QUERY_HOT, (product_id,))
+                return await cursor.fetchone()
+
+    async def scenario():
+        return [await lookup(product_id) for product_id in (1, 2)]
+
+    rows = asyncio.run(scenario())
+
+    assert [row["id"] for row in rows] == [1, 2]
+    assert connection.prepares == [QUERY_HOT]
@@ -0,0 +1,87 @@
+from adapters.db.product_repository import MySQLProductRepository, QUERY_PRODUCTS_BY_IDS
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class FakeCursor:
+    """Devolve as linhas cujo ID está nos parâmetros do IN (...)."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=()):
+        self.connection.statements.append((query, params))
+        self.result = [row for row in self.connection.rows if row["id"] in params]
+
+    def fetchall(self):
+        return self.result
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+
+class FakePool:
+    def __init__(self, connection):
+        self.connection = connection
+        self.checkouts = 0
+
+    def get_connection(self):
+        self.checkouts += 1
+        return self.connection
+
+
+def _row(product_id):
+    return {"id": product_id, "name": f"Produto {product_id}", "price": "12.50", "availability": 1,
+            "category": "pizza", "imageUrl": "", "visibility": 1}
+
+
+def _repository(rows):
+    repo = MySQLProductRepository.__new__(MySQLProductRepository) # Sem o pool global
+    connection = FakeConnection(rows)
+    repo.pool = repo.read_pool = FakePool(connection)
+    return repo, connection
+
+
+# ---------------------------
+# Testes
+# ---------------------------
+
+def test_find_by_ids_uses_a_single_in_query_without_duplicates():
+    repo, connection = _repository([_row(1), _row(2), _row(3)])
+
+    products = repo.find_by_ids([3, 1, 3, 99])
+
+    assert connection.statements == [
+        (QUERY_PRODUCTS_BY_IDS.format(placeholders="%s,%s,%s"), (3, 1, 99))
+    ]
+    assert sorted(products) == [1, 3]
+    assert products[3].price == 12.5 and products[3].availability is True
+
+
+def test_find_by_ids_with_empty_list_does_not_touch_the_database():
+    repo, connection = _repository([_row(1)])
+
+    assert repo.find_by_ids([]) == {}
+    assert repo.read_pool.checkouts == 0
+    assert connection.statements == []
@@ -0,0 +1,157 @@
+import pytest
+from mysql.connector import Error
+
+from domain.models import Product
+from adapters.db.product_repository import (
+    MySQLProductRepository,
+    QUERY_PRODUCTS_PAGE,
+    UPSERT_PRODUCT,
+    diff_products
+)
+from adapters.db.version_counter import BUMP_DATASET_VERSION, MENU_DATASET
+
+
+def _product(product_id, name="Mussarela", price=39.9, **extra):
+    data = dict(availability=True, category="pizza", imageUrl="", visibility=True)
+    data.update(extra)
+    return Product(id=product_id, name=name, price=price, **data)
+
+
+def _row(product):
+    return {**vars(product), "availability": int(product.availability), "visibility": int(product.visibility)}
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=()):
+        self.connection.statements.append((query, tuple(params)))
+        if query == QUERY_PRODUCTS_PAGE:
+            last_id, limit = params
+            self.rows = [row for row in self.connection.table if row["id"] > last_id][:limit]
+        else:
+            self.rows = [row for row in self.connection.table if row["id"] in params]
+
+    def executemany(self, query, params):
+        if self.connection.fail:
+            raise Error("Deadlock found")
+        self.connection.statements.append((query, list(params)))
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, table=(), fail=False):
+        self.table = [_row(product) for product in table]
+        self.fail = fail
+        self.statements = []
+        self.committed = self.rolled_back = False
+        self.borrowed = 0
+
+    def __enter__(self):
+        self.borrowed += 1
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def start_transaction(self):
+        pass
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+class FakePool:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def get_connection(self):
+        return self.connection
+
+
+def _repository(connection):
+    repo = MySQLProductRepository.__new__(MySQLProductRepository) # Sem o pool global
+    repo.pool = repo.read_pool = FakePool(connection)
+    return repo
+
+
+def test_diff_skips_unchanged_and_counts_inserts_and_updates():
+    current = {1: _product(1), 2: _product(2, "Calabresa")}
+    batch = [
+        _product(1, price=39.900000001), # Igual no DECIMAL(10,2)
+        _product(2, "Calabresa", price=42.0),
+        _product(7, "Portuguesa"), # ID que não existe: inserido com esse ID
+        _product(0, "Nova"),
+    ]
+
+    changed, inserted, updated, unchanged = diff_products(batch, current)
+
+    assert [product.name for product in changed] == ["Nova", "Calabresa", "Portuguesa"]
+    assert (inserted, updated, unchanged) == (2, 1, 1)
+
+
+def test_diff_keeps_last_occurrence_of_repeated_id():
+    changed, inserted, updated, unchanged = diff_products(
+        [_product(1, price=10.0), _product(1, price=12.0)], {1: _product(1, price=10.0)}
+    )
+
+    assert [product.price for product in changed] == [12.0]
+    assert (inserted, updated, unchanged) == (0, 1, 0)
+
+
+def test_upsert_batch_locks_current_rows_and_writes_only_changes():
+    connection = FakeConnection(table=[_product(1), _product(2, "Calabresa")])
+
+    counts = _repository(connection).upsert_batch(
+        [_product(1), _product(2, "Calabresa", visibility=False), _product(0, "Nova")]
+    )
+
+    assert counts == (1, 1, 1)
+    select, upsert, bump = connection.statements
+    assert select[0].endswith("FOR UPDATE") and select[1] == (1, 2)
+    assert upsert[0] == UPSERT_PRODUCT
+    assert [params[:2] for params in upsert[1]] == [(None, "Nova"), (2, "Calabresa")]
+    assert bump == (BUMP_DATASET_VERSION, (MENU_DATASET,)) # Nova versão do cardápio, na mesma transação
+    assert connection.committed
+
+
+def test_upsert_batch_without_changes_does_not_write():
+    connection = FakeConnection(table=[_product(1)])
+
+    assert _repository(connection).upsert_batch([_product(1)]) == (0, 0, 1)
+    assert len(connection.statements) == 1 # Só o SELECT (a versão do cardápio não muda)
+
+
+def test_upsert_batch_rolls_back_on_error():
+    connection = FakeConnection(fail=True)
+
+    with pytest.raises(Error):
+        _repository(connection).upsert_batch([_product(0, "Nova")])
+
+    assert connection.rolled_back and not connection.committed
+
+
+def test_iter_all_reads_keyset_pages_one_connection_each():
+    connection = FakeConnection(table=[_product(i, f"P{i}") for i in (3, 5, 8, 9, 12)])
+
+    products = list(_repository(connection).iter_all(batch_size=2))
+
+    assert [product.id for product in products] == [3, 5, 8, 9, 12]
+    assert [params for _, params in connection.statements] == [(0, 2), (5, 2), (9, 2)]
+    assert connection.borrowed == 3
@@ -0,0 +1,235 @@
+import asyncio
+
+from mysql.connector import Error
+
+from adapters.db import read_routing
+from adapters.db.read_routing import ReadRouter, AsyncReadRouter, primary_reads, _lag_from_status
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class FakeCursor:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query):
+        self.pool.queries.append(query)
+
+    def fetchone(self):
+        return self.pool.status
+
+
+class FakeConnection:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self, dictionary=False):
+        return FakeCursor(self.pool)
+
+    def commit(self):
+        for listener in self.pool.commit_listeners:
+            listener()
+
+
+class FakePool:
+    """Pool falso: conta os empréstimos e responde ao SHOW REPLICA STATUS."""
+
+    def __init__(self, name, lag=0):
+        self.name = name
+        self.commit_listeners = []
+        self.checkouts = 0
+        self.queries = []
+        self.status = {"Seconds_Behind_Source": lag}
+        self.fail = False
+
+    def get_connection(self):
+        if self.fail:
+            raise Error("Can't connect to MySQL server")
+        self.checkouts += 1
+        return FakeConnection(self)
+
+    def stats(self):
+        return {"checkouts": self.checkouts}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _router(lag=0, replica=True):
+    primary = FakePool("primary")
+    replica_pool = FakePool("replica", lag) if replica else None
+    clock = FakeClock()
+    router = ReadRouter(primary, replica_pool, read_your_writes_seconds=5,
+                        max_lag_seconds=2, lag_check_seconds=10, clock=clock)
+    return router, primary, replica_pool, clock
+
+
+def _read(router):
+    return router.get_connection().pool.name
+
+
+def _in_scope(replica_allowed, session=None):
+    read_routing.begin_scope(replica_allowed)
+    read_routing.bind_session(session)
+
+
+def teardown_function():
+    read_routing.end_scope()
+
+
+# ---------------------------
+# Testes
+# ---------------------------
+
+def test_reads_outside_a_request_go_to_primary():
+    router, _, _, _ = _router()
+
+    assert _read(router) == "primary"
+
+
+def test_get_request_reads_from_replica():
+    router, _, replica, _ = _router()
+    _in_scope(True, session=1)
+
+    assert _read(router) == "replica"
+    assert router.stats()["replica_reads"] == 1
+    assert replica.queries == [read_routing.QUERY_REPLICA_STATUS]
+
+
+def test_write_request_reads_from_primary():
+    router, _, _, _ = _router()
+    _in_scope(False, session=1)
+
+    assert _read(router) == "primary"
+
+
+def test_no_replica_configured_is_a_passthrough():
+    router, _, _, _ = _router(replica=False)
+    _in_scope(True, session=1)
+
+    assert _read(router) == "primary"
+    assert router.stats()["replica_configured"] is False
+
+
+def test_user_reads_own_writes_from_primary_until_window_expires():
+    router, primary, _, clock = _router()
+
+    # POST do usuário 1 grava no primário
+    _in_scope(False, session=1)
+    primary.get_connection().commit()
+
+    # GET seguinte do mesmo usuário: primário; de outro usuário: réplica
+    _in_scope(True, session=1)
+    assert _read(router) == "primary"
+    _in_scope(True, session=2)
+    assert _read(router) == "replica"
+
+    clock.now += 6
+    _in_scope(True, session=1)
+    assert _read(router) == "replica"
+    assert router.stats()["reads_after_write"] == 1
+
+
+def test_lagging_replica_falls_back_to_primary():
+    router, _, _, _ = _router(lag=30)
+    _in_scope(True, session=1)
+
+    assert _read(router) == "primary"
+    assert router.stats()["lag_fallbacks"] == 1
+
+
+def test_unknown_lag_falls_back_to_primary():
+    router, _, replica, _ = _router()
+    replica.status = {"Seconds_Behind_Source": None} # Replicação parada
+    _in_scope(True, session=1)
+
+    assert _read(router) == "primary"
+    assert router.stats()["lag_seconds"] is None
+
+
+def test_lag_is_measured_once_per_interval():
+    router, _, replica, clock = _router()
+    _in_scope(True, session=1)
+
+    for _ in range(5):
+        _read(router)
+    assert len(replica.queries) == 1
+
+    clock.now += 11
+    _read(router)
+    assert len(replica.queries) == 2
+
+
+def test_primary_reads_block_forces_primary():
+    router, _, _, _ = _router()
+    _in_scope(True, session=1)
+
+    with primary_reads():
+        assert _read(router) == "primary"
+    assert _read(router) == "replica"
+
+
+def test_replica_connection_error_falls_back_to_primary():
+    router, _, replica, _ = _router()
+    _in_scope(True, session=1)
+    replica.fail = True
+
+    assert _read(router) == "primary"
+    assert router.stats()["lag_check_failures"] == 1
+
+    # Não tenta de novo a cada leitura: espera a próxima medição
+    replica.fail = False
+    assert _read(router) == "primary"
+    assert replica.queries == []
+
+
+def test_lag_from_status_reads_both_column_names():
+    assert _lag_from_status({"Seconds_Behind_Source": 3}) == 3.0
+    assert _lag_from_status({"Seconds_Behind_Master": 1}) == 1.0
+    assert _lag_from_status(None) is None
+
+
+# --- Versão assíncrona ---
+
+class FakeAsyncPool(FakePool):
+    async def get_connection(self):
+        return super().get_connection()
+
+
+def test_async_router_reads_from_replica_in_get_scope():
+    primary = FakeAsyncPool("primary")
+    replica = FakeAsyncPool("replica")
+    router = AsyncReadRouter(primary, replica, lag_check_seconds=10)
+
+    async def read():
+        connection = await router.get_connection()
+        return connection.pool.name
+
+    async def scenario():
+        _in_scope(True, session=1)
+        router.lag_seconds, router._lag_checked_at = 0.0, router._clock()
+        on_get = await read()
+        _in_scope(False, session=1)
+        on_post = await read()
+        return on_get, on_post
+
+    assert asyncio.run(scenario()) == ("replica", "primary")
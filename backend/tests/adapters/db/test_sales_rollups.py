@@ -0,0 +1,185 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from domain.models import Order, Product, SalesDimension, User, UserRole
+from domain.exceptions import BusinessRuleException, ConcurrencyConflictException
+from domain.use_cases.admin import GetSalesReportUseCase
+from adapters.db.order_repository import MySQLOrderRepository, UPDATE_ORDER
+from adapters.db.sales_report_repository import (
+    MySQLSalesReportRepository, RECORD_SALE_STATEMENTS, QUERY_SALES_BY_PRODUCT
+)
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class FakeCursor:
+    """Cursor falso: registra o SQL; 'rows' é o resultado de qualquer SELECT."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = 0
+        self.lastrowid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=()):
+        self.connection.statements.append((query, params))
+        self.rowcount = self.connection.matches.get(query, 1)
+
+    def executemany(self, query, rows):
+        self.connection.statements.append((query, list(rows)))
+
+    def fetchall(self):
+        return self.connection.rows
+
+
+class FakeConnection:
+    def __init__(self, matches=None, rows=()):
+        self.matches = matches or {}
+        self.rows = list(rows)
+        self.statements = []
+        self.committed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def start_transaction(self):
+        pass
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+
+class FakePool:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def get_connection(self):
+        return self.connection
+
+
+def _order_repository(**matches):
+    repo = MySQLOrderRepository.__new__(MySQLOrderRepository) # Sem o pool global
+    connection = FakeConnection({globals()[name]: rows for name, rows in matches.items()})
+    repo.pool = repo.read_pool = FakePool(connection)
+    return repo, connection
+
+
+def _order_in_progress():
+    order = Order(id=7, table_number=1, waiter_id=2, version=1)
+    order.add_item(Product(id=1, name="Suco", price=8.0, availability=True,
+                           category="Bebidas", imageUrl="", visibility=True), 2)
+    order.mark_as_in_progress()
+    order.mark_as_persisted()
+    return order
+
+
+def _queries(connection):
+    return [query for query, _ in connection.statements]
+
+
+# ---------------------------
+# Atualização dos resumos
+# ---------------------------
+
+def test_completing_order_records_sale_in_the_same_transaction():
+    repo, connection = _order_repository()
+    order = _order_in_progress()
+    order.mark_as_completed()
+
+    repo.save(order)
+
+    assert _queries(connection) == [UPDATE_ORDER, *RECORD_SALE_STATEMENTS]
+    assert all(params == (7,) for _, params in connection.statements[1:])
+    assert connection.committed
+
+
+def test_other_changes_do_not_touch_rollups():
+    repo, connection = _order_repository()
+    order = _order_in_progress()
+    order.add_item(order.items[0].product, 1) # Ainda em preparo
+
+    repo.save(order)
+    order.mark_as_completed()
+    order.mark_as_persisted() # Já concluído no banco: salvar de novo não conta duas vezes
+    repo.save(order)
+
+    assert not set(RECORD_SALE_STATEMENTS) & set(_queries(connection))
+
+
+def test_conflicting_completion_records_nothing():
+    repo, connection = _order_repository(UPDATE_ORDER=0)
+    order = _order_in_progress()
+    order.mark_as_completed()
+
+    with pytest.raises(ConcurrencyConflictException):
+        repo.save(order)
+
+    assert _queries(connection) == [UPDATE_ORDER]
+
+
+# ---------------------------
+# Relatórios
+# ---------------------------
+
+def _report_repository(rows):
+    repo = MySQLSalesReportRepository.__new__(MySQLSalesReportRepository) # Sem o roteador global
+    connection = FakeConnection(rows=rows)
+    repo.read_pool = FakePool(connection)
+    return repo, connection
+
+
+def test_find_sales_reads_only_the_rollup_for_the_period():
+    rows = [{"sales_key": 5, "label": "Pizza", "orders_count": Decimal(12),
+             "items_count": Decimal(15), "revenue": Decimal("748.50")}]
+    repo, connection = _report_repository(rows)
+
+    lines = repo.find_sales(SalesDimension.PRODUCT, date(2025, 3, 1), date(2025, 3, 16))
+
+    assert connection.statements == [(QUERY_SALES_BY_PRODUCT, (date(2025, 3, 1), date(2025, 3, 16)))]
+    assert "FROM orders" not in QUERY_SALES_BY_PRODUCT
+    line = lines[0]
+    assert (line.key, line.label, line.orders, line.items, line.revenue) == (5, "Pizza", 12, 15, 748.5)
+    assert type(line.orders) is int and type(line.revenue) is float
+
+
+class FakeUserRepository:
+    def __init__(self, roles):
+        self.user = User(id=1, username="ana", name="Ana", hashed_password="-", roles=roles)
+
+    def find_by_id(self, user_id):
+        return self.user
+
+
+def test_sales_report_use_case_requires_admin():
+    hour = datetime(2025, 3, 1, 20, 0)
+    repo, _ = _report_repository([{"sales_key": hour, "label": None, "orders_count": 4,
+                                   "items_count": 9, "revenue": Decimal("120.00")}])
+
+    with pytest.raises(BusinessRuleException):
+        GetSalesReportUseCase(repo, FakeUserRepository([UserRole.WAITER])).execute(
+            1, SalesDimension.HOUR, date(2025, 3, 1), date(2025, 3, 2)
+        )
+
+    report = GetSalesReportUseCase(repo, FakeUserRepository([UserRole.ADMIN])).execute(
+        1, SalesDimension.HOUR, date(2025, 3, 1), date(2025, 3, 2)
+    )
+    assert [line.key for line in report.lines] == [hour]
+    assert (report.total_items, report.total_revenue) == (9, 120.0)
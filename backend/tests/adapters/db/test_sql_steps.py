@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from domain.models import Order, Product, Table, TableStatus
+from domain.exceptions import ConcurrencyConflictException
+from adapters.db.sql_steps import run_steps, run_steps_async
+from adapters.db.order_repository import (
+    order_write_steps,
+    CLAIM_TABLE_SESSION,
+    INSERT_ORDER,
+    INSERT_ORDER_ITEM
+)
+from adapters.db.table_repository import table_save_steps, CLOSE_TABLE_SESSION, UPDATE_TABLE
+from adapters.db.order_archive import ARCHIVE_SESSION_STATEMENTS
+from adapters.db.version_counter import BUMP_DATASET_VERSION
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class RecordingCursor:
+    """Registra (consulta, parâmetros, executemany?) e responde 'rowcount' conforme 'matches'."""
+
+    def __init__(self, **matches):
+        self.matches = matches
+        self.statements = []
+        self.rowcount = 0
+        self.lastrowid = None
+
+    def execute(self, query, params=()):
+        self.statements.append((query, params, False))
+        self.rowcount = self.matches.get(query, 1)
+        self.lastrowid = 42
+
+    def executemany(self, query, rows):
+        self.statements.append((query, list(rows), True))
+
+
+class AsyncRecordingCursor(RecordingCursor):
+    async def execute(self, query, params=()):
+        super().execute(query, params)
+
+    async def executemany(self, query, rows):
+        super().executemany(query, rows)
+
+
+def _sync(steps, **matches):
+    cursor = RecordingCursor(**matches)
+    return run_steps(cursor, steps), cursor.statements
+
+
+def _async(steps, **matches):
+    cursor = AsyncRecordingCursor(**matches)
+    return asyncio.run(run_steps_async(cursor, steps)), cursor.statements
+
+
+@pytest.fixture(params=[_sync, _async], ids=["sync", "async"])
+def run(request):
+    return request.param
+
+
+def _new_order():
+    order = Order(id=0, table_number=3, waiter_id=1, session_id=10)
+    order.add_item(Product(id=5, name="Suco", price=8.0, availability=True,
+                           category="Bebidas", imageUrl="", visibility=True), 2)
+    return order
+
+
+def _occupied_table():
+    return Table(id=3, status=TableStatus.OCCUPIED, number_of_people=2, session_id=10, version=4)
+
+
+# ---------------------------
+# Pedido novo (reserva da sessão)
+# ---------------------------
+
+def test_new_order_claims_session_then_inserts(run):
+    order = _new_order()
+
+    bumped, statements = run(order_write_steps(order))
+
+    assert bumped is False and order.id == 42
+    assert [(query, many) for query, _, many in statements] == [
+        (CLAIM_TABLE_SESSION, False), (INSERT_ORDER, False), (INSERT_ORDER_ITEM, True)
+    ]
+    assert statements[2][1] == [(42, 5, 2, 8.0)]
+
+
+def test_closed_session_stops_before_the_insert(run):
+    order = _new_order()
+
+    with pytest.raises(ConcurrencyConflictException, match="Mesa 3 foi fechada"):
+        run(order_write_steps(order), **{CLAIM_TABLE_SESSION: 0})
+
+
+# ---------------------------
+# Fechamento da mesa (arquivamento)
+# ---------------------------
+
+def test_closing_table_archives_then_saves(run):
+    table = _occupied_table()
+    table.close_table()
+
+    _, statements = run(table_save_steps(table))
+
+    assert [query for query, _, _ in statements] == [
+        *ARCHIVE_SESSION_STATEMENTS, CLOSE_TABLE_SESSION, UPDATE_TABLE, BUMP_DATASET_VERSION
+    ]
+
+
+def test_table_conflict_skips_the_version_bump(run):
+    table = _occupied_table()
+    table.close_table()
+
+    with pytest.raises(ConcurrencyConflictException, match="Mesa 3 foi alterada"):
+        run(table_save_steps(table), **{UPDATE_TABLE: 0})
@@ -0,0 +1,95 @@
+import pytest
+from mysql.connector import Error
+
+from domain.models import User, UserRole
+from adapters.db.user_repository import MySQLUserRepository, INSERT_USER
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def executemany(self, query, params):
+        if self.connection.fail:
+            raise Error("Duplicate entry")
+        self.connection.statements.append((query, list(params)))
+
+    def execute(self, query, params=()):
+        self.connection.statements.append((query, list(params)))
+
+    def fetchall(self):
+        # IDs não seguidos (autoinc intercalado com outras sessões)
+        return [(40, "ana.s"), (42, "bruno")]
+
+
+class FakeConnection:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.statements = []
+        self.committed = self.rolled_back = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def start_transaction(self):
+        pass
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+class FakePool:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def get_connection(self):
+        return self.connection
+
+
+def _repository(connection):
+    repo = MySQLUserRepository.__new__(MySQLUserRepository) # Sem o pool global
+    repo.pool = repo.read_pool = FakePool(connection)
+    return repo
+
+
+def _users():
+    return [User(id=0, username=name, name=name, hashed_password="h", roles=[UserRole.WAITER])
+            for name in ("bruno", "ana.s")]
+
+
+def test_insert_batch_uses_one_transaction_and_maps_ids_by_username():
+    connection = FakeConnection()
+
+    users = _repository(connection).insert_batch(_users())
+
+    assert [user.id for user in users] == [42, 40]
+    query, params = connection.statements[0]
+    assert query == INSERT_USER and len(params) == 2
+    assert params[0][3] == '["waiter"]'
+    assert connection.committed
+
+
+def test_insert_batch_rolls_back_everything_on_error():
+    connection = FakeConnection(fail=True)
+    users = _users()
+
+    with pytest.raises(Error):
+        _repository(connection).insert_batch(users)
+
+    assert connection.rolled_back and not connection.committed
+    assert all(user.id == 0 for user in users)
@@ -0,0 +1,260 @@
+import asyncio
+
+import pytest
+from mysql.connector import Error
+
+from domain.models import Product, Table
+from adapters.db.cached_product_repository import CachedProductRepository
+from adapters.db.versioned_table_repository import VersionedTableRepository
+import adapters.db.version_counter as version_module
+from adapters.db.version_counter import (
+    VersionCounter, SharedVersionCounter, AsyncSharedVersionCounter,
+    QUERY_DATASET_VERSION, MENU_DATASET
+)
+
+
+def _product(name):
+    return Product(id=1, name=name, price=8.0, availability=True,
+                   category="Bebidas", imageUrl="", visibility=True)
+
+
+class FakeProductRepository:
+    def __init__(self):
+        self.products = [_product("Suco")]
+
+    def get_all(self):
+        return list(self.products)
+
+    def save(self, product):
+        self.products = [product]
+        return product
+
+
+class FakeTableRepository:
+    def __init__(self):
+        self.saved = []
+
+    def find_by_id(self, table_id):
+        return Table(id=table_id)
+
+    def get_all_tables(self):
+        return [Table(id=1)]
+
+    def save(self, table):
+        self.saved.append(table)
+        return table
+
+
+def test_etag_changes_only_on_bump():
+    version = VersionCounter()
+    first = version.etag()
+
+    assert version.etag() == first
+    version.bump()
+    assert version.etag() != first
+    assert version.etag().startswith(version.epoch + "-")
+
+
+def test_etags_from_different_processes_never_match():
+    assert VersionCounter().etag() != VersionCounter().etag()
+
+
+def test_table_reads_do_not_change_version():
+    version = VersionCounter()
+    repo = VersionedTableRepository(inner=FakeTableRepository(), version=version)
+    etag = version.etag()
+
+    repo.get_all_tables()
+    repo.find_by_id(1)
+
+    assert version.etag() == etag
+
+
+def test_table_save_bumps_version():
+    inner = FakeTableRepository()
+    version = VersionCounter()
+    repo = VersionedTableRepository(inner=inner, version=version)
+    etag = version.etag()
+
+    repo.save(Table(id=1))
+
+    assert len(inner.saved) == 1
+    assert version.etag() != etag
+
+
+def test_product_save_bumps_version_after_invalidating_cache():
+    version = VersionCounter()
+    repo = CachedProductRepository(inner=FakeProductRepository(), version=version)
+    repo.get_all() # Carrega o snapshot
+    etag = version.etag()
+
+    repo.save(_product("Suco de Caju"))
+
+    assert version.etag() != etag
+    assert [p.name for p in repo.get_all()] == ["Suco de Caju"]
+
+
+# ---------------------------
+# Versão compartilhada (tabela dataset_versions)
+# ---------------------------
+
+class FakeVersionCursor:
+    def __init__(self, database):
+        self.database = database
+        self.row = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=()):
+        assert query == QUERY_DATASET_VERSION
+        self.database.queries += 1
+        if self.database.down:
+            raise Error("Lost connection to MySQL server")
+        version = self.database.versions.get(params[0])
+        self.row = None if version is None else (version,)
+
+    def fetchone(self):
+        return self.row
+
+
+class FakeVersionDatabase:
+    """Banco (e pool) compartilhado por vários 'workers'."""
+
+    def __init__(self):
+        self.versions = {MENU_DATASET: 7}
+        self.queries = 0
+        self.down = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get_connection(self):
+        return self
+
+    def cursor(self, *args, **kwargs):
+        return FakeVersionCursor(self)
+
+
+class AsyncFakeVersionDatabase(FakeVersionDatabase):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get_connection(self):
+        return self
+
+    async def cursor(self, *args, **kwargs):
+        database = self
+
+        class Cursor(FakeVersionCursor):
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, query, params=()):
+                FakeVersionCursor.execute(self, query, params)
+
+            async def fetchone(self):
+                return self.row
+
+        return Cursor(database)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(version_module.time, "monotonic", lambda: clock["now"])
+    return clock
+
+
+def test_shared_version_is_the_same_in_every_worker():
+    database = FakeVersionDatabase()
+
+    first = SharedVersionCounter(MENU_DATASET, database)
+    second = SharedVersionCounter(MENU_DATASET, database)
+
+    assert first.etag() == second.etag() == "menu-7"
+
+
+def test_write_in_another_worker_shows_up_within_refresh_interval(clock):
+    database = FakeVersionDatabase()
+    version = SharedVersionCounter(MENU_DATASET, database, refresh_seconds=1.0)
+    version.etag()
+
+    database.versions[MENU_DATASET] += 1 # Escrita feita por outro worker
+    clock["now"] += 0.5
+    assert version.etag() == "menu-7" # Ainda dentro do intervalo: sem consulta
+    assert database.queries == 1
+
+    clock["now"] += 0.6
+    assert version.etag() == "menu-8"
+    assert database.queries == 2
+
+
+def test_local_bump_forces_a_new_read(clock):
+    database = FakeVersionDatabase()
+    version = SharedVersionCounter(MENU_DATASET, database, refresh_seconds=60)
+    version.etag()
+
+    database.versions[MENU_DATASET] += 1 # O repositório incrementa na transação...
+    version.bump()                       # ...e o wrapper avisa depois do commit
+
+    assert version.etag() == "menu-8"
+
+
+def test_failed_read_never_produces_a_matching_etag(capsys):
+    database = FakeVersionDatabase()
+    database.down = True
+    version = SharedVersionCounter(MENU_DATASET, database, refresh_seconds=0)
+
+    assert version.etag() != version.etag()
+    assert "Erro ao ler a versão de 'menu'" in capsys.readouterr().out
+
+    missing = SharedVersionCounter("tables", FakeVersionDatabase(), refresh_seconds=0) # Migração não aplicada
+    assert missing.etag() != missing.etag()
+
+
+def test_async_shared_version_reads_through_async_pool():
+    database = AsyncFakeVersionDatabase()
+    version = AsyncSharedVersionCounter(MENU_DATASET, database)
+
+    async def scenario():
+        return [await version.etag_async(), await version.etag_async()]
+
+    assert asyncio.run(scenario()) == ["menu-7", "menu-7"]
+    assert database.queries == 1
+
+
+def test_async_local_bump_forces_a_new_read(clock):
+    database = AsyncFakeVersionDatabase()
+    version = AsyncSharedVersionCounter(MENU_DATASET, database, refresh_seconds=60)
+    asyncio.run(version.etag_async())
+
+    database.versions[MENU_DATASET] += 1
+    version.bump()
+
+    assert asyncio.run(version.etag_async()) == "menu-8"
+
+
+def test_menu_cache_reloads_when_another_worker_changes_the_menu(clock):
+    database = FakeVersionDatabase()
+    inner = FakeProductRepository()
+    repo = CachedProductRepository(inner=inner, version=SharedVersionCounter(MENU_DATASET, database))
+    assert [p.name for p in repo.get_all()] == ["Suco"]
+
+    inner.products = [_product("Suco de Uva")] # Salvo por outro worker...
+    database.versions[MENU_DATASET] += 1       # ...que incrementou a versão
+    clock["now"] += 2
+
+    assert [p.name for p in repo.get_all()] == ["Suco de Uva"]
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+
+import pytest
+from jose import jwt, JWTError
+
+from adapters.services.security_service import (
+    ALGORITHM, SECRET_KEY, BcryptPasswordHasher, JwtTokenGenerator, JwtTokenVerifier
+)
+from domain.exceptions import ServiceBusyException
+from domain.models import UserRole
+
+
+# ---------------------------
+# Testes do JwtTokenVerifier
+# ---------------------------
+
+def test_verify_caches_valid_token():
+    verifier = JwtTokenVerifier()
+    token = JwtTokenGenerator().generate(user_id=7, roles=[UserRole.WAITER])
+
+    assert verifier.verify(token)["sub"] == "7"
+    assert verifier.verify(token)["roles"] == ["waiter"]
+    assert verifier.stats()["misses"] == 1
+    assert verifier.stats()["hits"] == 1
+
+
+def test_verify_rejects_tampered_token():
+    verifier = JwtTokenVerifier()
+    token = JwtTokenGenerator().generate(user_id=7, roles=[UserRole.WAITER])
+
+    with pytest.raises(JWTError):
+        verifier.verify(token[:-2] + "xx")
+    assert verifier.stats()["cached_tokens"] == 0
+
+
+def test_verify_rejects_expired_token():
+    verifier = JwtTokenVerifier()
+    expired = jwt.encode(
+        {"sub": "7", "roles": [], "exp": datetime.utcnow() - timedelta(seconds=1)},
+        SECRET_KEY, algorithm=ALGORITHM
+    )
+    with pytest.raises(JWTError):
+        verifier.verify(expired)
+
+
+def test_cache_is_bounded():
+    verifier = JwtTokenVerifier(max_entries=2)
+    generator = JwtTokenGenerator()
+    for user_id in range(1, 4):
+        verifier.verify(generator.generate(user_id=user_id, roles=[]))
+
+    assert verifier.stats()["cached_tokens"] == 2
+
+
+# ---------------------------
+# Testes do BcryptPasswordHasher
+# ---------------------------
+
+def test_hash_and_check_inline():
+    hasher = BcryptPasswordHasher(rounds=4, workers=0)
+    hashed = hasher.hash("segredo123")
+
+    assert hashed.startswith("$2b$04$")
+    assert hasher.check("segredo123", hashed)
+    assert not hasher.check("errada", hashed)
+
+
+def test_check_malformed_hash_returns_false():
+    hasher = BcryptPasswordHasher(rounds=4, workers=0)
+    assert not hasher.check("segredo123", "nao-e-um-hash")
+
+
+def test_needs_rehash_when_cost_differs():
+    old_hash = BcryptPasswordHasher(rounds=4, workers=0).hash("segredo123")
+
+    assert not BcryptPasswordHasher(rounds=4, workers=0).needs_rehash(old_hash)
+    assert BcryptPasswordHasher(rounds=5, workers=0).needs_rehash(old_hash)
+    assert not BcryptPasswordHasher(rounds=5, workers=0).needs_rehash("nao-e-um-hash")
+
+
+def test_hash_runs_in_process_pool():
+    hasher = BcryptPasswordHasher(rounds=4, workers=1, max_queue=0)
+    hashed = hasher.hash("segredo123")
+
+    assert hasher.check("segredo123", hashed)
+
+
+def test_rejects_when_pool_is_saturated():
+    hasher = BcryptPasswordHasher(rounds=4, workers=1, max_queue=0)
+    hasher._slots.acquire()  # Única vaga ocupada por outro login
+
+    with pytest.raises(ServiceBusyException):
+        hasher.check("segredo123", "$2b$04$" + "a" * 53)
+
+
+def test_hash_many_keeps_order_across_processes():
+    hasher = BcryptPasswordHasher(rounds=4, workers=2, max_queue=0)
+    passwords = [f"senha-{i}" for i in range(5)]
+
+    hashes = hasher.hash_many(passwords) # Não usa as vagas dos requests
+
+    assert len(hashes) == 5
+    assert all(hasher.check(password, hashed) for password, hashed in zip(passwords, hashes))
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from domain.models import Product
+from adapters.web.catalog_io import (
+    catalog_format,
+    read_catalog,
+    read_catalog_async,
+    text_lines,
+    text_lines_async,
+    write_catalog
+)
+
+
+def _products():
+    return [
+        Product(id=1, name="Mussarela, grande", price=39.9, availability=True,
+                category="pizza", imageUrl="", visibility=True),
+        Product(id=2, name="Guaraná \"lata\"", price=6.5, availability=False,
+                category="bebida", imageUrl="https://img/2.png", visibility=False),
+    ]
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+def test_export_then_import_round_trip(fmt):
+    data = "".join(write_catalog(_products(), fmt)).encode("utf-8")
+
+    rows = list(read_catalog(text_lines(data.splitlines(keepends=True)), fmt))
+
+    assert [row.error for row in rows] == [None, None]
+    assert [row.product for row in rows] == _products()
+
+
+def test_import_reports_bad_lines_with_their_line_number():
+    data = (
+        "﻿id,name,price,availability,category,imageUrl,visibility\r\n"
+        ",Nova,12.5,,lanche,,\r\n"
+        "\r\n"
+        "3,Sem preço,,true,lanche,,true\r\n"
+    ).encode("utf-8")
+
+    rows = list(read_catalog(text_lines(data.splitlines(keepends=True)), "csv"))
+
+    assert rows[0].line == 2 and rows[0].product.id == 0 # Sem ID: produto novo
+    assert rows[0].product.availability is True
+    assert rows[1].line == 4 and rows[1].error.startswith("price:")
+
+
+def test_async_lines_may_arrive_split_across_chunks():
+    data = "".join(write_catalog(_products(), "ndjson")).encode("utf-8")
+
+    async def chunks():
+        for start in range(0, len(data), 7):
+            yield data[start:start + 7]
+
+    async def read():
+        return [row async for row in read_catalog_async(text_lines_async(chunks()), "ndjson")]
+
+    rows = asyncio.run(read())
+
+    assert [row.product for row in rows] == _products()
+
+
+def test_catalog_format_accepts_names_content_types_and_paths():
+    assert catalog_format(None, "text/csv") == "csv"
+    assert catalog_format("", "cardapio.jsonl") == "ndjson"
+    assert catalog_format("NDJSON") == "ndjson"
+    with pytest.raises(ValueError):
+        catalog_format("xlsx")
+    with pytest.raises(ValueError):
+        catalog_format(None, "")
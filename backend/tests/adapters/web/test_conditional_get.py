@@ -0,0 +1,66 @@
+from flask import Flask, Response, request
+
+from adapters.db.version_counter import VersionCounter
+from adapters.web.conditional_get import CACHE_CONTROL, is_not_modified, not_modified, with_etag
+
+
+def _app(version: VersionCounter, loads: list):
+    app = Flask(__name__)
+
+    @app.route("/items")
+    def items():
+        etag = version.etag()
+        if is_not_modified(request, etag):
+            return not_modified(Response, etag)
+        loads.append(1)
+        return with_etag(Response(b"[]\n", mimetype="application/json"), etag)
+
+    return app
+
+
+def test_first_get_returns_body_with_etag():
+    version, loads = VersionCounter(), []
+    client = _app(version, loads).test_client()
+
+    response = client.get("/items")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == f'"{version.etag()}"'
+    assert response.headers["Cache-Control"] == CACHE_CONTROL
+    assert loads == [1]
+
+
+def test_matching_if_none_match_returns_304_without_loading():
+    version, loads = VersionCounter(), []
+    client = _app(version, loads).test_client()
+    etag = client.get("/items").headers["ETag"]
+
+    response = client.get("/items", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+    assert loads == [1]
+
+
+def test_write_invalidates_client_etag():
+    version, loads = VersionCounter(), []
+    client = _app(version, loads).test_client()
+    etag = client.get("/items").headers["ETag"]
+
+    version.bump()
+    response = client.get("/items", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert loads == [1, 1]
+
+
+def test_wildcard_and_lists_are_honoured():
+    version, loads = VersionCounter(), []
+    client = _app(version, loads).test_client()
+    etag = client.get("/items").headers["ETag"]
+
+    assert client.get("/items", headers={"If-None-Match": "*"}).status_code == 304
+    assert client.get("/items", headers={"If-None-Match": f'"old", {etag}'}).status_code == 304
+    assert client.get("/items", headers={"If-None-Match": f"W/{etag}"}).status_code == 200
@@ -0,0 +1,50 @@
+import threading
+
+from adapters.web.deps import AppContainer, AsyncAppContainer
+
+
+def _built(container):
+    return sorted(name for name in vars(container) if not name.startswith("_"))
+
+
+def test_container_builds_nothing_until_used():
+    assert _built(AppContainer()) == []
+    assert _built(AsyncAppContainer()) == [] # Nem o pool assíncrono
+
+
+def test_first_access_builds_only_what_is_needed():
+    container = AppContainer()
+
+    use_case = container.create_user_uc # O que o cli.py usa
+
+    assert _built(container) == ["create_user_uc", "password_hasher", "user_repo"]
+    assert use_case.user_repository is container.user_repo
+    assert container.create_user_uc is use_case
+
+
+def test_shared_dependency_is_built_once_across_threads():
+    container = AppContainer()
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def access():
+        barrier.wait()
+        seen.append(container.product_repo)
+
+    threads = [threading.Thread(target=access) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(repo) for repo in seen}) == 1
+    assert container.get_visible_products_uc.repository is seen[0]
+
+
+def test_dependency_can_be_replaced_before_use():
+    container = AppContainer()
+    fake_repo = object()
+
+    container.order_repo = fake_repo
+
+    assert container.list_pending_orders_uc.order_repository is fake_repo
@@ -0,0 +1,183 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from domain.models.order import Order
+from domain.ports.order_event_publisher import OrderEventType
+from adapters.web.kitchen_feed import KitchenEventFeed
+from adapters.web.routers import kitchen_router
+from adapters.web.routers.kitchen_router import create_kitchen_blueprint
+
+
+def test_async_wait_times_out_without_events():
+    feed = KitchenEventFeed()
+
+    events, needs_resync = asyncio.run(feed.wait_for_events_async(0, timeout=0.05))
+
+    assert events == []
+    assert needs_resync is False
+
+
+def test_async_wait_returns_buffered_events_immediately():
+    feed = KitchenEventFeed()
+    feed.publish(OrderEventType.CREATED, Order(id=1, table_number=3, waiter_id=5))
+
+    events, _ = asyncio.run(feed.wait_for_events_async(0, timeout=5))
+
+    assert [(e.seq, e.type) for e in events] == [(1, "order_created")]
+
+
+def test_publish_from_another_thread_wakes_async_waiter():
+    feed = KitchenEventFeed()
+
+    async def scenario():
+        publisher = threading.Timer(
+            0.05, feed.publish, (OrderEventType.STATUS_CHANGED, Order(id=2, table_number=3, waiter_id=5))
+        )
+        publisher.start()
+        try:
+            return await feed.wait_for_events_async(0, timeout=5)
+        finally:
+            publisher.join()
+
+    events, _ = asyncio.run(scenario())
+
+    assert [e.type for e in events] == ["order_status_changed"]
+    assert feed._async_waiters == set()
+
+
+# ---------------------------
+# Publicação e espera (app Flask)
+# ---------------------------
+
+def _order(order_id):
+    return Order(id=order_id, table_number=3, waiter_id=5)
+
+
+def test_publish_then_wait_returns_only_newer_events():
+    feed = KitchenEventFeed()
+    for order_id in (1, 2, 3):
+        feed.publish(OrderEventType.CREATED, _order(order_id))
+
+    events, needs_resync = feed.wait_for_events(1, timeout=5)
+
+    assert [e.seq for e in events] == [2, 3]
+    assert needs_resync is False
+    assert '"id": 2' in events[0].data # Pedido já serializado na publicação
+
+
+def test_wait_times_out_without_events():
+    feed = KitchenEventFeed()
+    feed.publish(OrderEventType.CREATED, _order(1))
+
+    assert feed.wait_for_events(1, timeout=0.05) == ([], False)
+
+
+def test_publish_from_another_thread_wakes_waiter():
+    feed = KitchenEventFeed()
+    publisher = threading.Timer(0.05, feed.publish, (OrderEventType.CREATED, _order(1)))
+    publisher.start()
+
+    events, _ = feed.wait_for_events(0, timeout=5)
+    publisher.join()
+
+    assert [e.seq for e in events] == [1]
+
+
+def test_evicted_cursor_needs_resync():
+    feed = KitchenEventFeed(buffer_size=2)
+    for order_id in (1, 2, 3):
+        feed.publish(OrderEventType.CREATED, _order(order_id))
+
+    assert feed.wait_for_events(0, timeout=5) == ([], True) # O evento 1 já saiu do buffer
+    assert [e.seq for e in feed.wait_for_events(1, timeout=5)[0]] == [2, 3]
+
+
+# ---------------------------
+# Cursores e formato SSE
+# ---------------------------
+
+def test_parse_cursor():
+    feed = KitchenEventFeed()
+    feed.publish(OrderEventType.CREATED, _order(1))
+
+    assert feed.parse_cursor(feed.cursor()) == 1
+    assert feed.parse_cursor(f"{feed.epoch}-0") == 0
+    assert feed.parse_cursor(None) is None
+    assert feed.parse_cursor("outroepoch-1") is None # Servidor reiniciado
+    assert feed.parse_cursor(f"{feed.epoch}-abc") is None
+    assert feed.parse_cursor(f"{feed.epoch}--1") is None
+
+
+def test_format_event_and_resync():
+    feed = KitchenEventFeed()
+    feed.publish(OrderEventType.CREATED, _order(1))
+    event = feed.wait_for_events(0, timeout=5)[0][0]
+
+    assert feed.format_event(event) == f"id: {feed.epoch}-1\nevent: order_created\ndata: {event.data}\n\n"
+    assert feed.format_resync() == f"id: {feed.epoch}-1\nevent: resync\ndata: {{}}\n\n"
+
+
+# ---------------------------
+# Rota do stream
+# ---------------------------
+
+@pytest.fixture(scope="module")
+def stream_app():
+    # O blueprint é global no módulo: é criado uma vez para todos os testes
+    feed = KitchenEventFeed(buffer_size=2)
+    app = Flask(__name__)
+    app.register_blueprint(create_kitchen_blueprint(None, None, None, feed))
+    return app, feed
+
+
+@pytest.fixture
+def short_streams(monkeypatch):
+    monkeypatch.setattr(kitchen_router, "STREAM_MAX_LIFETIME_SECONDS", 0.2)
+
+
+def test_stream_sends_missed_events_and_closes_after_lifetime(stream_app, short_streams):
+    app, feed = stream_app
+    cursor = feed.cursor()
+    feed.publish(OrderEventType.CREATED, _order(10))
+
+    start = time.monotonic()
+    response = app.test_client().get("/kitchen/orders/stream", headers={"Last-Event-ID": cursor})
+    body = response.get_data(as_text=True) # Termina sozinho ao fim do tempo de vida
+
+    assert time.monotonic() - start < 5
+    assert response.mimetype == "text/event-stream"
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert body.startswith("retry: 3000\n\n")
+    assert f"id: {feed.cursor()}\nevent: order_created\ndata: " in body
+    assert "resync" not in body
+
+
+def test_stream_with_unknown_cursor_starts_with_resync(stream_app, short_streams):
+    app, feed = stream_app
+
+    body = app.test_client().get("/kitchen/orders/stream?cursor=outroepoch-5").get_data(as_text=True)
+
+    assert body.startswith(f"id: {feed.cursor()}\nevent: resync\ndata: {{}}\n\nretry: 3000\n\n")
+
+
+def test_stream_with_evicted_cursor_resyncs(stream_app, short_streams):
+    app, feed = stream_app
+    old_cursor = feed.cursor()
+    for order_id in (20, 21, 22):
+        feed.publish(OrderEventType.CREATED, _order(order_id))
+
+    body = app.test_client().get("/kitchen/orders/stream", headers={"Last-Event-ID": old_cursor}).get_data(as_text=True)
+
+    assert body == f"retry: 3000\n\nid: {feed.cursor()}\nevent: resync\ndata: {{}}\n\n: keep-alive\n\n"
+
+
+def test_stream_deadline_stops_at_token_expiry():
+    now = time.monotonic()
+
+    assert kitchen_router.stream_deadline(None) >= now + kitchen_router.STREAM_MAX_LIFETIME_SECONDS
+    assert kitchen_router.stream_deadline(time.time() + 60) < now + 61
+    assert kitchen_router.stream_deadline(time.time() - 60) <= time.monotonic() # Já vencido: fecha logo
@@ -0,0 +1,66 @@
+import time
+
+import pytest
+from flask import Flask, jsonify
+
+from adapters import request_stats
+from adapters.web.request_timing import RouteMetrics, install_request_timing
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+@pytest.fixture
+def metrics():
+    return RouteMetrics()
+
+
+@pytest.fixture
+def client(metrics):
+    app = Flask(__name__)
+    install_request_timing(app, metrics, log_requests=False)
+
+    @app.route("/items/<int:item_id>")
+    def get_item(item_id):
+        # Simula duas consultas ao banco
+        request_stats.record_sql(0.002)
+        request_stats.record_sql(0.001)
+        return jsonify({"id": item_id})
+
+    return app.test_client()
+
+
+# ---------------------------
+# Testes do middleware
+# ---------------------------
+
+def test_server_timing_header(client):
+    response = client.get("/items/1")
+    header = response.headers["Server-Timing"]
+
+    assert 'db;dur=3.00;desc="2 queries"' in header
+    assert "serialize;dur=" in header
+    assert "total;dur=" in header
+
+
+def test_metrics_grouped_by_route_template(client, metrics):
+    client.get("/items/1")
+    client.get("/items/2")
+
+    route = metrics.snapshot()["GET /items/<int:item_id>"]
+    assert route["count"] == 2
+    assert route["avg_sql_statements"] == 2
+    assert route["buckets_ms"]["+Inf"] == 2
+
+
+def test_stats_are_closed_after_request(client):
+    client.get("/items/1")
+    assert request_stats.current() is None
+
+
+def test_record_outside_request_is_ignored():
+    request_stats.record_sql(1.0)
+    with request_stats.timed("db"):
+        time.sleep(0)
+    assert request_stats.current() is None
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+from flask import Flask, request as flask_request
+from pydantic import BaseModel
+from quart import Quart, request as quart_request
+
+from domain.exceptions import (
+    BusinessRuleException,
+    UserNotFoundException,
+    TableNotFoundException,
+    ServiceBusyException
+)
+from adapters.web.route_helpers import FORBIDDEN_ERRORS, NO_JSON_DATA, parse_json, error_response
+
+TABLE_WRITE_ERRORS = {TableNotFoundException: 404, BusinessRuleException: 409, UserNotFoundException: 403}
+
+
+class OpenSchema(BaseModel):
+    number_of_people: int
+
+
+def _raise(kind):
+    errors = {
+        "missing": TableNotFoundException("Mesa 9 não encontrada."),
+        "busy": BusinessRuleException("Mesa já ocupada"),
+        "hasher": ServiceBusyException("Tente de novo."),
+        "bug": RuntimeError("falhou"),
+    }
+    if kind in errors:
+        raise errors[kind]
+
+
+def _route(data, kind):
+    validated = parse_json(OpenSchema, data)
+    _raise(kind)
+    return {"people": validated.number_of_people}, 200
+
+
+def _flask_client():
+    app = Flask(__name__)
+
+    @app.route("/<kind>", methods=["POST"])
+    def route(kind):
+        statuses = {**TABLE_WRITE_ERRORS, ServiceBusyException: 429}
+        try:
+            return _route(flask_request.get_json(silent=True), kind)
+        except Exception as e:
+            return error_response(e, statuses)
+
+    client = app.test_client()
+
+    def post(kind, body):
+        response = client.post(f"/{kind}", json=body)
+        return response.status_code, response.get_json(silent=True), response.get_data(as_text=True), response.headers
+
+    return post
+
+
+def _quart_client():
+    app = Quart(__name__)
+
+    @app.route("/<kind>", methods=["POST"])
+    async def route(kind):
+        statuses = {**TABLE_WRITE_ERRORS, ServiceBusyException: 429}
+        try:
+            return _route(await quart_request.get_json(silent=True), kind)
+        except Exception as e:
+            return error_response(e, statuses)
+
+    client = app.test_client()
+
+    def post(kind, body):
+        async def call():
+            response = await client.post(f"/{kind}", json=body)
+            text = await response.get_data(as_text=True)
+            return response.status_code, await response.get_json(), text, response.headers
+        return asyncio.run(call())
+
+    return post
+
+
+@pytest.fixture(params=[_flask_client, _quart_client], ids=["flask", "quart"])
+def post(request):
+    return request.param()
+
+
+def test_valid_body_reaches_the_route(post):
+    status, body, _, _ = post("ok", {"number_of_people": 4})
+
+    assert (status, body) == (200, {"people": 4})
+
+
+def test_empty_and_invalid_bodies_are_400(post):
+    status, _, text, _ = post("ok", {})
+    assert status == 400 and NO_JSON_DATA in text
+
+    status, body, _, _ = post("ok", {"number_of_people": "muitos"})
+    assert status == 400
+    assert body[0]["loc"] == ["number_of_people"]
+
+
+@pytest.mark.parametrize("kind, status, message", [
+    ("missing", 404, "Mesa 9 não encontrada."),
+    ("busy", 409, "Mesa já ocupada"),
+])
+def test_domain_errors_use_the_route_map(post, kind, status, message):
+    got_status, _, text, _ = post(kind, {"number_of_people": 2})
+
+    assert got_status == status
+    assert message in text
+
+
+def test_service_busy_asks_client_to_retry(post):
+    status, _, _, headers = post("hasher", {"number_of_people": 2})
+
+    assert status == 429
+    assert headers["Retry-After"] == "1"
+
+
+def test_unexpected_errors_are_500_json(post):
+    status, body, _, _ = post("bug", {"number_of_people": 2})
+
+    assert (status, body) == (500, {"error": "falhou"})
+
+
+def test_forbidden_map_covers_authorization_errors():
+    for error in (UserNotFoundException("x"), BusinessRuleException("y")):
+        with pytest.raises(Exception) as raised:
+            error_response(error, FORBIDDEN_ERRORS)
+        assert raised.value.code == 403
@@ -0,0 +1,190 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from flask import Flask, jsonify
+from werkzeug.http import http_date
+
+from domain.models.order import Order, OrderStatus
+from domain.models.product import Product
+from domain.models.table import Table, TableStatus
+from pydantic import ValidationError
+
+from domain.models import OrderHistoryCursor, SalesDimension, SalesReport, SalesReportLine
+from adapters.web.schemas import (
+    OrderHistoryQuerySchema,
+    SalesReportQuerySchema,
+    SalesReportSchema,
+    dump,
+    encode_history_cursor,
+    decode_history_cursor,
+    OrderResponseSchema,
+    ProductResponseSchema,
+    TableResponseSchema,
+    dump_many,
+    dump_many_json,
+    _http_datetime
+)
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+def make_products():
+    return [
+        Product(id=1, name="Pão de Queijo", price=0.1 + 0.2, availability=True,
+                category="Entradas", imageUrl="https://example.com/pão.jpg", visibility=True),
+        Product(id=2, name="Café \"expresso\"", price=7, availability=False,
+                category="Bebidas", imageUrl="", visibility=False),
+    ]
+
+
+def make_orders(n: int):
+    products = make_products()
+    orders = []
+    for i in range(1, n + 1):
+        order = Order(id=i, table_number=i % 30 + 1, waiter_id=5,
+                      created_at=datetime(2025, 11, 3, 20, i % 60, i % 60, 123456))
+        order.add_item(products[0], 2)
+        order.add_item(products[1], i % 3 + 1)
+        order.status = list(OrderStatus)[i % len(OrderStatus)]
+        orders.append(order)
+    return orders
+
+
+def make_odd_products():
+    """Valores que o pydantic escreve diferente do 'json' padrão."""
+    return [
+        Product(id=1, name="Caro", price=1e16, availability=True,
+                category="x", imageUrl="", visibility=True),
+        Product(id=2, name="Quase de graça", price=0.00001, availability=True,
+                category="x", imageUrl="", visibility=True),
+        Product(id=3, name="DEL \x7f no nome", price=1.5, availability=True,
+                category="x", imageUrl="https://example.com/1e3f.jpg", visibility=True),
+    ]
+
+
+def make_tables():
+    return [
+        Table(id=1),
+        Table(id=2, status=TableStatus.OCCUPIED, number_of_people=4),
+    ]
+
+
+@pytest.fixture(params=[False, True], ids=["compact", "debug"])
+def app(request):
+    app = Flask(__name__)
+    app.debug = request.param
+    return app
+
+
+# ---------------------------
+# Compatibilidade com o jsonify()
+# ---------------------------
+
+@pytest.mark.parametrize("schema, objs", [
+    (OrderResponseSchema, make_orders(50)),
+    (TableResponseSchema, make_tables()),
+    (ProductResponseSchema, make_products()),
+    (ProductResponseSchema, make_odd_products()),
+    (OrderResponseSchema, []),
+], ids=["orders", "tables", "products", "odd-values", "empty"])
+def test_dump_many_json_matches_jsonify_bytes(app, schema, objs):
+    with app.app_context():
+        expected = jsonify([schema.model_validate(o).model_dump() for o in objs]).get_data()
+        assert dump_many_json(schema, objs, pretty=app.debug) == expected
+
+
+@pytest.mark.parametrize("product", make_odd_products(), ids=["huge", "tiny", "del"])
+def test_each_odd_value_alone_matches_jsonify(product):
+    app = Flask(__name__)
+    with app.app_context():
+        expected = jsonify([ProductResponseSchema.model_validate(product).model_dump()]).get_data()
+        assert dump_many_json(ProductResponseSchema, [product]) == expected
+
+
+def test_dump_many_matches_per_object_dump():
+    orders = make_orders(10)
+
+    assert dump_many(OrderResponseSchema, orders) == [
+        OrderResponseSchema.model_validate(o).model_dump() for o in orders
+    ]
+
+
+@pytest.mark.parametrize("value", [
+    datetime(2025, 1, 5, 3, 4, 5),
+    datetime(1999, 12, 31, 23, 59, 59, 999999),
+    datetime(2025, 6, 1, 12, 0, tzinfo=timezone(timedelta(hours=-3))),
+])
+def test_http_datetime_matches_werkzeug(value):
+    assert _http_datetime(value) == http_date(value)
+
+
+# ---------------------------
+# Histórico de pedidos
+# ---------------------------
+
+def test_history_cursor_round_trip():
+    cursor = OrderHistoryCursor(created_at=datetime(2025, 3, 1, 21, 15, 2), id=4321)
+
+    token = encode_history_cursor(cursor)
+
+    assert "=" not in token and "|" not in token # Seguro na query string
+    assert decode_history_cursor(token) == cursor
+
+
+@pytest.mark.parametrize("params", [
+    {"cursor": "não-é-base64"},
+    {"cursor": encode_history_cursor(OrderHistoryCursor(datetime(2025, 1, 1), 1))[:-3]},
+    {"date_from": "2025-02-01", "date_to": "2025-01-01"},
+    {"limit": "0"},
+    {"status": "lost"},
+])
+def test_history_query_rejects_invalid_params(params):
+    with pytest.raises(ValidationError):
+        OrderHistoryQuerySchema.model_validate(params)
+
+
+def test_history_query_builds_filter_and_cursor():
+    cursor = OrderHistoryCursor(created_at=datetime(2025, 3, 1, 21, 15), id=7)
+    query = OrderHistoryQuerySchema.model_validate({
+        "date_from": "2025-01-01", "date_to": "2025-04-01", "table_id": "3",
+        "status": "completed", "cursor": encode_history_cursor(cursor)
+    })
+
+    filters = query.to_filter()
+    assert (filters.date_from, filters.table_id, filters.status) == (datetime(2025, 1, 1), 3, OrderStatus.COMPLETED)
+    assert filters.waiter_id is None
+    assert query.after() == cursor
+    assert query.limit == 50
+
+
+def test_sales_report_query_defaults_to_month_to_date():
+    query = SalesReportQuerySchema.model_validate({"dimension": "product"})
+
+    today = date.today()
+    assert query.dimension == SalesDimension.PRODUCT
+    assert (query.date_from, query.date_to) == (today.replace(day=1), today + timedelta(days=1))
+
+
+@pytest.mark.parametrize("params", [
+    {"dimension": "table"},
+    {"dimension": "hour", "date_from": "2025-02-01", "date_to": "2025-01-01"},
+    {"dimension": "hour", "date_from": "2020-01-01", "date_to": "2025-01-01"}, # Período longo demais
+])
+def test_sales_report_query_rejects_invalid_params(params):
+    with pytest.raises(ValidationError):
+        SalesReportQuerySchema.model_validate(params)
+
+
+def test_sales_report_dump_keeps_key_types_and_totals():
+    report = SalesReport(
+        dimension=SalesDimension.CATEGORY, date_from=date(2025, 3, 1), date_to=date(2025, 4, 1),
+        lines=[SalesReportLine(key="Bebidas", label=None, orders=3, items=5, revenue=40.1),
+               SalesReportLine(key="Pizza", label=None, orders=2, items=2, revenue=99.8)]
+    )
+
+    body = dump(SalesReportSchema, report)
+
+    assert [line["key"] for line in body["lines"]] == ["Bebidas", "Pizza"]
+    assert (body["total_items"], body["total_revenue"]) == (7, 139.9)
@@ -0,0 +1,106 @@
+import os
+import sys
+from datetime import datetime
+
+# Os scripts de benchmarks/ importam uns aos outros pelo nome do módulo
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'benchmarks'))
+
+import explain_check
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+class FakeCursor:
+    """Cursor falso: responde às consultas do seed_history e falha depois do close()."""
+
+    def __init__(self):
+        self.closed = False
+        self.statements = []
+        self._result = []
+
+    def _check_open(self):
+        if self.closed:
+            raise RuntimeError("Cursor is not connected")
+
+    def execute(self, query, params=()):
+        self._check_open()
+        self.statements.append(query)
+        if query.startswith("SELECT id, price FROM products"):
+            self._result = [(1, 8.0), (2, 30.0), (3, 12.5)]
+        elif query.startswith("SELECT id, category FROM products"):
+            self._result = [(1, "Bebidas"), (2, "Pratos"), (3, None)]
+        elif query.startswith("SELECT id FROM users"):
+            self._result = [(7,)]
+        else:
+            self._result = []
+
+    def executemany(self, query, rows):
+        self._check_open()
+        self.statements.append(query)
+
+    def fetchall(self):
+        self._check_open()
+        return self._result
+
+    def fetchone(self):
+        self._check_open()
+        return self._result[0]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self):
+        self.cursors = []
+        self.commits = 0
+
+    def cursor(self):
+        self.cursors.append(FakeCursor())
+        return self.cursors[-1]
+
+    def commit(self):
+        self.commits += 1
+
+
+def _seed(connection):
+    return explain_check.seed_history(connection, n_tables=2, sessions_per_table=3,
+                                      orders_per_session=2, items_per_order=2, seed=1)
+
+
+# ---------------------------
+# Semeadura do histórico
+# ---------------------------
+
+def test_seed_history_runs_to_the_end():
+    connection = FakeConnection()
+
+    ids = _seed(connection)
+
+    assert ids["waiter_id"] == 7
+    assert ids["open_order_ids"] == (13, 14)
+    assert all(cursor.closed for cursor in connection.cursors)
+
+
+def test_rollups_are_seeded_before_analyze():
+    connection = FakeConnection()
+
+    _seed(connection)
+
+    statements = [query for cursor in connection.cursors for query in cursor.statements]
+    analyze = next(i for i, query in enumerate(statements) if query.startswith("ANALYZE TABLE"))
+    rollups = [i for i, query in enumerate(statements) if query.startswith("INSERT INTO sales_")]
+    assert rollups and max(rollups) < analyze
+
+
+def test_rollups_count_only_completed_orders():
+    cursor = FakeCursor()
+    day = datetime(2024, 5, 1, 20, 15)
+    orders = [(1, 1, 7, "completed", day, 1), (2, 1, 7, "cancelled", day, 1)]
+    items = [(1, 1, 1, 2, 8.0), (2, 2, 2, 1, 30.0)]
+
+    explain_check.seed_sales_rollups(cursor, orders, items)
+
+    assert sum(query.startswith("INSERT INTO sales_") for query in cursor.statements) == 4
@@ -164,3 +164,136 @@ def test_mark_as_cancelled_invalid_if_completed(order):
 
     with pytest.raises(ValueError):
         order.mark_as_cancelled()
+
+
+# ---------------------------
+# Testes do rastreamento de mudanças (persistência incremental)
+# ---------------------------
+
+def test_new_order_items_are_all_added(order, product1, product2):
+    order.add_item(product1, 2)
+    order.add_item(product2, 1)
+
+    changes = order.pending_item_changes()
+    assert [item.product.id for item in changes.added] == [1, 2]
+    assert changes.changed == []
+    assert changes.removed == []
+
+
+def test_no_changes_after_mark_as_persisted(order, product1):
+    order.add_item(product1, 2)
+    order.mark_as_persisted()
+
+    assert order.pending_item_changes().is_empty()
+    assert not order.has_status_change()
+
+
+def test_adding_one_item_to_persisted_order_is_one_insert(order, product1, product2):
+    order.add_item(product1, 2)
+    order.mark_as_persisted()
+
+    order.add_item(product2, 1)
+    changes = order.pending_item_changes()
+    assert [item.product.id for item in changes.added] == [2]
+    assert changes.changed == []
+    assert changes.removed == []
+
+
+def test_incrementing_existing_item_is_a_change(order, product1):
+    order.add_item(product1, 2)
+    order.mark_as_persisted()
+
+    order.add_item(product1, 1)
+    changes = order.pending_item_changes()
+    assert changes.added == []
+    assert [(item.product.id, item.quantity) for item in changes.changed] == [(1, 3)]
+
+
+def test_removed_product_is_tracked(order, product1, product2):
+    order.add_item(product1, 1)
+    order.add_item(product2, 1)
+    order.mark_as_persisted()
+
+    order.remove_product(product1.id)
+    changes = order.pending_item_changes()
+    assert changes.removed == [product1.id]
+    assert changes.added == [] and changes.changed == []
+
+
+def test_status_change_is_tracked(order):
+    order.mark_as_persisted()
+    order.mark_as_in_progress()
+    assert order.has_status_change()
+
+
+# ---------------------------
+# Testes do índice de itens e do total em cache
+# ---------------------------
+
+def test_find_item_uses_product_id(order, product1, product2):
+    order.add_item(product1, 1)
+    order.add_item(product2, 2)
+
+    assert order.find_item(product2.id).quantity == 2
+    assert order.find_item(999) is None
+
+
+def test_total_follows_quantity_changes_and_removals(order, product1, product2):
+    order.add_item(product1, 1)
+    order.add_item(product2, 1)
+    assert order.total_price == 38
+
+    order.add_item(product1, 2)
+    assert order.total_price == 98
+
+    order.remove_product(product1.id)
+    assert order.total_price == 8
+    assert order.find_item(product1.id) is None
+
+
+def test_total_is_exactly_the_sum_of_items(order):
+    for i in range(1, 200):
+        product = Product(id=i, name=f"P{i}", price=0.1 * i, availability=True,
+                          category="Food", imageUrl="", visibility=True)
+        order.add_item(product, i % 3 + 1)
+        if i % 7 == 0:
+            order.add_item(product, 1)
+        if i % 11 == 0:
+            order.remove_product(i - 1)
+
+    assert order.total_price == sum(item.total_price for item in order.items)
+
+
+def test_items_given_to_constructor_are_indexed(product1, product2):
+    order = Order(id=1, table_number=10, waiter_id=5,
+                  items=[ItemOrder(product=product1, quantity=1)])
+
+    order.add_item(product1, 1)
+    assert len(order.items) == 1
+    assert order.total_price == 60
+
+
+def test_index_resyncs_after_direct_list_changes(order, product1, product2):
+    order.add_item(product1, 1)
+    assert order.total_price == 30
+
+    order.items.append(ItemOrder(product=product2, quantity=1))
+    assert order.total_price == 38
+    assert order.find_item(product2.id) is not None
+
+    order.items = []
+    assert order.total_price == 0
+    assert order.find_item(product1.id) is None
+
+
+def test_attach_item_skips_business_rules(order, product1):
+    order.mark_as_cancelled()
+
+    order.attach_item(ItemOrder(product=product1, quantity=2))
+
+    assert order.total_price == 60
+
+
+def test_models_use_slots(order):
+    assert not hasattr(order, "__dict__")
+    assert not hasattr(ItemOrder(product=None, quantity=1), "__dict__")
@@ -0,0 +1,60 @@
+import pytest
+from domain.models.order import Order, OrderStatus
+from domain.models.table import Table, TableStatus
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+@pytest.fixture
+def occupied_table():
+    # Mesa como carregada do banco: ocupada e com sessão aberta
+    return Table(id=3, status=TableStatus.OCCUPIED, number_of_people=2, session_id=42)
+
+
+# ---------------------------
+# Testes de sessão da mesa
+# ---------------------------
+
+def test_open_table_starts_new_session():
+    table = Table(id=3, session_id=7)
+    table.open_table(number_of_people=4)
+
+    assert table.status == TableStatus.OCCUPIED
+    assert table.number_of_people == 4
+    assert table.session_id is None  # Nova sessão é criada pelo repositório
+
+
+def test_add_new_order_assigns_current_session(occupied_table):
+    order = Order(id=0, table_number=3, waiter_id=1)
+    occupied_table.add_new_order(order)
+
+    assert order.session_id == 42
+    assert occupied_table.orders == [order]
+
+
+def test_add_new_order_from_other_table_raises(occupied_table):
+    order = Order(id=0, table_number=4, waiter_id=1)
+    with pytest.raises(ValueError):
+        occupied_table.add_new_order(order)
+    assert order.session_id is None
+
+
+def test_close_table_ends_session(occupied_table):
+    order = Order(id=1, table_number=3, waiter_id=1, status=OrderStatus.COMPLETED)
+    occupied_table.orders.append(order)
+
+    completed = occupied_table.close_table()
+
+    assert completed == [order]
+    assert occupied_table.status == TableStatus.AVAILABLE
+    assert occupied_table.session_id is None
+    assert occupied_table.orders == []
+
+
+def test_close_table_with_pending_orders_keeps_session(occupied_table):
+    occupied_table.orders.append(Order(id=1, table_number=3, waiter_id=1))
+    with pytest.raises(ValueError):
+        occupied_table.close_table()
+    assert occupied_table.session_id == 42
@@ -0,0 +1,133 @@
+import asyncio
+import copy
+
+import pytest
+
+from domain.models import Order, OrderStatus, Product
+from domain.exceptions import BusinessRuleException, ConcurrencyConflictException
+from domain.use_cases import conflict_retry
+from domain.use_cases.waiter import AddItemToOrderUseCase, AsyncAddItemToOrderUseCase
+from domain.use_cases.kitchen import StartOrderPreparationUseCase
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(conflict_retry, "BACKOFF_SECONDS", 0)
+
+
+def _product(product_id):
+    return Product(id=product_id, name=f"P{product_id}", price=10.0, availability=True,
+                   category="Food", imageUrl="", visibility=True)
+
+
+class VersionedOrderRepository:
+    """
+    Repositório em memória com o mesmo controle otimista do MySQL:
+    save() só grava se a 'version' do pedido ainda for a do "banco".
+    'concurrent_writes' são gravações de outra pessoa, feitas logo antes
+    dos próximos save() (entre a carga e a gravação do caso de uso).
+    """
+
+    def __init__(self, order):
+        self.stored = copy.deepcopy(order)
+        self.concurrent_writes = []
+        self.loads = 0
+        self.conflicts = 0
+
+    def find_by_id(self, order_id):
+        self.loads += 1
+        order = copy.deepcopy(self.stored)
+        order.mark_as_persisted()
+        return order
+
+    def save(self, order):
+        if self.concurrent_writes:
+            self.concurrent_writes.pop(0)(self.stored)
+            self.stored.version += 1
+        if order.version != self.stored.version:
+            self.conflicts += 1
+            raise ConcurrencyConflictException()
+        order.version += 1
+        self.stored = copy.deepcopy(order)
+        return order
+
+
+class FakeProductRepository:
+    def find_by_id(self, product_id):
+        return _product(product_id)
+
+
+class FakePublisher:
+    def __init__(self):
+        self.events = []
+
+    def publish(self, event_type, order):
+        self.events.append((event_type.value, order.id))
+
+
+class AsyncWrapper:
+    """Expõe os métodos de um fake síncrono como corrotinas."""
+
+    def __init__(self, inner):
+        self.inner = inner
+
+    def __getattr__(self, name):
+        method = getattr(self.inner, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+
+def _order():
+    order = Order(id=7, table_number=1, waiter_id=1)
+    order.add_item(_product(1), 1)
+    return order
+
+
+def test_concurrent_item_additions_are_not_lost():
+    repo = VersionedOrderRepository(_order())
+    # Outro garçom soma mais uma unidade entre a nossa carga e o nosso save
+    repo.concurrent_writes.append(lambda stored: stored.add_item(_product(1), 1))
+    publisher = FakePublisher()
+
+    order = AddItemToOrderUseCase(repo, FakeProductRepository(), publisher).execute(7, 1, 1)
+
+    assert order.find_item(1).quantity == 3
+    assert repo.stored.find_item(1).quantity == 3
+    assert (repo.loads, repo.conflicts) == (2, 1)
+    assert publisher.events == [("order_updated", 7)] # Só a tentativa que gravou avisa
+
+
+def test_retry_reevaluates_business_rules_on_fresh_state():
+    repo = VersionedOrderRepository(_order())
+    # O pedido é cancelado enquanto a cozinha o abria
+    repo.concurrent_writes.append(lambda stored: stored.mark_as_cancelled())
+
+    with pytest.raises(BusinessRuleException) as error:
+        StartOrderPreparationUseCase(repo).execute(7)
+
+    assert not isinstance(error.value, ConcurrencyConflictException)
+    assert repo.stored.status == OrderStatus.CANCELLED
+
+
+def test_gives_up_after_max_attempts():
+    repo = VersionedOrderRepository(_order())
+    repo.concurrent_writes = [lambda stored: None] * 10 # Sempre alguém na frente
+
+    with pytest.raises(ConcurrencyConflictException):
+        StartOrderPreparationUseCase(repo).execute(7)
+
+    assert repo.conflicts == conflict_retry.MAX_ATTEMPTS
+    assert repo.stored.status == OrderStatus.PENDING
+
+
+def test_async_use_case_retries_on_conflict():
+    repo = VersionedOrderRepository(_order())
+    repo.concurrent_writes.append(lambda stored: stored.add_item(_product(2), 1))
+    use_case = AsyncAddItemToOrderUseCase(AsyncWrapper(repo), AsyncWrapper(FakeProductRepository()))
+
+    order = asyncio.run(use_case.execute(7, 1, 1))
+
+    assert {item.product.id: item.quantity for item in order.items} == {1: 2, 2: 1}
+    assert repo.conflicts == 1
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from domain.models import Order, Product
+from domain.models.table import Table, TableStatus
+from domain.exceptions import ProductNotFoundException, TableNotFoundException
+from domain.use_cases.waiter.create_order_use_case import CreateOrderUseCase, AsyncCreateOrderUseCase
+from adapters.web.routers.waiter_router import BATCH_ERROR_STATUS
+
+
+# ---------------------------
+# Fixtures auxiliares
+# ---------------------------
+
+def _product(product_id, price=10.0):
+    return Product(id=product_id, name=f"Produto {product_id}", price=price, availability=True,
+                   category="pizza", imageUrl="", visibility=True)
+
+
+class FakeTableRepository:
+    def __init__(self):
+        self.table = Table(id=3, status=TableStatus.OCCUPIED, number_of_people=2, session_id=42)
+
+    def find_by_id(self, table_id):
+        return self.table if table_id == self.table.id else None
+
+
+class FakeProductRepository:
+    """Conta as buscas: o caso de uso deve fazer UMA por pedido."""
+
+    def __init__(self, products):
+        self.products = {p.id: p for p in products}
+        self.find_by_ids_calls = []
+
+    def find_by_id(self, product_id):
+        raise AssertionError("O pedido deve buscar os produtos com find_by_ids")
+
+    def find_by_ids(self, product_ids):
+        self.find_by_ids_calls.append(list(product_ids))
+        return {i: self.products[i] for i in product_ids if i in self.products}
+
+
+class FakeOrderRepository:
+    def __init__(self):
+        self.saved = []
+
+    def save(self, order: Order) -> Order:
+        order.id = len(self.saved) + 1
+        self.saved.append(order)
+        return order
+
+
+class AsyncAdapter:
+    """Expõe os métodos de um fake síncrono como corrotinas."""
+
+    def __init__(self, inner):
+        self.inner = inner
+
+    def __getattr__(self, name):
+        method = getattr(self.inner, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+
+@pytest.fixture
+def repos():
+    return FakeTableRepository(), FakeProductRepository([_product(1), _product(2, price=5.0)]), FakeOrderRepository()
+
+
+# ---------------------------
+# Testes do caso de uso
+# ---------------------------
+
+def test_all_products_found_creates_order_with_one_lookup(repos):
+    tables, products, orders = repos
+    items = [{"product_id": 1, "quantity": 2}, {"product_id": 2, "quantity": 1}, {"product_id": 1, "quantity": 1}]
+
+    order = CreateOrderUseCase(tables, products, orders).execute(waiter_id=7, table_id=3, items_data=items)
+
+    assert order.id == 1 and orders.saved == [order]
+    assert order.session_id == 42
+    assert order.total_price == 35.0 # 3 x 10 + 1 x 5
+    assert products.find_by_ids_calls == [[1, 2, 1]]
+
+
+def test_missing_products_raise_product_not_found(repos):
+    tables, products, orders = repos
+    items = [{"product_id": 1, "quantity": 1}, {"product_id": 98, "quantity": 1}, {"product_id": 99, "quantity": 1}]
+
+    with pytest.raises(ProductNotFoundException) as exc_info:
+        CreateOrderUseCase(tables, products, orders).execute(waiter_id=7, table_id=3, items_data=items)
+
+    assert "98, 99" in str(exc_info.value)
+    assert orders.saved == []
+    assert BATCH_ERROR_STATUS[ProductNotFoundException] == 404 # Mesmo status da rota individual
+
+
+def test_unknown_table_raises_before_looking_up_products(repos):
+    tables, products, orders = repos
+
+    with pytest.raises(TableNotFoundException):
+        CreateOrderUseCase(tables, products, orders).execute(waiter_id=7, table_id=9, items_data=[{"product_id": 1, "quantity": 1}])
+
+    assert products.find_by_ids_calls == []
+
+
+def test_async_use_case_follows_the_same_rules(repos):
+    tables, products, orders = repos
+    use_case = AsyncCreateOrderUseCase(AsyncAdapter(tables), AsyncAdapter(products), AsyncAdapter(orders))
+
+    order = asyncio.run(use_case.execute(waiter_id=7, table_id=3, items_data=[{"product_id": 2, "quantity": 2}]))
+    assert order.total_price == 10.0
+
+    with pytest.raises(ProductNotFoundException):
+        asyncio.run(use_case.execute(waiter_id=7, table_id=3, items_data=[{"product_id": 50, "quantity": 1}]))
+    assert products.find_by_ids_calls == [[2], [50]]
@@ -0,0 +1,82 @@
+import pytest
+
+from domain.models import Product, ProductImportRow, User, UserRole
+from domain.models.product_import import MAX_REPORTED_ERRORS
+from domain.exceptions import BusinessRuleException
+from domain.use_cases.admin import ImportProductsUseCase
+
+
+class FakeProductRepository:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on # Nome de produto que faz o lote falhar
+        self.batches = []
+
+    def upsert_batch(self, products):
+        if any(product.name == self.fail_on for product in products):
+            raise RuntimeError("Deadlock found") # Lote inteiro desfeito
+        self.batches.append([product.name for product in products])
+        # Um "inserido" por lote e o resto "igual", para somar
+        return 1, 0, len(products) - 1
+
+
+class FakeUserRepository:
+    def __init__(self):
+        self.users = {
+            1: User(id=1, username="admin", name="Admin", hashed_password="h", roles=[UserRole.ADMIN]),
+            2: User(id=2, username="ana", name="Ana", hashed_password="h", roles=[UserRole.WAITER]),
+        }
+
+    def find_by_id(self, user_id):
+        return self.users.get(user_id)
+
+
+def _row(line, name=None, error=None):
+    if error:
+        return ProductImportRow(line=line, error=error)
+    product = Product(id=0, name=name or f"P{line}", price=10.0, availability=True,
+                      category="pizza", imageUrl="", visibility=True)
+    return ProductImportRow(line=line, product=product)
+
+
+def _use_case(repo=None):
+    return ImportProductsUseCase(repo or FakeProductRepository(), FakeUserRepository())
+
+
+def test_rows_are_saved_in_batches_and_counts_are_summed():
+    repo = FakeProductRepository()
+    rows = (_row(line) for line in range(2, 9)) # Gerador: lido uma vez, aos poucos
+
+    summary = _use_case(repo).execute(rows, admin_id=1, batch_size=3)
+
+    assert repo.batches == [["P2", "P3", "P4"], ["P5", "P6", "P7"], ["P8"]]
+    assert (summary.inserted, summary.updated, summary.unchanged) == (3, 0, 4)
+    assert summary.rejected == 0 and summary.errors == []
+
+
+def test_invalid_rows_and_failed_batches_are_rejected_without_stopping():
+    repo = FakeProductRepository(fail_on="quebra")
+    rows = [_row(2), _row(3, error="price: obrigatório"), _row(4, "quebra"), _row(5), _row(6)]
+
+    summary = _use_case(repo).execute(rows, batch_size=2)
+
+    assert repo.batches == [["P5", "P6"]]
+    assert [(row.line, row.error.split(".")[0]) for row in summary.errors] == [
+        (3, "price: obrigatório"),
+        (2, "Não foi possível salvar o produto"), # Mesmo lote da linha 4
+        (4, "Não foi possível salvar o produto"),
+    ]
+    assert summary.rejected == 3 and summary.inserted == 1
+
+
+def test_summary_keeps_only_the_first_errors():
+    rows = [_row(line, error="ruim") for line in range(MAX_REPORTED_ERRORS + 50)]
+
+    summary = _use_case().execute(rows)
+
+    assert summary.rejected == MAX_REPORTED_ERRORS + 50
+    assert len(summary.errors) == MAX_REPORTED_ERRORS
+
+
+def test_only_admins_can_import():
+    with pytest.raises(BusinessRuleException):
+        _use_case().execute([_row(2)], admin_id=2)
@@ -0,0 +1,103 @@
+import pytest
+
+from domain.models import User, UserRole
+from domain.exceptions import BusinessRuleException
+from domain.use_cases.admin import ImportUsersUseCase
+
+
+class FakeUserRepository:
+    def __init__(self, existing=(), conflict_on=None):
+        self.users = {i: User(id=i, username=name, name=name, hashed_password="h", roles=[UserRole.WAITER])
+                      for i, name in enumerate(existing, start=1)}
+        self.conflict_on = conflict_on # Username criado por "outro processo"
+        self.batches = []
+        self.single_saves = []
+
+    def find_by_id(self, user_id):
+        return self.users.get(user_id)
+
+    def find_existing_usernames(self, usernames):
+        return {u.username for u in self.users.values() if u.username.lower() in {n.lower() for n in usernames}}
+
+    def _insert(self, user):
+        if user.username == self.conflict_on:
+            raise RuntimeError("Duplicate entry")
+        user.id = len(self.users) + 1
+        self.users[user.id] = user
+
+    def insert_batch(self, users):
+        if any(user.username == self.conflict_on for user in users):
+            raise RuntimeError("Duplicate entry") # Lote inteiro desfeito
+        self.batches.append([user.username for user in users])
+        for user in users:
+            self._insert(user)
+        return users
+
+    def save(self, user):
+        self.single_saves.append(user.username)
+        self._insert(user)
+        return user
+
+
+class FakeHasher:
+    def __init__(self):
+        self.calls = []
+
+    def hash_many(self, passwords):
+        self.calls.append(list(passwords))
+        return [f"hash:{password}" for password in passwords]
+
+
+def _row(line, username, password="segredo1", **extra):
+    return line, {"username": username, "password": password, "name": username.title(), **extra}
+
+
+def test_imports_in_batches_with_one_hash_call():
+    repo, hasher = FakeUserRepository(), FakeHasher()
+    rows = [_row(line, f"user{line}") for line in range(2, 7)]
+
+    results = ImportUsersUseCase(repo, hasher).execute(rows, batch_size=2)
+
+    assert [result.created for result in results] == [True] * 5
+    assert repo.batches == [["user2", "user3"], ["user4", "user5"], ["user6"]]
+    assert hasher.calls == [["segredo1"] * 5]
+    assert repo.users[results[0].user_id].hashed_password == "hash:segredo1"
+
+
+def test_reports_each_refused_row_and_keeps_the_others():
+    repo, hasher = FakeUserRepository(existing=["bruno"]), FakeHasher()
+    rows = [
+        _row(2, "ana.s"),
+        _row(3, "Bruno"),             # Já cadastrado (sem diferenciar caixa)
+        _row(4, "ANA.S"),             # Repetido no arquivo
+        _row(5, "dani", roles=["chef"]),
+        _row(6, "eva", password=""),
+    ]
+
+    results = ImportUsersUseCase(repo, hasher).execute(rows)
+
+    assert [result.line for result in results] == [2, 3, 4, 5, 6]
+    assert results[0].created
+    assert "já está em uso" in results[1].error
+    assert "se repete" in results[2].error
+    assert "inválidos" in results[3].error
+    assert "obrigatórios" in results[4].error
+    assert hasher.calls == [["segredo1"]] # Só as senhas que serão gravadas
+
+
+def test_failed_batch_falls_back_to_row_by_row():
+    repo = FakeUserRepository(conflict_on="bia")
+    rows = [_row(2, "ana.s"), _row(3, "bia"), _row(4, "caio")]
+
+    results = ImportUsersUseCase(repo, FakeHasher()).execute(rows, batch_size=10)
+
+    assert repo.single_saves == ["ana.s", "bia", "caio"]
+    assert [result.created for result in results] == [True, False, True]
+    assert "Não foi possível salvar" in results[1].error
+
+
+def test_requires_admin_when_called_by_a_user():
+    repo = FakeUserRepository(existing=["garcom"])
+
+    with pytest.raises(BusinessRuleException):
+        ImportUsersUseCase(repo, FakeHasher()).execute([_row(2, "ana.s")], admin_id=1)
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from mysql.connector import Error
+
+from domain.models import User, UserRole
+from domain.exceptions import ServiceBusyException
+from domain.use_cases.auth.login_use_case import LoginUseCase, AsyncLoginUseCase
+
+
+class FakeUserRepository:
+    def __init__(self, save_error=None):
+        self.user = User(id=1, username="ana", name="Ana", hashed_password="old:segredo", roles=[UserRole.WAITER])
+        self.save_error = save_error
+        self.saved = []
+
+    def find_by_username(self, username):
+        return self.user if username == self.user.username else None
+
+    def save(self, user):
+        if self.save_error:
+            raise self.save_error
+        self.saved.append(user.hashed_password)
+        return user
+
+
+class AsyncFakeUserRepository(FakeUserRepository):
+    async def find_by_username(self, username):
+        return super().find_by_username(username)
+
+    async def save(self, user):
+        return super().save(user)
+
+
+class FakeHasher:
+    """Hashes 'old:' precisam ser refeitos; 'hash_error' simula o hasher falhando."""
+
+    def __init__(self, hash_error=None):
+        self.hash_error = hash_error
+
+    def check(self, password_plaintext, hashed_password):
+        return hashed_password.split(":", 1)[1] == password_plaintext
+
+    def needs_rehash(self, hashed_password):
+        return hashed_password.startswith("old:")
+
+    def hash(self, password_plaintext):
+        if self.hash_error:
+            raise self.hash_error
+        return f"new:{password_plaintext}"
+
+
+class FakeTokens:
+    def generate(self, user_id, roles):
+        return f"token-{user_id}"
+
+
+def _login(repo, hasher):
+    return LoginUseCase(repo, hasher, FakeTokens()).execute("ana", "segredo")
+
+
+def test_login_rehashes_outdated_hash():
+    repo = FakeUserRepository()
+
+    assert _login(repo, FakeHasher()) == "token-1"
+    assert repo.saved == ["new:segredo"]
+
+
+@pytest.mark.parametrize("repo_error, hash_error", [
+    (Error("Lost connection to MySQL server"), None),
+    (None, ServiceBusyException()),
+])
+def test_expected_rehash_failures_do_not_block_login(repo_error, hash_error, capsys):
+    repo = FakeUserRepository(save_error=repo_error)
+
+    assert _login(repo, FakeHasher(hash_error=hash_error)) == "token-1"
+    assert repo.user.hashed_password == "old:segredo" # O hash antigo continua valendo
+    assert "Erro ao atualizar o hash" in capsys.readouterr().out
+
+
+def test_unexpected_rehash_errors_propagate():
+    with pytest.raises(TypeError):
+        _login(FakeUserRepository(save_error=TypeError("bug")), FakeHasher())
+
+
+def test_async_login_reports_rehash_failure(capsys):
+    repo = AsyncFakeUserRepository(save_error=Error("Deadlock found"))
+    use_case = AsyncLoginUseCase(repo, FakeHasher(), FakeTokens())
+
+    assert asyncio.run(use_case.execute("ana", "segredo")) == "token-1"
+    assert "Erro ao atualizar o hash" in capsys.readouterr().out
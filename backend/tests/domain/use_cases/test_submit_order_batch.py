@@ -0,0 +1,179 @@
+import asyncio
+
+import pytest
+
+from domain.models import Order, Product, Table
+from domain.exceptions import BusinessRuleException, ProductNotFoundException, TableNotFoundException
+from domain.use_cases.waiter import SubmitOrderBatchUseCase, AsyncSubmitOrderBatchUseCase
+
+
+def _product(product_id):
+    return Product(id=product_id, name=f"P{product_id}", price=10.0, availability=True,
+                   category="Food", imageUrl="", visibility=True)
+
+
+class FakeProductRepository:
+    def __init__(self, ids):
+        self.products = {i: _product(i) for i in ids}
+        self.lookups = []
+
+    def find_by_ids(self, product_ids):
+        self.lookups.append(list(product_ids))
+        return {i: self.products[i] for i in product_ids if i in self.products}
+
+
+class FakeTableRepository:
+    def __init__(self, tables):
+        self.tables = tables
+        self.loads = []
+
+    def find_by_id(self, table_id):
+        self.loads.append(table_id)
+        return self.tables.get(table_id)
+
+
+class FakeOrderRepository:
+    def __init__(self, orders=(), fail=False):
+        self.orders = {o.id: o for o in orders}
+        self.batches = []
+        self.fail = fail
+        self.next_id = 100
+
+    def find_by_id(self, order_id):
+        return self.orders.get(order_id)
+
+    def save_all(self, orders):
+        if self.fail:
+            raise RuntimeError("deadlock")
+        self.batches.append(list(orders))
+        for order in orders:
+            if order.id == 0:
+                self.next_id += 1
+                order.id = self.next_id
+        return orders
+
+
+class FakePublisher:
+    def __init__(self):
+        self.events = []
+
+    def publish(self, event_type, order):
+        self.events.append((event_type.value, order.id))
+
+
+class AsyncWrapper:
+    """Expõe os métodos de um fake síncrono como corrotinas."""
+
+    def __init__(self, inner):
+        self.inner = inner
+
+    def __getattr__(self, name):
+        method = getattr(self.inner, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+
+def _occupied(table_id):
+    table = Table(id=table_id)
+    table.open_table(4)
+    return table
+
+
+@pytest.fixture
+def repos():
+    existing = Order(id=7, table_number=1, waiter_id=5)
+    return (
+        FakeTableRepository({1: _occupied(1), 2: _occupied(2), 3: Table(id=3)}),
+        FakeProductRepository([1, 2, 3]),
+        FakeOrderRepository([existing]),
+        FakePublisher(),
+    )
+
+
+def _use_case(repos):
+    tables, products, orders, publisher = repos
+    return SubmitOrderBatchUseCase(tables, products, orders, publisher)
+
+
+def test_batch_saves_valid_entries_in_one_transaction(repos):
+    tables, products, orders, publisher = repos
+
+    result = _use_case(repos).execute(
+        waiter_id=5,
+        new_orders=[
+            {"table_id": 1, "items": [{"product_id": 1, "quantity": 2}]},
+            {"table_id": 1, "items": [{"product_id": 2, "quantity": 1}]},
+            {"table_id": 2, "items": [{"product_id": 3, "quantity": 1}]},
+        ],
+        additions=[
+            {"order_id": 7, "items": [{"product_id": 1, "quantity": 1}]},
+            {"order_id": 7, "items": [{"product_id": 1, "quantity": 2}]},
+        ],
+    )
+
+    assert all(r.ok for r in result.new_orders + result.additions)
+    assert products.lookups == [[1, 2, 3]]
+    assert tables.loads == [1, 2]
+    assert len(orders.batches) == 1
+    assert [o.id for o in orders.batches[0]] == [101, 102, 103, 7]
+    assert orders.orders[7].find_item(1).quantity == 3
+    assert publisher.events == [
+        ("order_created", 101), ("order_created", 102), ("order_created", 103), ("order_updated", 7)
+    ]
+
+
+def test_invalid_entries_get_their_own_error(repos):
+    _, _, orders, _ = repos
+
+    result = _use_case(repos).execute(
+        waiter_id=5,
+        new_orders=[
+            {"table_id": 9, "items": [{"product_id": 1, "quantity": 1}]},
+            {"table_id": 3, "items": [{"product_id": 1, "quantity": 1}]}, # Mesa livre
+            {"table_id": 1, "items": [{"product_id": 99, "quantity": 1}]},
+            {"table_id": 1, "items": [{"product_id": 1, "quantity": 1}]},
+        ],
+        additions=[
+            {"order_id": 7, "items": [{"product_id": 1, "quantity": 1}, {"product_id": 2, "quantity": 0}]},
+        ],
+    )
+
+    errors = [type(r.error) for r in result.new_orders + result.additions]
+    assert errors == [
+        TableNotFoundException, BusinessRuleException, ProductNotFoundException,
+        type(None), BusinessRuleException,
+    ]
+    # A entrada inválida não alterou o pedido existente
+    assert orders.orders[7].items == []
+    assert [o.id for o in orders.batches[0]] == [101]
+
+
+def test_failed_transaction_publishes_nothing(repos):
+    tables, products, _, publisher = repos
+    failing = FakeOrderRepository(fail=True)
+    use_case = SubmitOrderBatchUseCase(tables, products, failing, publisher)
+
+    with pytest.raises(RuntimeError):
+        use_case.execute(5, [{"table_id": 1, "items": [{"product_id": 1, "quantity": 1}]}], [])
+
+    assert publisher.events == []
+
+
+def test_async_batch_matches_sync(repos):
+    tables, products, orders, publisher = repos
+    use_case = AsyncSubmitOrderBatchUseCase(
+        AsyncWrapper(tables), AsyncWrapper(products), AsyncWrapper(orders), publisher
+    )
+
+    result = asyncio.run(use_case.execute(
+        5,
+        [{"table_id": 2, "items": [{"product_id": 2, "quantity": 3}]}],
+        [{"order_id": 8, "items": [{"product_id": 1, "quantity": 1}]}],
+    ))
+
+    assert result.new_orders[0].order.id == 101
+    assert result.new_orders[0].order.total_price == 30.0
+    assert not result.additions[0].ok
+    assert publisher.events == [("order_created", 101)]
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from domain.models import User, UserRole
+from domain.exceptions import UserNotFoundException, BusinessRuleException
+from domain.use_cases.admin import UpdateUserUseCase, AsyncUpdateUserUseCase
+
+
+class FakeUserRepository:
+    def __init__(self):
+        self.users = {
+            1: User(id=1, username="admin", name="Admin", hashed_password="h", roles=[UserRole.ADMIN]),
+            2: User(id=2, username="ana", name="Ana", hashed_password="h", roles=[UserRole.WAITER]),
+            3: User(id=3, username="bia", name="Bia", hashed_password="h", roles=[UserRole.WAITER]),
+        }
+        self.username_lookups = []
+
+    def find_by_id(self, user_id):
+        return self.users.get(user_id)
+
+    def find_by_username(self, username):
+        self.username_lookups.append(username)
+        return next((u for u in self.users.values() if u.username == username), None)
+
+    def save(self, user):
+        return user
+
+
+class AsyncFakeUserRepository(FakeUserRepository):
+    async def find_by_id(self, user_id):
+        return super().find_by_id(user_id)
+
+    async def find_by_username(self, username):
+        return super().find_by_username(username)
+
+    async def save(self, user):
+        return super().save(user)
+
+
+class FakeHasher:
+    def hash(self, password_plaintext):
+        return f"new:{password_plaintext}"
+
+
+def _sync(admin_id, user_id, data, repo=None):
+    repo = repo or FakeUserRepository()
+    return UpdateUserUseCase(repo, FakeHasher()).execute(admin_id, user_id, data)
+
+
+def _async(admin_id, user_id, data, repo=None):
+    repo = repo or AsyncFakeUserRepository()
+    return asyncio.run(AsyncUpdateUserUseCase(repo, FakeHasher()).execute(admin_id, user_id, data))
+
+
+@pytest.fixture(params=[_sync, _async], ids=["sync", "async"])
+def update(request):
+    return request.param
+
+
+def test_applies_fields_roles_and_new_password(update):
+    user = update(1, 2, {"name": "Ana Paula", "roles": ["admin"], "password": "nova", "email": "x"})
+
+    assert (user.name, user.roles) == ("Ana Paula", [UserRole.ADMIN])
+    assert user.hashed_password == "" # Nunca sai do caso de uso
+
+
+def test_only_a_changed_username_is_checked():
+    repo = FakeUserRepository()
+
+    _sync(1, 2, {"username": "ana", "name": "Ana"}, repo)
+
+    assert repo.username_lookups == []
+
+
+@pytest.mark.parametrize("admin_id, user_id, data, error, message", [
+    (9, 2, {}, UserNotFoundException, "Usuário 9 não encontrado."),
+    (2, 3, {}, BusinessRuleException, "Usuário Ana não tem permissão para atualizar usuários."),
+    (1, 9, {}, UserNotFoundException, "Usuário 9 não encontrado."),
+    (1, 2, {"username": "bia"}, BusinessRuleException, "O username 'bia' já está em uso."),
+    (1, 2, {"username": ""}, BusinessRuleException, "Dado de atualização inválido: Username não pode ser vazio."),
+    (1, 2, {"roles": ["chef"]}, BusinessRuleException, "Dado de atualização inválido"),
+])
+def test_same_errors_in_both_versions(update, admin_id, user_id, data, error, message):
+    with pytest.raises(error, match=message):
+        update(admin_id, user_id, data)
@@ -42,9 +42,34 @@ CREATE TABLE IF NOT EXISTS tables (
     id INT PRIMARY KEY AUTO_INCREMENT, -- O número da mesa
     -- (MELHORIA) Adiciona restrição CHECK para garantir integridade
     status VARCHAR(50) NOT NULL CHECK (status IN ('available', 'occupied')),
-    number_of_people INT NOT NULL DEFAULT 0
+    number_of_people INT NOT NULL DEFAULT 0,
+    -- Sessão aberta (NULL quando a mesa está livre)
+    current_session_id INT NULL,
+    -- Controle de concorrência otimista (incrementada a cada UPDATE)
+    version INT NOT NULL DEFAULT 0
 );
 
+-- Tabela de Sessões de Mesa (table_sessions)
+-- Uma sessão vai da abertura ao fechamento da mesa e agrupa os pedidos
+-- feitos nesse intervalo.
+DROP TABLE IF EXISTS table_sessions;
+CREATE TABLE IF NOT EXISTS table_sessions (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    table_id INT NOT NULL,
+    number_of_people INT NOT NULL,
+    opened_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    closed_at DATETIME NULL,
+
+    FOREIGN KEY (table_id) REFERENCES tables(id),
+
+    -- Fechamento da mesa busca a sessão aberta (closed_at IS NULL)
+    INDEX idx_table_sessions_open (table_id, closed_at)
+);
+
+ALTER TABLE tables
+    ADD CONSTRAINT fk_tables_current_session
+    FOREIGN KEY (current_session_id) REFERENCES table_sessions(id);
+
 -- Tabela de Pedidos (Orders)
 DROP TABLE IF EXISTS orders;
 CREATE TABLE IF NOT EXISTS orders (
@@ -55,10 +80,26 @@ CREATE TABLE IF NOT EXISTS orders (
     -- (MELHORIA) Adiciona restrição CHECK para garantir integridade
     status VARCHAR(50) NOT NULL CHECK (status IN ('pending', 'in_progress', 'completed', 'cancelled')),
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    -- Sessão da mesa em que o pedido foi feito
+    session_id INT NULL,
+    -- Controle de concorrência otimista (incrementada a cada UPDATE)
+    version INT NOT NULL DEFAULT 0,
     
     -- (CORRIGIDO) Chaves estrangeiras são essenciais
     FOREIGN KEY (table_number) REFERENCES tables(id),
-    FOREIGN KEY (waiter_id) REFERENCES users(id)
+    FOREIGN KEY (waiter_id) REFERENCES users(id),
+    FOREIGN KEY (session_id) REFERENCES table_sessions(id),
+
+    -- Detalhes da mesa buscam apenas os pedidos da sessão atual
+    INDEX idx_orders_session (session_id),
+    -- Fila da cozinha: WHERE status = %s ORDER BY created_at
+    -- (e o histórico filtrado por status)
+    INDEX idx_orders_status_created (status, created_at),
+    -- Histórico de pedidos (paginado por created_at, id): sem filtro,
+    -- por mesa e por garçom
+    INDEX idx_orders_created (created_at),
+    INDEX idx_orders_table_created (table_number, created_at),
+    INDEX idx_orders_waiter_created (waiter_id, created_at)
 );
 
 -- Tabela de Itens do Pedido (ItemOrders)
@@ -71,9 +112,100 @@ CREATE TABLE IF NOT EXISTS order_items (
     price_at_order DECIMAL(10, 2) NOT NULL,
     
     FOREIGN KEY (order_id) REFERENCES orders(id) ON DELETE CASCADE,
-    FOREIGN KEY (product_id) REFERENCES products(id)
+    FOREIGN KEY (product_id) REFERENCES products(id),
+
+    -- Itens de um pedido e UPDATE/DELETE por (pedido, produto)
+    INDEX idx_order_items_order_product (order_id, product_id)
+);
+
+-- Arquivo de pedidos (orders_archive / order_items_archive)
+-- Ao fechar a mesa, os pedidos da sessão e seus itens são movidos para cá
+-- (mesmas colunas e mesmos IDs); 'orders'/'order_items' guardam só as
+-- sessões abertas. O histórico lê as duas. Sem chaves estrangeiras: as
+-- linhas arquivadas não mudam mais (ver migrations/005).
+DROP TABLE IF EXISTS orders_archive;
+CREATE TABLE IF NOT EXISTS orders_archive (
+    id INT PRIMARY KEY, -- O mesmo ID de 'orders'
+    table_number INT NOT NULL,
+    waiter_id INT NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    created_at DATETIME NOT NULL,
+    session_id INT NULL,
+    version INT NOT NULL DEFAULT 0,
+
+    -- Os mesmos índices de histórico de 'orders'
+    INDEX idx_orders_archive_session (session_id),
+    INDEX idx_orders_archive_status_created (status, created_at),
+    INDEX idx_orders_archive_created (created_at),
+    INDEX idx_orders_archive_table_created (table_number, created_at),
+    INDEX idx_orders_archive_waiter_created (waiter_id, created_at)
+);
+
+DROP TABLE IF EXISTS order_items_archive;
+CREATE TABLE IF NOT EXISTS order_items_archive (
+    id INT PRIMARY KEY, -- O mesmo ID de 'order_items'
+    order_id INT NOT NULL,
+    product_id INT NOT NULL,
+    quantity INT NOT NULL,
+    price_at_order DECIMAL(10, 2) NOT NULL,
+
+    INDEX idx_order_items_archive_order (order_id)
+);
+
+
+-- Resumos de vendas (sales_hourly / sales_by_product / sales_by_category / sales_by_waiter)
+-- Somados pelo repositório de pedidos quando um pedido passa para
+-- 'completed' (na mesma transação); os relatórios do admin leem só estas
+-- tabelas. A PK começa pela hora/dia: cada relatório é uma faixa da PK.
+DROP TABLE IF EXISTS sales_hourly;
+CREATE TABLE IF NOT EXISTS sales_hourly (
+    hour DATETIME PRIMARY KEY, -- Início da hora (ex: 2025-03-01 21:00:00)
+    orders_count INT NOT NULL DEFAULT 0,
+    items_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0
+);
+
+DROP TABLE IF EXISTS sales_by_product;
+CREATE TABLE IF NOT EXISTS sales_by_product (
+    day DATE NOT NULL,
+    product_id INT NOT NULL,
+    orders_count INT NOT NULL DEFAULT 0,
+    items_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, product_id)
+);
+
+DROP TABLE IF EXISTS sales_by_category;
+CREATE TABLE IF NOT EXISTS sales_by_category (
+    day DATE NOT NULL,
+    category VARCHAR(100) NOT NULL, -- '' para produtos sem categoria
+    orders_count INT NOT NULL DEFAULT 0,
+    items_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, category)
+);
+
+DROP TABLE IF EXISTS sales_by_waiter;
+CREATE TABLE IF NOT EXISTS sales_by_waiter (
+    day DATE NOT NULL,
+    waiter_id INT NOT NULL,
+    orders_count INT NOT NULL DEFAULT 0,
+    items_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, waiter_id)
+);
+
+-- Versão de cada conjunto de dados servido às telas (ETags de GET /products
+-- e GET /tables). Os repositórios incrementam a linha na mesma transação
+-- da escrita; todos os workers da API leem a mesma versão.
+DROP TABLE IF EXISTS dataset_versions;
+CREATE TABLE IF NOT EXISTS dataset_versions (
+    name VARCHAR(32) PRIMARY KEY, -- 'menu' ou 'tables'
+    version BIGINT UNSIGNED NOT NULL DEFAULT 0
 );
 
+INSERT INTO dataset_versions (name) VALUES ('menu'), ('tables');
+
 
 -- Não vai precisar, pois agora a cli lida com isso e a criação de waiter vai ser via api com um usuário admin
 
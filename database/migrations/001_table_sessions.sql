@@ -0,0 +1,47 @@
+-- database/migrations/001_table_sessions.sql
+-- Sessões de mesa: agrupa os pedidos de cada abertura -> fechamento,
+-- para que os detalhes da mesa não leiam pedidos de sessões antigas.
+-- (Bancos criados com o init_db.sql atual já possuem estas mudanças.)
+-- ----------------------------------------------------
+
+USE mdk_db;
+
+-- 1. Nova tabela de sessões
+CREATE TABLE IF NOT EXISTS table_sessions (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    table_id INT NOT NULL,
+    number_of_people INT NOT NULL,
+    opened_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    closed_at DATETIME NULL,
+
+    FOREIGN KEY (table_id) REFERENCES tables(id)
+);
+
+-- 2. Sessão atual da mesa e sessão de cada pedido
+ALTER TABLE tables
+    ADD COLUMN current_session_id INT NULL,
+    ADD CONSTRAINT fk_tables_current_session
+        FOREIGN KEY (current_session_id) REFERENCES table_sessions(id);
+
+ALTER TABLE orders
+    ADD COLUMN session_id INT NULL,
+    ADD CONSTRAINT fk_orders_session
+        FOREIGN KEY (session_id) REFERENCES table_sessions(id),
+    ADD INDEX idx_orders_session (session_id);
+
+-- 3. Dados existentes: abre uma sessão para cada mesa ocupada e associa a
+-- ela os pedidos da mesa (o mesmo conjunto que a tela mostrava antes).
+-- Pedidos de mesas livres ficam sem sessão (histórico).
+-- Prefira rodar com todas as mesas fechadas.
+INSERT INTO table_sessions (table_id, number_of_people)
+SELECT id, number_of_people FROM tables WHERE status = 'occupied';
+
+UPDATE tables t
+JOIN table_sessions s ON s.table_id = t.id AND s.closed_at IS NULL
+SET t.current_session_id = s.id
+WHERE t.status = 'occupied';
+
+UPDATE orders o
+JOIN tables t ON t.id = o.table_number
+SET o.session_id = t.current_session_id
+WHERE t.current_session_id IS NOT NULL;
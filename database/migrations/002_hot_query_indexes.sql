@@ -0,0 +1,26 @@
+-- database/migrations/002_hot_query_indexes.sql
+-- Índices compostos para as consultas "quentes" dos repositórios, que
+-- faziam varredura completa (e ficavam mais lentas a cada noite de histórico).
+-- (Bancos criados com o init_db.sql atual já possuem estas mudanças.)
+-- Confira com: python benchmarks/explain_check.py (a partir de 'backend/')
+-- ----------------------------------------------------
+
+USE mdk_db;
+
+-- 1. Fila da cozinha: OrderRepository.find_by_status
+--    (WHERE status = %s ORDER BY created_at, id -> sem filesort)
+ALTER TABLE orders
+    ADD INDEX idx_orders_status_created (status, created_at);
+
+-- 2. Itens de um pedido: buscas por order_id e os UPDATE/DELETE por
+--    (order_id, product_id) do OrderRepository.save
+ALTER TABLE order_items
+    ADD INDEX idx_order_items_order_product (order_id, product_id);
+
+-- 3. Fechamento da mesa: TableRepository.save
+--    (WHERE table_id = %s AND closed_at IS NULL)
+ALTER TABLE table_sessions
+    ADD INDEX idx_table_sessions_open (table_id, closed_at);
+
+-- Atualiza as estatísticas usadas pelo otimizador
+ANALYZE TABLE orders, order_items, table_sessions;
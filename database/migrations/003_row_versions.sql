@@ -0,0 +1,15 @@
+-- database/migrations/003_row_versions.sql
+-- Coluna 'version' em 'orders' e 'tables' para o controle de concorrência
+-- otimista dos repositórios: cada UPDATE confere a versão lida e a
+-- incrementa (WHERE id = %s AND version = %s). Se outra pessoa gravou
+-- antes, nenhuma linha é alterada e o caso de uso recarrega e tenta de novo.
+-- (Bancos criados com o init_db.sql atual já possuem estas mudanças.)
+-- ----------------------------------------------------
+
+USE mdk_db;
+
+ALTER TABLE tables
+    ADD COLUMN version INT NOT NULL DEFAULT 0;
+
+ALTER TABLE orders
+    ADD COLUMN version INT NOT NULL DEFAULT 0;
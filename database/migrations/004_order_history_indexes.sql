@@ -0,0 +1,24 @@
+-- database/migrations/004_order_history_indexes.sql
+-- Índices para a busca no histórico de pedidos (GET /admin/orders/history),
+-- paginada por cursor em (created_at, id), do mais recente para o mais antigo.
+-- Cada filtro tem um índice que termina em created_at (o InnoDB acrescenta
+-- o id a todo índice secundário): o MySQL lê o índice de trás para frente
+-- e para ao completar a página, qualquer que seja o tamanho do período.
+-- O filtro por status usa o idx_orders_status_created (migração 002).
+-- Os índices de (table_number) e (waiter_id) criados para as chaves
+-- estrangeiras passam a ser cobertos pelos novos e podem ser removidos.
+-- (Bancos criados com o init_db.sql atual já possuem estas mudanças.)
+-- Confira com: python benchmarks/explain_check.py (a partir de 'backend/')
+-- ----------------------------------------------------
+
+USE mdk_db;
+
+ALTER TABLE orders
+    -- Sem filtros (ou só o período), e a "próxima página"
+    ADD INDEX idx_orders_created (created_at),
+    -- Por mesa
+    ADD INDEX idx_orders_table_created (table_number, created_at),
+    -- Por garçom
+    ADD INDEX idx_orders_waiter_created (waiter_id, created_at);
+
+ANALYZE TABLE orders;
@@ -0,0 +1,46 @@
+-- database/migrations/005_order_archive.sql
+-- Arquivo de pedidos: ao fechar a mesa, os pedidos da sessão (e seus itens)
+-- saem de 'orders'/'order_items' e vão para 'orders_archive'/'order_items_archive',
+-- na mesma transação do fechamento. As tabelas ativas guardam só as
+-- sessões abertas; o histórico (GET /admin/orders/history) lê as duas.
+--
+-- As linhas mantêm os mesmos IDs. O contador AUTO_INCREMENT de 'orders'
+-- precisa sobreviver a reinícios mesmo com a tabela quase vazia
+-- (MySQL 8+ / MariaDB 10.2.4+); um ID repetido falharia na PK do arquivo.
+-- Sem chaves estrangeiras: as linhas arquivadas não mudam mais, e mesas,
+-- garçons e produtos não são apagados.
+-- (Bancos criados com o init_db.sql atual já possuem estas mudanças.)
+--
+-- Depois desta migração, mova o histórico já existente em lotes pequenos
+-- (transações curtas, pode rodar com o restaurante aberto e ser repetido):
+--     python cli.py archive-orders          (a partir de 'backend/')
+-- ----------------------------------------------------
+
+USE mdk_db;
+
+CREATE TABLE IF NOT EXISTS orders_archive (
+    id INT PRIMARY KEY, -- O mesmo ID de 'orders'
+    table_number INT NOT NULL,
+    waiter_id INT NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    created_at DATETIME NOT NULL,
+    session_id INT NULL,
+    version INT NOT NULL DEFAULT 0,
+
+    -- Os mesmos índices de histórico de 'orders' (migrações 002 e 004)
+    INDEX idx_orders_archive_session (session_id),
+    INDEX idx_orders_archive_status_created (status, created_at),
+    INDEX idx_orders_archive_created (created_at),
+    INDEX idx_orders_archive_table_created (table_number, created_at),
+    INDEX idx_orders_archive_waiter_created (waiter_id, created_at)
+);
+
+CREATE TABLE IF NOT EXISTS order_items_archive (
+    id INT PRIMARY KEY, -- O mesmo ID de 'order_items'
+    order_id INT NOT NULL,
+    product_id INT NOT NULL,
+    quantity INT NOT NULL,
+    price_at_order DECIMAL(10, 2) NOT NULL,
+
+    INDEX idx_order_items_archive_order (order_id)
+);
@@ -0,0 +1,98 @@
+-- database/migrations/006_sales_rollups.sql
+-- Resumos de vendas para os relatórios do admin (GET /admin/reports/sales/...).
+-- Uma linha por hora, e por (dia, produto), (dia, categoria) e (dia, garçom).
+-- O repositório de pedidos soma cada pedido aos resumos na mesma transação
+-- em que ele passa para 'completed'. Os relatórios leem só estas tabelas:
+-- um mês por produto são algumas centenas de linhas, nunca os pedidos.
+-- Valores pelo preço gravado no pedido (order_items.price_at_order).
+-- (Bancos criados com o init_db.sql atual já possuem estas mudanças.)
+--
+-- O passo 2 soma o histórico já existente (ativo e arquivado, migração 005).
+-- Ele lê todos os pedidos concluídos uma única vez: rode fora do horário de
+-- serviço, antes de publicar a versão da aplicação que atualiza os resumos
+-- (pedidos concluídos entre os dois momentos ficariam fora dos resumos).
+-- ----------------------------------------------------
+
+USE mdk_db;
+
+-- 1. Tabelas de resumo (a PK começa pela hora/dia: relatórios são faixas)
+CREATE TABLE IF NOT EXISTS sales_hourly (
+    hour DATETIME PRIMARY KEY, -- Início da hora (ex: 2025-03-01 21:00:00)
+    orders_count INT NOT NULL DEFAULT 0,
+    items_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS sales_by_product (
+    day DATE NOT NULL,
+    product_id INT NOT NULL,
+    orders_count INT NOT NULL DEFAULT 0,
+    items_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, product_id)
+);
+
+CREATE TABLE IF NOT EXISTS sales_by_category (
+    day DATE NOT NULL,
+    category VARCHAR(100) NOT NULL, -- '' para produtos sem categoria
+    orders_count INT NOT NULL DEFAULT 0,
+    items_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, category)
+);
+
+CREATE TABLE IF NOT EXISTS sales_by_waiter (
+    day DATE NOT NULL,
+    waiter_id INT NOT NULL,
+    orders_count INT NOT NULL DEFAULT 0,
+    items_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, waiter_id)
+);
+
+-- 2. Histórico já existente (pedidos concluídos, ativos e arquivados)
+CREATE TEMPORARY TABLE completed_sales AS
+SELECT o.id AS order_id, o.created_at, o.waiter_id,
+       oi.product_id, oi.quantity, oi.price_at_order
+FROM (
+    SELECT id, created_at, waiter_id FROM orders WHERE status = 'completed'
+    UNION ALL
+    SELECT id, created_at, waiter_id FROM orders_archive WHERE status = 'completed'
+) o
+LEFT JOIN (
+    SELECT order_id, product_id, quantity, price_at_order FROM order_items
+    UNION ALL
+    SELECT order_id, product_id, quantity, price_at_order FROM order_items_archive
+) oi ON oi.order_id = o.id;
+
+INSERT INTO sales_hourly (hour, orders_count, items_count, revenue)
+SELECT TIMESTAMP(DATE(created_at), MAKETIME(HOUR(created_at), 0, 0)),
+       COUNT(DISTINCT order_id),
+       COALESCE(SUM(quantity), 0),
+       COALESCE(SUM(quantity * price_at_order), 0)
+FROM completed_sales
+GROUP BY TIMESTAMP(DATE(created_at), MAKETIME(HOUR(created_at), 0, 0));
+
+INSERT INTO sales_by_product (day, product_id, orders_count, items_count, revenue)
+SELECT DATE(created_at), product_id,
+       COUNT(DISTINCT order_id), SUM(quantity), SUM(quantity * price_at_order)
+FROM completed_sales
+WHERE product_id IS NOT NULL
+GROUP BY DATE(created_at), product_id;
+
+INSERT INTO sales_by_category (day, category, orders_count, items_count, revenue)
+SELECT DATE(s.created_at), COALESCE(p.category, ''),
+       COUNT(DISTINCT s.order_id), SUM(s.quantity), SUM(s.quantity * s.price_at_order)
+FROM completed_sales s
+JOIN products p ON p.id = s.product_id
+GROUP BY DATE(s.created_at), COALESCE(p.category, '');
+
+INSERT INTO sales_by_waiter (day, waiter_id, orders_count, items_count, revenue)
+SELECT DATE(created_at), waiter_id,
+       COUNT(DISTINCT order_id),
+       COALESCE(SUM(quantity), 0),
+       COALESCE(SUM(quantity * price_at_order), 0)
+FROM completed_sales
+GROUP BY DATE(created_at), waiter_id;
+
+DROP TEMPORARY TABLE completed_sales;
@@ -0,0 +1,20 @@
+-- database/migrations/007_dataset_versions.sql
+-- Versões do cardápio e das mesas (ETags de GET /products e GET /tables),
+-- uma linha por conjunto. Os repositórios incrementam a linha na mesma
+-- transação em que gravam produtos ou mesas; cada worker da API relê a
+-- versão a cada VERSION_REFRESH_SECONDS (padrão: 1s). Antes, a versão vivia
+-- em cada processo e um worker podia responder 304 com dados velhos.
+-- (Bancos criados com o init_db.sql atual já possuem estas mudanças.)
+--
+-- Aplique ANTES de publicar a versão da aplicação que usa a tabela: sem
+-- ela, as gravações de produtos e mesas falham.
+-- ----------------------------------------------------
+
+USE mdk_db;
+
+CREATE TABLE IF NOT EXISTS dataset_versions (
+    name VARCHAR(32) PRIMARY KEY, -- 'menu' ou 'tables'
+    version BIGINT UNSIGNED NOT NULL DEFAULT 0
+);
+
+INSERT IGNORE INTO dataset_versions (name) VALUES ('menu'), ('tables');